@@ -6,13 +6,15 @@ import traceback
 from typing import Dict, List, Optional, Tuple, Any
 import asyncio
 import os
-import importlib
+import copy
 from dotenv import load_dotenv
 from typing import Dict, Any, Protocol, Optional
 
 from resources import ResourceType, ResourceEventTypes, AgentContext, AgentContextType, EventQueue, StateManager, AgentContextManager, CacheManager, MetricsManager, ErrorHandler
 from agent_validation import Validator, ValidationException
-from api import AnthropicAPI
+from api import AnthropicAPI, CallPriority
+from prompt_registry import PromptRegistry
+from response_cache import LLMResponseCache
 
 class CorrectionRequest:
     """Data class representing a correction request."""
@@ -53,7 +55,8 @@ class Agent:
         cache_manager: CacheManager,
         metrics_manager: MetricsManager,
         error_handler: ErrorHandler,
-        model: str = "claude-3-7-sonnet-20250219"
+        model: str = "claude-3-7-sonnet-20250219",
+        response_cache: Optional[LLMResponseCache] = None
     ):
         load_dotenv()
         logging.basicConfig(level=logging.DEBUG)
@@ -72,13 +75,17 @@ class Agent:
             self.max_tokens = 1024
             self.max_validation_attempts = 3
             
-            # Initialize API client
+            # Recorded LLM responses; configured from FFTT_LLM_CACHE_MODE/DIR by default
+            self.response_cache = response_cache if response_cache is not None else LLMResponseCache.from_env()
+            
+            # Initialize API client; replay mode never reaches the network
             anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-            if not anthropic_api_key:
+            if not anthropic_api_key and not (self.response_cache and self.response_cache.replay_only):
                 raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
             self.api = AnthropicAPI(
                 model="claude-3-7-sonnet-20250219",
-                key=anthropic_api_key
+                key=anthropic_api_key or "",
+                response_cache=self.response_cache
             )
             if not self.api:
                 raise ValueError("failed to initialize AnthropicAPI")
@@ -151,19 +158,17 @@ class Agent:
                     self.logger.error(f"Schema file not found: {schema_path}")
                     raise FileNotFoundError(f"Schema file not found: {schema_path}")
                 
-                # Load the schema module dynamically
-                spec = importlib.util.spec_from_file_location(schema_name, schema_path)
-                if spec is None or spec.loader is None:
-                    self.logger.debug(f"Could not load schema spec from {schema_path}")
-                    raise ImportError(f"Could not load schema spec from {schema_path}")
-                    
-                schema_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(schema_module)
+                # Served from the prompt registry; the module is only re-executed when it changes
+                prompts = PromptRegistry.get_instance()
+                if not prompts.has_module(schema_dir):
+                    self.logger.debug(f"Could not import schema module {schema_path}")
+                    raise ImportError(f"Could not import schema module {schema_path}")
                 
-                # Get the schema from the module
-                self.schema = getattr(schema_module, schema_name, None)
-                if self.schema is None:
+                # Get the schema from the module; copied so changes stay local to this agent
+                schema = prompts.get_schema(schema_dir, schema_name)
+                if schema is None:
                     raise AttributeError(f"No schema found in {schema_path}")
+                self.schema = copy.deepcopy(schema)
                 
                 self.logger.debug(f"Schema loaded successfully: {schema_name}")
             # Get validation state entry
@@ -214,7 +219,8 @@ class Agent:
                 system_prompt_info=system_prompt_info,
                 schema=self.schema,
                 current_phase=current_phase,
-                max_tokens=max_tokens or self.max_tokens
+                max_tokens=max_tokens or self.max_tokens,
+                record=False
             )
             if content is None:
                 raise ValueError("API call returned None response")
@@ -257,6 +263,10 @@ class Agent:
                 
                 if success:
                     self.logger.debug(f"Validation succeeded after {validation_data['attempts']} attempts")
+                    await self.api.record_response(
+                        conversation, system_prompt_info, self.schema, content,
+                        current_phase=current_phase, max_tokens=max_tokens or self.max_tokens
+                    )
                     return result
                 
                 #Handle multiple validation attempts
@@ -266,12 +276,15 @@ class Agent:
                     val_errors = f"Validation failed with errors: {analysis}"
                     
                     # Get new content with validation feedback
+                    retry_conversation = conversation + "\n\n" + val_errors
                     new_content = await self.api.call(
-                        conversation=conversation + "\n\n" + val_errors,
+                        conversation=retry_conversation,
                         system_prompt_info=system_prompt_info,
                         schema=self.schema,
                         current_phase=current_phase,
-                        max_tokens=max_tokens or self.max_tokens
+                        max_tokens=max_tokens or self.max_tokens,
+                        priority=CallPriority.HIGH,
+                        record=False
                     )
                     
                     # Pass new content directly to validator
@@ -308,6 +321,10 @@ class Agent:
 
                     if success:
                         self.logger.debug(f"Validation succeeded on retry attempt {validation_data['attempts']}")
+                        await self.api.record_response(
+                            retry_conversation, system_prompt_info, self.schema, new_content,
+                            current_phase=current_phase, max_tokens=max_tokens or self.max_tokens
+                        )
                         return result
     
                          
@@ -400,7 +417,8 @@ class Agent:
                 system_prompt_info=("FFTT_system_prompts/validation/semantic_correction_agent", "semantic_correction_prompt"),
                 schema=request.schema,
                 current_phase="semantic_correction",
-                max_tokens=self.max_tokens
+                max_tokens=self.max_tokens,
+                priority=CallPriority.HIGH
             )
             
             if not corrected_content:
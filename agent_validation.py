@@ -1,15 +1,20 @@
+from collections import OrderedDict
 from datetime import datetime
+import hashlib
 import logging
 import os
 import re
-from typing import Dict, Any, List, Optional, Tuple, Protocol, Callable, Awaitable
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Protocol, Callable, Awaitable, Type
 import json
 import jsonschema
-from jsonschema import validate, ValidationError as JsonSchemaValidationError
+from jsonschema import ValidationError as JsonSchemaValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from pathlib import Path
 import asyncio
 import math
-from api import AnthropicAPI
+from api import AnthropicAPI, CallPriority
 
 from resources import EventQueue, StateManager, AgentContextManager, CacheManager, MetricsManager, ResourceEventTypes, ResourceType
 
@@ -83,6 +88,88 @@ ERROR_ANALYSIS_SCHEMA = {
     }
 }
 
+class SchemaValidatorCache:
+    """
+    Process-wide cache of compiled jsonschema validators.
+
+    Building a validator checks the schema against its metaschema, which costs
+    far more than validating a typical response. Validators are keyed by a
+    hash of the schema's content, so equal schemas share a validator and a
+    schema modified in place gets a new one.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._validators: "OrderedDict[Tuple[str, type], Any]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def schema_key(schema: Dict[str, Any]) -> str:
+        """Content hash of a schema."""
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, schema: Dict[str, Any], cls: Optional[Type] = None) -> Any:
+        """
+        Get a validator for schema, building and checking it on first use.
+
+        Args:
+            schema: JSON schema
+            cls: Validator class; by default chosen from the schema's $schema
+                like jsonschema.validate does
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid
+        """
+        if cls is None:
+            cls = validator_for(schema)
+        key = (self.schema_key(schema), cls)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self._stats["hits"] += 1
+                return validator
+            self._stats["misses"] += 1
+
+        cls.check_schema(schema)
+        validator = cls(schema)
+        with self._lock:
+            self._validators[key] = validator
+            while len(self._validators) > self.max_size:
+                self._validators.popitem(last=False)
+                self._stats["evictions"] += 1
+        return validator
+
+    def validate(self, instance: Any, schema: Dict[str, Any]) -> None:
+        """
+        Drop-in replacement for jsonschema.validate using a cached validator.
+
+        Raises:
+            jsonschema.ValidationError: The best matching error if instance is invalid
+        """
+        error = best_match(self.get(schema).iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, size=len(self._validators), max_size=self.max_size)
+
+
+# Shared by every Validator; agents validate against a small set of schemas
+schema_validators = SchemaValidatorCache()
+
+# Tokens that affect JSON object boundaries: a run of backslashes (with the
+# quote it may escape) or a brace/quote. Everything else is skipped by the regex engine.
+_JSON_BOUNDARY_TOKENS = re.compile(r'\\+"?|[{}"]')
+_JSON_DECODER = json.JSONDecoder()
+
 class ValidationErrorAnalyzer:
     def __init__(
         self,
@@ -243,18 +330,25 @@ class ValidationErrorAnalyzer:
             if not self._error_analysis_api:
                 raise ValueError("API not initialized. Did you use 'async with'?")
             logging.info("Calling error analysis api")
+            system_prompt_info = ("FFTT_system_prompts/validation/error_analysis_agent", "error_analysis_prompt")
             response = await self._error_analysis_api.call(
                 conversation=conversation,
-                system_prompt_info=("FFTT_system_prompts/validation/error_analysis_agent", "error_analysis_prompt"),
+                system_prompt_info=system_prompt_info,
                 schema=ERROR_ANALYSIS_SCHEMA,
                 current_phase="error_analysis",
-                max_tokens=8000
+                max_tokens=8000,
+                priority=CallPriority.HIGH,
+                record=False
             )
             logging.info(f"Error Analysis Agent response: {response}")
             parsed = json.loads(response)
             
             # Validate structure
-            jsonschema.validate(instance=parsed, schema=ERROR_ANALYSIS_SCHEMA)
+            schema_validators.validate(parsed, ERROR_ANALYSIS_SCHEMA)
+            await self._error_analysis_api.record_response(
+                conversation, system_prompt_info, ERROR_ANALYSIS_SCHEMA, response,
+                current_phase="error_analysis", max_tokens=8000
+            )
             
             # Add metadata
             parsed["error_analysis"]["analysis_timestamp"] = datetime.now().isoformat()
@@ -366,12 +460,15 @@ Do not include any explanation or additional text - only return the JSON object.
     Return ONLY the corrected JSON object with NO additional text or markup."""
 
             print("Calling formatting correction API...")
+            system_prompt_info = ("FFTT_system_prompts/validation/formatting_correction_agent", "formatting_correction_prompt")
             response = await self._formatting_correction_api.call(
                 conversation=conversation,
-                system_prompt_info=("FFTT_system_prompts/validation/formatting_correction_agent", "formatting_correction_prompt"),
+                system_prompt_info=system_prompt_info,
                 schema=self.validator.current_schema,
                 current_phase="formatting_correction",
-                max_tokens=8000
+                max_tokens=8000,
+                priority=CallPriority.HIGH,
+                record=False
             )
             print(f"Formatting API Response received: {response}")
 
@@ -387,7 +484,11 @@ Do not include any explanation or additional text - only return the JSON object.
                 if not is_valid:
                     print(f"Formatting validation failed: {issues}")
                     return None
-                    
+                
+                await self._formatting_correction_api.record_response(
+                    conversation, system_prompt_info, self.validator.current_schema, response,
+                    current_phase="formatting_correction", max_tokens=8000
+                )
                 return corrected
                 
             except json.JSONDecodeError as e:
@@ -787,14 +888,18 @@ class Validator:
         if not isinstance(content, str) or not content.strip():
             return None
             
-        # Step 1: Extract JSON object pattern with proper bracket matching
+        # Step 1: Decode the object at the first brace directly when it is valid JSON
+        if decoded := self._extract_json_with_raw_decode(content):
+            return decoded
+        
+        # Step 2: Extract JSON object pattern with proper bracket matching
         # Use bracket counting to handle arbitrary nesting levels
         extracted_json = self._extract_json_with_bracket_counting(content)
         if extracted_json:
             if validated := self.validate_json(extracted_json):
                 return validated
     
-        # Step 2: If no valid JSON found, check for string escaping
+        # Step 3: If no valid JSON found, check for string escaping
         # Common in API responses or logged outputs
         escaped_match = re.search(r'"(\{(?:\\.|[^"\\])*\})"', content)
         if escaped_match:
@@ -826,43 +931,47 @@ class Validator:
         if start_idx == -1:
             return None
         
+        # Single pass over the significant characters; a quote is escaped when
+        # preceded by an odd-length run of backslashes
         brace_count = 0
         in_string = False
-        i = start_idx
-        
-        while i < len(content):
-            char = content[i]
-            
-            # Handle string boundaries (only double quotes for valid JSON)
-            if char == '"':
-                # Check if this quote is escaped by counting preceding backslashes
-                escaped = False
-                backslash_count = 0
-                j = i - 1
-                while j >= 0 and content[j] == '\\':
-                    backslash_count += 1
-                    j -= 1
-                escaped = (backslash_count % 2 == 1)
-                
-                if not escaped:
+        for match in _JSON_BOUNDARY_TOKENS.finditer(content, start_idx):
+            token = match.group()
+            if token[0] == '\\':
+                if token[-1] == '"' and (len(token) - 1) % 2 == 0:
                     in_string = not in_string
-                    
-            # Only count braces outside of strings
+            elif token == '"':
+                in_string = not in_string
             elif not in_string:
-                if char == '{':
+                if token == '{':
                     brace_count += 1
-                elif char == '}':
+                else:
                     brace_count -= 1
                     
                     # Found complete JSON object
                     if brace_count == 0:
-                        return content[start_idx:i+1]
-            
-            i += 1
+                        return content[start_idx:match.end()]
         
         # No complete JSON object found (unmatched braces)
         return None
     
+    def _extract_json_with_raw_decode(self, content: str) -> Optional[str]:
+        """
+        Fast path: decode a JSON object starting at the first opening brace.
+        
+        Uses the C decoder and ignores any trailing text. Returns None if the
+        text at the first brace is not a valid JSON object, in which case
+        bracket counting is used instead.
+        """
+        start_idx = content.find('{')
+        if start_idx == -1:
+            return None
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(content, start_idx)
+        except json.JSONDecodeError:
+            return None
+        return json.dumps(parsed) if isinstance(parsed, dict) else None
+    
     async def validate_output(
         self,
         output: Dict[str, Any],
@@ -932,7 +1041,7 @@ class Validator:
 
             # Now validate the JSON against the schema
             try:
-                validate(instance=json_obj, schema=schema)
+                schema_validators.validate(json_obj, schema)
                 
                 # Success case
                 success_analysis = {
@@ -1005,7 +1114,7 @@ class Validator:
             corrected_output = await corrector.attempt_formatting_correction(output)
             if corrected_output:
                 try:
-                    validate(instance=corrected_output, schema=schema)
+                    schema_validators.validate(corrected_output, schema)
                     await self._handle_success(validation_key, corrected_output, error_analysis, operation_id)
                     return True, corrected_output, error_analysis
                 except JsonSchemaValidationError:
@@ -1263,7 +1372,7 @@ class Validator:
     ) -> List[ValidationError]:
         """Get all validation errors for an output against a schema."""
         errors = []
-        validator = jsonschema.Draft7Validator(schema)
+        validator = schema_validators.get(schema, jsonschema.Draft7Validator)
         
         for error in validator.iter_errors(output):
             validation_error = ValidationError(
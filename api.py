@@ -2,16 +2,363 @@ import traceback
 import anthropic
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from resources.circuit_breakers_simple import CircuitBreakerSimple, CircuitOpenError, CircuitBreakerConfig
+from prompt_registry import PromptRegistry
+from response_cache import LLMResponseCache, ReplayMissError
+
+
+class CallPriority(IntEnum):
+    """Scheduling lane of an LLM call; lower values are dispatched first."""
+    HIGH = 0    # Validation retries and corrections that block an in-progress operation
+    NORMAL = 1  # First-pass generation
+    LOW = 2     # Background work
+
+
+@dataclass
+class ModelRateLimit:
+    """Per-model request and token budgets; None disables that budget."""
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+
+@dataclass
+class LLMConcurrencyConfig:
+    """Configuration for the shared LLM call scheduler."""
+    max_in_flight: int = 8
+    model_limits: Dict[str, ModelRateLimit] = field(default_factory=dict)
+    max_rate_limit_retries: int = 5
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 60.0
+    metrics_window: int = 1000
+
+
+class _Budget:
+    """
+    Continuously refilling budget of units per minute.
+
+    Reservations are granted immediately and may drive the balance negative;
+    the caller then waits until the balance would have recovered. This keeps
+    reservations in arrival order without a retry loop.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Reserve units and return the delay before they may be used."""
+        self._refill(now)
+        self.available -= min(amount, self.capacity)
+        return max(0.0, -self.available / self.rate)
+
+    def refund(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.available = min(self.capacity, self.available + amount)
+
+
+class _ModelLimiter:
+    """Request and token budgets for a single model."""
+
+    def __init__(self, limit: ModelRateLimit):
+        self.requests = _Budget(limit.requests_per_minute) if limit.requests_per_minute else None
+        self.tokens = _Budget(limit.tokens_per_minute) if limit.tokens_per_minute else None
+        self.blocked_until = 0.0
+
+    def reserve(self, tokens: int) -> float:
+        now = time.monotonic()
+        delay = max(0.0, self.blocked_until - now)
+        if self.requests:
+            delay = max(delay, self.requests.reserve(1, now))
+        if self.tokens:
+            delay = max(delay, self.tokens.reserve(tokens, now))
+        return delay
+
+    def refund_tokens(self, tokens: int) -> None:
+        if self.tokens and tokens > 0:
+            self.tokens.refund(tokens, time.monotonic())
+
+    def block_for(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class LLMCallScheduler:
+    """
+    Process-wide scheduler for blocking LLM client calls.
+
+    Bounds the number of calls in flight, dispatches waiting calls by
+    priority lane (FIFO within a lane), applies per-model request and token
+    rate limits, retries rate-limited (429) calls with backoff and records
+    queue-wait and latency metrics.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, config: Optional[LLMConcurrencyConfig] = None):
+        self._config = config or LLMConcurrencyConfig()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._config.max_in_flight,
+            thread_name_prefix="llm-call"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._limiters: Dict[str, _ModelLimiter] = {}
+
+        window = self._config.metrics_window
+        self._queue_waits: Deque[float] = deque(maxlen=window)
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rate_limited": 0,
+            "retries": 0,
+            "peak_in_flight": 0,
+        }
+
+    @classmethod
+    def get_instance(cls, config: Optional[LLMConcurrencyConfig] = None) -> 'LLMCallScheduler':
+        """Get the shared scheduler, creating it with config on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(config)
+            return cls._instance
+
+    @classmethod
+    def reset_for_testing(cls) -> None:
+        """Drop the shared scheduler so the next get_instance creates a fresh one."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance._executor.shutdown(wait=False)
+            cls._instance = None
+
+    @property
+    def config(self) -> LLMConcurrencyConfig:
+        return self._config
+
+    def set_model_limit(self, model: str, limit: ModelRateLimit) -> None:
+        """Set or replace the rate limit of a model."""
+        with self._lock:
+            self._config.model_limits[model] = limit
+            self._limiters.pop(model, None)
+
+    def _limiter(self, model: str) -> Optional[_ModelLimiter]:
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            limit = self._config.model_limits.get(model)
+            if limit is None:
+                return None
+            limiter = self._limiters[model] = _ModelLimiter(limit)
+        return limiter
+
+    async def _acquire_slot(self, priority: int) -> None:
+        with self._lock:
+            if self._in_flight < self._config.max_in_flight and not self._waiters:
+                self._take_slot_locked()
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            raise
+
+    def _take_slot_locked(self) -> None:
+        self._in_flight += 1
+        if self._in_flight > self._counters["peak_in_flight"]:
+            self._counters["peak_in_flight"] = self._in_flight
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            # Hand the slot directly to the highest-priority live waiter
+            while self._waiters:
+                _, _, waiter = heapq.heappop(self._waiters)
+                if waiter.done():
+                    continue
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+                    return
+                except RuntimeError:
+                    # Waiter belongs to a closed event loop
+                    continue
+            self._in_flight -= 1
+
+    def _grant(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # Cancelled before the hand-off landed; pass the slot on
+            self._release_slot()
+        else:
+            waiter.set_result(None)
+
+    def _reserve(self, model: str, tokens: int) -> float:
+        with self._lock:
+            limiter = self._limiter(model)
+            return limiter.reserve(tokens) if limiter else 0.0
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        delay = min(self._config.retry_max_delay, self._config.retry_base_delay * (2 ** attempt))
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers:
+            try:
+                delay = max(delay, float(headers.get("retry-after", 0)))
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    @staticmethod
+    def is_rate_limit_error(error: Exception) -> bool:
+        return isinstance(error, anthropic.RateLimitError) or getattr(error, "status_code", None) == 429
+
+    async def run(
+        self,
+        fn: Callable[[], Any],
+        model: str,
+        estimated_tokens: int = 0,
+        priority: int = CallPriority.NORMAL
+    ) -> Any:
+        """
+        Run a blocking client call under the concurrency and rate limits.
+
+        Args:
+            fn: Zero-argument callable performing the client call
+            model: Model name used to select the rate limit
+            estimated_tokens: Estimated input plus output tokens of the call
+            priority: Dispatch lane, see CallPriority
+
+        Returns:
+            The value returned by fn
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._counters["submitted"] += 1
+        submitted = time.monotonic()
+        attempt = 0
+
+        while True:
+            await self._acquire_slot(int(priority))
+            try:
+                delay = self._reserve(model, estimated_tokens)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                started = time.monotonic()
+                try:
+                    result = await loop.run_in_executor(self._executor, fn)
+                except Exception as e:
+                    if not self.is_rate_limit_error(e) or attempt >= self._config.max_rate_limit_retries:
+                        with self._lock:
+                            self._counters["failed"] += 1
+                            if self.is_rate_limit_error(e):
+                                self._counters["rate_limited"] += 1
+                        raise
+                    retry_delay = self._retry_delay(e, attempt)
+                    with self._lock:
+                        self._counters["rate_limited"] += 1
+                        self._counters["retries"] += 1
+                        limiter = self._limiter(model)
+                        if limiter:
+                            limiter.block_for(retry_delay)
+                    logging.warning(f"LLM call to {model} rate limited, retrying in {retry_delay:.1f}s "
+                                    f"(attempt {attempt + 1}/{self._config.max_rate_limit_retries})")
+                else:
+                    finished = time.monotonic()
+                    with self._lock:
+                        self._counters["completed"] += 1
+                        self._queue_waits.append(started - submitted)
+                        self._latencies.append(finished - started)
+                        limiter = self._limiter(model)
+                        if limiter:
+                            limiter.refund_tokens(estimated_tokens - _usage_tokens(result, estimated_tokens))
+                    return result
+            finally:
+                self._release_slot()
+
+            # Back off without holding a slot so other calls can proceed
+            await asyncio.sleep(retry_delay)
+            attempt += 1
+            submitted = time.monotonic()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get scheduler counters and queue-wait/latency statistics in seconds."""
+        with self._lock:
+            metrics = dict(self._counters)
+            metrics["in_flight"] = self._in_flight
+            metrics["max_in_flight"] = self._config.max_in_flight
+            queued = {priority.name.lower(): 0 for priority in CallPriority}
+            for priority, _, waiter in self._waiters:
+                if not waiter.done():
+                    lane = _lane_name(priority)
+                    queued[lane] = queued.get(lane, 0) + 1
+            metrics["queued"] = sum(queued.values())
+            metrics["queued_by_priority"] = queued
+            metrics["queue_wait"] = _summarize(self._queue_waits)
+            metrics["latency"] = _summarize(self._latencies)
+        return metrics
+
+
+def _usage_tokens(response: Any, default: int) -> int:
+    """Actual tokens used by a response, or default if it reports no usage."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return default
+    try:
+        return int(usage.input_tokens) + int(usage.output_tokens)
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+def _lane_name(priority: int) -> str:
+    try:
+        return CallPriority(priority).name.lower()
+    except ValueError:
+        return str(priority)
+
+
+def _summarize(samples: Deque[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
 
 class AnthropicAPI:
-    def __init__(self, model: str = "claude-3-5-sonnet-20241022", key: str="", system_prompt_path: Optional[Tuple[str, Path]] = None):
+    def __init__(
+        self,
+        model: str = "claude-3-5-sonnet-20241022",
+        key: str = "",
+        system_prompt_path: Optional[Tuple[str, Path]] = None,
+        client: Optional[Any] = None,
+        scheduler: Optional[LLMCallScheduler] = None,
+        response_cache: Optional[LLMResponseCache] = None
+    ):
         self.system_prompt_path = system_prompt_path
         # Configure logging
         logging.basicConfig(
@@ -22,9 +369,13 @@ class AnthropicAPI:
         # Suppress noisy libraries
         logging.getLogger("httpx").setLevel(logging.WARNING)
         logging.getLogger("httpcore").setLevel(logging.WARNING)
-        self.client = anthropic.Anthropic(api_key=key)
+        self.client = client if client is not None else anthropic.Anthropic(api_key=key)
         self.model = model
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Calls from every AnthropicAPI instance share one scheduler so the
+        # in-flight and rate limits apply process-wide
+        self._scheduler = scheduler or LLMCallScheduler.get_instance()
+        self._response_cache = response_cache
+        self._prompts = PromptRegistry.get_instance()
         
         # Single centralized circuit breaker for ALL LLM API calls
         self._llm_circuit_breaker = CircuitBreakerSimple(
@@ -40,8 +391,15 @@ class AnthropicAPI:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if hasattr(self, '_executor'):
-            self._executor.shutdown(wait=True)
+        # The scheduler and its worker threads are shared with other instances
+        pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get concurrency, queue-wait and latency metrics of the LLM call scheduler."""
+        metrics = self._scheduler.get_metrics()
+        if self._response_cache is not None:
+            metrics["response_cache"] = self._response_cache.get_stats()
+        return metrics
 
     def _sync_api_call(
         self,
@@ -97,45 +455,55 @@ class AnthropicAPI:
         system_prompt_info: Tuple[str, str],
         schema: Dict[str, Any],
         current_phase: Optional[str] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        priority: CallPriority = CallPriority.NORMAL,
+        record: bool = True
     ) -> str:
-        """Make the API call with properly formatted system messages and circuit breaker protection"""
+        """
+        Make the API call with properly formatted system messages and circuit breaker protection.
+        
+        With record=False a fresh response is not written to the response cache;
+        callers that validate the response commit it with record_response() once
+        it passes, so malformed responses are never replayed.
+        """
+        messages = [
+            {"role": "user", "content": conversation}
+        ]
+        system = self._system_blocks(system_prompt_info, schema)
+
+        # Serve recorded responses before touching the network or circuit breaker
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = LLMResponseCache.make_key(self.model, system, schema, conversation, max_tokens)
+            if self._response_cache.reads_enabled:
+                cached = await asyncio.to_thread(self._response_cache.get, cache_key)
+                if cached is not None:
+                    logging.debug(f"LLM response cache hit for {current_phase or 'call'} ({cache_key[:12]})")
+                    return cached
+            if self._response_cache.replay_only:
+                raise ReplayMissError(
+                    f"No recorded LLM response for {current_phase or 'call'} (key {cache_key}) in replay mode"
+                )
+
         async def _make_llm_call():
             logging.debug("Making API call with:")
             logging.debug(f"Model: {self.model}")
             logging.debug(f"Max tokens: {max_tokens}")
             logging.debug(f"System prompt directory: {self.system_prompt_path}")
 
-            messages = [
-                {"role": "user", "content": conversation}
-            ]
-            system = []
-            system_prompt = self.get_prompt_from_dir(system_prompt_info[0], system_prompt_info[1])
-            if system_prompt:
-                system.append({
-                    "type": "text",
-                    "text": system_prompt,
-                    "cache_control": {"type": "ephemeral"}
-                })
-                
-                # Add schema as a separate system message
-                system.append({
-                    "type": "text",
-                    "text": json.dumps(schema),
-                    "cache_control": {"type": "ephemeral"}
-                })
-            
-            # Run the synchronous API call in a thread to avoid blocking the event loop
-            # Use run_in_executor for qasync compatibility
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                self._executor,
+            # Run the synchronous API call on the scheduler's worker threads to
+            # avoid blocking the event loop; rough estimate of 4 chars per token
+            prompt_chars = len(conversation) + sum(len(block["text"]) for block in system)
+            response = await self._scheduler.run(
                 lambda: self.client.messages.create(
                     model=self.model,
                     max_tokens=max_tokens,
                     messages=messages,
                     system=system
-                )
+                ),
+                model=self.model,
+                estimated_tokens=prompt_chars // 4 + (max_tokens or 0),
+                priority=priority
             )
             
             if not response.content:
@@ -146,16 +514,68 @@ class AnthropicAPI:
         
         # Protect the LLM call with circuit breaker
         try:
-            return await self._llm_circuit_breaker.execute(_make_llm_call)
+            content = await self._llm_circuit_breaker.execute(_make_llm_call)
         except CircuitOpenError:
             error_msg = "LLM API circuit breaker is open - too many recent failures"
             logging.warning(error_msg)
             raise RuntimeError(error_msg)
+
+        if record and cache_key is not None and self._response_cache.writes_enabled:
+            await self._record(cache_key, content, current_phase)
+        return content
+
+    async def record_response(
+        self,
+        conversation: str,
+        system_prompt_info: Tuple[str, str],
+        schema: Dict[str, Any],
+        content: str,
+        current_phase: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> None:
+        """Record a validated response for a call made with record=False."""
+        if self._response_cache is None or not self._response_cache.writes_enabled:
+            return
+        system = self._system_blocks(system_prompt_info, schema)
+        cache_key = LLMResponseCache.make_key(self.model, system, schema, conversation, max_tokens)
+        await self._record(cache_key, content, current_phase)
+
+    async def _record(self, cache_key: str, content: str, current_phase: Optional[str]) -> None:
+        try:
+            await asyncio.to_thread(
+                self._response_cache.put,
+                cache_key, content,
+                {"model": self.model, "phase": current_phase}
+            )
+        except OSError as e:
+            logging.warning(f"Failed to record LLM response: {e}")
+
+    def _system_blocks(self, system_prompt_info: Tuple[str, str], schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build the system prompt and schema blocks sent with a call."""
+        system = []
+        system_prompt = self.get_prompt_from_dir(system_prompt_info[0], system_prompt_info[1])
+        if system_prompt:
+            system.append({
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            })
+            
+            # Add schema as a separate system message
+            system.append({
+                "type": "text",
+                "text": self._prompts.schema_to_json(schema),
+                "cache_control": {"type": "ephemeral"}
+            })
+        return system
     
     def get_prompt_from_dir(self, system_prompt_dir: str, prompt_name: str = "system_prompt") -> Optional[str]:
         """
         Load system prompt from a directory by importing the specified prompt variable.
         
+        Prompts are served from the process-wide PromptRegistry, so the module
+        is only imported again when its source file changes.
+        
         Args:
             system_prompt_dir: Path to the directory containing the prompt file
             prompt_name: Name of the prompt variable to import (default: "system_prompt")
@@ -165,46 +585,7 @@ class AnthropicAPI:
         """
         try:
             logging.debug(f"System prompt directory: {system_prompt_dir}")
-            
-            # Remove .py extension if present
-            if system_prompt_dir.endswith('.py'):
-                system_prompt_dir = system_prompt_dir[:-3]
-                
-            # Convert directory path to module path format
-            module_path = system_prompt_dir.replace("/", ".")
-            
-            # Remove any leading dots
-            module_path = module_path.lstrip('.')
-            
-            logging.debug(f"Attempting to import module: {module_path}")
-            
-            # Import the module dynamically
-            import importlib
-            import sys
-            
-            # Add the current directory to sys.path if not already there
-            current_dir = str(Path.cwd())
-            if current_dir not in sys.path:
-                sys.path.insert(0, current_dir)
-                
-            module = importlib.import_module(module_path)
-            
-            # Get the specified prompt from the module
-            prompt = getattr(module, prompt_name)
-            
-            if not isinstance(prompt, str):
-                logging.error(f"Prompt '{prompt_name}' is not a string")
-                return None
-                
-            return prompt
-                
-        except ImportError as e:
-            logging.error(f"Could not import prompt module: {str(e)}")
-            logging.debug(f"sys.path: {sys.path}")
-            return None
-        except AttributeError as e:
-            logging.error(f"Prompt '{prompt_name}' not found in module: {str(e)}")
-            return None
+            return self._prompts.get_prompt(system_prompt_dir, prompt_name)
         except Exception as e:
             logging.error(f"Error loading prompt: {str(e)}")
             logging.debug(f"Exception details: {traceback.format_exc()}")
@@ -490,10 +490,12 @@ class Component(ComponentInterface):
         for feature_id in self._features:
             feature_dependency_manager.add_node(feature_id)
             
-        for feature_id, feature in self._features.items():
-            for dependency_id in feature._metadata.dependencies:
-                if dependency_id in self._features:
-                    feature_dependency_manager.add_dependency(feature_id, dependency_id)
+        feature_dependency_manager.add_dependencies(
+            (feature_id, dependency_id)
+            for feature_id, feature in self._features.items()
+            for dependency_id in feature._metadata.dependencies
+            if dependency_id in self._features
+        )
         
         # Get development order
         return feature_dependency_manager.get_development_order()
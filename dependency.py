@@ -1,6 +1,7 @@
 """
 Core Classes:
 DependencyManager: Manages dependency relationships and DAG
+DependencyGraph: Incrementally maintained DAG with topological order and development layers
 DependencyInterface: Inherits from BaseInterface for dependency management
 DevelopmentPath: Handles development path ordering and holding points
 BranchState: Manages branch states during development
@@ -22,9 +23,10 @@ Added comprehensive validation mechanisms
 Included monitoring hooks
 """
 
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum, auto
+import heapq
 import logging
 from datetime import datetime
 from collections import defaultdict
@@ -60,6 +62,271 @@ class DevelopmentPath:
     branch_state: BranchState = BranchState.PENDING
     resources_reserved: Dict[str, Any] = field(default_factory=dict)
 
+class DependencyGraph:
+    """
+    Dependency DAG that maintains its topological order and development layers incrementally.
+    
+    Nodes carry an order index with every dependency ordered before its dependents.
+    When a new edge contradicts the order, only the nodes between the two endpoints
+    are searched and renumbered (Pearce-Kelly), which is also where a cycle would
+    have to be. Each node's development layer, the length of its longest dependency
+    chain, is brought up to date when layers are read, revisiting only nodes
+    downstream of edges changed since the last read.
+    
+    Edges added with allow_cycle that would close a cycle (hierarchical
+    relationships) are stored but do not constrain the order or the layers.
+    """
+    
+    def __init__(self):
+        self.dependencies: Dict[str, Set[str]] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._levels: Dict[str, int] = {}
+        self._layers: List[Set[str]] = []
+        self._layers_cache: Optional[List[frozenset]] = None
+        # Nodes whose level may be out of date since the last layer read
+        self._stale_levels: Set[str] = set()
+        self._unordered: Set[Tuple[str, str]] = set()
+        self._stats = {
+            "edges_added": 0,
+            "reorders": 0,
+            "reordered_nodes": 0,
+            "level_updates": 0,
+            "layer_rebuilds": 0
+        }
+    
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._order
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def add_node(self, node_id: str) -> bool:
+        """Add a node without dependencies; returns False if it already exists."""
+        if node_id in self._order:
+            return False
+        self.dependencies[node_id] = set()
+        self.dependents[node_id] = set()
+        self._order[node_id] = self._next_order
+        self._next_order += 1
+        self._levels[node_id] = 0
+        self._add_to_layer(node_id, 0)
+        return True
+    
+    def remove_node(self, node_id: str) -> None:
+        """Remove a node and all of its edges."""
+        if node_id not in self._order:
+            return
+        for dependency in list(self.dependencies[node_id]):
+            self.remove_edge(node_id, dependency)
+        for dependent in list(self.dependents[node_id]):
+            self.remove_edge(dependent, node_id)
+        self._stale_levels.discard(node_id)
+        self._remove_from_layer(node_id)
+        del self.dependencies[node_id]
+        del self.dependents[node_id]
+        del self._order[node_id]
+        del self._levels[node_id]
+    
+    def add_edge(self, dependent: str, dependency: str, allow_cycle: bool = False) -> bool:
+        """
+        Add an edge from a dependent to its dependency, adding missing nodes.
+        
+        Args:
+            dependent: Node that depends on the other
+            dependency: Node that must come first
+            allow_cycle: Store an edge that would close a cycle as unordered
+                instead of rejecting it
+            
+        Returns:
+            True if the edge was added, False if it already existed
+            
+        Raises:
+            ValueError: If the edge would create a cycle and allow_cycle is False
+        """
+        self.add_node(dependent)
+        self.add_node(dependency)
+        if dependency in self.dependencies[dependent]:
+            return False
+        
+        if not self._restore_order(dependent, dependency):
+            if not allow_cycle:
+                raise ValueError(f"Dependency {dependent} -> {dependency} would create a cycle")
+            self._unordered.add((dependent, dependency))
+            self.dependencies[dependent].add(dependency)
+            self.dependents[dependency].add(dependent)
+            self._stats["edges_added"] += 1
+            return True
+        
+        self.dependencies[dependent].add(dependency)
+        self.dependents[dependency].add(dependent)
+        self._stats["edges_added"] += 1
+        self._stale_levels.add(dependent)
+        return True
+    
+    def remove_edge(self, dependent: str, dependency: str) -> bool:
+        """Remove an edge; returns False if it did not exist."""
+        if dependency not in self.dependencies.get(dependent, ()):
+            return False
+        self.dependencies[dependent].discard(dependency)
+        self.dependents[dependency].discard(dependent)
+        if (dependent, dependency) in self._unordered:
+            self._unordered.discard((dependent, dependency))
+        else:
+            self._stale_levels.add(dependent)
+        return True
+    
+    def would_create_cycle(self, dependent: str, dependency: str) -> bool:
+        """Check whether the dependency already depends, directly or transitively, on the dependent."""
+        if dependent == dependency:
+            return True
+        if dependent not in self._order or dependency not in self._order:
+            return False
+        # With only ordered edges, any such path runs from higher to lower order indexes
+        bounded = not self._unordered
+        if bounded and self._order[dependency] < self._order[dependent]:
+            return False
+        lower_bound = self._order[dependent]
+        visited = {dependency}
+        stack = [dependency]
+        while stack:
+            for next_node in self.dependencies[stack.pop()]:
+                if next_node == dependent:
+                    return True
+                if next_node not in visited and (not bounded or self._order[next_node] > lower_bound):
+                    visited.add(next_node)
+                    stack.append(next_node)
+        return False
+    
+    def topological_order(self) -> List[str]:
+        """Get all nodes with every dependency before its dependents."""
+        return sorted(self._order, key=self._order.__getitem__)
+    
+    def get_layers(self) -> List[frozenset]:
+        """
+        Get development layers: nodes grouped by the length of their longest dependency chain.
+        
+        The layer list is rebuilt only after a node changes layer.
+        """
+        self._refresh_levels()
+        if self._layers_cache is None:
+            self._layers_cache = [frozenset(layer) for layer in self._layers if layer]
+            self._stats["layer_rebuilds"] += 1
+        return list(self._layers_cache)
+    
+    def get_level(self, node_id: str) -> int:
+        """Get the development layer index of a node."""
+        self._refresh_levels()
+        return self._levels[node_id]
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get graph size and maintenance counters."""
+        return {
+            "nodes": len(self._order),
+            "edges": sum(len(deps) for deps in self.dependencies.values()),
+            "unordered_edges": len(self._unordered),
+            "layers": len(self.get_layers()),
+            **self._stats
+        }
+    
+    def _ordered_dependencies(self, node_id: str) -> Iterable[str]:
+        if not self._unordered:
+            return self.dependencies[node_id]
+        return [dep for dep in self.dependencies[node_id] if (node_id, dep) not in self._unordered]
+    
+    def _ordered_dependents(self, node_id: str) -> Iterable[str]:
+        if not self._unordered:
+            return self.dependents[node_id]
+        return [dep for dep in self.dependents[node_id] if (dep, node_id) not in self._unordered]
+    
+    def _restore_order(self, dependent: str, dependency: str) -> bool:
+        """
+        Renumber the affected region so the dependency is ordered before the dependent.
+        
+        Returns:
+            False if the edge would close a cycle, leaving the order unchanged
+        """
+        lower, upper = self._order[dependent], self._order[dependency]
+        if upper < lower:
+            return True
+        if dependent == dependency:
+            return False
+        
+        # Dependents of the dependent that are not yet past the dependency
+        forward = [dependent]
+        visited = {dependent}
+        stack = [dependent]
+        while stack:
+            for next_node in self._ordered_dependents(stack.pop()):
+                order = self._order[next_node]
+                if next_node == dependency:
+                    return False
+                if next_node not in visited and order < upper:
+                    visited.add(next_node)
+                    forward.append(next_node)
+                    stack.append(next_node)
+        
+        # Dependencies of the dependency that are not yet before the dependent
+        backward = [dependency]
+        visited = {dependency}
+        stack = [dependency]
+        while stack:
+            for next_node in self._ordered_dependencies(stack.pop()):
+                if next_node not in visited and self._order[next_node] > lower:
+                    visited.add(next_node)
+                    backward.append(next_node)
+                    stack.append(next_node)
+        
+        # Reuse the same order slots: the backward set first, then the forward set
+        forward.sort(key=self._order.__getitem__)
+        backward.sort(key=self._order.__getitem__)
+        slots = sorted(self._order[node] for node in forward + backward)
+        for node, slot in zip(backward + forward, slots):
+            self._order[node] = slot
+        self._stats["reorders"] += 1
+        self._stats["reordered_nodes"] += len(slots)
+        return True
+    
+    def _refresh_levels(self) -> None:
+        if self._stale_levels:
+            nodes = list(self._stale_levels)
+            self._stale_levels.clear()
+            self._update_levels(nodes)
+    
+    def _update_levels(self, nodes: List[str]) -> None:
+        """Recompute layers from the given nodes downstream, in topological order."""
+        heap = [(self._order[node], node) for node in nodes]
+        heapq.heapify(heap)
+        queued = set(nodes)
+        while heap:
+            _, node = heapq.heappop(heap)
+            queued.discard(node)
+            level = max((self._levels[dep] + 1 for dep in self._ordered_dependencies(node)), default=0)
+            if level == self._levels[node]:
+                continue
+            self._remove_from_layer(node)
+            self._levels[node] = level
+            self._add_to_layer(node, level)
+            self._stats["level_updates"] += 1
+            for dependent in self._ordered_dependents(node):
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(heap, (self._order[dependent], dependent))
+    
+    def _add_to_layer(self, node_id: str, level: int) -> None:
+        while len(self._layers) <= level:
+            self._layers.append(set())
+        self._layers[level].add(node_id)
+        self._layers_cache = None
+    
+    def _remove_from_layer(self, node_id: str) -> None:
+        self._layers[self._levels[node_id]].discard(node_id)
+        # Layers can only be empty transiently, while levels are being updated
+        while self._layers and not self._layers[-1]:
+            self._layers.pop()
+        self._layers_cache = None
+
 class DependencyInterface(BaseInterface):
     """Dependency management interface inheriting from BaseInterface."""
     
@@ -86,8 +353,9 @@ class DependencyInterface(BaseInterface):
         
         self._dependency_type = DependencyType.SECONDARY
         self._development_paths: Dict[str, DevelopmentPath] = {}
-        self._dependency_graph: Dict[str, Set[str]] = defaultdict(set)
-        self._reverse_graph: Dict[str, Set[str]] = defaultdict(set)
+        self._graph = DependencyGraph()
+        self._dependency_graph: Dict[str, Set[str]] = self._graph.dependencies
+        self._reverse_graph: Dict[str, Set[str]] = self._graph.dependents
         self._holding_points: Dict[str, Set[str]] = defaultdict(set)
         self._validation_errors: List[Dict[str, Any]] = []
         
@@ -126,10 +394,7 @@ class DependencyInterface(BaseInterface):
 
     def add_node(self, node_id: str) -> None:
         """Add a node to the dependency graph without any dependencies."""
-        if node_id not in self._dependency_graph:
-            self._dependency_graph[node_id] = set()
-            self._reverse_graph[node_id] = set()
-            
+        if self._graph.add_node(node_id):
             # Update state in resource manager
             self._resource_manager.set_state(
                 f"dependency:{self.interface_id}:graph:{node_id}",
@@ -151,12 +416,11 @@ class DependencyInterface(BaseInterface):
         self.add_node(dependent)
         self.add_node(dependency)
         
-        # Check for cycles before adding unless it's a hierarchical dependency
-        if dep_type != DependencyType.HIERARCHICAL and self._would_create_cycle(dependent, dependency):
-            raise ValueError(f"Adding dependency {dependency} would create a cycle")
-            
-        self._dependency_graph[dependent].add(dependency)
-        self._reverse_graph[dependency].add(dependent)
+        # Check for cycles while adding unless it's a hierarchical dependency
+        try:
+            self._graph.add_edge(dependent, dependency, allow_cycle=dep_type == DependencyType.HIERARCHICAL)
+        except ValueError:
+            raise ValueError(f"Adding dependency {dependency} would create a cycle") from None
         
         # Update state in resource manager
         self._resource_manager.set_state(
@@ -181,6 +445,72 @@ class DependencyInterface(BaseInterface):
             }
         )
         
+    def add_dependencies(self,
+                         dependencies: Iterable[Union[Tuple[str, str], Tuple[str, str, DependencyType]]],
+                         dep_type: DependencyType = DependencyType.SECONDARY) -> int:
+        """
+        Add many dependency relationships with a single state write and event.
+        
+        Args:
+            dependencies: (dependent, dependency) pairs, or triples with their own DependencyType
+            dep_type: Type for pairs without one
+            
+        Returns:
+            Number of new dependency relationships
+            
+        Raises:
+            ValueError: If any dependency would create a cycle; none of the batch is added
+        """
+        new_nodes: List[str] = []
+        added: List[Tuple[str, str, DependencyType]] = []
+        try:
+            for item in dependencies:
+                dependent, dependency = item[0], item[1]
+                edge_type = item[2] if len(item) > 2 else dep_type
+                for node_id in (dependent, dependency):
+                    if self._graph.add_node(node_id):
+                        new_nodes.append(node_id)
+                try:
+                    is_new = self._graph.add_edge(dependent, dependency,
+                                                  allow_cycle=edge_type == DependencyType.HIERARCHICAL)
+                except ValueError:
+                    raise ValueError(f"Adding dependency {dependency} would create a cycle") from None
+                if is_new:
+                    added.append((dependent, dependency, edge_type))
+        except ValueError:
+            # Roll back the whole batch
+            for dependent, dependency, _ in added:
+                self._graph.remove_edge(dependent, dependency)
+            for node_id in new_nodes:
+                self._graph.remove_node(node_id)
+            raise
+        
+        if not added and not new_nodes:
+            return 0
+        
+        changed = {dependent for dependent, _, _ in added}
+        self._resource_manager.set_state(
+            f"dependency:{self.interface_id}:graph",
+            {
+                "graph": {node_id: list(self._dependency_graph[node_id]) for node_id in changed | set(new_nodes)},
+                "types": {f"{dependent}:{dependency}": edge_type.name for dependent, dependency, edge_type in added}
+            },
+            metadata={"batch_size": len(added)}
+        )
+        
+        self._resource_manager.emit_event(
+            "dependencies_added",
+            {
+                "interface_id": self.interface_id,
+                "nodes_added": new_nodes,
+                "dependencies": [
+                    {"dependent": dependent, "dependency": dependency, "dependency_type": edge_type.name}
+                    for dependent, dependency, edge_type in added
+                ]
+            }
+        )
+        return len(added)
+        
     def get_dependencies(self, component_id: str) -> List[str]:
         """Get all dependencies for a component."""
         return list(self._dependency_graph.get(component_id, set()))
@@ -214,13 +544,12 @@ class DependencyInterface(BaseInterface):
 
     def remove_dependency(self, dependent: str, dependency: str) -> None:
         """Remove a dependency relationship from the DAG."""
-        self._dependency_graph[dependent].discard(dependency)
-        self._reverse_graph[dependency].discard(dependent)
+        self._graph.remove_edge(dependent, dependency)
         
         # Update state in resource manager
         self._resource_manager.set_state(
             f"dependency:{self.interface_id}:graph:{dependent}",
-            list(self._dependency_graph[dependent])
+            list(self._dependency_graph.get(dependent, ()))
         )
         
         # Emit dependency removed event
@@ -235,44 +564,17 @@ class DependencyInterface(BaseInterface):
 
     def _would_create_cycle(self, dependent: str, dependency: str) -> bool:
         """Check if adding a dependency would create a cycle."""
-        visited = set()
-        
-        def dfs(node: str) -> bool:
-            if node == dependent:
-                return True
-            visited.add(node)
-            for next_node in self._dependency_graph[node]:
-                if next_node not in visited and dfs(next_node):
-                    return True
-            return False
-            
-        return dfs(dependency)
+        return self._graph.would_create_cycle(dependent, dependency)
 
     def get_development_order(self) -> List[Set[str]]:
-        """Get ordered development layers based on dependencies."""
-        in_degree = defaultdict(int)
-        for node in self._dependency_graph:
-            for dep in self._dependency_graph[node]:
-                in_degree[dep] += 1
-                
-        # Start with nodes that have no dependencies
-        ready = {node for node in self._dependency_graph 
-                if in_degree.get(node, 0) == 0}
-        result = []
-        
-        while ready:
-            result.append(ready)
-            next_ready = set()
-            
-            for node in ready:
-                for dependent in self._reverse_graph[node]:
-                    in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        next_ready.add(dependent)
-                        
-            ready = next_ready
-            
-        return result
+        """
+        Get ordered development layers based on dependencies.
+        
+        Each layer holds the nodes whose dependencies are all in earlier layers.
+        Layers are maintained as dependencies change and returned as frozensets
+        shared between calls.
+        """
+        return self._graph.get_layers()
 
     def create_development_path(self, path_id: str, components: List[str], 
                               priority: int = 0) -> DevelopmentPath:
@@ -791,7 +1093,7 @@ def register_dependency_metrics(dependency_interface: DependencyInterface) -> No
 def monitor_dependency_changes(dependency_interface: DependencyInterface) -> None:
     """Monitor dependency changes."""
     def dependency_change_callback(event_type: str, data: Dict[str, Any]) -> None:
-        if event_type in ["dependency_added", "dependency_removed", "dependency_type_changed"]:
+        if event_type in ["dependency_added", "dependencies_added", "dependency_removed", "dependency_type_changed"]:
             logger.info(f"Dependency change event: {data}")
             register_dependency_metrics(dependency_interface)
     
@@ -799,6 +1101,7 @@ def monitor_dependency_changes(dependency_interface: DependencyInterface) -> Non
     event_queue = EventQueue()
     resource_manager = StateManager(event_queue)
     resource_manager.subscribe_to_events("dependency_added", dependency_change_callback)
+    resource_manager.subscribe_to_events("dependencies_added", dependency_change_callback)
     resource_manager.subscribe_to_events("dependency_removed", dependency_change_callback)
     resource_manager.subscribe_to_events("dependency_type_changed", dependency_change_callback)
     
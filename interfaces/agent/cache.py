@@ -7,6 +7,7 @@ from datetime import datetime
 import logging
 import sys
 import time
+import weakref
 from typing import Dict, Any, Optional
 
 from resources import (
@@ -15,11 +16,91 @@ from resources import (
     MetricsManager,
     MemoryMonitor
 )
+from resources.monitoring import ProcessMemoryGauge
 from ..errors import ResourceError
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pending memory tracking updates are sent once this many accumulate or the interval passes
+TRACKING_BATCH_SIZE = 32
+TRACKING_FLUSH_INTERVAL = 1.0
+
+
+class MemoryPressureController:
+    """
+    Debounced memory-pressure cleanup shared by all InterfaceCache instances.
+    
+    When process memory exceeds the threshold, one forced cleanup runs over
+    every registered CacheManager and one memory_pressure alert is emitted.
+    Further reports are ignored while that cleanup runs and for the cooldown
+    period after it started.
+    """
+    def __init__(self, threshold_mb: float = 500.0, cooldown: float = 30.0):
+        self._threshold_mb = threshold_mb
+        self._cooldown = cooldown
+        self._cache_managers = weakref.WeakSet()
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._last_cleanup: Optional[float] = None
+        
+    def register(self, cache_manager: CacheManager) -> None:
+        """Include a cache manager in pressure cleanups."""
+        self._cache_managers.add(cache_manager)
+        
+    def _cleanup_running(self) -> bool:
+        task = self._cleanup_task
+        # A task left behind by another (possibly closed) loop no longer counts
+        return task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+        
+    async def check(self, event_queue: EventQueue, interface_id: str) -> bool:
+        """
+        Start a cleanup if memory is over the threshold and none is due to be debounced.
+        
+        Returns:
+            True if a cleanup was started
+        """
+        total_memory_mb = ProcessMemoryGauge().rss_mb()
+        if total_memory_mb <= self._threshold_mb or self._cleanup_running():
+            return False
+        now = time.monotonic()
+        if self._last_cleanup is not None and now - self._last_cleanup < self._cooldown:
+            return False
+        self._last_cleanup = now
+        
+        logger.warning(f"High memory usage detected: {total_memory_mb:.2f}MB. Triggering proactive cleanup.")
+        try:
+            from resources.events import ResourceEventTypes
+            await event_queue.emit(
+                ResourceEventTypes.RESOURCE_ALERT_CREATED.value,
+                {
+                    "interface_id": interface_id,
+                    "alert_type": "memory_pressure",
+                    "severity": "WARNING",
+                    "message": f"High memory usage: {total_memory_mb:.2f}MB",
+                    "total_memory_mb": total_memory_mb,
+                    "timestamp": datetime.now().isoformat()
+                }
+            )
+        except Exception:
+            pass  # Ignore event emission failures
+            
+        # Run the cleanup asynchronously so it doesn't block the cache write
+        self._cleanup_task = asyncio.create_task(self._cleanup())
+        return True
+        
+    async def _cleanup(self) -> None:
+        """Force a cleanup of every registered cache manager."""
+        for cache_manager in list(self._cache_managers):
+            try:
+                await cache_manager.cleanup(force=True)
+            except Exception as e:
+                logger.error(f"Failed to perform memory cleanup: {str(e)}")
+        logger.info(f"Completed proactive memory cleanup of {len(self._cache_managers)} cache managers")
+
+
+# Shared by every InterfaceCache in the process
+memory_pressure_controller = MemoryPressureController()
+
 
 class InterfaceCache:
     """
@@ -42,6 +123,14 @@ class InterfaceCache:
         self._memory_monitor = memory_monitor
         self._event_queue = event_queue
         
+        # Memory tracking updates waiting to be sent to the memory monitor
+        self._pending_tracking: Dict[str, float] = {}
+        self._last_tracking_flush = time.monotonic()
+        self._tracking_flush_task: Optional[asyncio.Task] = None
+        
+        if cache_manager is not None:
+            memory_pressure_controller.register(cache_manager)
+        
         # Ensure component is registered with memory monitor
         asyncio.create_task(self._ensure_registered())
         
@@ -145,49 +234,11 @@ class InterfaceCache:
                 except Exception as e:
                     logger.warning(f"Failed to emit alert event: {str(e)}")
             
-            # Track memory with enhanced error recovery
+            # Queue memory tracking and check process memory pressure
             try:
-                # Get current memory usage before adding new resource
-                total_memory_mb = 0
-                try:
-                    import psutil
-                    process = psutil.Process()
-                    total_memory_mb = process.memory_info().rss / (1024 * 1024)
-                except ImportError:
-                    # Fallback if psutil not available
-                    pass
-                
-                # Track the resource
-                await self._memory_monitor.track_resource(
-                    f"cache:{key}", 
-                    size_mb,
-                    self._interface_id
-                )
-                
-                # If total memory is high, trigger cleanup proactively
-                if total_memory_mb > 0 and total_memory_mb > 500:  # 500MB threshold
-                    logger.warning(f"High memory usage detected: {total_memory_mb:.2f}MB. Triggering proactive cleanup.")
-                    
-                    # Emit memory pressure event
-                    try:
-                        from resources.events import ResourceEventTypes
-                        await self._event_queue.emit(
-                            ResourceEventTypes.RESOURCE_ALERT_CREATED.value,
-                            {
-                                "interface_id": self._interface_id,
-                                "alert_type": "memory_pressure",
-                                "severity": "WARNING",
-                                "message": f"High memory usage: {total_memory_mb:.2f}MB",
-                                "total_memory_mb": total_memory_mb,
-                                "timestamp": datetime.now().isoformat()
-                            }
-                        )
-                    except Exception:
-                        pass  # Ignore event emission failures
-                    
-                    # Trigger cache cleanup (asynchronously so it doesn't block)
-                    asyncio.create_task(self._trigger_memory_cleanup())
-                
+                self._pending_tracking[f"cache:{key}"] = size_mb
+                await self._schedule_tracking_flush()
+                await memory_pressure_controller.check(self._event_queue, self._interface_id)
             except Exception as e:
                 logger.warning(f"Failed to track memory for cache {key}: {str(e)}")
                 
@@ -205,21 +256,29 @@ class InterfaceCache:
             )
             raise
     
-    async def _trigger_memory_cleanup(self) -> None:
-        """Trigger memory cleanup when memory pressure is detected."""
-        try:
-            # Use cache manager's cleanup if available
-            if hasattr(self._cache_manager, 'cleanup') and callable(self._cache_manager.cleanup):
-                if asyncio.iscoroutinefunction(self._cache_manager.cleanup):
-                    await self._cache_manager.cleanup(force=True)
-                else:
-                    self._cache_manager.cleanup(force=True)
-                    
-            # Log cleanup success
-            logger.info(f"Completed proactive memory cleanup for {self._interface_id}")
+    async def _schedule_tracking_flush(self) -> None:
+        """Flush pending memory tracking when the batch is full or the interval has passed."""
+        if (len(self._pending_tracking) >= TRACKING_BATCH_SIZE or
+                time.monotonic() - self._last_tracking_flush >= TRACKING_FLUSH_INTERVAL):
+            await self.flush_memory_tracking()
+        elif self._tracking_flush_task is None or self._tracking_flush_task.done():
+            # Make sure sizes recorded just before a quiet period are still sent
+            self._tracking_flush_task = asyncio.create_task(self._flush_tracking_after(TRACKING_FLUSH_INTERVAL))
             
+    async def _flush_tracking_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.flush_memory_tracking()
+        
+    async def flush_memory_tracking(self) -> None:
+        """Send pending cache sizes to the memory monitor in one update."""
+        pending, self._pending_tracking = self._pending_tracking, {}
+        self._last_tracking_flush = time.monotonic()
+        if not pending or not self._memory_monitor:
+            return
+        try:
+            await self._memory_monitor.track_resources(pending, self._interface_id)
         except Exception as e:
-            logger.error(f"Failed to perform memory cleanup: {str(e)}")
+            logger.warning(f"Failed to track memory for {len(pending)} cache entries: {str(e)}")
             
     async def set_cache_with_retries(self, cache_key, value, metadata, size_mb, start_time):
         """
@@ -379,6 +438,7 @@ class InterfaceCache:
             )
             
             # Clean up memory tracking
+            self._pending_tracking.pop(f"cache:{key}", None)
             try:
                 await self._memory_monitor.untrack_resource(f"cache:{key}", self._interface_id)
             except Exception as e:
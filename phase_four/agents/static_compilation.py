@@ -1,11 +1,6 @@
 """Agent responsible for running static compilation checks."""
 
-import asyncio
 import logging
-import os
-import subprocess
-import time
-from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
 from resources import (
@@ -21,8 +16,8 @@ from resources import (
 from resources.monitoring import CircuitBreaker, CircuitOpenError
 from interface import AgentInterface, AgentState
 
-from phase_four.models import CompilerType, CompilationState, CompilationResult, CompilationContext
-from phase_four.utils import parse_compiler_output
+from phase_four.compilation import CompilationEngine
+from phase_four.models import CompilerType, CompilationState, CompilationResult
 
 logger = logging.getLogger(__name__)
 
@@ -57,164 +52,86 @@ class StaticCompilationAgent(AgentInterface):
                 failure_window=600
             )
         )
+        self._engine = CompilationEngine()
     
-    async def _run_compiler(self, ctx: CompilationContext, 
-                         compiler_type: CompilerType) -> CompilationResult:
-        """Run a specific compiler on the code."""
-        result = CompilationResult(compiler_type=compiler_type)
-        result.state = CompilationState.RUNNING
-        
-        start_time = time.time()
-        
+    async def _compile(self, features: Dict[str, str]) -> Dict[str, Dict[CompilerType, CompilationResult]]:
+        """Run all compilers over the given features through the circuit breaker."""
         try:
-            # Write the code to a temporary file
-            with open(ctx.source_file_path, 'w') as file:
-                file.write(ctx.feature_code)
-            
-            # Define compiler commands based on compiler type
-            commands = {
-                CompilerType.FORMAT: ["black", "--check", ctx.source_file_path],
-                CompilerType.STYLE: ["flake8", ctx.source_file_path],
-                CompilerType.LINT: ["pylint", ctx.source_file_path],
-                CompilerType.TYPE: ["mypy", ctx.source_file_path],
-                CompilerType.SECURITY: ["bandit", "-r", ctx.source_file_path]
-            }
-            
-            command = commands[compiler_type]
-            
-            # Run command in a separate thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                process = await loop.run_in_executor(
-                    executor,
-                    lambda: subprocess.run(
-                        command,
-                        capture_output=True,
-                        text=True,
-                        check=False
+            return await self._circuit_breaker.execute(
+                lambda: self._engine.compile_batch(features)
+            )
+        except CircuitOpenError:
+            logger.error("Circuit breaker open for static compilation")
+            return {
+                feature_id: {
+                    compiler_type: CompilationResult(
+                        compiler_type=compiler_type,
+                        state=CompilationState.ERROR,
+                        success=False,
+                        error_message="Circuit breaker open due to excessive failures"
                     )
-                )
-            
-            # Process results
-            result.output = process.stdout
-            result.error_message = process.stderr
-            result.success = process.returncode == 0
-            
-            # Format-specific success if black finds no formatting issues
-            if compiler_type == CompilerType.FORMAT and "would be reformatted" not in result.output:
-                result.success = True
-            
-            # Parse issues into structured format
-            if not result.success:
-                result.state = CompilationState.FAILED
-                result.issues = parse_compiler_output(
-                    compiler_type, result.output, result.error_message
-                )
-            else:
-                result.state = CompilationState.SUCCEEDED
-                
-        except Exception as e:
-            logger.error(f"Error running {compiler_type.name} compiler: {str(e)}", exc_info=True)
-            result.state = CompilationState.ERROR
-            result.success = False
-            result.error_message = str(e)
-            
-        finally:
-            result.execution_time = time.time() - start_time
-            return result
+                    for compiler_type in CompilerType
+                }
+                for feature_id in features
+            }
+    
+    async def _build_response(self,
+                           feature_id: str,
+                           operation_id: str,
+                           results: Dict[CompilerType, CompilationResult]) -> Dict[str, Any]:
+        """Record compiler metrics and build the compilation response for a feature."""
+        for compiler_type, result in results.items():
+            await self._metrics_manager.record_metric(
+                f"compiler:{compiler_type.name.lower()}:execution_time",
+                result.execution_time,
+                metadata={
+                    "feature_id": feature_id,
+                    "success": result.success,
+                    "cached": result.cached
+                }
+            )
+        
+        return {
+            "feature_id": feature_id,
+            "operation_id": operation_id,
+            "success": all(result.success for result in results.values()),
+            "results": {
+                compiler_type.name.lower(): {
+                    "success": result.success,
+                    "state": result.state.name,
+                    "issues": result.issues,
+                    "execution_time": result.execution_time,
+                    "cached": result.cached,
+                }
+                for compiler_type, result in results.items()
+            }
+        }
     
     async def run_compilation(self, 
                            code: str, 
                            feature_id: str,
                            operation_id: str) -> Dict[str, Any]:
-        """Run all compilation steps on the given code."""
+        """Run all compilation steps on the given code.
+        
+        Independent compilers run concurrently, so every compiler reports a
+        result even when an earlier one fails.
+        """
         try:
             logger.info(f"Starting compilation process for feature {feature_id}")
             
             # Set agent state to processing
             await self.set_agent_state(AgentState.PROCESSING)
             
-            # Create temporary source file
-            temp_dir = "/tmp/fftt_phase_four"
-            os.makedirs(temp_dir, exist_ok=True)
-            source_file_path = f"{temp_dir}/{feature_id}.py"
-            
-            # Create compilation context
-            ctx = CompilationContext(
-                feature_code=code,
-                feature_id=feature_id,
-                source_file_path=source_file_path
-            )
-            
-            # Run all compilers in sequence
-            for compiler_type in CompilerType:
-                try:
-                    # Use circuit breaker to prevent excessive failures
-                    result = await self._circuit_breaker.execute(
-                        lambda: self._run_compiler(ctx, compiler_type)
-                    )
-                    ctx.results[compiler_type] = result
-                    
-                    # Record metrics
-                    await self._metrics_manager.record_metric(
-                        f"compiler:{compiler_type.name.lower()}:execution_time",
-                        result.execution_time,
-                        metadata={
-                            "feature_id": feature_id,
-                            "success": result.success
-                        }
-                    )
-                    
-                    # If compilation failed, break the sequence
-                    if not result.success:
-                        break
-                        
-                except CircuitOpenError:
-                    logger.error(f"Circuit breaker open for {compiler_type.name} compilation")
-                    ctx.results[compiler_type] = CompilationResult(
-                        compiler_type=compiler_type,
-                        state=CompilationState.ERROR,
-                        success=False,
-                        error_message="Circuit breaker open due to excessive failures"
-                    )
-                    break
-                    
-                except Exception as e:
-                    logger.error(f"Error in {compiler_type.name} compilation: {str(e)}", exc_info=True)
-                    ctx.results[compiler_type] = CompilationResult(
-                        compiler_type=compiler_type,
-                        state=CompilationState.ERROR,
-                        success=False,
-                        error_message=str(e)
-                    )
-                    break
-            
-            # Check if all compilers passed
-            all_passed = all(result.success for result in ctx.results.values())
+            results = await self._compile({feature_id: code})
+            response = await self._build_response(feature_id, operation_id, results[feature_id])
             
             # Update state based on results
-            if all_passed:
+            if response["success"]:
                 await self.set_agent_state(AgentState.COMPLETE)
             else:
                 await self.set_agent_state(AgentState.FAILED_VALIDATION)
             
-            # Prepare response
-            response = {
-                "feature_id": feature_id,
-                "operation_id": operation_id,
-                "success": all_passed,
-                "results": {
-                    compiler_type.name.lower(): {
-                        "success": result.success,
-                        "state": result.state.name,
-                        "issues": result.issues,
-                        "execution_time": result.execution_time,
-                    }
-                    for compiler_type, result in ctx.results.items()
-                }
-            }
-            
-            logger.info(f"Compilation completed for {feature_id}: {all_passed}")
+            logger.info(f"Compilation completed for {feature_id}: {response['success']}")
             return response
             
         except Exception as e:
@@ -226,4 +143,47 @@ class StaticCompilationAgent(AgentInterface):
                 "operation_id": operation_id,
                 "success": False,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+    
+    async def run_batch_compilation(self,
+                                 features: Dict[str, str],
+                                 operation_id: str) -> Dict[str, Dict[str, Any]]:
+        """Run all compilation steps on many features at once.
+        
+        Each compiler is invoked once for all features, amortizing tool
+        startup. Returns a response per feature ID in the same format as
+        run_compilation.
+        """
+        try:
+            logger.info(f"Starting batch compilation of {len(features)} features")
+            
+            await self.set_agent_state(AgentState.PROCESSING)
+            
+            results = await self._compile(features)
+            responses = {
+                feature_id: await self._build_response(feature_id, operation_id, feature_results)
+                for feature_id, feature_results in results.items()
+            }
+            
+            all_passed = all(response["success"] for response in responses.values())
+            if all_passed:
+                await self.set_agent_state(AgentState.COMPLETE)
+            else:
+                await self.set_agent_state(AgentState.FAILED_VALIDATION)
+            
+            logger.info(f"Batch compilation completed for {len(features)} features: {all_passed}")
+            return responses
+            
+        except Exception as e:
+            logger.error(f"Error in batch compilation process: {str(e)}", exc_info=True)
+            await self.set_agent_state(AgentState.ERROR)
+            
+            return {
+                feature_id: {
+                    "feature_id": feature_id,
+                    "operation_id": operation_id,
+                    "success": False,
+                    "error": str(e)
+                }
+                for feature_id in features
+            }
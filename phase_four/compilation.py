@@ -0,0 +1,284 @@
+"""Compilation engine that runs the static analysis tools for Phase Four.
+
+This module runs the Phase Four checkers (Black, Flake8, Pylint, MyPy and
+Bandit) as asyncio subprocesses. Independent checkers run concurrently, and
+each compilation gets its own temporary work directory so concurrent
+operations on the same feature never share files. Results are cached by code
+hash and tool version. Batch mode checks many features in a single invocation
+of each tool, so interpreter startup is paid once per tool rather than once
+per feature.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from phase_four.models import CompilerType, CompilationState, CompilationResult
+from phase_four.utils import parse_compiler_output
+
+logger = logging.getLogger(__name__)
+
+# Base command for each compiler; file names are appended per invocation
+COMPILER_COMMANDS: Dict[CompilerType, List[str]] = {
+    CompilerType.FORMAT: ["black", "--check"],
+    CompilerType.STYLE: ["flake8"],
+    CompilerType.LINT: ["pylint"],
+    CompilerType.TYPE: ["mypy"],
+    # One line per issue so batch output can be attributed to its file
+    CompilerType.SECURITY: [
+        "bandit", "-f", "custom",
+        "--msg-template", "{relpath}:{line}: Issue: [{test_id}] {msg} Severity: {severity}"
+    ]
+}
+
+# Work files are named by index so every output line maps back to one file
+_WORK_FILE_PATTERN = re.compile(r"feature_\d+\.py")
+
+
+def _split_output_by_file(text: str) -> Dict[str, List[str]]:
+    """Group output lines by the work file they mention, dropping the rest."""
+    lines: Dict[str, List[str]] = {}
+    for line in text.splitlines():
+        match = _WORK_FILE_PATTERN.search(line)
+        if match:
+            lines.setdefault(match.group(0), []).append(line)
+    return lines
+
+
+class CompilationEngine:
+    """Runs static analysis tools concurrently with result caching.
+
+    Results are cached per (code hash, compiler type, tool version), so
+    unchanged code is not re-checked until the tool itself is upgraded.
+    Results in the ERROR state (e.g. a missing tool or a timeout) are never
+    cached.
+
+    Args:
+        commands: Base command per compiler type, defaults to COMPILER_COMMANDS
+        max_concurrency: Maximum number of tool processes running at once,
+            defaults to the CPU count
+        cache_size: Maximum number of cached results
+        timeout: Seconds to wait for a single tool invocation
+    """
+
+    def __init__(self,
+                commands: Optional[Dict[CompilerType, List[str]]] = None,
+                max_concurrency: Optional[int] = None,
+                cache_size: int = 1024,
+                timeout: float = 120.0):
+        self._commands = dict(commands or COMPILER_COMMANDS)
+        self._semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 4)
+        self._cache: OrderedDict[Tuple[str, CompilerType, str], CompilationResult] = OrderedDict()
+        self._cache_size = cache_size
+        self._timeout = timeout
+        self._tool_versions: Dict[CompilerType, str] = {}
+
+    @staticmethod
+    def code_hash(code: str) -> str:
+        """Return the cache key component for a piece of source code."""
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    async def _exec(self, command: Sequence[str], cwd: Optional[str]) -> Tuple[int, str, str]:
+        """Run a command, returning its exit code, stdout and stderr."""
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), self._timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise TimeoutError(f"{command[0]} did not finish within {self._timeout}s")
+            return (
+                process.returncode,
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace")
+            )
+
+    async def tool_version(self, compiler_type: CompilerType) -> str:
+        """Return the version string of a compiler's tool, probing it once.
+
+        Missing tools report an empty version, which is not remembered so
+        that a tool installed later is picked up.
+        """
+        version = self._tool_versions.get(compiler_type)
+        if version is not None:
+            return version
+        try:
+            _, stdout, stderr = await self._exec([self._commands[compiler_type][0], "--version"], None)
+        except (OSError, TimeoutError) as e:
+            logger.warning(f"Could not determine {compiler_type.name} tool version: {str(e)}")
+            return ""
+        version = (stdout or stderr).strip()
+        self._tool_versions[compiler_type] = version
+        return version
+
+    def _cache_get(self, key: Tuple[str, CompilerType, str]) -> Optional[CompilationResult]:
+        result = self._cache.get(key)
+        if result is None:
+            return None
+        self._cache.move_to_end(key)
+        return replace(result, issues=list(result.issues), cached=True)
+
+    def _cache_put(self, key: Tuple[str, CompilerType, str], result: CompilationResult) -> None:
+        self._cache[key] = replace(result, issues=list(result.issues))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached results and tool versions."""
+        self._cache.clear()
+        self._tool_versions.clear()
+
+    async def _run_tool(self, compiler_type: CompilerType, file_names: List[str],
+                        work_dir: str) -> Dict[str, CompilationResult]:
+        """Run one compiler over several work files in a single invocation.
+
+        Output lines are attributed to the file they mention. With more than
+        one file, the reported execution time is the invocation's wall time
+        divided evenly across the files.
+        """
+        start_time = time.time()
+        try:
+            returncode, stdout, stderr = await self._exec(self._commands[compiler_type] + file_names, work_dir)
+        except Exception as e:
+            logger.error(f"Error running {compiler_type.name} compiler: {str(e)}", exc_info=True)
+            execution_time = (time.time() - start_time) / len(file_names)
+            return {
+                name: CompilationResult(
+                    compiler_type=compiler_type,
+                    state=CompilationState.ERROR,
+                    success=False,
+                    error_message=str(e),
+                    execution_time=execution_time
+                )
+                for name in file_names
+            }
+        execution_time = (time.time() - start_time) / len(file_names)
+
+        if len(file_names) == 1:
+            outputs = {file_names[0]: (stdout, stderr)}
+            failed = {file_names[0]} if returncode != 0 else set()
+        else:
+            stdout_lines = _split_output_by_file(stdout)
+            stderr_lines = _split_output_by_file(stderr)
+            outputs = {
+                name: ("\n".join(stdout_lines.get(name, [])), "\n".join(stderr_lines.get(name, [])))
+                for name in file_names
+            }
+            failed = set(stdout_lines) | set(stderr_lines) if returncode != 0 else set()
+            if returncode != 0 and not failed:
+                # The tool failed without reporting on any file (e.g. a usage error)
+                return {
+                    name: CompilationResult(
+                        compiler_type=compiler_type,
+                        state=CompilationState.ERROR,
+                        success=False,
+                        output=stdout,
+                        error_message=stderr,
+                        execution_time=execution_time
+                    )
+                    for name in file_names
+                }
+
+        results = {}
+        for name in file_names:
+            output, error_message = outputs[name]
+            result = CompilationResult(
+                compiler_type=compiler_type,
+                success=name not in failed,
+                output=output,
+                error_message=error_message,
+                execution_time=execution_time
+            )
+            if result.success:
+                result.state = CompilationState.SUCCEEDED
+            else:
+                result.state = CompilationState.FAILED
+                result.issues = parse_compiler_output(compiler_type, output, error_message)
+            results[name] = result
+        return results
+
+    async def compile_batch(self, features: Dict[str, str],
+                            compiler_types: Optional[Sequence[CompilerType]] = None
+                            ) -> Dict[str, Dict[CompilerType, CompilationResult]]:
+        """Check many features, running each tool once over all uncached code.
+
+        Args:
+            features: Mapping of feature ID to source code
+            compiler_types: The compilers to run, defaults to all of them
+
+        Returns:
+            A mapping of feature ID to its results, keyed by compiler type in
+            the order given
+        """
+        compiler_types = list(compiler_types or CompilerType)
+        hashes = {feature_id: self.code_hash(code) for feature_id, code in features.items()}
+        versions = dict(zip(
+            compiler_types,
+            await asyncio.gather(*[self.tool_version(compiler_type) for compiler_type in compiler_types])
+        ))
+
+        results: Dict[str, Dict[CompilerType, CompilationResult]] = {feature_id: {} for feature_id in features}
+        pending: Dict[CompilerType, List[str]] = {}
+        for compiler_type in compiler_types:
+            for feature_id, code_hash in hashes.items():
+                cached = self._cache_get((code_hash, compiler_type, versions[compiler_type]))
+                if cached is not None:
+                    results[feature_id][compiler_type] = cached
+                elif code_hash not in pending.setdefault(compiler_type, []):
+                    pending[compiler_type].append(code_hash)
+        pending = {compiler_type: code_hashes for compiler_type, code_hashes in pending.items() if code_hashes}
+
+        if pending:
+            work_dir = tempfile.mkdtemp(prefix="fftt_phase_four_")
+            try:
+                # Identical code is written, checked and cached once
+                file_names: Dict[str, str] = {}
+                for feature_id, code_hash in hashes.items():
+                    if code_hash not in file_names:
+                        file_names[code_hash] = f"feature_{len(file_names)}.py"
+                        with open(os.path.join(work_dir, file_names[code_hash]), 'w') as file:
+                            file.write(features[feature_id])
+
+                tool_results = await asyncio.gather(*[
+                    self._run_tool(compiler_type, [file_names[code_hash] for code_hash in code_hashes], work_dir)
+                    for compiler_type, code_hashes in pending.items()
+                ])
+
+                for compiler_type, by_file in zip(pending, tool_results):
+                    by_hash = {code_hash: by_file[file_names[code_hash]] for code_hash in pending[compiler_type]}
+                    for code_hash, result in by_hash.items():
+                        if result.state != CompilationState.ERROR:
+                            self._cache_put((code_hash, compiler_type, versions[compiler_type]), result)
+                    for feature_id, code_hash in hashes.items():
+                        if compiler_type not in results[feature_id]:
+                            result = by_hash[code_hash]
+                            results[feature_id][compiler_type] = replace(result, issues=list(result.issues))
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        return {
+            feature_id: {compiler_type: feature_results[compiler_type] for compiler_type in compiler_types}
+            for feature_id, feature_results in results.items()
+        }
+
+    async def compile(self, code: str, feature_id: str,
+                      compiler_types: Optional[Sequence[CompilerType]] = None
+                      ) -> Dict[CompilerType, CompilationResult]:
+        """Check a single feature, running its compilers concurrently."""
+        results = await self.compile_batch({feature_id: code}, compiler_types)
+        return results[feature_id]
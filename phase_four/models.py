@@ -67,6 +67,7 @@ class CompilationResult:
         error_message: The standard error output of the compilation tool
         execution_time: The time taken to execute the compilation step (in seconds)
         issues: A list of structured issues found during compilation
+        cached: Whether the result was reused from an earlier run on identical code
     """
     compiler_type: CompilerType
     state: CompilationState = CompilationState.PENDING
@@ -75,6 +76,7 @@ class CompilationResult:
     error_message: str = ""
     execution_time: float = 0.0
     issues: List[Dict[str, Any]] = field(default_factory=list)
+    cached: bool = False
 
 
 @dataclass
@@ -35,8 +35,8 @@ def parse_compiler_output(compiler_type: CompilerType,
     issues = []
     
     if compiler_type == CompilerType.FORMAT:
-        # Parse black output
-        if "would be reformatted" in stdout:
+        # Parse black output, which reports files to reformat on stderr
+        if "would be reformatted" in stdout or "would reformat" in stderr:
             issues.append({
                 "type": "formatting",
                 "message": "Code requires reformatting",
@@ -92,7 +92,8 @@ def parse_compiler_output(compiler_type: CompilerType,
         for line in stdout.split('\n'):
             if 'Issue:' in line or 'Severity:' in line:
                 message = line.strip()
-                severity = "high" if "High" in line else "medium" if "Medium" in line else "low"
+                level = line.rsplit('Severity:', 1)[-1].upper()
+                severity = "high" if "HIGH" in level else "medium" if "MEDIUM" in level else "low"
                 issues.append({
                     "type": "security",
                     "message": message,
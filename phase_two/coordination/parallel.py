@@ -7,6 +7,9 @@ balances workload, and tracks dependencies between features.
 
 import logging
 import asyncio
+import heapq
+import threading
+import time
 import uuid
 from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
@@ -41,7 +44,9 @@ class ParallelFeatureCoordinator:
                  metrics_manager: MetricsManager,
                  phase_coordination: PhaseCoordinationIntegration,
                  max_concurrent_features: int = 5,
-                 dependency_resolution_mode: str = "topological"):
+                 dependency_resolution_mode: str = "topological",
+                 scheduling_mode: str = "dag",
+                 cancel_dependents_on_failure: bool = True):
         """
         Initialize the ParallelFeatureCoordinator.
         
@@ -52,6 +57,11 @@ class ParallelFeatureCoordinator:
             phase_coordination: PhaseCoordinationIntegration for coordination
             max_concurrent_features: Maximum number of concurrent features to process
             dependency_resolution_mode: Mode for resolving dependencies ("topological" or "level")
+            scheduling_mode: "dag" starts each feature as soon as its own dependencies
+                complete, longest critical path first; "layered" runs dependency layers
+                one after another
+            cancel_dependents_on_failure: Cancel features that depend, directly or
+                transitively, on a failed feature instead of running them
         """
         self._event_queue = event_queue
         self._state_manager = state_manager
@@ -59,6 +69,8 @@ class ParallelFeatureCoordinator:
         self._phase_coordination = phase_coordination
         self._max_concurrent_features = max_concurrent_features
         self._dependency_resolution_mode = dependency_resolution_mode
+        self._scheduling_mode = scheduling_mode
+        self._cancel_dependents_on_failure = cancel_dependents_on_failure
         
         # Store active parallel operations
         self._active_operations: Dict[str, Dict[str, Any]] = {}
@@ -72,9 +84,13 @@ class ParallelFeatureCoordinator:
         # Store workload distribution
         self._workload_distribution: Dict[str, int] = {}  # resource_id -> count
         
+        # Monotonic start time of each operation's schedule, for trace offsets
+        self._schedule_clocks: Dict[str, float] = {}
+        
+        # Processing task of each running operation, so cancellation can stop it
+        self._operation_tasks: Dict[str, asyncio.Task] = {}
+        
         # Store thread affinity for proper thread boundary enforcement
-        import threading
-        import asyncio
         self._creation_thread_id = threading.get_ident()
         
         # Store the event loop for this component
@@ -90,7 +106,8 @@ class ParallelFeatureCoordinator:
         self._feature_semaphores = {}
         self._semaphore_lock = threading.RLock()
         
-        logger.info(f"ParallelFeatureCoordinator initialized with max_concurrent_features={max_concurrent_features}")
+        logger.info(f"ParallelFeatureCoordinator initialized with max_concurrent_features={max_concurrent_features}, "
+                    f"scheduling_mode={scheduling_mode}")
     
     async def start_parallel_feature_development(self,
                                                parent_phase_id: str,
@@ -142,10 +159,13 @@ class ParallelFeatureCoordinator:
             "config": config,
             "feature_count": len(features),
             "execution_order": execution_order,
+            "scheduling_mode": self._scheduling_mode,
             "completed_features": [],
             "in_progress_features": [],
             "pending_features": [f["id"] for f in features],
-            "failed_features": []
+            "failed_features": [],
+            "cancelled_features": [],
+            "schedule_trace": []
         }
         
         # Store operation
@@ -175,7 +195,9 @@ class ParallelFeatureCoordinator:
         )
         
         # Start processing features asynchronously
-        asyncio.create_task(self._process_features(operation_id, parent_phase_id, features, config))
+        task = asyncio.create_task(self._process_features(operation_id, parent_phase_id, features, config))
+        self._operation_tasks[operation_id] = task
+        task.add_done_callback(lambda _: self._operation_tasks.pop(operation_id, None))
         
         return {
             "operation_id": operation_id,
@@ -248,12 +270,14 @@ class ParallelFeatureCoordinator:
             "in_progress_count": len(operation["in_progress_features"]),
             "pending_count": len(operation["pending_features"]),
             "failed_count": len(operation["failed_features"]),
+            "cancelled_count": len(operation.get("cancelled_features", [])),
             "completion_percentage": completion_percentage,
             "features": {
                 "completed": operation["completed_features"],
                 "in_progress": operation["in_progress_features"],
                 "pending": operation["pending_features"],
-                "failed": operation["failed_features"]
+                "failed": operation["failed_features"],
+                "cancelled": operation.get("cancelled_features", [])
             },
             "feature_statuses": feature_statuses
         }
@@ -330,6 +354,11 @@ class ParallelFeatureCoordinator:
         operation["end_time"] = datetime.now().isoformat()
         operation["cancel_reason"] = reason
         
+        # Stop scheduling; running features are cancelled with the processing task
+        task = self._operation_tasks.pop(operation_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+        
         # Update feature statuses for in-progress and pending features
         for feature_id in operation["in_progress_features"] + operation["pending_features"]:
             self._feature_statuses[feature_id]["status"] = "cancelled"
@@ -337,7 +366,8 @@ class ParallelFeatureCoordinator:
             self._feature_statuses[feature_id]["cancel_reason"] = reason
         
         # Move all pending features to cancelled
-        operation["cancelled_features"] = operation["in_progress_features"] + operation["pending_features"]
+        operation["cancelled_features"] = (operation.get("cancelled_features", []) +
+                                           operation["in_progress_features"] + operation["pending_features"])
         operation["in_progress_features"] = []
         operation["pending_features"] = []
         
@@ -522,67 +552,33 @@ class ParallelFeatureCoordinator:
         # Get dependency information
         dependency_graph = self._feature_dependencies.get(operation_id, {})
         execution_order = operation["execution_order"]
+        features_by_id = {feature["id"]: feature for feature in features}
         
-        # Group features by dependency layer
-        layers = self._get_dependency_layers(execution_order, dependency_graph)
+        # Use a thread-safe dictionary of semaphores to ensure each thread has its own semaphore
+        current_thread_id = threading.get_ident()
+        with self._semaphore_lock:
+            if current_thread_id not in self._feature_semaphores:
+                self._feature_semaphores[current_thread_id] = asyncio.Semaphore(self._max_concurrent_features)
+            semaphore = self._feature_semaphores[current_thread_id]
+        
+        self._schedule_clocks[operation_id] = time.monotonic()
         
         try:
-            # Process each layer in order
-            for layer_idx, layer in enumerate(layers):
-                logger.info(f"Processing layer {layer_idx + 1}/{len(layers)} with {len(layer)} features for operation {operation_id}")
-                
-                # Emit layer start event
-                await self._event_queue.emit(
-                    ResourceEventTypes.PHASE_COORDINATION_EVENT.value,
-                    {
-                        "event_type": "parallel_features_layer_started",
-                        "operation_id": operation_id,
-                        "layer_index": layer_idx,
-                        "feature_count": len(layer),
-                        "timestamp": datetime.now().isoformat()
-                    }
+            if self._scheduling_mode == "layered":
+                await self._run_layered_schedule(
+                    semaphore, operation_id, parent_phase_id, features_by_id, config,
+                    execution_order, dependency_graph
                 )
-                
-                # Process features in this layer in parallel with concurrency limit
-                layer_tasks = []
-                
-                # Use a thread-safe dictionary of semaphores to ensure each thread has its own semaphore
-                current_thread_id = threading.get_ident()
-                with self._semaphore_lock:
-                    if current_thread_id not in self._feature_semaphores:
-                        self._feature_semaphores[current_thread_id] = asyncio.Semaphore(self._max_concurrent_features)
-                    semaphore = self._feature_semaphores[current_thread_id]
-                
-                for feature_id in layer:
-                    # Get feature definition
-                    feature = next((f for f in features if f["id"] == feature_id), None)
-                    if not feature:
-                        logger.warning(f"Feature {feature_id} not found in features list for operation {operation_id}")
-                        continue
-                    
-                    # Create task for this feature
-                    task = asyncio.create_task(
-                        self._process_feature_with_semaphore(
-                            semaphore, operation_id, parent_phase_id, feature, config
-                        )
-                    )
-                    layer_tasks.append(task)
-                
-                # Wait for all features in this layer to complete
-                await asyncio.gather(*layer_tasks)
-                
-                # Emit layer completion event
-                await self._event_queue.emit(
-                    ResourceEventTypes.PHASE_COORDINATION_EVENT.value,
-                    {
-                        "event_type": "parallel_features_layer_completed",
-                        "operation_id": operation_id,
-                        "layer_index": layer_idx,
-                        "feature_count": len(layer),
-                        "timestamp": datetime.now().isoformat()
-                    }
+            else:
+                await self._run_dag_schedule(
+                    semaphore, operation_id, parent_phase_id, features_by_id, config,
+                    execution_order, dependency_graph
                 )
             
+            if operation["status"] == "cancelled":
+                logger.info(f"Operation {operation_id} was cancelled, stopping feature processing")
+                return
+            
             # Mark operation as completed
             operation["status"] = "completed"
             operation["end_time"] = datetime.now().isoformat()
@@ -610,6 +606,8 @@ class ParallelFeatureCoordinator:
                     "feature_count": total_count,
                     "completed_count": completed_count,
                     "failed_count": failed_count,
+                    "cancelled_count": len(operation["cancelled_features"]),
+                    "scheduling_mode": operation["scheduling_mode"],
                     "duration_ms": (datetime.fromisoformat(operation["end_time"]) - 
                                     datetime.fromisoformat(operation["start_time"])).total_seconds() * 1000
                 }
@@ -681,6 +679,273 @@ class ParallelFeatureCoordinator:
                 }
             )
     
+    async def _run_layered_schedule(self,
+                                    semaphore: asyncio.Semaphore,
+                                    operation_id: str,
+                                    parent_phase_id: str,
+                                    features_by_id: Dict[str, Dict[str, Any]],
+                                    config: Dict[str, Any],
+                                    execution_order: List[str],
+                                    dependency_graph: Dict[str, Set[str]]) -> None:
+        """
+        Process features layer by layer, waiting for each layer to finish before starting the next.
+        
+        Args:
+            semaphore: Semaphore for concurrency control
+            operation_id: ID of the operation
+            parent_phase_id: ID of the parent phase
+            features_by_id: Feature definitions keyed by feature ID
+            config: Configuration for feature development
+            execution_order: Topological sort of features
+            dependency_graph: Dependency graph
+        """
+        operation = self._active_operations[operation_id]
+        layers = self._get_dependency_layers(execution_order, dependency_graph)
+        
+        for layer_idx, layer in enumerate(layers):
+            if operation["status"] == "cancelled":
+                return
+            
+            logger.info(f"Processing layer {layer_idx + 1}/{len(layers)} with {len(layer)} features for operation {operation_id}")
+            
+            # Emit layer start event
+            await self._event_queue.emit(
+                ResourceEventTypes.PHASE_COORDINATION_EVENT.value,
+                {
+                    "event_type": "parallel_features_layer_started",
+                    "operation_id": operation_id,
+                    "layer_index": layer_idx,
+                    "feature_count": len(layer),
+                    "timestamp": datetime.now().isoformat()
+                }
+            )
+            
+            # Process features in this layer in parallel with concurrency limit
+            layer_tasks = []
+            for feature_id in layer:
+                feature = features_by_id.get(feature_id)
+                if not feature:
+                    logger.warning(f"Feature {feature_id} not found in features list for operation {operation_id}")
+                    continue
+                
+                if self._cancel_dependents_on_failure and self._has_failed_dependency(
+                        feature_id, dependency_graph, operation):
+                    self._cancel_feature(operation_id, feature_id, "dependency failed")
+                    continue
+                
+                layer_tasks.append(asyncio.create_task(
+                    self._process_feature_with_semaphore(
+                        semaphore, operation_id, parent_phase_id, feature, config
+                    )
+                ))
+            
+            # Wait for all features in this layer to complete
+            await asyncio.gather(*layer_tasks)
+            
+            # Emit layer completion event
+            await self._event_queue.emit(
+                ResourceEventTypes.PHASE_COORDINATION_EVENT.value,
+                {
+                    "event_type": "parallel_features_layer_completed",
+                    "operation_id": operation_id,
+                    "layer_index": layer_idx,
+                    "feature_count": len(layer),
+                    "timestamp": datetime.now().isoformat()
+                }
+            )
+    
+    async def _run_dag_schedule(self,
+                                semaphore: asyncio.Semaphore,
+                                operation_id: str,
+                                parent_phase_id: str,
+                                features_by_id: Dict[str, Dict[str, Any]],
+                                config: Dict[str, Any],
+                                execution_order: List[str],
+                                dependency_graph: Dict[str, Set[str]]) -> None:
+        """
+        Process features from a ready queue, starting each one as soon as its own dependencies complete.
+        
+        Ready features are started in order of their critical path length, so the
+        longest remaining dependency chains begin first. When a feature fails, its
+        dependents are cancelled if cancel_dependents_on_failure is set. Cancelling
+        the operation cancels features that are still running.
+        
+        Args:
+            semaphore: Semaphore for concurrency control
+            operation_id: ID of the operation
+            parent_phase_id: ID of the parent phase
+            features_by_id: Feature definitions keyed by feature ID
+            config: Configuration for feature development
+            execution_order: Topological sort of features
+            dependency_graph: Dependency graph
+        """
+        operation = self._active_operations[operation_id]
+        critical_paths = self._critical_path_lengths(features_by_id, dependency_graph)
+        position = {feature_id: index for index, feature_id in enumerate(execution_order)}
+        
+        dependents: Dict[str, Set[str]] = {feature_id: set() for feature_id in dependency_graph}
+        remaining_dependencies: Dict[str, int] = {}
+        for feature_id, dependencies in dependency_graph.items():
+            remaining_dependencies[feature_id] = len(dependencies)
+            for dep_id in dependencies:
+                dependents[dep_id].add(feature_id)
+        
+        ready: List[Tuple[float, int, str]] = []
+        for feature_id in execution_order:
+            if remaining_dependencies[feature_id] == 0:
+                heapq.heappush(ready, (-critical_paths[feature_id], position[feature_id], feature_id))
+        
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while ready or running:
+                if operation["status"] == "cancelled":
+                    break
+                
+                while ready and len(running) < self._max_concurrent_features:
+                    _, _, feature_id = heapq.heappop(ready)
+                    feature = features_by_id.get(feature_id)
+                    if not feature:
+                        logger.warning(f"Feature {feature_id} not found in features list for operation {operation_id}")
+                        continue
+                    task = asyncio.create_task(
+                        self._process_feature_with_semaphore(
+                            semaphore, operation_id, parent_phase_id, feature, config
+                        )
+                    )
+                    running[task] = feature_id
+                
+                if not running:
+                    continue
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    feature_id = running.pop(task)
+                    if self._feature_statuses[feature_id]["status"] == "failed":
+                        if self._cancel_dependents_on_failure:
+                            for dependent_id in self._transitive_dependents(feature_id, dependents):
+                                if self._feature_statuses[dependent_id]["status"] == "pending":
+                                    self._cancel_feature(operation_id, dependent_id, f"dependency {feature_id} failed")
+                            continue
+                    for dependent_id in dependents[feature_id]:
+                        remaining_dependencies[dependent_id] -= 1
+                        if (remaining_dependencies[dependent_id] == 0 and
+                                self._feature_statuses[dependent_id]["status"] == "pending"):
+                            heapq.heappush(ready, (-critical_paths[dependent_id], position[dependent_id], dependent_id))
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+    
+    def _critical_path_lengths(self,
+                               features_by_id: Dict[str, Dict[str, Any]],
+                               dependency_graph: Dict[str, Set[str]]) -> Dict[str, float]:
+        """
+        Calculate the critical path length from each feature to the end of the schedule.
+        
+        A feature's critical path is its own estimated cost plus the longest critical
+        path among the features that depend on it. Costs come from the feature's
+        "estimated_duration" or "complexity" field and default to 1.
+        
+        Args:
+            features_by_id: Feature definitions keyed by feature ID
+            dependency_graph: Dependency graph
+            
+        Returns:
+            Dictionary mapping feature ID to critical path length
+        """
+        dependents: Dict[str, List[str]] = {feature_id: [] for feature_id in dependency_graph}
+        for feature_id, dependencies in dependency_graph.items():
+            for dep_id in dependencies:
+                dependents[dep_id].append(feature_id)
+        
+        def cost(feature_id: str) -> float:
+            feature = features_by_id.get(feature_id, {})
+            value = feature.get("estimated_duration", feature.get("complexity", 1))
+            return float(value) if isinstance(value, (int, float)) else 1.0
+        
+        lengths: Dict[str, float] = {}
+        for feature_id in reversed(self._topological_sort(dependency_graph)):
+            lengths[feature_id] = cost(feature_id) + max(
+                (lengths[dependent_id] for dependent_id in dependents[feature_id]), default=0.0)
+        return lengths
+    
+    def _transitive_dependents(self, feature_id: str, dependents: Dict[str, Set[str]]) -> List[str]:
+        """Get every feature that depends, directly or transitively, on a feature."""
+        found = []
+        seen = {feature_id}
+        stack = [feature_id]
+        while stack:
+            for dependent_id in dependents.get(stack.pop(), ()):
+                if dependent_id not in seen:
+                    seen.add(dependent_id)
+                    found.append(dependent_id)
+                    stack.append(dependent_id)
+        return found
+    
+    def _has_failed_dependency(self,
+                               feature_id: str,
+                               dependency_graph: Dict[str, Set[str]],
+                               operation: Dict[str, Any]) -> bool:
+        """Check whether any dependency of a feature failed or was cancelled."""
+        unavailable = set(operation["failed_features"]) | set(operation["cancelled_features"])
+        return any(dep_id in unavailable for dep_id in dependency_graph.get(feature_id, ()))
+    
+    def _cancel_feature(self, operation_id: str, feature_id: str, reason: str) -> None:
+        """Mark a pending feature as cancelled without running it."""
+        operation = self._active_operations[operation_id]
+        self._feature_statuses[feature_id].update({
+            "status": "cancelled",
+            "cancelled_at": datetime.now().isoformat(),
+            "cancel_reason": reason
+        })
+        if feature_id in operation["pending_features"]:
+            operation["pending_features"].remove(feature_id)
+        operation["cancelled_features"].append(feature_id)
+        self._record_schedule_event(operation_id, feature_id, "cancelled")
+        logger.info(f"Cancelled feature {feature_id} for operation {operation_id}: {reason}")
+    
+    def _record_schedule_event(self, operation_id: str, feature_id: str, event: str) -> None:
+        """Append a start, end or cancelled event to an operation's schedule trace."""
+        operation = self._active_operations.get(operation_id)
+        if operation is None:
+            return
+        clock = self._schedule_clocks.get(operation_id, time.monotonic())
+        operation["schedule_trace"].append({
+            "feature_id": feature_id,
+            "event": event,
+            "status": self._feature_statuses.get(feature_id, {}).get("status"),
+            "offset": time.monotonic() - clock
+        })
+    
+    def get_schedule_trace(self, operation_id: str) -> Dict[str, Any]:
+        """
+        Get the schedule trace of an operation.
+        
+        Args:
+            operation_id: ID of the operation
+            
+        Returns:
+            Dictionary with the scheduling mode, the ordered trace events with offsets
+            in seconds from the start of the schedule, and the makespan so far
+        """
+        operation = self._active_operations.get(operation_id)
+        if operation is None:
+            return {
+                "found": False,
+                "operation_id": operation_id,
+                "message": f"Operation {operation_id} not found"
+            }
+        
+        trace = list(operation["schedule_trace"])
+        return {
+            "found": True,
+            "operation_id": operation_id,
+            "scheduling_mode": operation["scheduling_mode"],
+            "events": trace,
+            "makespan": max((event["offset"] for event in trace), default=0.0)
+        }
+    
     async def _process_feature_with_semaphore(self,
                                             semaphore: asyncio.Semaphore,
                                             operation_id: str,
@@ -710,8 +975,12 @@ class ParallelFeatureCoordinator:
         
         # Use the semaphore to limit concurrency
         async with semaphore:
-            # Process the feature in its own task to ensure thread safety
-            await self._process_single_feature(operation_id, parent_phase_id, feature, config)
+            self._record_schedule_event(operation_id, feature["id"], "start")
+            try:
+                # Process the feature in its own task to ensure thread safety
+                await self._process_single_feature(operation_id, parent_phase_id, feature, config)
+            finally:
+                self._record_schedule_event(operation_id, feature["id"], "end")
     
     async def _process_single_feature(self,
                                     operation_id: str,
@@ -961,8 +1230,8 @@ class ParallelFeatureCoordinator:
             if node not in visited:
                 visit(node)
         
-        # Reverse to get execution order
-        return list(reversed(order))
+        # Dependencies are appended before their dependents, so this is already execution order
+        return order
     
     def _get_dependency_layers(self,
                              execution_order: List[str],
@@ -1007,25 +1276,13 @@ class ParallelFeatureCoordinator:
             return layers
         else:
             # Default to topological grouping
-            # Group features with the same predecessors together
+            # Place each feature in the layer after its deepest dependency
             layers = []
-            processed = set()
+            layer_of: Dict[str, int] = {}
             
             for feature_id in execution_order:
-                # Find layer where all dependencies are already processed
-                layer_idx = 0
-                
-                while layer_idx < len(layers):
-                    # Check if any dependency is in this layer
-                    layer = layers[layer_idx]
-                    dependencies = dependency_graph.get(feature_id, set())
-                    
-                    if any(dep in layer for dep in dependencies):
-                        # Can't add to this layer, try next
-                        layer_idx += 1
-                    else:
-                        # Can add to this layer
-                        break
+                dependencies = dependency_graph.get(feature_id, set())
+                layer_idx = max((layer_of[dep] + 1 for dep in dependencies if dep in layer_of), default=0)
                 
                 # Add to the appropriate layer
                 if layer_idx < len(layers):
@@ -1034,8 +1291,7 @@ class ParallelFeatureCoordinator:
                     # Create a new layer
                     layers.append([feature_id])
                 
-                # Mark as processed
-                processed.add(feature_id)
+                layer_of[feature_id] = layer_idx
             
             return layers
     
@@ -1,6 +1,7 @@
 import json
 import asyncio
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
@@ -36,7 +37,17 @@ class PhaseZeroOrchestrator(PhaseZeroInterface):
             error_handler: ErrorHandler,
              health_tracker: Optional[HealthTracker] = None,
              memory_monitor: Optional[MemoryMonitor] = None,
-             system_monitor: Optional[SystemMonitor] = None):
+             system_monitor: Optional[SystemMonitor] = None,
+             concurrent_agents: bool = True,
+             max_concurrent_agents: int = 4,
+             agent_timeout: float = 60.0):
+        """
+        Args:
+            concurrent_agents: Run the independent analysis agents concurrently
+                instead of one after another
+            max_concurrent_agents: Maximum number of analysis agents running at once
+            agent_timeout: Seconds each analysis agent may run before it is cancelled
+        """
         # Initialize resource managers
         self._event_queue = event_queue
         self._state_manager = state_manager
@@ -48,6 +59,11 @@ class PhaseZeroOrchestrator(PhaseZeroInterface):
         # Track revision attempts by agent
         self.revision_attempts = {}
         
+        # Analysis agent fan-out configuration
+        self.concurrent_agents = concurrent_agents
+        self.max_concurrent_agents = max(1, max_concurrent_agents)
+        self.agent_timeout = agent_timeout
+        
         # Monitoring components
         self._health_tracker = health_tracker
         self._memory_monitor = memory_monitor
@@ -420,25 +436,9 @@ class PhaseZeroOrchestrator(PhaseZeroInterface):
                 "pollinator": self.pollinator_agent
             }
             
-            for agent_id, agent in agents_to_execute.items():
-                try:
-                    analysis_results[agent_id] = await execute_agent_with_monitoring(
-                        agent, 
-                        phase_one_outputs,
-                        health_tracker=self._health_tracker,
-                        metrics_manager=self._metrics_manager,
-                        event_queue=self._event_queue,
-                        state_manager=self._state_manager,
-                        revision_attempts=self.revision_attempts
-                    )
-                except Exception as e:
-                    logger.error(f"Agent {agent_id} analysis failed: {e}")
-                    analysis_results[agent_id] = {
-                        "error": str(e),
-                        "status": "failure",
-                        "agent_id": agent_id,
-                        "timestamp": datetime.now().isoformat()
-                    }
+            analysis_results, agent_execution = await self._run_analysis_agents(
+                agents_to_execute, phase_one_outputs
+            )
             
             # Run evolution synthesis
             try:
@@ -469,6 +469,7 @@ class PhaseZeroOrchestrator(PhaseZeroInterface):
                 "monitoring_analysis": monitoring_result,
                 "deep_analysis": analysis_results,
                 "evolution_synthesis": evolution_result,
+                "agent_execution": agent_execution,
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -550,6 +551,97 @@ class PhaseZeroOrchestrator(PhaseZeroInterface):
             # Re-raise for outer handler
             raise
 
+    async def _run_analysis_agents(self, agents_to_execute: Dict[str, Any],
+                                   phase_one_outputs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Run the independent analysis agents on the phase one outputs.
+        
+        In concurrent mode at most max_concurrent_agents run at once, so total
+        latency approaches that of the slowest agent rather than the sum. Each
+        agent is cancelled after agent_timeout seconds; failed or timed out
+        agents get a failure entry and the remaining results are kept.
+        Cancelling the caller cancels all running agents.
+        
+        Returns:
+            Tuple of results keyed by agent ID (in agents_to_execute order) and
+            an execution summary with per-agent wall times
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_agents if self.concurrent_agents else 1)
+        wall_times: Dict[str, float] = {}
+        timed_out: List[str] = []
+        failed: List[str] = []
+        
+        async def run_agent(agent_id: str, agent: Any) -> Any:
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    return await execute_agent_with_monitoring(
+                        agent, 
+                        phase_one_outputs,
+                        timeout=self.agent_timeout,
+                        health_tracker=self._health_tracker,
+                        metrics_manager=self._metrics_manager,
+                        event_queue=self._event_queue,
+                        state_manager=self._state_manager,
+                        revision_attempts=self.revision_attempts
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"Agent {agent_id} analysis timed out after {self.agent_timeout}s")
+                    timed_out.append(agent_id)
+                    return {
+                        "error": f"Timed out after {self.agent_timeout}s",
+                        "status": "timeout",
+                        "agent_id": agent_id,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                except Exception as e:
+                    logger.error(f"Agent {agent_id} analysis failed: {e}")
+                    failed.append(agent_id)
+                    return {
+                        "error": str(e),
+                        "status": "failure",
+                        "agent_id": agent_id,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                finally:
+                    wall_times[agent_id] = time.monotonic() - start
+        
+        start = time.monotonic()
+        if self.concurrent_agents:
+            # gather cancels every agent task if this coroutine is cancelled
+            results = await asyncio.gather(*(
+                run_agent(agent_id, agent) for agent_id, agent in agents_to_execute.items()
+            ))
+        else:
+            results = [await run_agent(agent_id, agent) for agent_id, agent in agents_to_execute.items()]
+        total_time = time.monotonic() - start
+        
+        for agent_id, wall_time in wall_times.items():
+            await self._metrics_manager.record_metric(
+                f"phase_zero:agent:{agent_id}:wall_time",
+                wall_time,
+                metadata={"concurrent": self.concurrent_agents}
+            )
+        await self._metrics_manager.record_metric(
+            "phase_zero:analysis_agents:wall_time",
+            total_time,
+            metadata={
+                "concurrent": self.concurrent_agents,
+                "agent_count": len(agents_to_execute),
+                "failed": len(failed) + len(timed_out)
+            }
+        )
+        
+        execution = {
+            "mode": "concurrent" if self.concurrent_agents else "sequential",
+            "max_concurrent_agents": self.max_concurrent_agents if self.concurrent_agents else 1,
+            "total_time": total_time,
+            "agent_times": {agent_id: wall_times[agent_id] for agent_id in agents_to_execute if agent_id in wall_times},
+            "failed": failed,
+            "timed_out": timed_out
+        }
+        return dict(zip(agents_to_execute, results)), execution
+
     async def validate_guideline_update(self, agent_id: str, current_guideline: Dict, proposed_update: Dict) -> Dict:
         """Earth mechanism: Validate a proposed guideline update and provide feedback."""
         return await validate_guideline_update(
@@ -85,8 +85,9 @@ async def with_timeout(coro: Coroutine,
         # Emit timeout event
         if event_queue:
             await event_queue.emit(
-                ResourceEventTypes.TIMEOUT_OCCURRED.value,
+                ResourceEventTypes.ERROR_OCCURRED.value,
                 {
+                    "error_type": "timeout",
                     "operation": operation_name,
                     "timeout": timeout_seconds,
                     "timestamp": datetime.now().isoformat()
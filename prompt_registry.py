@@ -0,0 +1,342 @@
+"""
+Process-wide registry of agent system prompts and schemas.
+
+Generalizes the per-agent cache of phase_zero.prompt_loader.PhaseZeroPromptLoader
+to every prompt module: all of FFTT_system_prompts/ is imported once, and
+prompt strings, JSON-serialized schemas and compiled jsonschema validators are
+served from memory. Modules are re-imported when their source file's mtime
+changes, so prompts can be edited while the system is running.
+"""
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from jsonschema.validators import validator_for
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROMPT_ROOT = Path(__file__).resolve().parent / "FFTT_system_prompts"
+
+
+@dataclass
+class _PromptModule:
+    """A loaded prompt module and the artifacts derived from it."""
+    name: str
+    module: Any
+    path: Optional[str]
+    mtime: float
+    checked: float
+    schema_json: Dict[str, str] = field(default_factory=dict)
+    validators: Dict[str, Any] = field(default_factory=dict)
+
+
+class PromptRegistry:
+    """
+    Registry of prompt and schema modules keyed by dotted module name.
+
+    Modules may be referenced by path ("FFTT_system_prompts/phase_one/agent",
+    with or without ".py") or by dotted name. Modules outside the prompt root
+    are imported and tracked on first use; existing files that cannot be
+    imported by dotted name (absolute paths, or paths outside sys.path) are
+    loaded from their file location.
+
+    Args:
+        root: Prompt package directory indexed by load_all
+        check_interval: Minimum seconds between mtime checks of a module;
+            0 checks on every lookup, None disables hot reload
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_PROMPT_ROOT, check_interval: Optional[float] = 2.0):
+        self.root = Path(root).resolve()
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._modules: Dict[str, _PromptModule] = {}
+        # Module reference -> registry key, and keys of modules loaded by file location
+        self._resolved: Dict[str, str] = {}
+        self._file_modules: Dict[str, str] = {}
+        # Schemas served by the registry, by id, so their JSON is only built once
+        self._schema_owners: Dict[int, Tuple[Any, str, str]] = {}
+        self._stats = {
+            "lookups": 0,
+            "imports": 0,
+            "reloads": 0,
+            "failures": 0,
+            "load_seconds": 0.0,
+        }
+
+        # Prompt modules are imported relative to the directory containing the root package
+        import_root = str(self.root.parent)
+        if import_root not in sys.path:
+            sys.path.insert(0, import_root)
+
+    @classmethod
+    def get_instance(cls) -> 'PromptRegistry':
+        """Get the shared registry, indexing the prompt root on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                registry = cls()
+                registry.load_all()
+                cls._instance = registry
+            return cls._instance
+
+    @classmethod
+    def reset_for_testing(cls) -> None:
+        with cls._instance_lock:
+            cls._instance = None
+
+    @staticmethod
+    def module_name(module_ref: str) -> str:
+        """Convert a path or dotted module reference to a dotted module name."""
+        if module_ref.endswith(".py"):
+            module_ref = module_ref[:-3]
+        return module_ref.replace("\\", "/").replace("/", ".").lstrip(".")
+
+    def _resolve(self, module_ref: str) -> str:
+        """Map a module reference to its registry key, loading existing files outside sys.path by location."""
+        key = self._resolved.get(module_ref)
+        if key is not None:
+            return key
+        key = self.module_name(module_ref)
+        if module_ref.endswith(".py") or "/" in module_ref or "\\" in module_ref:
+            path = Path(module_ref if module_ref.endswith(".py") else f"{module_ref}.py")
+            if path.is_file():
+                path = path.resolve()
+                try:
+                    key = self.module_name(str(path.relative_to(self.root.parent)))
+                except ValueError:
+                    key = f"_prompt_file_{hashlib.sha1(str(path).encode()).hexdigest()[:12]}"
+                    self._file_modules[key] = str(path)
+        self._resolved[module_ref] = key
+        return key
+
+    def load_all(self) -> Dict[str, Any]:
+        """
+        Import every module under the prompt root.
+
+        Returns:
+            Summary with the module, prompt and schema counts and load time
+        """
+        start = time.perf_counter()
+        package = self.root.name
+        failed = 0
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            relative = Path(dirpath).relative_to(self.root)
+            prefix = ".".join((package,) + relative.parts)
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                name = prefix if filename == "__init__.py" else f"{prefix}.{filename[:-3]}"
+                with self._lock:
+                    if name not in self._modules and self._import(name) is None:
+                        failed += 1
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            prompts, schemas = self._count_artifacts()
+            summary = {
+                "modules": len(self._modules),
+                "prompts": prompts,
+                "schemas": schemas,
+                "failed": failed,
+                "seconds": elapsed,
+            }
+        logger.info(f"Prompt registry indexed {summary['modules']} modules "
+                    f"({prompts} prompts, {schemas} schemas) in {elapsed * 1000:.1f}ms"
+                    + (f", {failed} failed to import" if failed else ""))
+        return summary
+
+    def _count_artifacts(self) -> Tuple[int, int]:
+        prompts = schemas = 0
+        for entry in self._modules.values():
+            for key, value in vars(entry.module).items():
+                if key.startswith("_"):
+                    continue
+                if isinstance(value, str):
+                    prompts += 1
+                elif isinstance(value, dict):
+                    schemas += 1
+        return prompts, schemas
+
+    def _import(self, name: str, reload_module: Any = None) -> Optional[_PromptModule]:
+        start = time.perf_counter()
+        try:
+            if name in self._file_modules:
+                spec = importlib.util.spec_from_file_location(name, self._file_modules[name])
+                if spec is None or spec.loader is None:
+                    raise ImportError(f"Could not load spec from {self._file_modules[name]}")
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._stats["reloads" if reload_module is not None else "imports"] += 1
+            elif reload_module is not None:
+                module = importlib.reload(reload_module)
+                self._stats["reloads"] += 1
+            else:
+                module = importlib.import_module(name)
+                self._stats["imports"] += 1
+        except Exception as e:
+            self._stats["failures"] += 1
+            logger.error(f"Could not import prompt module {name}: {e}")
+            return None
+        finally:
+            self._stats["load_seconds"] += time.perf_counter() - start
+
+        path = getattr(module, "__file__", None)
+        try:
+            mtime = os.path.getmtime(path) if path else 0.0
+        except OSError:
+            mtime = 0.0
+
+        old = self._modules.get(name)
+        if old is not None:
+            self._forget_schemas(old)
+        entry = _PromptModule(name=name, module=module, path=path, mtime=mtime, checked=time.monotonic())
+        self._modules[name] = entry
+        return entry
+
+    def _forget_schemas(self, entry: _PromptModule) -> None:
+        for key, (_, module_name, _) in list(self._schema_owners.items()):
+            if module_name == entry.name:
+                del self._schema_owners[key]
+
+    def _entry(self, module_ref: str) -> Optional[_PromptModule]:
+        with self._lock:
+            name = self._resolve(module_ref)
+            self._stats["lookups"] += 1
+            entry = self._modules.get(name)
+            if entry is None:
+                return self._import(name)
+            if self.check_interval is not None:
+                now = time.monotonic()
+                if now - entry.checked >= self.check_interval:
+                    entry.checked = now
+                    return self._reload_if_changed(entry)
+            return entry
+
+    def _reload_if_changed(self, entry: _PromptModule) -> _PromptModule:
+        if not entry.path:
+            return entry
+        try:
+            mtime = os.path.getmtime(entry.path)
+        except OSError:
+            return entry
+        if mtime == entry.mtime:
+            return entry
+        logger.info(f"Reloading changed prompt module {entry.name}")
+        reloaded = self._import(entry.name, reload_module=entry.module)
+        if reloaded is None:
+            # Keep serving the last good version until the file is fixed
+            entry.mtime = mtime
+            return entry
+        return reloaded
+
+    def reload_changed(self) -> List[str]:
+        """Re-import every module whose source changed; returns their names."""
+        changed = []
+        with self._lock:
+            for entry in list(self._modules.values()):
+                entry.checked = time.monotonic()
+                if self._reload_if_changed(entry) is not entry:
+                    changed.append(entry.name)
+        return changed
+
+    def has_module(self, module_ref: str) -> bool:
+        """Whether the module exists and imports cleanly."""
+        return self._entry(module_ref) is not None
+
+    def get_value(self, module_ref: str, name: str) -> Any:
+        """
+        Get a module-level value.
+
+        Raises:
+            ImportError: If the module cannot be imported
+            AttributeError: If the module has no such value
+        """
+        entry = self._entry(module_ref)
+        if entry is None:
+            raise ImportError(f"Could not import prompt module {module_ref}")
+        return getattr(entry.module, name)
+
+    def get_prompt(self, module_ref: str, prompt_name: str = "system_prompt") -> Optional[str]:
+        """Get a prompt string, or None if it does not exist or is not a string."""
+        try:
+            prompt = self.get_value(module_ref, prompt_name)
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Prompt '{prompt_name}' not available: {e}")
+            return None
+        if not isinstance(prompt, str):
+            logger.error(f"Prompt '{prompt_name}' is not a string")
+            return None
+        return prompt
+
+    def get_schema(self, module_ref: str, schema_name: str) -> Optional[Dict[str, Any]]:
+        """Get a schema dict, or None if it does not exist."""
+        try:
+            schema = self.get_value(module_ref, schema_name)
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Schema '{schema_name}' not available: {e}")
+            return None
+        if schema is not None:
+            with self._lock:
+                self._schema_owners.setdefault(id(schema), (schema, self._resolve(module_ref), schema_name))
+        return schema
+
+    def get_schema_json(self, module_ref: str, schema_name: str) -> Optional[str]:
+        """Get a schema serialized to JSON, built once per module version."""
+        schema = self.get_schema(module_ref, schema_name)
+        if schema is None:
+            return None
+        return self.schema_to_json(schema)
+
+    def schema_to_json(self, schema: Any) -> str:
+        """
+        Serialize a schema to JSON.
+
+        Schemas served by the registry are serialized once; any other object
+        is serialized on every call since it may have been modified.
+        """
+        with self._lock:
+            owner = self._schema_owners.get(id(schema))
+            if owner is None or owner[0] is not schema:
+                return json.dumps(schema)
+            entry = self._modules.get(owner[1])
+            if entry is None:
+                return json.dumps(schema)
+            cached = entry.schema_json.get(owner[2])
+            if cached is None:
+                cached = entry.schema_json[owner[2]] = json.dumps(schema)
+            return cached
+
+    def get_validator(self, module_ref: str, schema_name: str) -> Optional[Any]:
+        """Get a compiled jsonschema validator for a schema, or None if it does not exist."""
+        schema = self.get_schema(module_ref, schema_name)
+        if schema is None:
+            return None
+        with self._lock:
+            entry = self._modules[self._resolve(module_ref)]
+            validator = entry.validators.get(schema_name)
+            if validator is None:
+                cls = validator_for(schema)
+                cls.check_schema(schema)
+                validator = entry.validators[schema_name] = cls(schema)
+            return validator
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry counters and load time."""
+        with self._lock:
+            stats = dict(self._stats)
+            prompts, schemas = self._count_artifacts()
+            stats.update({"modules": len(self._modules), "prompts": prompts, "schemas": schemas})
+            return stats
@@ -21,11 +21,12 @@ from .models import (
     ContextRequest,
     ContextResponse
 )
-from .history_tracker import get_decision_history
+from .history_store import get_states_many
+from .history_tracker import get_decision_history, get_decision_aggregates, _get_fire_intervention_keys
 from .pattern_analyzer import (
-    analyze_decision_patterns,
-    identify_success_patterns,
-    identify_failure_patterns
+    patterns_from_snapshot,
+    success_patterns_from_snapshot,
+    failure_patterns_from_snapshot
 )
 
 logger = logging.getLogger(__name__)
@@ -84,23 +85,25 @@ async def provide_refinement_context(
         # Combine all relevant events
         relevant_events = refinement_decisions + strategy_decisions
         
+        # Read precomputed pattern statistics for the same scope
+        aggregates = await get_decision_aggregates(state_manager)
+        statistics = aggregates.snapshot(
+            agent=requesting_agent,
+            decision_types=["refinement_necessity", "refinement_strategy"],
+            phase="phase_one",
+            start=datetime.now() - lookback_period
+        )
+        
         # Analyze decision patterns
-        decision_patterns = await analyze_decision_patterns(
-            relevant_events,
+        decision_patterns = patterns_from_snapshot(
+            statistics,
             pattern_types=["refinement_necessity", "refinement_strategy"],
             min_frequency=2
         )
         
         # Identify success and failure patterns
-        success_patterns = await identify_success_patterns(
-            relevant_events,
-            success_threshold=0.7
-        )
-        
-        failure_patterns = await identify_failure_patterns(
-            relevant_events,
-            failure_threshold=0.3
-        )
+        success_patterns = success_patterns_from_snapshot(statistics, success_threshold=0.7)
+        failure_patterns = failure_patterns_from_snapshot(statistics, failure_threshold=0.3)
         
         # Generate specific recommendations based on current context
         recommendations = await _generate_refinement_recommendations(
@@ -559,26 +562,22 @@ async def _get_fire_intervention_history(
         return interventions
     
     try:
-        # Get Fire intervention keys (simplified implementation)
-        intervention_keys = await state_manager.list_keys("air_agent:fire_intervention:")
-        
-        cutoff_time = datetime.now() - lookback_period
+        # Resolve time range and context through the intervention index
+        intervention_keys = await _get_fire_intervention_keys(
+            state_manager, lookback_period, context_filter=context_filter, max_results=50
+        )
+        intervention_data_by_key = await get_states_many(state_manager, intervention_keys)
         
         for key in intervention_keys:
             try:
-                intervention_data = await state_manager.get_state(key, "STATE")
+                intervention_data = intervention_data_by_key.get(key)
                 if intervention_data:
-                    timestamp = datetime.fromisoformat(intervention_data["timestamp"])
-                    if timestamp >= cutoff_time:
-                        # Filter by context if specified
-                        if context_filter in intervention_data.get("intervention_context", ""):
-                            intervention = _deserialize_fire_intervention(intervention_data)
-                            interventions.append(intervention)
+                    interventions.append(_deserialize_fire_intervention(intervention_data))
             except Exception as e:
                 logger.warning(f"Error retrieving Fire intervention {key}: {e}")
                 continue
         
-        return interventions[:50]  # Limit results
+        return interventions
         
     except Exception as e:
         logger.error(f"Error getting Fire intervention history: {e}")
@@ -0,0 +1,313 @@
+"""
+Air Agent time-partitioned history store.
+
+Decision events and Fire interventions are stored as individual records,
+with one index partition per day listing the records of that day in
+timestamp order together with secondary indexes over selected fields.
+Queries read only the partitions inside the requested time range, resolve
+filters through the indexes and then load the matching records in one bulk
+read. Retention drops whole partitions.
+
+Records stored before partitioning existed are indexed into their day's
+partition the first time a store is used, so they remain queryable and are
+dropped by retention like any other record.
+"""
+
+import asyncio
+import bisect
+import logging
+import weakref
+from dataclasses import asdict, is_dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PARTITION_FORMAT = "%Y%m%d"
+
+
+def serialize_record(record: Any) -> Any:
+    """Convert a record dataclass into JSON-compatible data for storage."""
+    if is_dataclass(record) and not isinstance(record, type):
+        record = asdict(record)
+    if isinstance(record, dict):
+        return {key: serialize_record(value) for key, value in record.items()}
+    if isinstance(record, (list, tuple)):
+        return [serialize_record(value) for value in record]
+    if isinstance(record, datetime):
+        return record.isoformat()
+    if isinstance(record, timedelta):
+        return record.total_seconds()
+    if isinstance(record, Enum):
+        return record.value
+    return record
+
+
+async def get_states_many(state_manager, keys: List[str]) -> Dict[str, Any]:
+    """Read several state entries, in one bulk read when the state manager supports it."""
+    if not keys:
+        return {}
+    if hasattr(state_manager, "get_states_many"):
+        entries = await state_manager.get_states_many(keys)
+        return {key: getattr(entry, "state", entry) for key, entry in entries.items()}
+
+    results = {}
+    for key in keys:
+        data = await state_manager.get_state(key, "STATE")
+        if data is not None:
+            results[key] = data
+    return results
+
+
+class HistoryStore:
+    """
+    Time-partitioned record store with secondary indexes, persisted through a state manager.
+
+    Each partition is stored under ``{kind}_partition:{YYYYMMDD}`` and holds
+    ``entries`` - ``[timestamp, record_key, fields]`` triples sorted by
+    timestamp - and ``indexes`` mapping each indexed field value to the
+    positions of its entries. Partitions are cached after first use, so
+    appending a record costs one record write and one partition write.
+    """
+
+    def __init__(self, state_manager, kind: str, indexed_fields: List[str]):
+        self._state_manager = state_manager
+        self.record_prefix = f"air_agent:{kind}:"
+        self.partition_prefix = f"air_agent:{kind}_partition:"
+        self.backfill_key = f"air_agent:{kind}_index_backfill"
+        self._indexed_fields = indexed_fields
+        self._partitions: Dict[str, Dict[str, Any]] = {}
+        self._backfilled = False
+        self._lock = asyncio.Lock()
+
+    def _partition_key(self, timestamp: datetime) -> str:
+        return f"{self.partition_prefix}{timestamp.strftime(PARTITION_FORMAT)}"
+
+    def _partition_date(self, partition_key: str) -> Optional[datetime]:
+        try:
+            return datetime.strptime(partition_key[len(self.partition_prefix):], PARTITION_FORMAT)
+        except ValueError:
+            return None
+
+    def _new_partition(self) -> Dict[str, Any]:
+        return {"entries": [], "indexes": {field: {} for field in self._indexed_fields}}
+
+    def _rebuild_indexes(self, partition: Dict[str, Any]) -> None:
+        indexes = {field: {} for field in self._indexed_fields}
+        for position, (_, _, fields) in enumerate(partition["entries"]):
+            for field in self._indexed_fields:
+                indexes[field].setdefault(str(fields.get(field)), []).append(position)
+        partition["indexes"] = indexes
+
+    async def _load_partitions(self, partition_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the requested partitions, bulk-reading those not cached."""
+        missing = [key for key in partition_keys if key not in self._partitions]
+        if missing:
+            loaded = await get_states_many(self._state_manager, missing)
+            for key in missing:
+                partition = loaded.get(key)
+                if isinstance(partition, dict) and "entries" in partition:
+                    self._partitions[key] = partition
+        return {key: self._partitions[key] for key in partition_keys if key in self._partitions}
+
+    async def _partition_keys(self, start: Optional[datetime], end: Optional[datetime]) -> List[str]:
+        """List partition keys overlapping [start, end], newest first."""
+        keys = await self._state_manager.list_keys(self.partition_prefix)
+        selected = []
+        for key in keys:
+            day = self._partition_date(key)
+            if day is None:
+                continue
+            if start is not None and day + timedelta(days=1) <= start:
+                continue
+            if end is not None and day > end:
+                continue
+            selected.append(key)
+        selected.sort(reverse=True)
+        return selected
+
+    async def _ensure_backfilled(self) -> None:
+        """Index records written before partitioning, once per store."""
+        if self._backfilled:
+            return
+        async with self._lock:
+            if self._backfilled:
+                return
+            # The marker key is unique, so listing it checks existence without a read
+            if not await self._state_manager.list_keys(self.backfill_key):
+                record_keys = await self._state_manager.list_keys(self.record_prefix)
+                if record_keys:
+                    partitions = await self._load_partitions(await self._state_manager.list_keys(self.partition_prefix))
+                    indexed = {entry[1] for partition in partitions.values() for entry in partition["entries"]}
+                    unindexed = [key for key in record_keys if key not in indexed]
+                    records = await self.load(unindexed)
+                    touched = set()
+                    for record_key in unindexed:
+                        record = records.get(record_key)
+                        try:
+                            timestamp = datetime.fromisoformat(record["timestamp"])
+                        except (TypeError, KeyError, ValueError):
+                            logger.warning(f"Cannot index history record {record_key} without a valid timestamp")
+                            continue
+                        partition_key = self._partition_key(timestamp)
+                        partition = (await self._load_partitions([partition_key])).get(partition_key)
+                        if partition is None:
+                            partition = self._partitions[partition_key] = self._new_partition()
+                        partition["entries"].append([
+                            timestamp.isoformat(),
+                            record_key,
+                            {field: record.get(field) for field in self._indexed_fields}
+                        ])
+                        touched.add(partition_key)
+                    for partition_key in touched:
+                        partition = self._partitions[partition_key]
+                        partition["entries"].sort(key=lambda entry: entry[0])
+                        self._rebuild_indexes(partition)
+                        await self._state_manager.set_state(partition_key, partition, "STATE")
+                    if touched:
+                        logger.info(f"Indexed {len(unindexed)} history records under {self.record_prefix} "
+                                    f"into {len(touched)} partitions")
+                await self._state_manager.set_state(
+                    self.backfill_key, {"completed_at": datetime.now().isoformat()}, "STATE"
+                )
+            self._backfilled = True
+
+    async def add(self, record_id: str, timestamp: datetime, record: Dict[str, Any], fields: Dict[str, Any]) -> str:
+        """
+        Store a record and add it to its day's partition.
+
+        Args:
+            record_id: Record identifier
+            timestamp: Record timestamp, determines the partition
+            record: Serialized record data
+            fields: Values of the indexed fields
+
+        Returns:
+            The record's state key
+        """
+        await self._ensure_backfilled()
+        record_key = f"{self.record_prefix}{record_id}"
+        partition_key = self._partition_key(timestamp)
+        await self._state_manager.set_state(record_key, record, "STATE")
+
+        async with self._lock:
+            partition = (await self._load_partitions([partition_key])).get(partition_key)
+            if partition is None:
+                partition = self._partitions[partition_key] = self._new_partition()
+
+            entries = partition["entries"]
+            entry = [timestamp.isoformat(), record_key, {field: fields.get(field) for field in self._indexed_fields}]
+            if not entries or entries[-1][0] <= entry[0]:
+                entries.append(entry)
+                for field in self._indexed_fields:
+                    partition["indexes"][field].setdefault(str(entry[2][field]), []).append(len(entries) - 1)
+            else:
+                # Out-of-order timestamp: insert in place and reindex this partition
+                entries.insert(bisect.bisect_right([existing[0] for existing in entries], entry[0]), entry)
+                self._rebuild_indexes(partition)
+
+            await self._state_manager.set_state(partition_key, partition, "STATE")
+        return record_key
+
+    async def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Find record keys in a time range, newest first.
+
+        Args:
+            start: Earliest timestamp to include
+            end: Latest timestamp to include
+            filters: Exact values required for indexed fields; None values are ignored
+            predicate: Additional condition on the indexed field values
+            limit: Maximum number of keys to return
+
+        Returns:
+            Matching record keys, most recent first
+        """
+        await self._ensure_backfilled()
+        filters = {field: value for field, value in (filters or {}).items() if value is not None}
+        start_iso = start.isoformat() if start else None
+        end_iso = end.isoformat() if end else None
+
+        partition_keys = await self._partition_keys(start, end)
+        partitions = await self._load_partitions(partition_keys)
+
+        results = []
+        for partition_key in partition_keys:
+            partition = partitions.get(partition_key)
+            if partition is None:
+                continue
+            entries = partition["entries"]
+
+            # Narrow to the smallest index bucket among the filtered fields
+            positions = None
+            for field, value in filters.items():
+                bucket = partition["indexes"].get(field, {}).get(str(value), [])
+                if positions is None or len(bucket) < len(positions):
+                    positions = bucket
+            if positions is None:
+                positions = range(len(entries))
+
+            for position in reversed(positions):
+                timestamp, record_key, fields = entries[position]
+                if end_iso is not None and timestamp > end_iso:
+                    continue
+                if start_iso is not None and timestamp < start_iso:
+                    break
+                if any(str(fields.get(field)) != str(value) for field, value in filters.items()):
+                    continue
+                if predicate is not None and not predicate(fields):
+                    continue
+                results.append(record_key)
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
+
+    async def load(self, record_keys: List[str]) -> Dict[str, Any]:
+        """Load records in one bulk read."""
+        return await get_states_many(self._state_manager, record_keys)
+
+    async def drop_before(self, cutoff: datetime) -> Tuple[int, int]:
+        """
+        Delete partitions that end before the cutoff, along with their records.
+
+        Records are retained at partition granularity, so a partition that
+        contains the cutoff is kept whole.
+
+        Returns:
+            Tuple of partitions and records deleted
+        """
+        await self._ensure_backfilled()
+        partitions_dropped = records_dropped = 0
+        async with self._lock:
+            expired = [
+                key for key in await self._state_manager.list_keys(self.partition_prefix)
+                if (day := self._partition_date(key)) is not None and day + timedelta(days=1) <= cutoff
+            ]
+            partitions = await self._load_partitions(expired)
+            for partition_key in expired:
+                for _, record_key, _ in partitions.get(partition_key, {}).get("entries", []):
+                    await self._state_manager.delete_state(record_key, "STATE")
+                    records_dropped += 1
+                await self._state_manager.delete_state(partition_key, "STATE")
+                self._partitions.pop(partition_key, None)
+                partitions_dropped += 1
+        return partitions_dropped, records_dropped
+
+
+_stores: "weakref.WeakKeyDictionary[Any, Dict[str, HistoryStore]]" = weakref.WeakKeyDictionary()
+
+
+def get_history_store(state_manager, kind: str, indexed_fields: List[str]) -> HistoryStore:
+    """Get the history store of a kind for a state manager, creating it on first use."""
+    stores = _stores.setdefault(state_manager, {})
+    if kind not in stores:
+        stores[kind] = HistoryStore(state_manager, kind, indexed_fields)
+    return stores[kind]
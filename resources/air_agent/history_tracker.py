@@ -19,6 +19,8 @@ from .models import (
     AirAgentConfig,
     EffectivenessTracking
 )
+from .history_store import HistoryStore, get_history_store, serialize_record
+from .pattern_analyzer import PatternAggregates, get_pattern_aggregates
 
 logger = logging.getLogger(__name__)
 
@@ -356,44 +358,65 @@ async def get_decision_history(
             logger.warning("No state manager provided for decision history retrieval")
             return []
         
-        # Get all decision event keys
-        decision_keys = await _get_decision_event_keys(state_manager, lookback_period)
+        # Resolve time range and filters through the decision index, most recent first
+        store = _decision_store(state_manager)
+        start = datetime.now() - lookback_period if lookback_period else None
+        decision_keys = await store.query(
+            start=start,
+            filters={
+                "decision_agent": agent_filter,
+                "decision_type": decision_type_filter,
+                "phase_context": phase_filter
+            },
+            limit=max_events
+        )
         
-        # Retrieve and filter decision events
+        # Retrieve matching decision events in one bulk read
+        event_data_by_key = await store.load(decision_keys)
         decision_events = []
-        for key in decision_keys[:max_events * 2]:  # Get extra in case of filtering
+        for key in decision_keys:
             try:
-                event_data = await state_manager.get_state(key, "STATE")
+                event_data = event_data_by_key.get(key)
                 if event_data:
-                    decision_event = _deserialize_decision_event(event_data)
-                    
-                    # Apply filters
-                    if agent_filter and decision_event.decision_agent != agent_filter:
-                        continue
-                    if decision_type_filter and decision_event.decision_type.value != decision_type_filter:
-                        continue
-                    if phase_filter and decision_event.phase_context != phase_filter:
-                        continue
-                    
-                    decision_events.append(decision_event)
-                    
-                    if len(decision_events) >= max_events:
-                        break
-                        
+                    decision_events.append(_deserialize_decision_event(event_data))
             except Exception as e:
                 logger.warning(f"Error retrieving decision event {key}: {e}")
                 continue
         
-        # Sort by timestamp (most recent first)
-        decision_events.sort(key=lambda x: x.timestamp, reverse=True)
-        
-        return decision_events[:max_events]
+        return decision_events
         
     except Exception as e:
         logger.error(f"Error retrieving decision history: {str(e)}")
         return []
 
 
+async def get_decision_aggregates(state_manager=None, max_events: int = 10000) -> PatternAggregates:
+    """
+    Get the incrementally maintained decision pattern statistics.
+    
+    On first use in a process the statistics are rebuilt from the stored
+    decision history inside the aggregation window; afterwards they are
+    updated as decisions are tracked.
+    
+    Args:
+        state_manager: State manager the decisions are stored in
+        max_events: Maximum number of stored decisions read when rebuilding
+        
+    Returns:
+        Pattern aggregates for the state manager
+    """
+    aggregates = get_pattern_aggregates(state_manager)
+    if not aggregates.warmed and state_manager:
+        decision_events = await get_decision_history(
+            lookback_period=aggregates.window,
+            max_events=max_events,
+            state_manager=state_manager
+        )
+        aggregates.rebuild(decision_events)
+        logger.info(f"Rebuilt decision pattern aggregates from {len(decision_events)} stored decisions")
+    return aggregates
+
+
 async def clear_old_history(
     retention_days: int = 90,
     state_manager=None,
@@ -416,35 +439,10 @@ async def clear_old_history(
         
         cutoff_date = datetime.now() - timedelta(days=retention_days)
         
-        # Clean up decision events
-        decision_keys = await _get_decision_event_keys(state_manager, None)
-        decisions_cleaned = 0
-        
-        for key in decision_keys:
-            try:
-                event_data = await state_manager.get_state(key, "STATE")
-                if event_data:
-                    event_timestamp = datetime.fromisoformat(event_data.get("timestamp", ""))
-                    if event_timestamp < cutoff_date:
-                        await state_manager.delete_state(key, "STATE")
-                        decisions_cleaned += 1
-            except Exception as e:
-                logger.warning(f"Error cleaning decision event {key}: {e}")
-        
-        # Clean up Fire interventions
-        fire_keys = await _get_fire_intervention_keys(state_manager, None)
-        interventions_cleaned = 0
-        
-        for key in fire_keys:
-            try:
-                intervention_data = await state_manager.get_state(key, "STATE")
-                if intervention_data:
-                    intervention_timestamp = datetime.fromisoformat(intervention_data.get("timestamp", ""))
-                    if intervention_timestamp < cutoff_date:
-                        await state_manager.delete_state(key, "STATE")
-                        interventions_cleaned += 1
-            except Exception as e:
-                logger.warning(f"Error cleaning Fire intervention {key}: {e}")
+        # Drop whole daily partitions that end before the cutoff
+        decision_partitions, decisions_cleaned = await _decision_store(state_manager).drop_before(cutoff_date)
+        fire_partitions, interventions_cleaned = await _fire_store(state_manager).drop_before(cutoff_date)
+        get_pattern_aggregates(state_manager).expire_before(cutoff_date)
         
         # Track cleanup metrics
         if health_tracker:
@@ -455,6 +453,7 @@ async def clear_old_history(
             "success": True,
             "decisions_cleaned": decisions_cleaned,
             "interventions_cleaned": interventions_cleaned,
+            "partitions_dropped": decision_partitions + fire_partitions,
             "cutoff_date": cutoff_date.isoformat(),
             "cleanup_timestamp": datetime.now().isoformat()
         }
@@ -536,11 +535,30 @@ def _extract_effective_techniques(decomposition_result: Dict[str, Any]) -> List[
 
 # Storage and retrieval helpers
 
+def _decision_store(state_manager) -> HistoryStore:
+    """Decision events indexed by agent, decision type and phase."""
+    return get_history_store(state_manager, "decision_event", ["decision_agent", "decision_type", "phase_context"])
+
+
+def _fire_store(state_manager) -> HistoryStore:
+    """Fire interventions indexed by intervention context."""
+    return get_history_store(state_manager, "fire_intervention", ["intervention_context"])
+
+
 async def _store_decision_event(state_manager, decision_event: DecisionEvent):
     """Store decision event in state manager."""
     try:
-        key = f"air_agent:decision_event:{decision_event.event_id}"
-        await state_manager.set_state(key, decision_event.__dict__, "STATE")
+        await _decision_store(state_manager).add(
+            decision_event.event_id,
+            decision_event.timestamp,
+            serialize_record(decision_event),
+            {
+                "decision_agent": decision_event.decision_agent,
+                "decision_type": decision_event.decision_type.value,
+                "phase_context": decision_event.phase_context
+            }
+        )
+        get_pattern_aggregates(state_manager).observe(decision_event)
     except Exception as e:
         logger.warning(f"Failed to store decision event: {e}")
 
@@ -557,64 +575,47 @@ async def _store_refinement_cycle(state_manager, cycle_summary: Dict[str, Any]):
 async def _store_fire_intervention(state_manager, fire_intervention: FireIntervention):
     """Store Fire intervention in state manager."""
     try:
-        key = f"air_agent:fire_intervention:{fire_intervention.intervention_id}"
-        await state_manager.set_state(key, fire_intervention.__dict__, "STATE")
+        await _fire_store(state_manager).add(
+            fire_intervention.intervention_id,
+            fire_intervention.timestamp,
+            serialize_record(fire_intervention),
+            {"intervention_context": fire_intervention.intervention_context}
+        )
     except Exception as e:
         logger.warning(f"Failed to store Fire intervention: {e}")
 
 
 async def _get_decision_event_keys(state_manager, lookback_period: Optional[timedelta]) -> List[str]:
-    """Get decision event keys from state manager."""
+    """Get decision event keys within the lookback period, most recent first."""
     try:
-        # This is a simplified implementation - in practice would use state manager's query capabilities
-        all_keys = await state_manager.list_keys("air_agent:decision_event:")
-        
-        if lookback_period:
-            cutoff_time = datetime.now() - lookback_period
-            filtered_keys = []
-            
-            for key in all_keys:
-                try:
-                    event_data = await state_manager.get_state(key, "STATE")
-                    if event_data:
-                        event_timestamp = datetime.fromisoformat(event_data.get("timestamp", ""))
-                        if event_timestamp >= cutoff_time:
-                            filtered_keys.append(key)
-                except Exception:
-                    continue
-            
-            return filtered_keys
-        
-        return all_keys
-        
+        start = datetime.now() - lookback_period if lookback_period else None
+        return await _decision_store(state_manager).query(start=start)
     except Exception as e:
         logger.warning(f"Error getting decision event keys: {e}")
         return []
 
 
-async def _get_fire_intervention_keys(state_manager, lookback_period: Optional[timedelta]) -> List[str]:
-    """Get Fire intervention keys from state manager."""
+async def _get_fire_intervention_keys(
+    state_manager,
+    lookback_period: Optional[timedelta],
+    context_filter: Optional[str] = None,
+    max_results: Optional[int] = None
+) -> List[str]:
+    """
+    Get Fire intervention keys within the lookback period, most recent first.
+    
+    Args:
+        state_manager: State manager for data retrieval
+        lookback_period: Time period to look back
+        context_filter: Only include interventions whose context contains this string
+        max_results: Maximum number of keys to return
+    """
     try:
-        all_keys = await state_manager.list_keys("air_agent:fire_intervention:")
-        
-        if lookback_period:
-            cutoff_time = datetime.now() - lookback_period
-            filtered_keys = []
-            
-            for key in all_keys:
-                try:
-                    intervention_data = await state_manager.get_state(key, "STATE")
-                    if intervention_data:
-                        intervention_timestamp = datetime.fromisoformat(intervention_data.get("timestamp", ""))
-                        if intervention_timestamp >= cutoff_time:
-                            filtered_keys.append(key)
-                except Exception:
-                    continue
-            
-            return filtered_keys
-        
-        return all_keys
-        
+        start = datetime.now() - lookback_period if lookback_period else None
+        predicate = None
+        if context_filter:
+            predicate = lambda fields: context_filter in (fields.get("intervention_context") or "")
+        return await _fire_store(state_manager).query(start=start, predicate=predicate, limit=max_results)
     except Exception as e:
         logger.warning(f"Error getting Fire intervention keys: {e}")
         return []
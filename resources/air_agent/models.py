@@ -121,7 +121,7 @@ class DecisionPattern:
     
     # Actionable insights
     recommendations: List[str]
-    anti_patterns: List[str]  # Patterns to avoid
+    anti_patterns: List[str] = field(default_factory=list)  # Patterns to avoid
     
     # Supporting evidence
     supporting_events: List[str] = field(default_factory=list)
@@ -3,12 +3,19 @@ Air Agent pattern analysis functionality.
 
 This module analyzes historical decision data to identify patterns, trends,
 and insights that can inform future decision-making.
+
+Patterns are built from grouped success/failure statistics. PatternAggregates
+maintains those statistics incrementally as decisions are tracked, so context
+provision reads precomputed groups; the list-based analysis functions compute
+the same statistics from a decision list in one pass.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Set, Tuple
+from datetime import date, datetime, timedelta
+from collections import Counter
 
 from .models import (
     DecisionEvent,
@@ -22,6 +29,248 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+GROUP_DIMENSIONS = (
+    "by_type", "by_hour", "by_phase", "by_agent", "by_rationale_keywords", "by_error_keywords"
+)
+
+
+@dataclass
+class OutcomeStats:
+    """Running statistics for the decisions of one outcome within a group."""
+    count: int = 0
+    first_observed: Optional[datetime] = None
+    last_observed: Optional[datetime] = None
+    decision_types: Set[str] = field(default_factory=set)
+    contexts: Set[str] = field(default_factory=set)
+    rationale_keywords: Counter = field(default_factory=Counter)
+    event_ids: List[str] = field(default_factory=list)
+    
+    def add(self, decision: DecisionEvent, keywords: List[str], max_event_ids: int) -> None:
+        self.count += 1
+        if self.first_observed is None or decision.timestamp < self.first_observed:
+            self.first_observed = decision.timestamp
+        if self.last_observed is None or decision.timestamp > self.last_observed:
+            self.last_observed = decision.timestamp
+        self.decision_types.add(decision.decision_type.value)
+        if decision.phase_context:
+            self.contexts.add(decision.phase_context)
+        self.rationale_keywords.update(keywords)
+        self.event_ids.append(decision.event_id)
+        if len(self.event_ids) > max_event_ids:
+            del self.event_ids[0]
+    
+    def merge(self, other: "OutcomeStats", max_event_ids: int) -> None:
+        self.count += other.count
+        if other.first_observed and (self.first_observed is None or other.first_observed < self.first_observed):
+            self.first_observed = other.first_observed
+        if other.last_observed and (self.last_observed is None or other.last_observed > self.last_observed):
+            self.last_observed = other.last_observed
+        self.decision_types |= other.decision_types
+        self.contexts |= other.contexts
+        self.rationale_keywords.update(other.rationale_keywords)
+        self.event_ids.extend(other.event_ids)
+        if len(self.event_ids) > max_event_ids:
+            del self.event_ids[:-max_event_ids]
+
+
+@dataclass
+class AggregateSnapshot:
+    """
+    Decision statistics grouped by dimension and outcome.
+    
+    ``groups`` maps ``(dimension, key)`` - e.g. ``("by_agent", "evolution")`` -
+    to per-outcome statistics keyed by outcome value.
+    """
+    total: int = 0
+    outcome_counts: Counter = field(default_factory=Counter)
+    first_observed: Optional[datetime] = None
+    last_observed: Optional[datetime] = None
+    groups: Dict[Tuple[str, Any], Dict[str, OutcomeStats]] = field(default_factory=dict)
+    
+    def add(self, decision: DecisionEvent, max_event_ids: int) -> None:
+        outcome = decision.decision_outcome.value
+        self.total += 1
+        self.outcome_counts[outcome] += 1
+        if self.first_observed is None or decision.timestamp < self.first_observed:
+            self.first_observed = decision.timestamp
+        if self.last_observed is None or decision.timestamp > self.last_observed:
+            self.last_observed = decision.timestamp
+        
+        rationale_keywords = _extract_keywords_from_rationale(decision.decision_rationale)
+        for group_key in _group_keys(decision, rationale_keywords):
+            stats = self.groups.setdefault(group_key, {}).setdefault(outcome, OutcomeStats())
+            # Only agent groups report their common rationale keywords
+            stats.add(decision, rationale_keywords if group_key[0] == "by_agent" else [], max_event_ids)
+    
+    def merge(self, other: "AggregateSnapshot", max_event_ids: int) -> None:
+        self.total += other.total
+        self.outcome_counts.update(other.outcome_counts)
+        if other.first_observed and (self.first_observed is None or other.first_observed < self.first_observed):
+            self.first_observed = other.first_observed
+        if other.last_observed and (self.last_observed is None or other.last_observed > self.last_observed):
+            self.last_observed = other.last_observed
+        for group_key, outcomes in other.groups.items():
+            group = self.groups.setdefault(group_key, {})
+            for outcome, stats in outcomes.items():
+                group.setdefault(outcome, OutcomeStats()).merge(stats, max_event_ids)
+    
+    def groups_of(self, dimension: str) -> List[Tuple[Any, Dict[str, OutcomeStats]]]:
+        """List the (key, outcomes) groups of a dimension."""
+        return [(key, outcomes) for (group_dimension, key), outcomes in self.groups.items() if group_dimension == dimension]
+
+
+class PatternAggregates:
+    """
+    Decision pattern statistics maintained incrementally as decisions are tracked.
+    
+    Statistics are bucketed per (agent, decision type, phase) cell and per day,
+    so a query merges the day buckets of the matching cells inside its window
+    rather than regrouping every decision. Buckets that fall out of the window
+    are dropped once a day. ``from_events`` builds the same statistics from a
+    decision list in one pass, which is the batch path used by the list-based
+    analysis functions and by ``verify``.
+    """
+    
+    def __init__(self, window: Optional[timedelta] = timedelta(days=30), max_event_ids: int = 50):
+        """
+        Args:
+            window: How long decisions are retained; None keeps everything
+            max_event_ids: Supporting event IDs kept per group and outcome
+        """
+        self.window = window
+        self.max_event_ids = max_event_ids
+        self.warmed = False
+        self._cells: Dict[Tuple[str, str, str], Dict[date, AggregateSnapshot]] = {}
+        self._observed = 0
+        self._last_expiry: Optional[date] = None
+    
+    @classmethod
+    def from_events(cls, decision_events: List[DecisionEvent], max_event_ids: Optional[int] = None) -> "PatternAggregates":
+        """Batch-compute aggregates from a decision list."""
+        aggregates = cls(window=None, max_event_ids=max_event_ids or max(len(decision_events), 1))
+        aggregates.rebuild(decision_events)
+        return aggregates
+    
+    def observe(self, decision: DecisionEvent) -> None:
+        """Add a tracked decision to the statistics."""
+        cell_key = (decision.decision_agent, decision.decision_type.value, decision.phase_context or "unknown")
+        buckets = self._cells.setdefault(cell_key, {})
+        day = decision.timestamp.date()
+        if day not in buckets:
+            buckets[day] = AggregateSnapshot()
+        buckets[day].add(decision, self.max_event_ids)
+        self._observed += 1
+        
+        today = date.today()
+        if self.window is not None and self._last_expiry != today:
+            self._last_expiry = today
+            self.expire_before(datetime.now() - self.window)
+    
+    def rebuild(self, decision_events: List[DecisionEvent]) -> None:
+        """Replace the statistics with ones computed from a decision list."""
+        self._cells = {}
+        self._observed = 0
+        for decision in decision_events:
+            self.observe(decision)
+        self.warmed = True
+    
+    def expire_before(self, cutoff: datetime) -> int:
+        """
+        Drop day buckets that end before the cutoff.
+        
+        Returns:
+            Number of buckets dropped
+        """
+        dropped = 0
+        for cell_key in list(self._cells):
+            buckets = self._cells[cell_key]
+            for day in [day for day in buckets if day < cutoff.date()]:
+                del buckets[day]
+                dropped += 1
+            if not buckets:
+                del self._cells[cell_key]
+        return dropped
+    
+    def snapshot(
+        self,
+        agent: Optional[str] = None,
+        decision_types: Optional[List[str]] = None,
+        phase: Optional[str] = None,
+        start: Optional[datetime] = None
+    ) -> AggregateSnapshot:
+        """
+        Merge the statistics of matching decisions.
+        
+        Args:
+            agent: Only include decisions by this agent
+            decision_types: Only include these decision type values
+            phase: Only include decisions in this phase context
+            start: Only include day buckets from this date on; the window is
+                rounded down to the start of the day
+            
+        Returns:
+            Merged statistics
+        """
+        result = AggregateSnapshot()
+        start_day = start.date() if start else None
+        for (cell_agent, cell_type, cell_phase), buckets in self._cells.items():
+            if agent is not None and cell_agent != agent:
+                continue
+            if decision_types is not None and cell_type not in decision_types:
+                continue
+            if phase is not None and cell_phase != phase:
+                continue
+            for day in sorted(buckets):
+                if start_day is None or day >= start_day:
+                    result.merge(buckets[day], self.max_event_ids)
+        return result
+    
+    def verify(self, decision_events: List[DecisionEvent], **scope) -> List[str]:
+        """
+        Compare the incremental statistics with a batch recompute.
+        
+        Args:
+            decision_events: The decisions the statistics should reflect
+            **scope: Snapshot filters applied to both sides
+            
+        Returns:
+            Descriptions of differing counts; empty when consistent
+        """
+        batch = PatternAggregates.from_events(decision_events).snapshot(**scope)
+        incremental = self.snapshot(**scope)
+        
+        differences = []
+        if batch.outcome_counts != incremental.outcome_counts:
+            differences.append(f"outcomes: batch {dict(batch.outcome_counts)}, incremental {dict(incremental.outcome_counts)}")
+        for group_key in sorted(set(batch.groups) | set(incremental.groups), key=str):
+            batch_counts = {outcome: stats.count for outcome, stats in batch.groups.get(group_key, {}).items()}
+            incremental_counts = {outcome: stats.count for outcome, stats in incremental.groups.get(group_key, {}).items()}
+            if batch_counts != incremental_counts:
+                differences.append(f"{group_key}: batch {batch_counts}, incremental {incremental_counts}")
+        return differences
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get aggregate bookkeeping statistics."""
+        return {
+            "cells": len(self._cells),
+            "buckets": sum(len(buckets) for buckets in self._cells.values()),
+            "observed": self._observed,
+            "warmed": self.warmed
+        }
+
+
+_aggregates: "weakref.WeakKeyDictionary[Any, PatternAggregates]" = weakref.WeakKeyDictionary()
+
+
+def get_pattern_aggregates(state_manager) -> PatternAggregates:
+    """Get the pattern aggregates for a state manager, creating them on first use."""
+    if state_manager is None:
+        return PatternAggregates()
+    if state_manager not in _aggregates:
+        _aggregates[state_manager] = PatternAggregates()
+    return _aggregates[state_manager]
+
+
 async def analyze_decision_patterns(
     decision_events: List[DecisionEvent],
     pattern_types: Optional[List[str]] = None,
@@ -45,30 +294,8 @@ async def analyze_decision_patterns(
             logger.info("Insufficient events for pattern analysis")
             return []
         
-        patterns = []
-        
-        # Analyze success/failure patterns by decision type
-        type_patterns = await _analyze_decision_type_patterns(decision_events, min_frequency)
-        patterns.extend(type_patterns)
-        
-        # Analyze temporal patterns
-        temporal_patterns = await _analyze_temporal_patterns(decision_events, min_frequency)
-        patterns.extend(temporal_patterns)
-        
-        # Analyze contextual patterns
-        contextual_patterns = await _analyze_contextual_patterns(decision_events, min_frequency)
-        patterns.extend(contextual_patterns)
-        
-        # Analyze agent-specific patterns
-        agent_patterns = await _analyze_agent_patterns(decision_events, min_frequency)
-        patterns.extend(agent_patterns)
-        
-        # Filter by pattern types if specified
-        if pattern_types:
-            patterns = [p for p in patterns if any(pt in p.pattern_type for pt in pattern_types)]
-        
-        # Sort patterns by confidence and frequency
-        patterns.sort(key=lambda p: (p.confidence_level.value, p.frequency), reverse=True)
+        snapshot = PatternAggregates.from_events(decision_events).snapshot()
+        patterns = patterns_from_snapshot(snapshot, pattern_types, min_frequency)
         
         logger.info(f"Identified {len(patterns)} decision patterns")
         
@@ -96,61 +323,12 @@ async def identify_success_patterns(
     try:
         logger.info(f"Identifying success patterns from {len(decision_events)} events")
         
-        success_patterns = []
-        
-        # Filter successful decisions
-        successful_decisions = [
-            d for d in decision_events 
-            if d.decision_outcome == DecisionOutcome.SUCCESS
-        ]
-        
-        if len(successful_decisions) < 3:
-            return success_patterns
-        
-        # Group successful decisions by various attributes
-        success_groups = {
-            "by_agent": defaultdict(list),
-            "by_type": defaultdict(list),
-            "by_phase": defaultdict(list),
-            "by_rationale_keywords": defaultdict(list)
-        }
-        
-        # Populate success groups
-        for decision in successful_decisions:
-            success_groups["by_agent"][decision.decision_agent].append(decision)
-            success_groups["by_type"][decision.decision_type.value].append(decision)
-            success_groups["by_phase"][decision.phase_context or "unknown"].append(decision)
-            
-            # Extract keywords from rationale
-            keywords = _extract_keywords_from_rationale(decision.decision_rationale)
-            for keyword in keywords:
-                success_groups["by_rationale_keywords"][keyword].append(decision)
-        
-        # Analyze each group for patterns
-        for group_type, groups in success_groups.items():
-            for group_key, group_decisions in groups.items():
-                if len(group_decisions) >= 3:  # Minimum for pattern
-                    # Calculate success rate for this group
-                    total_decisions_in_group = len([
-                        d for d in decision_events
-                        if _decision_matches_group(d, group_type, group_key)
-                    ])
-                    
-                    if total_decisions_in_group > 0:
-                        success_rate = len(group_decisions) / total_decisions_in_group
-                        
-                        if success_rate >= success_threshold:
-                            pattern = _create_success_pattern(
-                                group_type, group_key, group_decisions, success_rate
-                            )
-                            success_patterns.append(pattern)
-        
-        # Sort by success rate and frequency
-        success_patterns.sort(key=lambda p: (p.success_rate, p.frequency), reverse=True)
+        snapshot = PatternAggregates.from_events(decision_events).snapshot()
+        success_patterns = success_patterns_from_snapshot(snapshot, success_threshold)
         
         logger.info(f"Identified {len(success_patterns)} success patterns")
         
-        return success_patterns[:10]  # Top 10 patterns
+        return success_patterns
         
     except Exception as e:
         logger.error(f"Error identifying success patterns: {str(e)}")
@@ -174,68 +352,118 @@ async def identify_failure_patterns(
     try:
         logger.info(f"Identifying failure patterns from {len(decision_events)} events")
         
-        failure_patterns = []
-        
-        # Filter failed decisions
-        failed_decisions = [
-            d for d in decision_events 
-            if d.decision_outcome == DecisionOutcome.FAILURE
-        ]
-        
-        if len(failed_decisions) < 2:
-            return failure_patterns
-        
-        # Group failed decisions by various attributes
-        failure_groups = {
-            "by_agent": defaultdict(list),
-            "by_type": defaultdict(list),
-            "by_phase": defaultdict(list),
-            "by_error_keywords": defaultdict(list)
-        }
-        
-        # Populate failure groups
-        for decision in failed_decisions:
-            failure_groups["by_agent"][decision.decision_agent].append(decision)
-            failure_groups["by_type"][decision.decision_type.value].append(decision)
-            failure_groups["by_phase"][decision.phase_context or "unknown"].append(decision)
-            
-            # Extract error keywords from failure factors
-            error_keywords = _extract_error_keywords(decision)
-            for keyword in error_keywords:
-                failure_groups["by_error_keywords"][keyword].append(decision)
-        
-        # Analyze each group for failure patterns
-        for group_type, groups in failure_groups.items():
-            for group_key, group_decisions in groups.items():
-                if len(group_decisions) >= 2:  # Minimum for failure pattern
-                    # Calculate failure rate for this group
-                    total_decisions_in_group = len([
-                        d for d in decision_events
-                        if _decision_matches_group(d, group_type, group_key)
-                    ])
-                    
-                    if total_decisions_in_group > 0:
-                        failure_rate = len(group_decisions) / total_decisions_in_group
-                        success_rate = 1.0 - failure_rate
-                        
-                        if success_rate <= failure_threshold:
-                            pattern = _create_failure_pattern(
-                                group_type, group_key, group_decisions, success_rate
-                            )
-                            failure_patterns.append(pattern)
-        
-        # Sort by failure frequency and failure rate
-        failure_patterns.sort(key=lambda p: (p.frequency, 1.0 - p.success_rate), reverse=True)
+        snapshot = PatternAggregates.from_events(decision_events).snapshot()
+        failure_patterns = failure_patterns_from_snapshot(snapshot, failure_threshold)
         
         logger.info(f"Identified {len(failure_patterns)} failure patterns")
         
-        return failure_patterns[:5]  # Top 5 failure patterns
+        return failure_patterns
         
     except Exception as e:
         logger.error(f"Error identifying failure patterns: {str(e)}")
         return []
 
 
+def patterns_from_snapshot(
+    snapshot: AggregateSnapshot,
+    pattern_types: Optional[List[str]] = None,
+    min_frequency: int = 3
+) -> List[DecisionPattern]:
+    """
+    Build decision patterns from aggregated statistics.
+    
+    Args:
+        snapshot: Aggregated decision statistics
+        pattern_types: Optional filter for specific pattern types
+        min_frequency: Minimum frequency for a pattern to be considered
+        
+    Returns:
+        Decision patterns sorted by confidence and frequency
+    """
+    if snapshot.total < min_frequency:
+        return []
+    
+    patterns = []
+    patterns.extend(_decision_type_patterns(snapshot, min_frequency))
+    patterns.extend(_temporal_patterns(snapshot, min_frequency))
+    patterns.extend(_contextual_patterns(snapshot, min_frequency))
+    patterns.extend(_agent_patterns(snapshot, min_frequency))
+    
+    # Filter by pattern types if specified
+    if pattern_types:
+        patterns = [p for p in patterns if any(pt in p.pattern_type for pt in pattern_types)]
+    
+    # Sort patterns by confidence and frequency
+    patterns.sort(key=lambda p: (p.confidence_level.value, p.frequency), reverse=True)
+    return patterns
+
+
+def success_patterns_from_snapshot(
+    snapshot: AggregateSnapshot,
+    success_threshold: float = 0.7
+) -> List[DecisionPattern]:
+    """
+    Build success patterns from aggregated statistics.
+    
+    Args:
+        snapshot: Aggregated decision statistics
+        success_threshold: Minimum success rate to consider a pattern
+        
+    Returns:
+        Top 10 success patterns
+    """
+    success = DecisionOutcome.SUCCESS.value
+    if snapshot.outcome_counts[success] < 3:
+        return []
+    
+    success_patterns = []
+    for group_type in ("by_agent", "by_type", "by_phase", "by_rationale_keywords"):
+        for group_key, outcomes in snapshot.groups_of(group_type):
+            successes = outcomes.get(success)
+            if successes is None or successes.count < 3:  # Minimum for pattern
+                continue
+            success_rate = successes.count / _group_total(outcomes)
+            if success_rate >= success_threshold:
+                success_patterns.append(_create_success_pattern(group_type, group_key, successes, success_rate))
+    
+    # Sort by success rate and frequency
+    success_patterns.sort(key=lambda p: (p.success_rate, p.frequency), reverse=True)
+    return success_patterns[:10]
+
+
+def failure_patterns_from_snapshot(
+    snapshot: AggregateSnapshot,
+    failure_threshold: float = 0.3
+) -> List[DecisionPattern]:
+    """
+    Build failure patterns from aggregated statistics.
+    
+    Args:
+        snapshot: Aggregated decision statistics
+        failure_threshold: Maximum success rate to consider a failure pattern
+        
+    Returns:
+        Top 5 failure patterns
+    """
+    failure = DecisionOutcome.FAILURE.value
+    if snapshot.outcome_counts[failure] < 2:
+        return []
+    
+    failure_patterns = []
+    for group_type in ("by_agent", "by_type", "by_phase", "by_error_keywords"):
+        for group_key, outcomes in snapshot.groups_of(group_type):
+            failures = outcomes.get(failure)
+            if failures is None or failures.count < 2:  # Minimum for failure pattern
+                continue
+            success_rate = 1.0 - failures.count / _group_total(outcomes)
+            if success_rate <= failure_threshold:
+                failure_patterns.append(_create_failure_pattern(group_type, group_key, failures, success_rate))
+    
+    # Sort by failure frequency and failure rate
+    failure_patterns.sort(key=lambda p: (p.frequency, 1.0 - p.success_rate), reverse=True)
+    return failure_patterns[:5]
+
+
 def calculate_pattern_confidence(
     pattern: DecisionPattern,
     total_events: int,
@@ -284,79 +512,88 @@ def calculate_pattern_confidence(
 
 # Helper functions for pattern analysis
 
-async def _analyze_decision_type_patterns(
-    decision_events: List[DecisionEvent],
-    min_frequency: int
-) -> List[DecisionPattern]:
-    """Analyze patterns by decision type."""
+def _group_keys(decision: DecisionEvent, rationale_keywords: List[str]) -> List[Tuple[str, Any]]:
+    """List the (dimension, key) groups a decision belongs to."""
+    group_keys = [
+        ("by_type", decision.decision_type.value),
+        ("by_hour", decision.timestamp.hour),
+        ("by_phase", decision.phase_context or "unknown"),
+        ("by_agent", decision.decision_agent)
+    ]
+    group_keys.extend(("by_rationale_keywords", keyword) for keyword in rationale_keywords)
+    group_keys.extend(("by_error_keywords", keyword) for keyword in dict.fromkeys(_extract_error_keywords(decision)))
+    return group_keys
+
+
+def _group_total(outcomes: Dict[str, OutcomeStats]) -> int:
+    return sum(stats.count for stats in outcomes.values())
+
+
+def _combined_stats(outcomes: Dict[str, OutcomeStats]) -> OutcomeStats:
+    combined = OutcomeStats()
+    for stats in outcomes.values():
+        combined.merge(stats, len(combined.event_ids) + len(stats.event_ids))
+    return combined
+
+
+def _success_rate(outcomes: Dict[str, OutcomeStats]) -> float:
+    successes = outcomes.get(DecisionOutcome.SUCCESS.value)
+    return (successes.count if successes else 0) / _group_total(outcomes)
+
+
+def _decision_type_patterns(snapshot: AggregateSnapshot, min_frequency: int) -> List[DecisionPattern]:
+    """Build patterns by decision type."""
     patterns = []
     
-    # Group by decision type
-    type_groups = defaultdict(list)
-    for decision in decision_events:
-        type_groups[decision.decision_type].append(decision)
-    
-    # Analyze each type
-    for decision_type, decisions in type_groups.items():
-        if len(decisions) >= min_frequency:
-            # Calculate success rate
-            successes = len([d for d in decisions if d.decision_outcome == DecisionOutcome.SUCCESS])
-            success_rate = successes / len(decisions)
-            
-            # Determine pattern type
-            if success_rate >= 0.7:
-                pattern_type = "success_pattern"
-                pattern_name = f"Successful {decision_type.value}"
-            elif success_rate <= 0.3:
-                pattern_type = "failure_pattern"
-                pattern_name = f"Problematic {decision_type.value}"
-            else:
-                pattern_type = "neutral_pattern"
-                pattern_name = f"Mixed {decision_type.value}"
-            
-            # Create pattern
-            pattern = DecisionPattern(
-                pattern_id=f"type_{decision_type.value}",
-                pattern_type=pattern_type,
-                pattern_name=pattern_name,
-                pattern_description=f"{decision_type.value} decisions show {success_rate:.0%} success rate",
-                decision_types=[decision_type],
-                contexts=list(set(d.phase_context for d in decisions if d.phase_context)),
-                frequency=len(decisions),
-                success_rate=success_rate,
-                preconditions=[f"Decision type: {decision_type.value}"],
-                outcomes=_analyze_common_outcomes(decisions),
-                confidence_level=PatternConfidence.MEDIUM,
-                first_observed=min(d.timestamp for d in decisions),
-                last_observed=max(d.timestamp for d in decisions),
-                recommendations=_generate_type_recommendations(decision_type, success_rate),
-                supporting_events=[d.event_id for d in decisions]
-            )
-            
-            patterns.append(pattern)
+    for type_value, outcomes in snapshot.groups_of("by_type"):
+        combined = _combined_stats(outcomes)
+        if combined.count < min_frequency:
+            continue
+        success_rate = _success_rate(outcomes)
+        decision_type = DecisionType(type_value)
+        
+        # Determine pattern type
+        if success_rate >= 0.7:
+            pattern_type = "success_pattern"
+            pattern_name = f"Successful {type_value}"
+        elif success_rate <= 0.3:
+            pattern_type = "failure_pattern"
+            pattern_name = f"Problematic {type_value}"
+        else:
+            pattern_type = "neutral_pattern"
+            pattern_name = f"Mixed {type_value}"
+        
+        patterns.append(DecisionPattern(
+            pattern_id=f"type_{type_value}",
+            pattern_type=pattern_type,
+            pattern_name=pattern_name,
+            pattern_description=f"{type_value} decisions show {success_rate:.0%} success rate",
+            decision_types=[decision_type],
+            contexts=list(combined.contexts),
+            frequency=combined.count,
+            success_rate=success_rate,
+            preconditions=[f"Decision type: {type_value}"],
+            outcomes=_analyze_common_outcomes(outcomes),
+            confidence_level=PatternConfidence.MEDIUM,
+            first_observed=combined.first_observed,
+            last_observed=combined.last_observed,
+            recommendations=_generate_type_recommendations(decision_type, success_rate),
+            supporting_events=combined.event_ids
+        ))
     
     return patterns
 
 
-async def _analyze_temporal_patterns(
-    decision_events: List[DecisionEvent],
-    min_frequency: int
-) -> List[DecisionPattern]:
-    """Analyze temporal patterns in decisions."""
+def _temporal_patterns(snapshot: AggregateSnapshot, min_frequency: int) -> List[DecisionPattern]:
+    """Build time-of-day patterns."""
     patterns = []
     
-    if len(decision_events) < min_frequency:
-        return patterns
-    
-    # Sort by timestamp
-    sorted_events = sorted(decision_events, key=lambda x: x.timestamp)
-    
-    # Analyze time-of-day patterns
-    hour_success_rates = _analyze_hour_patterns(sorted_events)
-    for hour, (count, success_rate) in hour_success_rates.items():
+    for hour, outcomes in sorted(snapshot.groups_of("by_hour"), key=lambda group: group[0]):
+        count = _group_total(outcomes)
+        success_rate = _success_rate(outcomes)
         if count >= min_frequency and (success_rate >= 0.8 or success_rate <= 0.2):
             pattern_type = "success_pattern" if success_rate >= 0.8 else "failure_pattern"
-            pattern = DecisionPattern(
+            patterns.append(DecisionPattern(
                 pattern_id=f"temporal_hour_{hour}",
                 pattern_type=pattern_type,
                 pattern_name=f"Hour {hour} Pattern",
@@ -368,95 +605,73 @@ async def _analyze_temporal_patterns(
                 preconditions=[f"Decision time: hour {hour}"],
                 outcomes=[f"{success_rate:.0%} success rate"],
                 confidence_level=PatternConfidence.LOW,
-                first_observed=min(d.timestamp for d in sorted_events),
-                last_observed=max(d.timestamp for d in sorted_events),
+                first_observed=snapshot.first_observed,
+                last_observed=snapshot.last_observed,
                 recommendations=[f"{'Favor' if success_rate >= 0.8 else 'Avoid'} decisions around hour {hour}"]
-            )
-            patterns.append(pattern)
+            ))
     
     return patterns
 
 
-async def _analyze_contextual_patterns(
-    decision_events: List[DecisionEvent],
-    min_frequency: int
-) -> List[DecisionPattern]:
-    """Analyze patterns based on decision context."""
+def _contextual_patterns(snapshot: AggregateSnapshot, min_frequency: int) -> List[DecisionPattern]:
+    """Build patterns by phase context."""
     patterns = []
     
-    # Group by phase context
-    phase_groups = defaultdict(list)
-    for decision in decision_events:
-        phase = decision.phase_context or "unknown"
-        phase_groups[phase].append(decision)
-    
-    # Analyze each phase
-    for phase, decisions in phase_groups.items():
-        if len(decisions) >= min_frequency:
-            successes = len([d for d in decisions if d.decision_outcome == DecisionOutcome.SUCCESS])
-            success_rate = successes / len(decisions)
-            
-            pattern = DecisionPattern(
-                pattern_id=f"context_{phase}",
-                pattern_type="context_pattern",
-                pattern_name=f"{phase} Context Pattern",
-                pattern_description=f"{phase} decisions show {success_rate:.0%} success rate",
-                decision_types=list(set(d.decision_type for d in decisions)),
-                contexts=[phase],
-                frequency=len(decisions),
-                success_rate=success_rate,
-                preconditions=[f"Phase context: {phase}"],
-                outcomes=_analyze_common_outcomes(decisions),
-                confidence_level=PatternConfidence.MEDIUM,
-                first_observed=min(d.timestamp for d in decisions),
-                last_observed=max(d.timestamp for d in decisions),
-                recommendations=_generate_context_recommendations(phase, success_rate)
-            )
-            
-            patterns.append(pattern)
+    for phase, outcomes in snapshot.groups_of("by_phase"):
+        combined = _combined_stats(outcomes)
+        if combined.count < min_frequency:
+            continue
+        success_rate = _success_rate(outcomes)
+        
+        patterns.append(DecisionPattern(
+            pattern_id=f"context_{phase}",
+            pattern_type="context_pattern",
+            pattern_name=f"{phase} Context Pattern",
+            pattern_description=f"{phase} decisions show {success_rate:.0%} success rate",
+            decision_types=[DecisionType(value) for value in combined.decision_types],
+            contexts=[phase],
+            frequency=combined.count,
+            success_rate=success_rate,
+            preconditions=[f"Phase context: {phase}"],
+            outcomes=_analyze_common_outcomes(outcomes),
+            confidence_level=PatternConfidence.MEDIUM,
+            first_observed=combined.first_observed,
+            last_observed=combined.last_observed,
+            recommendations=_generate_context_recommendations(phase, success_rate)
+        ))
     
     return patterns
 
 
-async def _analyze_agent_patterns(
-    decision_events: List[DecisionEvent],
-    min_frequency: int
-) -> List[DecisionPattern]:
-    """Analyze patterns specific to decision agents."""
+def _agent_patterns(snapshot: AggregateSnapshot, min_frequency: int) -> List[DecisionPattern]:
+    """Build patterns specific to decision agents."""
     patterns = []
     
-    # Group by agent
-    agent_groups = defaultdict(list)
-    for decision in decision_events:
-        agent_groups[decision.decision_agent].append(decision)
-    
-    # Analyze each agent
-    for agent, decisions in agent_groups.items():
-        if len(decisions) >= min_frequency:
-            successes = len([d for d in decisions if d.decision_outcome == DecisionOutcome.SUCCESS])
-            success_rate = successes / len(decisions)
-            
-            # Analyze agent-specific characteristics
-            common_rationales = _find_common_rationales(decisions)
-            
-            pattern = DecisionPattern(
-                pattern_id=f"agent_{agent}",
-                pattern_type="agent_pattern",
-                pattern_name=f"{agent} Agent Pattern",
-                pattern_description=f"{agent} decisions show {success_rate:.0%} success rate",
-                decision_types=list(set(d.decision_type for d in decisions)),
-                contexts=list(set(d.phase_context for d in decisions if d.phase_context)),
-                frequency=len(decisions),
-                success_rate=success_rate,
-                preconditions=[f"Decision agent: {agent}"],
-                outcomes=_analyze_common_outcomes(decisions),
-                confidence_level=PatternConfidence.MEDIUM,
-                first_observed=min(d.timestamp for d in decisions),
-                last_observed=max(d.timestamp for d in decisions),
-                recommendations=_generate_agent_recommendations(agent, success_rate, common_rationales)
-            )
-            
-            patterns.append(pattern)
+    for agent, outcomes in snapshot.groups_of("by_agent"):
+        combined = _combined_stats(outcomes)
+        if combined.count < min_frequency:
+            continue
+        success_rate = _success_rate(outcomes)
+        
+        # Most common rationale keywords for this agent
+        common_rationales = [keyword for keyword, _ in combined.rationale_keywords.most_common(3)]
+        
+        patterns.append(DecisionPattern(
+            pattern_id=f"agent_{agent}",
+            pattern_type="agent_pattern",
+            pattern_name=f"{agent} Agent Pattern",
+            pattern_description=f"{agent} decisions show {success_rate:.0%} success rate",
+            decision_types=[DecisionType(value) for value in combined.decision_types],
+            contexts=list(combined.contexts),
+            frequency=combined.count,
+            success_rate=success_rate,
+            preconditions=[f"Decision agent: {agent}"],
+            outcomes=_analyze_common_outcomes(outcomes),
+            confidence_level=PatternConfidence.MEDIUM,
+            first_observed=combined.first_observed,
+            last_observed=combined.last_observed,
+            recommendations=_generate_agent_recommendations(agent, success_rate, common_rationales)
+        ))
     
     return patterns
 
@@ -506,30 +721,15 @@ def _extract_error_keywords(decision: DecisionEvent) -> List[str]:
     return keywords
 
 
-def _decision_matches_group(decision: DecisionEvent, group_type: str, group_key: str) -> bool:
-    """Check if a decision matches a specific group criteria."""
-    if group_type == "by_agent":
-        return decision.decision_agent == group_key
-    elif group_type == "by_type":
-        return decision.decision_type.value == group_key
-    elif group_type == "by_phase":
-        return (decision.phase_context or "unknown") == group_key
-    elif group_type == "by_rationale_keywords":
-        return group_key in decision.decision_rationale.lower()
-    elif group_type == "by_error_keywords":
-        error_keywords = _extract_error_keywords(decision)
-        return group_key in error_keywords
-    
-    return False
 
 
 def _create_success_pattern(
     group_type: str,
     group_key: str,
-    decisions: List[DecisionEvent],
+    successes: OutcomeStats,
     success_rate: float
 ) -> DecisionPattern:
-    """Create a success pattern from grouped decisions."""
+    """Create a success pattern from a group's successful decisions."""
     pattern_name = f"Successful {group_key}"
     pattern_description = f"{group_key} shows {success_rate:.0%} success rate"
     
@@ -538,27 +738,27 @@ def _create_success_pattern(
         pattern_type="success_pattern",
         pattern_name=pattern_name,
         pattern_description=pattern_description,
-        decision_types=list(set(d.decision_type for d in decisions)),
-        contexts=list(set(d.phase_context for d in decisions if d.phase_context)),
-        frequency=len(decisions),
+        decision_types=[DecisionType(value) for value in successes.decision_types],
+        contexts=list(successes.contexts),
+        frequency=successes.count,
         success_rate=success_rate,
         preconditions=[f"{group_type}: {group_key}"],
-        outcomes=_analyze_common_outcomes(decisions),
+        outcomes=_analyze_common_outcomes({DecisionOutcome.SUCCESS.value: successes}),
         confidence_level=PatternConfidence.MEDIUM,
-        first_observed=min(d.timestamp for d in decisions),
-        last_observed=max(d.timestamp for d in decisions),
+        first_observed=successes.first_observed,
+        last_observed=successes.last_observed,
         recommendations=[f"Continue using {group_key} approach"],
-        supporting_events=[d.event_id for d in decisions]
+        supporting_events=list(successes.event_ids)
     )
 
 
 def _create_failure_pattern(
     group_type: str,
     group_key: str,
-    decisions: List[DecisionEvent],
+    failures: OutcomeStats,
     success_rate: float
 ) -> DecisionPattern:
-    """Create a failure pattern from grouped decisions."""
+    """Create a failure pattern from a group's failed decisions."""
     pattern_name = f"Problematic {group_key}"
     pattern_description = f"{group_key} shows only {success_rate:.0%} success rate"
     
@@ -567,69 +767,29 @@ def _create_failure_pattern(
         pattern_type="failure_pattern",
         pattern_name=pattern_name,
         pattern_description=pattern_description,
-        decision_types=list(set(d.decision_type for d in decisions)),
-        contexts=list(set(d.phase_context for d in decisions if d.phase_context)),
-        frequency=len(decisions),
+        decision_types=[DecisionType(value) for value in failures.decision_types],
+        contexts=list(failures.contexts),
+        frequency=failures.count,
         success_rate=success_rate,
         preconditions=[f"{group_type}: {group_key}"],
-        outcomes=_analyze_common_outcomes(decisions),
+        outcomes=_analyze_common_outcomes({DecisionOutcome.FAILURE.value: failures}),
         confidence_level=PatternConfidence.MEDIUM,
-        first_observed=min(d.timestamp for d in decisions),
-        last_observed=max(d.timestamp for d in decisions),
+        first_observed=failures.first_observed,
+        last_observed=failures.last_observed,
         recommendations=[f"Avoid or revise {group_key} approach"],
         anti_patterns=[f"Avoid {group_key} in similar contexts"],
-        supporting_events=[d.event_id for d in decisions]
+        supporting_events=list(failures.event_ids)
     )
 
 
-def _analyze_common_outcomes(decisions: List[DecisionEvent]) -> List[str]:
-    """Analyze common outcomes across decisions."""
-    outcomes = []
-    
-    # Count outcome types
-    outcome_counts = Counter(d.decision_outcome for d in decisions)
-    total = len(decisions)
-    
-    for outcome, count in outcome_counts.items():
-        percentage = (count / total) * 100
-        outcomes.append(f"{outcome.value}: {percentage:.0f}%")
-    
-    return outcomes
-
-
-def _analyze_hour_patterns(events: List[DecisionEvent]) -> Dict[int, Tuple[int, float]]:
-    """Analyze success patterns by hour of day."""
-    hour_data = defaultdict(lambda: {"total": 0, "success": 0})
-    
-    for event in events:
-        hour = event.timestamp.hour
-        hour_data[hour]["total"] += 1
-        if event.decision_outcome == DecisionOutcome.SUCCESS:
-            hour_data[hour]["success"] += 1
-    
-    # Calculate success rates
-    hour_success_rates = {}
-    for hour, data in hour_data.items():
-        if data["total"] > 0:
-            success_rate = data["success"] / data["total"]
-            hour_success_rates[hour] = (data["total"], success_rate)
-    
-    return hour_success_rates
-
-
-def _find_common_rationales(decisions: List[DecisionEvent]) -> List[str]:
-    """Find common rationale patterns across decisions."""
-    rationale_keywords = []
-    
-    for decision in decisions:
-        keywords = _extract_keywords_from_rationale(decision.decision_rationale)
-        rationale_keywords.extend(keywords)
-    
-    # Find most common keywords
-    keyword_counts = Counter(rationale_keywords)
-    common_keywords = [kw for kw, count in keyword_counts.most_common(3)]
-    
-    return common_keywords
+def _analyze_common_outcomes(outcomes: Dict[str, OutcomeStats]) -> List[str]:
+    """Summarize the outcome distribution of a group."""
+    total = _group_total(outcomes)
+    return [
+        f"{outcome}: {(stats.count / total) * 100:.0f}%"
+        for outcome, stats in outcomes.items()
+        if stats.count
+    ]
 
 
 def _generate_type_recommendations(decision_type: DecisionType, success_rate: float) -> List[str]:
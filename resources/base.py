@@ -11,6 +11,7 @@ import logging
 import random
 import threading
 import time
+import weakref
 from typing import Optional, Callable, Any, Awaitable, List, Dict
 
 # Define interface stubs to avoid circular imports
@@ -45,10 +46,11 @@ logger = logging.getLogger(__name__)
 
 # Import qasync utilities for event loop compatibility
 try:
-    from resources.events.qasync_utils import qasync_wait_for
+    from resources.events.qasync_utils import qasync_wait_for, qasync_timeout
 except ImportError:
     # Fallback if qasync_utils not available
     qasync_wait_for = asyncio.wait_for
+    qasync_timeout = asyncio.timeout
 
 def ensure_event_loop(context_name: str = "unknown") -> asyncio.AbstractEventLoop:
     """Ensure there's a running event loop or create one with qasync compatibility.
@@ -452,6 +454,13 @@ class ManagerConfig:
     writer_priority: bool = False              # Whether to prioritize writers over readers
     max_retry_count: int = 3                   # Maximum number of retries
     retry_backoff_factor: float = 1.5          # Multiplier for retry backoff
+    health_update_interval: float = 1.0        # Minimum seconds between success health updates
+
+class OperationMode(Enum):
+    """Protection tier for BaseManager.protected_operation"""
+    EXCLUSIVE = auto()  # One call per operation name at a time
+    READ = auto()       # No lock; the operation must not await while state is half-updated
+    WRITE = auto()      # One call per key at a time; EXCLUSIVE when no key is given
 
 # ErrorHandler has been moved to system_error_recovery.py
 
@@ -527,6 +536,13 @@ class BaseManager(ABC):
         
         # Set up operation-specific locks for thread safety
         self._operation_locks = {}
+        # Per-key write locks, dropped once no caller holds or waits on them
+        self._key_locks = weakref.WeakValueDictionary()
+        
+        # Successful operations not yet reported to the health tracker
+        self._health_success_count = 0
+        self._last_health_update = 0.0
+        self._health_update_due = True
         
         # Resource ownership tracking
         self._owned_resources = {}
@@ -866,6 +882,8 @@ class BaseManager(ABC):
 
     async def handle_operation_error(self, error: Exception, operation: str) -> None:
         """Handle errors in manager operations with standardized error handling"""
+        # Report the next success right away so recovery is visible
+        self._health_update_due = True
         try:
             # Get base component ID
             component_id = self.__class__.__name__.lower()
@@ -889,34 +907,60 @@ class BaseManager(ABC):
     async def protected_operation(self, 
                                 operation: str,
                                 func: Callable[[], Awaitable[Any]],
-                                timeout: Optional[float] = None) -> Any:
-        """Execute operation with error handling and timeout - circuit breaker removed"""
+                                timeout: Optional[float] = None,
+                                mode: OperationMode = OperationMode.EXCLUSIVE,
+                                key: Optional[str] = None) -> Any:
+        """Execute operation with error handling and timeout - circuit breaker removed
+        
+        Args:
+            operation: Operation name used for locking, errors and health reporting
+            func: Async callable performing the operation
+            timeout: Timeout in seconds, defaults to the manager's operation timeout
+            mode: READ runs without a lock, WRITE serializes calls sharing ``key``,
+                EXCLUSIVE serializes calls sharing the operation name
+            key: Resource key for WRITE operations
+        """
         try:
+            if mode is OperationMode.READ:
+                # Lock-free fast path
+                return await self._execute_protected(operation, func, timeout)
+            
+            lock = None
+            if mode is OperationMode.WRITE and key is not None:
+                lock = self._key_locks.get(key)
+                if lock is None:
+                    lock = self._key_locks[key] = asyncio.Lock()
+            
             # Direct execution with thread safety and timeout protection
             return await self._ensure_thread_safety(
                 operation, 
-                lambda: self._execute_protected(operation, func, timeout)
+                lambda: self._execute_protected(operation, func, timeout),
+                lock=lock
             )
         except Exception as e:
             await self.handle_operation_error(e, operation)
             raise
             
-    async def _ensure_thread_safety(self, operation_key: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+    async def _ensure_thread_safety(self, operation_key: str, operation: Callable[[], Awaitable[Any]],
+                                    lock: Optional[asyncio.Lock] = None) -> Any:
         """Ensure thread safety for operations using operation-specific locks
         
         Args:
             operation_key: Unique key for the operation to lock
             operation: Async callable to execute with thread safety
+            lock: Lock to use instead of the operation's own lock
             
         Returns:
             The result of the operation
         """
-        # Get or create a lock for this specific operation
-        if operation_key not in self._operation_locks:
-            self._operation_locks[operation_key] = asyncio.Lock()
+        if lock is None:
+            # Get or create a lock for this specific operation
+            if operation_key not in self._operation_locks:
+                self._operation_locks[operation_key] = asyncio.Lock()
+            lock = self._operation_locks[operation_key]
             
         # Execute with lock protection
-        async with self._operation_locks[operation_key]:
+        async with lock:
             # Debug logging for lock acquisition in high-contention scenarios
             logger.debug(f"Acquired lock for operation {operation_key} in {self.__class__.__name__}")
             
@@ -945,11 +989,10 @@ class BaseManager(ABC):
             timeout_value = timeout or (self._config.default_operation_timeout if hasattr(self, '_config') else 30.0)
             
             try:
-                # Ensure there's a running event loop for wait_for
-                ensure_event_loop(f"_execute_protected for {operation}")
-                
-                # Wrap operation execution in qasync-compatible wait_for()
-                result = await qasync_wait_for(func(), timeout=timeout_value)
+                # Enforce the timeout on the current task rather than wrapping
+                # the operation in a new one
+                async with qasync_timeout(timeout_value):
+                    result = await func()
             except asyncio.TimeoutError:
                 # Convert to ResourceTimeoutError with detailed context
                 error = ResourceTimeoutError(
@@ -962,15 +1005,7 @@ class BaseManager(ABC):
                 await self.handle_operation_error(error, operation)
                 raise error
 
-            # Update health status on successful operation
-            await self._health_tracker.update_health(
-                self.__class__.__name__.lower(),
-                HealthStatus(
-                    status="HEALTHY",
-                    source=self.__class__.__name__.lower(),
-                    description=f"Operation {operation} completed successfully"
-                )
-            )
+            await self._record_operation_success(operation)
             
             return result
             
@@ -979,6 +1014,32 @@ class BaseManager(ABC):
                 await self.handle_operation_error(e, operation)
             raise
         
+    async def _record_operation_success(self, operation: str) -> None:
+        """Update health status on successful operations, at most once per interval
+        
+        Successes in between are counted and reported with the next update.
+        """
+        self._health_success_count += 1
+        now = time.monotonic()
+        if not self._health_update_due and now - self._last_health_update < self._config.health_update_interval:
+            return
+            
+        success_count = self._health_success_count
+        self._health_success_count = 0
+        self._health_update_due = False
+        self._last_health_update = now
+        
+        component_id = self.__class__.__name__.lower()
+        await self._health_tracker.update_health(
+            component_id,
+            HealthStatus(
+                status="HEALTHY",
+                source=component_id,
+                description=f"Operation {operation} completed successfully",
+                metadata={"successful_operations": success_count}
+            )
+        )
+        
     async def protected_read(self, operation: Callable[[], Awaitable[Any]], 
                          timeout: Optional[float] = None) -> Any:
         """Execute a read operation with proper locking and timeout"""
@@ -1142,6 +1203,7 @@ __all__ = [
     'CleanupPolicy',
     'CleanupConfig',
     'ManagerConfig',
+    'OperationMode',
     'PrioritizedLockManager',
     'BaseManager',
     'DEFAULT_CACHE_CIRCUIT_CONFIG',
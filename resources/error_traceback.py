@@ -6,6 +6,7 @@ allowing for root cause identification and comprehensive error recovery.
 """
 
 import asyncio
+import bisect
 import logging
 import time
 import traceback
@@ -50,36 +51,82 @@ class TracebackEdge:
     metadata: Dict[str, Any] = field(default_factory=dict)
     weight: float = 1.0  # Weight for graph traversal algorithms
 
+def _insort(index: list, entry: tuple) -> None:
+    """Insert into a sorted list, appending directly in the common in-order case"""
+    if not index or entry >= index[-1]:
+        index.append(entry)
+    else:
+        bisect.insort(index, entry)
+
 class ErrorTracebackGraph:
     """
     Directed graph representing error propagation and relationships across the system.
     Enables traversal for root cause analysis and impact assessment.
+    
+    Edges have stable integer IDs, and adjacency indices are insertion-ordered
+    dicts used as sets, so removing an edge never shifts other references.
+    Nodes and edges are also kept in timestamp-sorted indices so pruning only
+    touches expired entries, and ERROR nodes are indexed by
+    (error_type, component_id) for similarity queries.
     """
     def __init__(self):
         self._nodes: Dict[str, TracebackNode] = {}
-        self._edges: List[TracebackEdge] = []
+        self._edges: Dict[int, TracebackEdge] = {}
+        self._next_edge_id = 0
         # Indices for faster lookups
-        self._node_type_index: DefaultDict[TracebackNodeType, List[str]] = defaultdict(list)
-        self._outgoing_edges: DefaultDict[str, List[int]] = defaultdict(list)  # node_id -> list of edge indices
-        self._incoming_edges: DefaultDict[str, List[int]] = defaultdict(list)  # node_id -> list of edge indices
-        self._relationship_index: DefaultDict[str, List[int]] = defaultdict(list)  # relationship -> list of edge indices
+        self._node_type_index: DefaultDict[TracebackNodeType, Dict[str, None]] = defaultdict(dict)
+        self._outgoing_edges: DefaultDict[str, Dict[int, None]] = defaultdict(dict)  # node_id -> edge IDs
+        self._incoming_edges: DefaultDict[str, Dict[int, None]] = defaultdict(dict)  # node_id -> edge IDs
+        self._relationship_index: DefaultDict[str, Dict[int, None]] = defaultdict(dict)  # relationship -> edge IDs
+        # Time-ordered indices of (timestamp, id)
+        self._node_time_index: List[Tuple[datetime, str]] = []
+        self._edge_time_index: List[Tuple[datetime, int]] = []
+        self._error_time_index: List[Tuple[datetime, str]] = []
+        # (error_type, component_id) -> time-ordered (timestamp, node_id) of ERROR nodes
+        self._error_key_index: DefaultDict[Tuple[str, str], List[Tuple[datetime, str]]] = defaultdict(list)
         # Locking for thread safety
         self._lock = asyncio.Lock()
         
+    @staticmethod
+    def _error_key(node: TracebackNode) -> Tuple[str, str]:
+        return (node.metadata.get("error_type", "unknown"), node.metadata.get("component_id", "unknown"))
+        
+    def _remove_sorted(self, index: list, entry: tuple) -> None:
+        position = bisect.bisect_left(index, entry)
+        if position < len(index) and index[position] == entry:
+            del index[position]
+        
     async def add_node(self, node: TracebackNode) -> str:
         """Add a node to the graph, returns the node ID"""
         async with self._lock:
-            if node.node_id in self._nodes:
+            existing = self._nodes.get(node.node_id)
+            if existing:
                 # Update metadata if node already exists
-                self._nodes[node.node_id].metadata.update(node.metadata)
+                if existing.node_type == TracebackNodeType.ERROR:
+                    old_key = self._error_key(existing)
+                    existing.metadata.update(node.metadata)
+                    new_key = self._error_key(existing)
+                    if new_key != old_key:
+                        entry = (existing.timestamp, existing.node_id)
+                        self._remove_sorted(self._error_key_index[old_key], entry)
+                        if not self._error_key_index[old_key]:
+                            del self._error_key_index[old_key]
+                        _insort(self._error_key_index[new_key], entry)
+                else:
+                    existing.metadata.update(node.metadata)
                 return node.node_id
                 
             self._nodes[node.node_id] = node
-            self._node_type_index[node.node_type].append(node.node_id)
+            self._node_type_index[node.node_type][node.node_id] = None
+            entry = (node.timestamp, node.node_id)
+            _insort(self._node_time_index, entry)
+            if node.node_type == TracebackNodeType.ERROR:
+                _insort(self._error_time_index, entry)
+                _insort(self._error_key_index[self._error_key(node)], entry)
             return node.node_id
     
     async def add_edge(self, edge: TracebackEdge) -> int:
-        """Add an edge to the graph, returns the edge index"""
+        """Add an edge to the graph, returns the edge ID"""
         async with self._lock:
             # Verify nodes exist
             if edge.source_id not in self._nodes:
@@ -88,12 +135,14 @@ class ErrorTracebackGraph:
                 raise ValueError(f"Target node {edge.target_id} does not exist")
                 
             # Add edge
-            edge_idx = len(self._edges)
-            self._edges.append(edge)
-            self._outgoing_edges[edge.source_id].append(edge_idx)
-            self._incoming_edges[edge.target_id].append(edge_idx)
-            self._relationship_index[edge.relationship].append(edge_idx)
-            return edge_idx
+            edge_id = self._next_edge_id
+            self._next_edge_id += 1
+            self._edges[edge_id] = edge
+            self._outgoing_edges[edge.source_id][edge_id] = None
+            self._incoming_edges[edge.target_id][edge_id] = None
+            self._relationship_index[edge.relationship][edge_id] = None
+            _insort(self._edge_time_index, (edge.timestamp, edge_id))
+            return edge_id
     
     async def get_node(self, node_id: str) -> Optional[TracebackNode]:
         """Get a node by ID"""
@@ -103,17 +152,38 @@ class ErrorTracebackGraph:
     async def get_nodes_by_type(self, node_type: TracebackNodeType) -> List[TracebackNode]:
         """Get all nodes of a given type"""
         async with self._lock:
-            return [self._nodes[node_id] for node_id in self._node_type_index.get(node_type, [])]
+            return [self._nodes[node_id] for node_id in self._node_type_index.get(node_type, {})]
+    
+    async def get_errors_since(self, cutoff: datetime, error_type: Optional[str] = None,
+                               component_id: Optional[str] = None) -> List[TracebackNode]:
+        """
+        Get ERROR nodes with timestamps at or after cutoff, oldest first.
+        
+        When both error_type and component_id are given only that
+        combination's index is searched.
+        """
+        async with self._lock:
+            if error_type is not None and component_id is not None:
+                index = self._error_key_index.get((error_type, component_id), [])
+            else:
+                index = self._error_time_index
+            start = bisect.bisect_left(index, (cutoff,))
+            nodes = [self._nodes[node_id] for _, node_id in index[start:]]
+            if error_type is not None and component_id is None:
+                nodes = [node for node in nodes if node.metadata.get("error_type") == error_type]
+            elif component_id is not None and error_type is None:
+                nodes = [node for node in nodes if node.metadata.get("component_id") == component_id]
+            return nodes
     
     async def get_outgoing_edges(self, node_id: str) -> List[TracebackEdge]:
         """Get all edges originating from a node"""
         async with self._lock:
-            return [self._edges[edge_idx] for edge_idx in self._outgoing_edges.get(node_id, [])]
+            return [self._edges[edge_idx] for edge_idx in self._outgoing_edges.get(node_id, {})]
     
     async def get_incoming_edges(self, node_id: str) -> List[TracebackEdge]:
         """Get all edges targeting a node"""
         async with self._lock:
-            return [self._edges[edge_idx] for edge_idx in self._incoming_edges.get(node_id, [])]
+            return [self._edges[edge_idx] for edge_idx in self._incoming_edges.get(node_id, {})]
     
     async def find_roots(self, node_id: str, max_depth: int = 10) -> List[str]:
         """
@@ -129,7 +199,7 @@ class ErrorTracebackGraph:
                     return
                 
                 visited.add(current_id)
-                incoming = [self._edges[edge_idx] for edge_idx in self._incoming_edges.get(current_id, [])]
+                incoming = [self._edges[edge_idx] for edge_idx in self._incoming_edges.get(current_id, {})]
                 
                 if not incoming:
                     # This is a root node (no incoming edges)
@@ -161,7 +231,7 @@ class ErrorTracebackGraph:
                     impacted.append(current_id)
                 
                 # Continue traversal down the chain
-                outgoing = [self._edges[edge_idx] for edge_idx in self._outgoing_edges.get(current_id, [])]
+                outgoing = [self._edges[edge_idx] for edge_idx in self._outgoing_edges.get(current_id, {})]
                 for edge in outgoing:
                     await dfs(edge.target_id, depth - 1)
             
@@ -288,70 +358,67 @@ class ErrorTracebackGraph:
         
         return trace
     
+    def _remove_edge(self, edge_id: int) -> None:
+        edge = self._edges.pop(edge_id, None)
+        if edge is None:
+            return
+        # Expired entries were already cut from the time index; this drops recent edges of removed nodes
+        self._remove_sorted(self._edge_time_index, (edge.timestamp, edge_id))
+        for index, key in ((self._outgoing_edges, edge.source_id),
+                           (self._incoming_edges, edge.target_id),
+                           (self._relationship_index, edge.relationship)):
+            edge_ids = index.get(key)
+            if edge_ids is not None:
+                edge_ids.pop(edge_id, None)
+                if not edge_ids:
+                    del index[key]
+    
     async def prune_old_entries(self, max_age: timedelta = timedelta(days=7)):
         """Remove entries older than max_age to prevent unbounded growth"""
         async with self._lock:
             cutoff = datetime.now() - max_age
             
-            # Find nodes to remove
-            nodes_to_remove = [
-                node_id for node_id, node in self._nodes.items()
-                if node.timestamp < cutoff
-            ]
+            # Expired entries are the prefix of each time index
+            node_end = bisect.bisect_left(self._node_time_index, (cutoff,))
+            nodes_to_remove = [node_id for _, node_id in self._node_time_index[:node_end]]
+            del self._node_time_index[:node_end]
             
-            # Find edges to remove (either connected to removed nodes or old themselves)
-            edges_to_remove = [
-                i for i, edge in enumerate(self._edges)
-                if edge.timestamp < cutoff or 
-                edge.source_id in nodes_to_remove or 
-                edge.target_id in nodes_to_remove
-            ]
+            edge_end = bisect.bisect_left(self._edge_time_index, (cutoff,))
+            edges_to_remove = [edge_id for _, edge_id in self._edge_time_index[:edge_end] if edge_id in self._edges]
+            del self._edge_time_index[:edge_end]
             
-            # Remove edges (need to update indices)
-            for edge_idx in sorted(edges_to_remove, reverse=True):
-                edge = self._edges[edge_idx]
-                self._outgoing_edges[edge.source_id].remove(edge_idx)
-                self._incoming_edges[edge.target_id].remove(edge_idx)
-                self._relationship_index[edge.relationship].remove(edge_idx)
-                # Remove the edge
-                self._edges.pop(edge_idx)
-                
-                # Update indices for shifted edges
-                for i in range(edge_idx, len(self._edges)):
-                    # Update all references to this edge
-                    for node_id, edges in self._outgoing_edges.items():
-                        for j, e_idx in enumerate(edges):
-                            if e_idx > edge_idx:
-                                self._outgoing_edges[node_id][j] -= 1
-                    
-                    for node_id, edges in self._incoming_edges.items():
-                        for j, e_idx in enumerate(edges):
-                            if e_idx > edge_idx:
-                                self._incoming_edges[node_id][j] -= 1
-                    
-                    for rel, edges in self._relationship_index.items():
-                        for j, e_idx in enumerate(edges):
-                            if e_idx > edge_idx:
-                                self._relationship_index[rel][j] -= 1
+            # Edges connected to removed nodes go too, whatever their age
+            for node_id in nodes_to_remove:
+                edges_to_remove.extend(self._outgoing_edges.get(node_id, {}))
+                edges_to_remove.extend(self._incoming_edges.get(node_id, {}))
+            
+            removed_edges = len(self._edges)
+            for edge_id in edges_to_remove:
+                self._remove_edge(edge_id)
+            removed_edges -= len(self._edges)
             
             # Remove nodes
+            error_end = bisect.bisect_left(self._error_time_index, (cutoff,))
+            del self._error_time_index[:error_end]
             for node_id in nodes_to_remove:
                 node = self._nodes.pop(node_id)
-                self._node_type_index[node.node_type].remove(node_id)
+                type_index = self._node_type_index[node.node_type]
+                del type_index[node_id]
                 
-                # Clean up empty lists
-                if not self._node_type_index[node.node_type]:
+                # Clean up empty indices
+                if not type_index:
                     del self._node_type_index[node.node_type]
                 
-                if node_id in self._outgoing_edges:
-                    del self._outgoing_edges[node_id]
-                
-                if node_id in self._incoming_edges:
-                    del self._incoming_edges[node_id]
+                if node.node_type == TracebackNodeType.ERROR:
+                    key = self._error_key(node)
+                    key_index = self._error_key_index.get(key)
+                    if key_index is not None:
+                        del key_index[:bisect.bisect_left(key_index, (cutoff,))]
+                        if not key_index:
+                            del self._error_key_index[key]
             
             # Log pruning stats
-            logger.info(f"Pruned {len(nodes_to_remove)} nodes and {len(edges_to_remove)} edges from error traceback graph")
-
+            logger.info(f"Pruned {len(nodes_to_remove)} nodes and {removed_edges} edges from error traceback graph")
 
 class ErrorTracebackManager:
     """
@@ -803,24 +870,19 @@ class ErrorTracebackManager:
         """Find recent similar errors for pattern recognition"""
         cutoff = datetime.now() - time_window
         
-        # Get all error nodes
-        error_nodes = await self._graph.get_nodes_by_type(TracebackNodeType.ERROR)
-        
-        # Filter by time, error type, and component
-        similar_errors = []
-        for node in error_nodes:
-            if (node.timestamp >= cutoff and 
-                node.metadata.get("error_type") == error_type and
-                node.metadata.get("component_id") == component_id):
-                similar_errors.append({
-                    "error_id": node.node_id,
-                    "timestamp": node.timestamp.isoformat(),
-                    "message": node.metadata.get("message", ""),
-                    "operation": node.metadata.get("operation", "unknown"),
-                    "resolved": node.metadata.get("resolved", False)
-                })
+        # Look up recent errors of this type in this component
+        error_nodes = await self._graph.get_errors_since(cutoff, error_type, component_id)
         
-        return similar_errors
+        return [
+            {
+                "error_id": node.node_id,
+                "timestamp": node.timestamp.isoformat(),
+                "message": node.metadata.get("message", ""),
+                "operation": node.metadata.get("operation", "unknown"),
+                "resolved": node.metadata.get("resolved", False)
+            }
+            for node in error_nodes
+        ]
     
     async def analyze_error_patterns(self) -> Dict[str, Any]:
         """
@@ -829,8 +891,7 @@ class ErrorTracebackManager:
         """
         # Get all error nodes from last 24 hours
         cutoff = datetime.now() - timedelta(hours=24)
-        error_nodes = await self._graph.get_nodes_by_type(TracebackNodeType.ERROR)
-        recent_errors = [node for node in error_nodes if node.timestamp >= cutoff]
+        recent_errors = await self._graph.get_errors_since(cutoff)
         
         # Group by component and error type
         component_errors = defaultdict(lambda: defaultdict(list))
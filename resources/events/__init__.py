@@ -7,6 +7,9 @@ with prioritization, batching, reliable delivery, and monitoring capabilities.
 # Re-export all public symbols for backward compatibility
 from .types import ResourceEventTypes, Event
 from .queue import EventQueue
+from .history import EventHistory
+from .fanout import MailboxPolicy
+from .schema_registry import EventSchemaRegistry, SchemaValidationMode
 from .monitoring import EventMonitor
 from .loop_management import EventLoopManager, ThreadLocalEventLoopStorage
 from .utils import get_llm_client
@@ -16,6 +19,10 @@ __all__ = [
     'ResourceEventTypes',
     'Event',
     'EventQueue',
+    'EventHistory',
+    'MailboxPolicy',
+    'EventSchemaRegistry',
+    'SchemaValidationMode',
     'EventMonitor',
     'EventLoopManager',
     'ThreadLocalEventLoopStorage',
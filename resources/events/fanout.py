@@ -0,0 +1,288 @@
+"""
+Per-subscriber mailboxes for concurrent event fan-out.
+
+Each subscription gets a bounded mailbox drained by its own worker task in
+the EventQueue processor loop. The dispatcher only enqueues into mailboxes,
+so a slow or failing subscriber delays nothing but its own mailbox. Failed
+deliveries are moved to a per-subscriber delayed retry queue instead of
+being retried in line. Mailboxes for plain (sync) callbacks can hand several
+queued events to one executor submission to cut thread hops.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MailboxPolicy(Enum):
+    """What a full subscriber mailbox does with a new event."""
+    BLOCK = "block"              # Dispatcher waits for space (no loss)
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued event
+    DROP_NEWEST = "drop_newest"  # Discard the incoming event
+
+
+# (payload, attempt, enqueued_at)
+_MailboxItem = Tuple[Dict[str, Any], int, float]
+
+
+class SubscriberMailbox:
+    """
+    Bounded mailbox and delivery worker for a single subscription.
+
+    Must only be used from the event loop that owns it (the EventQueue
+    processor loop). Delivery order per subscriber is preserved, except that
+    a due retry is delivered ahead of newer events.
+    """
+
+    def __init__(self,
+                 event_type: str,
+                 callback: Callable,
+                 deliver: Callable[[str, Dict[str, Any], Callable], Awaitable[bool]],
+                 retry_backoff: Callable[[int], Optional[float]],
+                 capacity: int = 1000,
+                 policy: MailboxPolicy = MailboxPolicy.BLOCK,
+                 on_closed: Optional[Callable[['SubscriberMailbox'], None]] = None,
+                 deliver_batch: Optional[Callable[[str, List[Dict[str, Any]], Callable],
+                                                  Awaitable[List[Optional[Exception]]]]] = None,
+                 batch_size: int = 1):
+        """
+        Initialize the mailbox.
+
+        Args:
+            event_type: Event type this subscription is for
+            callback: The subscriber callback
+            deliver: Coroutine performing one delivery attempt; returns False if
+                     the subscriber is gone and the mailbox should close
+            retry_backoff: Maps a failed attempt number to a retry delay, or None
+                           when retries are exhausted
+            capacity: Maximum number of queued events
+            policy: Behaviour when the mailbox is full
+            on_closed: Called once when the mailbox closes itself
+            deliver_batch: Optional coroutine delivering several payloads in one
+                           attempt; returns one exception (or None) per payload
+            batch_size: Maximum payloads per deliver_batch call (1 disables batching)
+        """
+        self.event_type = event_type
+        self.callback = callback
+        self._deliver = deliver
+        self._retry_backoff = retry_backoff
+        self._capacity = max(1, capacity)
+        self._policy = policy
+        self._on_closed = on_closed
+        self._deliver_batch = deliver_batch
+        self._batch_size = max(1, batch_size) if deliver_batch else 1
+
+        self._items: Deque[_MailboxItem] = deque()
+        self._has_items = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._worker: Optional[asyncio.Task] = None
+        self._retry_handles = set()
+        self._closed = False
+        self._in_flight = 0
+
+        # Statistics
+        self._delivered = 0
+        self._failed = 0
+        self._retried = 0
+        self._dropped = 0
+        self._batches = 0
+        self._max_depth = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._last_latency = 0.0
+
+    @property
+    def name(self) -> str:
+        """Readable subscriber name for logs and stats."""
+        callback = self.callback
+        return getattr(callback, '__qualname__', None) or repr(callback)
+
+    @property
+    def depth(self) -> int:
+        """Events queued or being delivered."""
+        return len(self._items) + self._in_flight
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def put(self, payload: Dict[str, Any]) -> bool:
+        """
+        Queue an event payload for delivery.
+
+        Returns:
+            bool: False if the payload was dropped or the mailbox is closed
+        """
+        if self._closed:
+            return False
+
+        while len(self._items) >= self._capacity:
+            if self._policy is MailboxPolicy.DROP_NEWEST:
+                self._dropped += 1
+                logger.debug(f"Mailbox for {self.name} on {self.event_type} full, dropping newest event")
+                return False
+            if self._policy is MailboxPolicy.DROP_OLDEST:
+                self._items.popleft()
+                self._dropped += 1
+                logger.debug(f"Mailbox for {self.name} on {self.event_type} full, dropping oldest event")
+                break
+            # Block until the worker frees a slot
+            self._has_space.clear()
+            await self._has_space.wait()
+            if self._closed:
+                return False
+
+        self._items.append((payload, 0, time.perf_counter()))
+        if len(self._items) > self._max_depth:
+            self._max_depth = len(self._items)
+        self._ensure_worker()
+        self._has_items.set()
+        return True
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self._closed:
+            if not self._items:
+                self._has_items.clear()
+                await self._has_items.wait()
+                continue
+
+            if self._batch_size > 1 and len(self._items) > 1:
+                count = min(self._batch_size, len(self._items))
+                batch = [self._items.popleft() for _ in range(count)]
+                self._has_space.set()
+                self._in_flight = count
+                try:
+                    await self._deliver_many(batch)
+                finally:
+                    self._in_flight = 0
+                continue
+
+            item = self._items.popleft()
+            self._has_space.set()
+            self._in_flight = 1
+            try:
+                if not await self._deliver_one(item):
+                    return
+            finally:
+                self._in_flight = 0
+
+    async def _deliver_one(self, item: _MailboxItem) -> bool:
+        """Deliver a single payload; returns False once the mailbox has closed itself."""
+        payload, attempt, enqueued_at = item
+        try:
+            delivered = await self._deliver(self.event_type, payload, self.callback)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._schedule_retry(payload, attempt, enqueued_at, e)
+            return True
+
+        if delivered is False:
+            self.close()
+            if self._on_closed:
+                self._on_closed(self)
+            return False
+        self._record_latency(time.perf_counter() - enqueued_at)
+        self._delivered += 1
+        return True
+
+    async def _deliver_many(self, batch: List[_MailboxItem]) -> None:
+        """Deliver several payloads in one attempt, retrying failures individually."""
+        try:
+            errors = await self._deliver_batch(self.event_type, [payload for payload, _, _ in batch],
+                                               self.callback)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            errors = [e] * len(batch)
+
+        self._batches += 1
+        now = time.perf_counter()
+        for (payload, attempt, enqueued_at), error in zip(batch, errors):
+            if error is None:
+                self._record_latency(now - enqueued_at)
+                self._delivered += 1
+            else:
+                self._schedule_retry(payload, attempt, enqueued_at, error)
+
+    def _schedule_retry(self, payload: Dict[str, Any], attempt: int,
+                        enqueued_at: float, error: Exception) -> None:
+        delay = self._retry_backoff(attempt)
+        if delay is None:
+            self._failed += 1
+            logger.error(f"Delivery of {self.event_type} to {self.name} failed after {attempt} retries: {error}")
+            return
+
+        logger.warning(f"Error delivering {self.event_type} to {self.name}: {error}, "
+                       f"retry {attempt + 1} in {delay:.2f}s")
+        self._retried += 1
+        loop = asyncio.get_running_loop()
+        handle = None
+
+        def requeue():
+            self._retry_handles.discard(handle)
+            if self._closed:
+                return
+            # Due retries go ahead of newer events
+            self._items.appendleft((payload, attempt + 1, enqueued_at))
+            self._ensure_worker()
+            self._has_items.set()
+
+        handle = loop.call_later(delay, requeue)
+        self._retry_handles.add(handle)
+
+    def _record_latency(self, latency: float) -> None:
+        self._last_latency = latency
+        self._latency_total += latency
+        if latency > self._latency_max:
+            self._latency_max = latency
+
+    def close(self) -> None:
+        """Stop the worker and discard queued events and pending retries."""
+        if self._closed:
+            return
+        self._closed = True
+        for handle in list(self._retry_handles):
+            handle.cancel()
+        self._retry_handles.clear()
+        self._items.clear()
+        # Release any dispatcher blocked on a full mailbox
+        self._has_space.set()
+        self._has_items.set()
+        worker = self._worker
+        if worker is not None and not worker.done():
+            try:
+                current = asyncio.current_task()
+            except RuntimeError:
+                current = None
+            if worker is not current:
+                worker.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivery statistics for this subscriber."""
+        delivered = self._delivered
+        return {
+            "subscriber": self.name,
+            "queue_depth": self.depth,
+            "max_queue_depth": self._max_depth,
+            "capacity": self._capacity,
+            "policy": self._policy.value,
+            "delivered": delivered,
+            "failed": self._failed,
+            "retried": self._retried,
+            "pending_retries": len(self._retry_handles),
+            "dropped": self._dropped,
+            "batches": self._batches,
+            "mean_latency_ms": (self._latency_total / delivered * 1000) if delivered else 0.0,
+            "max_latency_ms": self._latency_max * 1000,
+            "last_latency_ms": self._last_latency * 1000,
+        }
@@ -0,0 +1,273 @@
+"""
+Bounded event history with indexed queries.
+
+This module provides the EventHistory ring buffer used by EventQueue to keep
+recently emitted events for debugging and introspection. Appends are O(1),
+and per-event-type and per-correlation-id indexes let recent-event queries
+cost O(limit) instead of a scan over the whole history. Events evicted from
+the buffer can optionally be spilled to a JSON-lines file for post-mortem
+replay of long runs.
+"""
+import json
+import logging
+import os
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from .types import Event
+
+logger = logging.getLogger(__name__)
+
+
+class EventHistory:
+    """
+    Thread-safe fixed-capacity ring buffer of events.
+
+    Every appended event gets a monotonically increasing sequence number and
+    is stored at slot ``seq % capacity``. Secondary indexes map event types and
+    correlation ids to deques of sequence numbers in emit order; because the
+    oldest event is always evicted first, evicting only ever pops from the
+    left of those deques.
+    """
+
+    def __init__(self, capacity: int = 10000, spill_path: Optional[str] = None,
+                 spill_flush_size: int = 256):
+        """
+        Initialize the history.
+
+        Args:
+            capacity: Maximum number of events kept in memory
+            spill_path: Optional JSON-lines file receiving evicted events
+            spill_flush_size: Number of evicted events buffered before writing
+        """
+        if capacity <= 0:
+            raise ValueError(f"EventHistory capacity must be positive, got {capacity}")
+
+        self._capacity = capacity
+        self._slots: List[Optional[Event]] = [None] * capacity
+        self._next_seq = 0  # Sequence number of the next append
+        self._lock = threading.RLock()
+
+        self._by_type: Dict[str, Deque[int]] = {}
+        self._by_correlation: Dict[str, Deque[int]] = {}
+
+        self._spill_path = spill_path
+        self._spill_flush_size = max(1, spill_flush_size)
+        self._spill_buffer: List[str] = []
+        self._spilled_count = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of events held in memory."""
+        return self._capacity
+
+    @property
+    def _first_seq(self) -> int:
+        return max(0, self._next_seq - self._capacity)
+
+    def append(self, event: Event) -> None:
+        """Record an event, evicting the oldest one if the buffer is full."""
+        with self._lock:
+            seq = self._next_seq
+            if seq >= self._capacity:
+                self._evict(seq - self._capacity)
+
+            self._slots[seq % self._capacity] = event
+            self._next_seq = seq + 1
+
+            self._by_type.setdefault(event.event_type, deque()).append(seq)
+            if event.correlation_id is not None:
+                self._by_correlation.setdefault(event.correlation_id, deque()).append(seq)
+
+    def _evict(self, seq: int) -> None:
+        """Drop the oldest event (sequence ``seq``) from the indexes."""
+        event = self._slots[seq % self._capacity]
+        if event is None:
+            return
+
+        self._drop_index_entry(self._by_type, event.event_type, seq)
+        if event.correlation_id is not None:
+            self._drop_index_entry(self._by_correlation, event.correlation_id, seq)
+
+        if self._spill_path:
+            self._spill_buffer.append(self._serialize(event))
+            if len(self._spill_buffer) >= self._spill_flush_size:
+                self._flush_spill()
+
+    @staticmethod
+    def _drop_index_entry(index: Dict[str, Deque[int]], key: str, seq: int) -> None:
+        entries = index.get(key)
+        if entries and entries[0] == seq:
+            entries.popleft()
+            if not entries:
+                del index[key]
+
+    def _resolve(self, seqs) -> List[Event]:
+        return [self._slots[seq % self._capacity] for seq in seqs]
+
+    def get_recent(self, event_type: Optional[str] = None, limit: int = 100) -> List[Event]:
+        """
+        Get the most recent events, oldest first.
+
+        Args:
+            event_type: Optional event type to filter by
+            limit: Maximum number of events to return
+
+        Returns:
+            List[Event]: Up to ``limit`` events in emit order
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            if event_type is None:
+                start = max(self._first_seq, self._next_seq - limit)
+                return self._resolve(range(start, self._next_seq))
+
+            entries = self._by_type.get(event_type)
+            if not entries:
+                return []
+            seqs = list(islice(reversed(entries), limit))
+            seqs.reverse()
+            return self._resolve(seqs)
+
+    def get_by_correlation(self, correlation_id: str, limit: Optional[int] = None) -> List[Event]:
+        """
+        Get events sharing a correlation id, oldest first.
+
+        Args:
+            correlation_id: Correlation id to look up
+            limit: Optional maximum number of (most recent) events to return
+
+        Returns:
+            List[Event]: Matching events in emit order
+        """
+        with self._lock:
+            entries = self._by_correlation.get(correlation_id)
+            if not entries:
+                return []
+            if limit is None:
+                return self._resolve(entries)
+            seqs = list(islice(reversed(entries), limit))
+            seqs.reverse()
+            return self._resolve(seqs)
+
+    def count(self, event_type: Optional[str] = None) -> int:
+        """Count events held in memory, optionally for a single event type."""
+        with self._lock:
+            if event_type is None:
+                return self._next_seq - self._first_seq
+            return len(self._by_type.get(event_type, ()))
+
+    def get_event_types(self) -> Dict[str, int]:
+        """Get in-memory event counts keyed by event type."""
+        with self._lock:
+            return {event_type: len(seqs) for event_type, seqs in self._by_type.items()}
+
+    def snapshot(self) -> List[Event]:
+        """Copy of all in-memory events, oldest first."""
+        with self._lock:
+            return self._resolve(range(self._first_seq, self._next_seq))
+
+    def clear(self) -> None:
+        """Drop all in-memory events (already spilled events stay on disk)."""
+        with self._lock:
+            self.flush()
+            self._slots = [None] * self._capacity
+            self._next_seq = 0
+            self._by_type.clear()
+            self._by_correlation.clear()
+
+    # Spill-to-disk support
+
+    @staticmethod
+    def _serialize(event: Event) -> str:
+        try:
+            return event.to_json()
+        except Exception:
+            # Payloads holding non-JSON objects are recorded with their repr
+            return json.dumps({
+                "event_type": event.event_type,
+                "data": {k: repr(v) for k, v in (event.data or {}).items()},
+                "timestamp": str(event.timestamp),
+                "correlation_id": event.correlation_id,
+                "metadata": {k: repr(v) for k, v in (event.metadata or {}).items()},
+                "priority": getattr(event.priority, "value", event.priority),
+            })
+
+    def _flush_spill(self) -> None:
+        if not self._spill_buffer:
+            return
+        lines = self._spill_buffer
+        self._spill_buffer = []
+        try:
+            directory = os.path.dirname(self._spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self._spill_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines))
+                f.write("\n")
+            self._spilled_count += len(lines)
+        except OSError as e:
+            logger.error(f"Failed to spill {len(lines)} events to {self._spill_path}: {e}")
+
+    def flush(self) -> None:
+        """Write any buffered evicted events to the spill file."""
+        with self._lock:
+            if self._spill_path:
+                self._flush_spill()
+
+    def replay(self) -> Iterator[Event]:
+        """
+        Iterate over the full recorded history, oldest first.
+
+        Spilled events are read back from disk before the in-memory ones.
+        Unreadable spill lines are skipped.
+        """
+        self.flush()
+        if self._spill_path and os.path.exists(self._spill_path):
+            with open(self._spill_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield Event.from_json(line)
+                    except Exception as e:
+                        logger.debug(f"Skipping unreadable spilled event: {e}")
+        yield from self.snapshot()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get history size and spill statistics."""
+        with self._lock:
+            return {
+                "capacity": self._capacity,
+                "size": self._next_seq - self._first_seq,
+                "total_recorded": self._next_seq,
+                "event_types": len(self._by_type),
+                "correlation_ids": len(self._by_correlation),
+                "spill_path": self._spill_path,
+                "spilled": self._spilled_count,
+                "spill_pending": len(self._spill_buffer),
+            }
+
+    # Sequence protocol so callers can treat the history like the list it replaced
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self.snapshot())
+
+    def __getitem__(self, index):
+        return self.snapshot()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, EventHistory):
+            return self.snapshot() == other.snapshot()
+        if isinstance(other, (list, tuple)):
+            return self.snapshot() == list(other)
+        return NotImplemented
+
+    __hash__ = None
@@ -7,7 +7,8 @@ in qasync environments where standard asyncio methods may fail.
 
 import asyncio
 import logging
-from typing import Coroutine, Any, TypeVar
+from contextlib import asynccontextmanager
+from typing import Coroutine, Any, TypeVar, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -167,6 +168,49 @@ async def qasync_wait_for(coro_or_task, timeout: float = None) -> T:
         raise
 
 
+@asynccontextmanager
+async def qasync_timeout(timeout: Optional[float] = None):
+    """
+    qasync-compatible timeout for the body of an ``async with`` block.
+    
+    Unlike qasync_wait_for(), this does not run the work in a separate task.
+    It schedules a cancellation of the current task with loop.call_later and
+    converts that cancellation into asyncio.TimeoutError, so the fast path
+    costs one timer handle instead of a task per call.
+    
+    Args:
+        timeout: Timeout in seconds (None for no timeout)
+        
+    Raises:
+        asyncio.TimeoutError: If timeout is exceeded
+    """
+    task = asyncio.current_task() if timeout is not None else None
+    if task is None:
+        yield
+        return
+    
+    timeout_occurred = False
+    
+    def timeout_callback():
+        nonlocal timeout_occurred
+        if not task.done():
+            timeout_occurred = True
+            task.cancel()
+    
+    timeout_handle = task.get_loop().call_later(timeout, timeout_callback)
+    try:
+        yield
+    except asyncio.CancelledError:
+        if not timeout_occurred:
+            raise
+        # Withdraw our own cancellation request so the task can continue
+        if hasattr(task, "uncancel"):
+            task.uncancel()
+        raise asyncio.TimeoutError(f"Operation timed out after {timeout} seconds") from None
+    finally:
+        timeout_handle.cancel()
+
+
 async def qasync_sleep(delay: float) -> None:
     """
     qasync-compatible sleep function.
@@ -19,16 +19,31 @@ from typing import Dict, Any, List, Set, Optional, Callable, Awaitable, Tuple, U
 
 from .types import Event, ResourceEventTypes
 from .backpressure import EventBackpressureManager
-from .utils import wait_with_backoff, with_timeout
-
-# Import qasync utilities for event loop compatibility
-try:
-    from .qasync_utils import qasync_wait_for
-except ImportError:
-    qasync_wait_for = asyncio.wait_for
+from .history import EventHistory
+from .fanout import MailboxPolicy, SubscriberMailbox
+from .schema_registry import SchemaValidationMode, get_schema_registry
+from .utils import wait_with_backoff, with_timeout, ThreadPoolExecutorManager
 
 logger = logging.getLogger(__name__)
 
+# Worker counts for sync-callback delivery pools, keyed by event type prefix.
+# The longest matching prefix wins; "" is the fallback for all other events.
+DEFAULT_SYNC_DELIVERY_POOLS: Dict[str, int] = {"": 4}
+
+
+def _call_sync_batch(callback: Callable, event_type: str,
+                     payloads: List[Dict[str, Any]]) -> List[Optional[Exception]]:
+    """Call a sync subscriber once per payload inside one executor submission."""
+    errors: List[Optional[Exception]] = []
+    for payload in payloads:
+        try:
+            callback(event_type, payload)
+            errors.append(None)
+        except Exception as e:
+            errors.append(e)
+    return errors
+
+
 class EventQueue:
     """
     Thread-safe event queue with priority processing, backpressure, and batching.
@@ -37,7 +52,17 @@ class EventQueue:
     thread with its own event loop, and all communication with the queue is done through
     thread-safe message passing. This avoids cross-thread event loop access issues.
     """
-    def __init__(self, max_size: int = 1000, queue_id: Optional[str] = None):
+    def __init__(self, max_size: int = 1000, queue_id: Optional[str] = None,
+                 schema_validation: Union[str, SchemaValidationMode] = SchemaValidationMode.STRICT,
+                 schema_sample_rate: int = 100,
+                 history_size: int = 10000,
+                 history_spill_path: Optional[str] = None,
+                 delivery_mode: str = "fanout",
+                 subscriber_mailbox_size: int = 1000,
+                 subscriber_backpressure: Union[str, MailboxPolicy] = MailboxPolicy.BLOCK,
+                 sync_delivery_pools: Optional[Dict[str, int]] = None,
+                 sync_batch_size: int = 1,
+                 batch_linger: float = 0.0):
         # Queue configuration
         # Add type conversion and validation to prevent string issues
         if isinstance(max_size, str):
@@ -81,18 +106,45 @@ class EventQueue:
         self._normal_priority_queue = None
         self._low_priority_queue = None
         
-        # Async converter queue - used only by the processor thread
-        self._async_high_queue = None
-        self._async_normal_queue = None
-        self._async_low_queue = None
+        # Dispatcher state - the loop and wakeup signal live in the processor thread
+        self._processor_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup_event: Optional[asyncio.Event] = None
+        self._wakeup_pending = False
+        self._dispatch_busy = False
+        self._dispatch_wakeups = 0
+        self._normal_carry: Optional[Event] = None
+        # Seconds a lone normal event waits for batch companions; opt-in since it delays every lone event
+        self._batch_linger = max(0.0, batch_linger)
         
         # Resource management
         self._subscribers: Dict[str, Set[Callable[[str, Dict[str, Any]], Awaitable[None]]]] = {}
-        self._event_history: List[Event] = []
+        self._event_history = EventHistory(capacity=history_size, spill_path=history_spill_path)
         self._processing_retries: Dict[str, int] = {}
         self._max_retries = 3
         self._retry_delay = 1.0  # seconds
         
+        # Subscriber delivery: "fanout" delivers to all subscribers concurrently via
+        # per-subscriber mailboxes, "sequential" delivers one subscriber at a time
+        if delivery_mode not in ("fanout", "sequential"):
+            logger.error(f"Unknown delivery mode '{delivery_mode}', using fanout")
+            delivery_mode = "fanout"
+        self._delivery_mode = delivery_mode
+        self._mailbox_size = subscriber_mailbox_size
+        self._mailbox_policy = self._resolve_mailbox_policy(subscriber_backpressure)
+        # (event_type, callback) -> mailbox; only touched from the processor loop
+        self._mailboxes: Dict[Tuple[str, Callable], SubscriberMailbox] = {}
+        self._mailbox_drain_timeout = 1.0  # seconds allowed for mailboxes to drain on stop
+        
+        # Sync callbacks run in named pools from the shared executor manager,
+        # sized per event type class (prefix) instead of the loop's default executor
+        self._executor_manager = ThreadPoolExecutorManager.get_instance()
+        self._sync_delivery_pools = dict(sync_delivery_pools or DEFAULT_SYNC_DELIVERY_POOLS)
+        self._sync_delivery_pools.setdefault("", DEFAULT_SYNC_DELIVERY_POOLS[""])
+        self._sync_pool_cache: Dict[str, Tuple[str, int]] = {}
+        self._sync_batch_size = max(1, sync_batch_size)
+        # (event_type, callback) -> (capacity, policy) overrides given at subscribe time
+        self._subscriber_options: Dict[Tuple[str, Callable], Tuple[int, MailboxPolicy]] = {}
+        
         # State tracking
         self._running = False
         self._processor_thread = None
@@ -102,6 +154,29 @@ class EventQueue:
         # Initialize backpressure manager
         self._backpressure_manager = EventBackpressureManager()
         
+        # Payload schema validation, resolved through the shared precompiled registry
+        try:
+            self._schema_validation = SchemaValidationMode(
+                schema_validation.value if hasattr(schema_validation, 'value') else schema_validation
+            )
+        except ValueError:
+            logger.error(f"Unknown schema validation mode '{schema_validation}', using strict")
+            self._schema_validation = SchemaValidationMode.STRICT
+        self._schema_sample_rate = max(1, int(schema_sample_rate))
+        self._schema_sample_counters: Dict[str, int] = {}
+        self._schema_registry = get_schema_registry()
+        
+        # Emit-path timing counters (nanoseconds)
+        self._emit_stats_lock = threading.Lock()
+        self._emit_stats = {
+            "emit_count": 0,
+            "emit_time_ns": 0,
+            "max_emit_time_ns": 0,
+            "schema_time_ns": 0,
+            "validations": 0,
+            "validation_failures": 0,
+        }
+        
         # Ensure these are preserved for consistent thread identity
         self._processor_thread_id = None
         self._creation_thread_id = threading.get_ident()
@@ -150,123 +225,89 @@ class EventQueue:
         # Convert enum if needed
         event_type_str = event_type.value if hasattr(event_type, 'value') else str(event_type)
         
-        # Validate payload schema if available
+        emit_start = time.perf_counter_ns()
+        
+        # Complete and validate the payload against its precompiled schema
+        validated = None
         try:
-            import inspect
-            from resources.schemas import (
-                ValidationEventPayload,
-                ValidationStateChangedPayload, RefinementContextPayload,
-                RefinementIterationPayload, AgentUpdateRequestPayload,
-                # Phase Two schemas
-                ComponentEventPayload, TestEventPayload, IntegrationEventPayload,
-                # Phase Three schemas
-                FeatureEventPayload, OptimizationEventPayload, FeatureIntegrationPayload,
-                # Phase Four schemas
-                CodeGenerationPayload, CompilationPayload, RefinementIterationPayloadPhase4
-            )
-            
-            # Map event types to expected payload schemas
-            event_schema_mapping = {
-                # Phase 0 Earth Agent events
-                ResourceEventTypes.EARTH_VALIDATION_COMPLETE.value: ValidationEventPayload,
-                ResourceEventTypes.EARTH_VALIDATION_STARTED.value: ValidationEventPayload,
-                ResourceEventTypes.EARTH_VALIDATION_FAILED.value: ValidationEventPayload,
-                
-                # Phase One validation events
-                ResourceEventTypes.PHASE_ONE_VALIDATION_STATE_CHANGED.value: ValidationStateChangedPayload,
-                ResourceEventTypes.PHASE_ONE_VALIDATION_COMPLETED.value: ValidationStateChangedPayload,
-                ResourceEventTypes.PHASE_ONE_VALIDATION_FAILED.value: ValidationStateChangedPayload,
-                
-                # Phase One refinement events
-                ResourceEventTypes.PHASE_ONE_REFINEMENT_CREATED.value: RefinementContextPayload,
-                ResourceEventTypes.PHASE_ONE_REFINEMENT_UPDATED.value: RefinementContextPayload,
-                ResourceEventTypes.PHASE_ONE_REFINEMENT_COMPLETED.value: RefinementContextPayload,
-                ResourceEventTypes.PHASE_ONE_REFINEMENT_ITERATION.value: RefinementIterationPayload,
-                
-                # Agent update events
-                ResourceEventTypes.AGENT_UPDATE_REQUEST.value: AgentUpdateRequestPayload,
-                ResourceEventTypes.AGENT_UPDATE_COMPLETE.value: AgentUpdateRequestPayload,
-                ResourceEventTypes.AGENT_UPDATE_FAILED.value: AgentUpdateRequestPayload,
-                
-                # Phase Two component events
-                ResourceEventTypes.PHASE_TWO_COMPONENT_CREATED.value: ComponentEventPayload,
-                ResourceEventTypes.PHASE_TWO_COMPONENT_UPDATED.value: ComponentEventPayload,
-                ResourceEventTypes.PHASE_TWO_COMPONENT_DELETED.value: ComponentEventPayload,
-                
-                # Phase Two test events
-                ResourceEventTypes.PHASE_TWO_TEST_CREATED.value: TestEventPayload,
-                ResourceEventTypes.PHASE_TWO_TEST_EXECUTED.value: TestEventPayload,
-                ResourceEventTypes.PHASE_TWO_TEST_FAILED.value: TestEventPayload,
-                ResourceEventTypes.PHASE_TWO_TEST_PASSED.value: TestEventPayload,
-                
-                # Phase Two integration events
-                ResourceEventTypes.PHASE_TWO_INTEGRATION_STARTED.value: IntegrationEventPayload,
-                ResourceEventTypes.PHASE_TWO_INTEGRATION_COMPLETED.value: IntegrationEventPayload,
-                ResourceEventTypes.PHASE_TWO_INTEGRATION_FAILED.value: IntegrationEventPayload,
-                ResourceEventTypes.PHASE_TWO_SYSTEM_TEST_STARTED.value: IntegrationEventPayload,
-                ResourceEventTypes.PHASE_TWO_SYSTEM_TEST_COMPLETED.value: IntegrationEventPayload,
-                
-                # Phase Three feature events
-                ResourceEventTypes.PHASE_THREE_FEATURE_REQUESTED.value: FeatureEventPayload,
-                ResourceEventTypes.PHASE_THREE_FEATURE_CREATED.value: FeatureEventPayload,
-                ResourceEventTypes.PHASE_THREE_FEATURE_EVOLVED.value: FeatureEventPayload,
-                ResourceEventTypes.PHASE_THREE_FEATURE_INTEGRATED.value: FeatureEventPayload,
-                
-                # Phase Three optimization events
-                ResourceEventTypes.PHASE_THREE_OPTIMIZATION_STARTED.value: OptimizationEventPayload,
-                ResourceEventTypes.PHASE_THREE_OPTIMIZATION_ITERATION.value: OptimizationEventPayload,
-                ResourceEventTypes.PHASE_THREE_OPTIMIZATION_COMPLETED.value: OptimizationEventPayload,
-                ResourceEventTypes.PHASE_THREE_NATURAL_SELECTION.value: OptimizationEventPayload,
-                
-                # Phase Four code generation events
-                ResourceEventTypes.PHASE_FOUR_CODE_GENERATION_STARTED.value: CodeGenerationPayload,
-                ResourceEventTypes.PHASE_FOUR_CODE_GENERATION_COMPLETED.value: CodeGenerationPayload,
-                ResourceEventTypes.PHASE_FOUR_CODE_GENERATION_FAILED.value: CodeGenerationPayload,
+            compiled_schema = self._schema_registry.get(event_type_str)
+            if compiled_schema is not None:
+                compiled_schema.fill_defaults(data)
                 
-                # Phase Four compilation events
-                ResourceEventTypes.PHASE_FOUR_COMPILATION_STARTED.value: CompilationPayload,
-                ResourceEventTypes.PHASE_FOUR_COMPILATION_PASSED.value: CompilationPayload,
-                ResourceEventTypes.PHASE_FOUR_COMPILATION_FAILED.value: CompilationPayload,
-                
-                # Phase Four refinement events
-                ResourceEventTypes.PHASE_FOUR_REFINEMENT_ITERATION.value: RefinementIterationPayloadPhase4,
-                ResourceEventTypes.PHASE_FOUR_DEBUG_STARTED.value: CodeGenerationPayload,
-                ResourceEventTypes.PHASE_FOUR_DEBUG_COMPLETED.value: CodeGenerationPayload,
-            }
-            
-            # Check if event type has a schema mapping
-            if event_type_str in event_schema_mapping:
-                schema_class = event_schema_mapping[event_type_str]
-                
-                # If the payload doesn't match the schema, add required fields with defaults
-                required_fields = inspect.signature(schema_class.__init__).parameters
-                
-                # Add any missing required fields with default values
-                for field_name, param in required_fields.items():
-                    if field_name not in ('self', 'args', 'kwargs') and field_name not in data:
-                        # Get default value if available
-                        if param.default is not inspect.Parameter.empty:
-                            data[field_name] = param.default
-                        elif field_name in ('timestamp', 'event_id'):
-                            # Special handling for common fields
-                            if field_name == 'timestamp':
-                                data[field_name] = datetime.now().isoformat()
-                            elif field_name == 'event_id':
-                                data[field_name] = str(uuid.uuid4())
-                
-                logger.debug(f"Validated event {event_type_str} against schema {schema_class.__name__}")
-                
-                # Try to validate the completed payload against the schema
-                try:
-                    schema_instance = schema_class(**data)
-                except Exception as validation_error:
-                    logger.warning(f"Event payload for {event_type_str} does not match schema {schema_class.__name__}: {validation_error}")
-        except ImportError:
-            # If schemas module is not available, skip validation
-            logger.debug(f"Schema validation skipped for event {event_type_str}")
+                if self._should_validate_payload(event_type_str):
+                    error = compiled_schema.validate(data)
+                    validated = error is None
+                    if error is not None:
+                        logger.warning(f"Event payload for {event_type_str} does not match schema "
+                                       f"{compiled_schema.schema_class.__name__}: {error}")
         except Exception as e:
             logger.warning(f"Error validating event payload for {event_type_str}: {e}")
         
+        schema_done = time.perf_counter_ns()
+        try:
+            return self._enqueue_event(event_type_str, data, correlation_id, priority)
+        finally:
+            self._record_emit_timing(emit_start, schema_done, validated)
+    
+    def _should_validate_payload(self, event_type: str) -> bool:
+        """Decide whether this payload is checked under the configured validation mode."""
+        mode = self._schema_validation
+        if mode is SchemaValidationMode.STRICT:
+            return True
+        if mode is SchemaValidationMode.OFF:
+            return False
+        
+        # Sampled: validate the first payload of each type, then every Nth
+        count = self._schema_sample_counters.get(event_type, 0)
+        self._schema_sample_counters[event_type] = count + 1
+        return count % self._schema_sample_rate == 0
+    
+    def _record_emit_timing(self, start_ns: int, schema_done_ns: int, validated: Optional[bool]) -> None:
+        """Accumulate emit-path timing counters."""
+        elapsed = time.perf_counter_ns() - start_ns
+        with self._emit_stats_lock:
+            stats = self._emit_stats
+            stats["emit_count"] += 1
+            stats["emit_time_ns"] += elapsed
+            stats["schema_time_ns"] += schema_done_ns - start_ns
+            if elapsed > stats["max_emit_time_ns"]:
+                stats["max_emit_time_ns"] = elapsed
+            if validated is not None:
+                stats["validations"] += 1
+                if not validated:
+                    stats["validation_failures"] += 1
+    
+    def get_emit_stats(self) -> Dict[str, Any]:
+        """
+        Get emit-path timing counters.
+        
+        Returns:
+            Dict[str, Any]: Emit count, total/mean/max emit time and time spent in
+                            schema handling (microseconds), plus validation counts
+        """
+        with self._emit_stats_lock:
+            stats = dict(self._emit_stats)
+        count = stats["emit_count"]
+        return {
+            "emit_count": count,
+            "validation_mode": self._schema_validation.value,
+            "validations": stats["validations"],
+            "validation_failures": stats["validation_failures"],
+            "total_emit_time_us": stats["emit_time_ns"] / 1000,
+            "mean_emit_time_us": stats["emit_time_ns"] / count / 1000 if count else 0.0,
+            "max_emit_time_us": stats["max_emit_time_ns"] / 1000,
+            "mean_schema_time_us": stats["schema_time_ns"] / count / 1000 if count else 0.0,
+        }
+    
+    def reset_emit_stats(self) -> None:
+        """Reset emit-path timing counters."""
+        with self._emit_stats_lock:
+            for key in self._emit_stats:
+                self._emit_stats[key] = 0
+    
+    def _enqueue_event(self, event_type_str: str, data: Dict[str, Any],
+                       correlation_id: Optional[str], priority: str) -> bool:
+        """Build the event and route it through throttling, batching and backpressure."""
         # Create event object with priority
         try:
             event_id = str(uuid.uuid4())
@@ -326,14 +367,11 @@ class EventQueue:
             else:
                 target_queue = self.normal_priority_queue
             
-            # Thread-safe queue insertion
-            target_queue.put_nowait(event)
+            # Thread-safe queue insertion; wakes the dispatcher directly
+            self._put_event(target_queue, event)
             
-            # Store event in history for debugging
-            with self._queue_lock:
-                self._event_history.append(event)
-                if len(self._event_history) > 10000:
-                    self._event_history = self._event_history[-10000:]
+            # Store event in history for debugging (bounded ring buffer)
+            self._event_history.append(event)
             
             logger.debug(f"Emitted {final_priority} priority event {event.event_type} to queue {self._id}")
             return True
@@ -432,8 +470,7 @@ class EventQueue:
             
             # Add directly to queue without further processing
             try:
-                target_queue = self.low_priority_queue
-                target_queue.put_nowait(summary_event)
+                self._put_event(self.low_priority_queue, summary_event)
                 logger.debug(f"Flushed batch of {len(events)} {event_type} events as summary")
             except queue.Full:
                 logger.warning(f"Could not flush batch for {event_type} - queue full")
@@ -482,11 +519,13 @@ class EventQueue:
             
             # Validate against schema if available
             if metadata and metadata.schema_class:
+                schema_class = metadata.schema_class
                 try:
-                    schema_class = metadata.schema_class
-                    schema_class(**data)
+                    error = self._schema_registry.compile(schema_class).validate(data)
                 except Exception as e:
-                    logger.warning(f"Event payload does not match schema {schema_class.__name__}: {e}")
+                    error = str(e)
+                if error is not None:
+                    logger.warning(f"Event payload does not match schema {schema_class.__name__}: {error}")
             
             # Set priority from metadata if not explicitly provided
             if metadata and priority == "normal":
@@ -551,12 +590,17 @@ class EventQueue:
                 normal_empty = self.normal_priority_queue.empty()
                 low_empty = self.low_priority_queue.empty()
                 
-                if high_empty and normal_empty and low_empty:
+                dispatcher_idle = (not self._dispatch_busy and self._normal_carry is None
+                                   and self._mailbox_backlog() == 0)
+                
+                if high_empty and normal_empty and low_empty and dispatcher_idle:
                     # Add a small delay to allow for any in-progress processing
                     await asyncio.sleep(0.1)
                     if (self.high_priority_queue.empty() and
                         self.normal_priority_queue.empty() and
-                        self.low_priority_queue.empty()):
+                        self.low_priority_queue.empty() and
+                        not self._dispatch_busy and
+                        self._mailbox_backlog() == 0):
                         return True
             except Exception:
                 # If we can't check queue status, just wait
@@ -604,7 +648,8 @@ class EventQueue:
         Main function for the processor thread.
         
         This runs in a dedicated thread and maintains its own event loop for
-        processing events from the queue.
+        processing events from the queue. The loop sleeps until a producer
+        wakes it, so an idle queue costs no CPU.
         """
         try:
             # Set up thread identity
@@ -615,218 +660,132 @@ class EventQueue:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             
-            # Create async queues for the processor
-            self._async_high_queue = asyncio.Queue(maxsize=max(10, self._max_size // 10))
-            self._async_normal_queue = asyncio.Queue(maxsize=self._max_size)
-            self._async_low_queue = asyncio.Queue(maxsize=self._max_size * 2)
-            
-            # Run the event processor coroutines in this loop
-            logger.debug(f"Starting queue to async bridge for {self._id}")
-            bridge_task = loop.create_task(self._queue_to_async_bridge())
-            logger.debug(f"Starting event processor for {self._id}")
-            processor_task = loop.create_task(self._process_events())
-            
-            # Wait for stop event while keeping event loop running
-            while not self._stop_event.is_set():
-                loop.run_until_complete(asyncio.sleep(0.1))
-            
-            # Cancel tasks
-            bridge_task.cancel()
-            processor_task.cancel()
+            # Publish the loop and wakeup signal so producers can reach the dispatcher
+            self._wakeup_event = asyncio.Event()
+            self._wakeup_pending = False
+            self._processor_loop = loop
             
-            # Cleanup
-            pending = asyncio.all_tasks(loop)
-            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-            loop.close()
+            logger.debug(f"Starting event dispatcher for {self._id}")
+            try:
+                loop.run_until_complete(self._dispatch_events())
+            finally:
+                self._processor_loop = None
+                
+                # Cleanup
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.close()
             
             logger.debug(f"Processor thread {self._processor_thread_id} for queue {self._id} stopped")
         except Exception as e:
             logger.error(f"Error in processor thread: {e}", exc_info=True)
     
-    async def _queue_to_async_bridge(self):
+    def _wake_processor(self, force: bool = False) -> None:
         """
-        Bridge between threading.Queue and asyncio.Queue.
+        Wake the dispatcher after an event has been queued.
         
-        This coroutine runs in the processor thread and continuously pulls events from
-        the thread-safe queues and puts them in the asyncio queues for async processing.
-        """
-        # Create a task for each priority level
-        tasks = [
-            asyncio.create_task(self._bridge_queue(
-                self.high_priority_queue, self._async_high_queue, "high")),
-            asyncio.create_task(self._bridge_queue(
-                self.normal_priority_queue, self._async_normal_queue, "normal")),
-            asyncio.create_task(self._bridge_queue(
-                self.low_priority_queue, self._async_low_queue, "low"))
-        ]
-        
-        # Wait for all bridge tasks to complete (should be when stop is called)
-        await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def _bridge_queue(self, thread_queue, async_queue, priority):
-        """
-        Bridge a specific queue from threading to asyncio.
+        Safe to call from any thread. Only one wakeup is scheduled until the
+        dispatcher consumes it, so bursts of emits cost a single loop callback.
         
         Args:
-            thread_queue: Source threading.Queue
-            async_queue: Target asyncio.Queue
-            priority: Priority level for logging
+            force: Schedule a wakeup even if one is already pending (used on stop)
         """
-        logger.debug(f"Starting bridge for {priority} queue")
-        while self._running and not self._stop_event.is_set():
-            try:
-                # Non-blocking check with timeout to allow for shutdown checks
-                try:
-                    # Using get with a timeout allows for checking stop condition
-                    event = thread_queue.get(timeout=0.1)
-                    logger.debug(f"Bridging {priority} event to async queue: {event.event_type}")
-                    await async_queue.put(event)
-                    thread_queue.task_done()
-                    logger.debug(f"Bridged {priority} event type: {event.event_type}")
-                except queue.Empty:
-                    # No events, just wait a bit
-                    await asyncio.sleep(0.01)
-            except Exception as e:
-                logger.error(f"Error in {priority} queue bridge: {e}")
-                await asyncio.sleep(0.1)
+        loop = self._processor_loop
+        if loop is None or (self._wakeup_pending and not force):
+            return
+        self._wakeup_pending = True
+        try:
+            loop.call_soon_threadsafe(self._wakeup_event.set)
+        except RuntimeError:
+            # Loop already closed during shutdown
+            pass
+    
+    def _put_event(self, target_queue: queue.Queue, event: Event) -> None:
+        """Insert an event into a priority lane and wake the dispatcher."""
+        target_queue.put_nowait(event)
+        self._wake_processor()
+    
+    def _take_event(self, lane: queue.Queue) -> Optional[Event]:
+        """Non-blocking take from a priority lane."""
+        try:
+            event = lane.get_nowait()
+        except queue.Empty:
+            return None
+        lane.task_done()
+        return event
     
-    async def _process_events(self):
+    async def _dispatch_events(self):
         """
-        Process events with batching support and priority handling.
-        
-        This coroutine runs in the processor thread and processes events from
-        the asyncio queues, delivering them to subscribers.
+        Dispatch queued events in strict priority order.
+        
+        High priority events are always drained before normal ones, and normal
+        before low; the high lane is re-checked after every dispatch. Runs of
+        same-type normal priority events are delivered as a batch, with a
+        short linger on a lone event so bursts still coalesce. When all
+        lanes are empty the coroutine waits on the wakeup signal set by
+        ``_wake_processor`` instead of polling.
         """
-        consecutive_errors = 0
-        batch = []
-        last_event_type = None
+        high_lane = self.high_priority_queue
+        normal_lane = self.normal_priority_queue
+        low_lane = self.low_priority_queue
         max_batch_size = 5  # Max events to process in a batch
+        consecutive_errors = 0
         
-        logger.debug(f"Event processor started for queue {self._id} with {len(self._subscribers)} subscribers")
+        logger.debug(f"Event dispatcher started for queue {self._id} with {len(self._subscribers)} subscribers")
         
         while self._running and not self._stop_event.is_set():
             try:
-                # Process high priority queue first - never batched
-                try:
-                    high_priority_event = await qasync_wait_for(
-                        self._async_high_queue.get(), 
-                        timeout=0.1
-                    )
-                    await self._process_single_event(high_priority_event)
-                    self._async_high_queue.task_done()
+                event = self._take_event(high_lane)
+                if event is not None:
+                    self._dispatch_busy = True
+                    await self._process_single_event(event)
                     self._track_event_processed()
                     consecutive_errors = 0
-                    continue  # Continue loop to keep checking high priority first
-                except asyncio.TimeoutError:
-                    # No high priority events, continue to normal priority
-                    pass
-                    
-                    # Try to process normal priority events with batching
-                    try:
-                        if not batch:  # Start a new batch
-                            normal_priority_event = await qasync_wait_for(
-                                self._async_normal_queue.get(),
-                                timeout=0.1
-                            )
-                            logger.debug(f"Got first event for batch: {normal_priority_event.event_type}")
-                            batch.append(normal_priority_event)
-                            last_event_type = normal_priority_event.event_type
-                            self._async_normal_queue.task_done()
-                        
-                        # Try to fill batch with same event type
-                        batch_filled = False
-                        while len(batch) < max_batch_size and not batch_filled:
-                            try:
-                                # Non-blocking get
-                                normal_priority_event = self._async_normal_queue.get_nowait()
-                                logger.debug(f"Adding to batch: {normal_priority_event.event_type}")
-                                
-                                # Only batch events of the same type
-                                if normal_priority_event.event_type == last_event_type:
-                                    batch.append(normal_priority_event)
-                                    self._async_normal_queue.task_done()
-                                else:
-                                    # Put it back and stop batching for now
-                                    logger.debug(f"Different event type, stopping batch: {normal_priority_event.event_type}")
-                                    await self._async_normal_queue.put(normal_priority_event)
-                                    batch_filled = True
-                            except asyncio.QueueEmpty:
-                                logger.debug("Normal queue empty, processing current batch")
-                                batch_filled = True
-                        
-                        # Process the batch
-                        if batch:
-                            await self._process_event_batch(batch)
-                            # Track each event in the batch
-                            for _ in batch:
-                                self._track_event_processed()
-                            batch = []
-                            last_event_type = None
-                            consecutive_errors = 0
-                    except asyncio.TimeoutError:
-                        logger.debug("No normal priority events")
-                        # No normal priority events, check low priority
-                    pass
-                except asyncio.QueueEmpty:
-                    # Queue is empty, continue to normal priority
-                    pass
-                
-                # Check if we need to process the current batch
-                if batch and (len(batch) >= max_batch_size or 
-                            (last_event_type is not None and batch[0].event_type != last_event_type)):
-                    await self._process_event_batch(batch)
-                    batch = []
+                    continue
                 
-                # Try to get event from normal priority queue
-                try:
-                    # Use shorter timeout to balance responsiveness
-                    normal_event = await qasync_wait_for(
-                        self._async_normal_queue.get(), 
-                        timeout=0.2
-                    )
-                    consecutive_errors = 0
+                # A normal event pulled while filling the previous batch goes first
+                event = self._normal_carry or self._take_event(normal_lane)
+                self._normal_carry = None
+                if event is not None:
+                    self._dispatch_busy = True
+                    batch = [event]
                     
-                    # Start or continue a batch
-                    if not batch:
-                        batch.append(normal_event)
-                        last_event_type = normal_event.event_type
-                        logger.debug(f"Started new batch with event type {last_event_type}")
-                    elif normal_event.event_type == last_event_type and len(batch) < max_batch_size:
-                        batch.append(normal_event)
-                        logger.debug(f"Added to batch, now size {len(batch)}")
-                    else:
-                        # Process the existing batch
-                        if batch:
-                            logger.debug(f"Processing batch of {len(batch)} events of type {batch[0].event_type}")
-                            await self._process_event_batch(batch)
-                        # Start a new batch
-                        batch = [normal_event]
-                        last_event_type = normal_event.event_type
-                        logger.debug(f"Started new batch with event type {last_event_type}")
-                        
-                    self._async_normal_queue.task_done()
+                    # A lone event may be the head of a burst; linger briefly so
+                    # same-type events emitted right behind it share the batch
+                    if self._batch_linger > 0 and normal_lane.empty() and high_lane.empty():
+                        await asyncio.sleep(self._batch_linger)
                     
-                except asyncio.TimeoutError:
-                    # Process any pending batch before checking low priority
-                    if batch:
-                        logger.debug(f"Processing batch of {len(batch)} events of type {batch[0].event_type} after timeout")
-                        await self._process_event_batch(batch)
-                        batch = []
+                    while len(batch) < max_batch_size and high_lane.empty():
+                        next_event = self._take_event(normal_lane)
+                        if next_event is None:
+                            break
+                        if next_event.event_type != event.event_type:
+                            self._normal_carry = next_event
+                            break
+                        batch.append(next_event)
                     
-                    # Only check low priority if normal is empty
-                    try:
-                        # Use longer timeout for low priority
-                        low_event = await qasync_wait_for(
-                            self._async_low_queue.get(), 
-                            timeout=0.5
-                        )
-                        await self._process_single_event(low_event)
-                        self._async_low_queue.task_done()
+                    await self._process_event_batch(batch)
+                    for _ in batch:
                         self._track_event_processed()
-                        consecutive_errors = 0
-                    except (asyncio.TimeoutError, asyncio.QueueEmpty):
-                        # No events in any queue, sleep briefly
-                        await asyncio.sleep(0.1)
+                    consecutive_errors = 0
+                    continue
+                
+                event = self._take_event(low_lane)
+                if event is not None:
+                    self._dispatch_busy = True
+                    await self._process_single_event(event)
+                    self._track_event_processed()
+                    consecutive_errors = 0
+                    continue
+                
+                # All lanes empty: sleep until a producer (or stop) wakes us
+                self._dispatch_busy = False
+                await self._wakeup_event.wait()
+                self._wakeup_event.clear()
+                self._wakeup_pending = False
+                self._dispatch_wakeups += 1
                 
             except Exception as e:
                 logger.error(f"Error in event processing: {e}", exc_info=True)
@@ -834,12 +793,34 @@ class EventQueue:
                 # Add backoff for repeated errors
                 await asyncio.sleep(min(consecutive_errors * 0.1, 5))
         
-        # Process any remaining batch when shutting down
-        if batch:
+        # Deliver an event held back from batching when shutting down
+        if self._normal_carry is not None:
             try:
-                await self._process_event_batch(batch)
+                await self._process_single_event(self._normal_carry)
             except Exception as e:
-                logger.error(f"Error processing final batch during shutdown: {e}")
+                logger.error(f"Error processing final event during shutdown: {e}")
+            self._normal_carry = None
+        
+        # Give subscriber mailboxes a bounded grace period to finish delivering
+        deadline = time.monotonic() + self._mailbox_drain_timeout
+        while self._mailbox_backlog() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        self._dispatch_busy = False
+    
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """
+        Get dispatcher activity counters.
+        
+        Returns:
+            Dict[str, Any]: Number of wakeups, events processed and whether the
+                            dispatcher is currently delivering events
+        """
+        return {
+            "wakeups": self._dispatch_wakeups,
+            "processed": self._processed_count,
+            "busy": self._dispatch_busy,
+            "running": self._processor_loop is not None,
+        }
     
     async def _process_event_batch(self, batch: List[Event]):
         """
@@ -897,6 +878,10 @@ class EventQueue:
         # Early return if no valid handlers
         if not handlers:
             return
+        
+        if self._delivery_mode == "fanout":
+            await self._fan_out(event_type, batch_payload, handlers)
+            return
             
         # Deliver to all subscribers (double-check for None)
         for handler in handlers:
@@ -949,6 +934,10 @@ class EventQueue:
         if not subscribers:
             return
         
+        if self._delivery_mode == "fanout":
+            await self._fan_out(event.event_type, event.data, subscribers)
+            return
+        
         # Process event for each subscriber with error isolation
         for callback in subscribers:
             if callback is None:
@@ -988,6 +977,7 @@ class EventQueue:
             self._running = False
             if self._stop_event:
                 self._stop_event.set()
+            self._wake_processor(force=True)
         
         # Wait for thread to finish with timeout
         if self._processor_thread and self._processor_thread.is_alive():
@@ -1006,6 +996,10 @@ class EventQueue:
             subscribers_count = sum(len(subs) for subs in self._subscribers.values())
             logger.info(f"Clearing {subscribers_count} subscribers from queue {self._id}")
             self._subscribers.clear()
+            self._subscriber_options.clear()
+            
+            # Mailbox workers died with the processor loop
+            self._mailboxes.clear()
             
             # Clear processing retries to prevent memory leaks
             retry_count = len(self._processing_retries)
@@ -1013,17 +1007,25 @@ class EventQueue:
                 logger.debug(f"Clearing {retry_count} processing retries from queue {self._id}")
             self._processing_retries.clear()
         
+        # Persist any evicted events still buffered for the spill file
+        self._event_history.flush()
+        
         logger.info(f"Event queue {self._id} stopped")
     
     async def subscribe(self, 
                       event_type: str, 
-                      callback: Callable[[str, Dict[str, Any]], Awaitable[None]]) -> None:
+                      callback: Callable[[str, Dict[str, Any]], Awaitable[None]],
+                      mailbox_size: Optional[int] = None,
+                      backpressure: Optional[Union[str, MailboxPolicy]] = None) -> None:
         """
         Add subscriber for an event type.
         
         Args:
             event_type: The event type to subscribe to
             callback: The callback function to call when the event occurs
+            mailbox_size: Optional mailbox capacity for this subscriber (fan-out mode)
+            backpressure: Optional policy when the mailbox is full - "block",
+                          "drop_oldest" or "drop_newest" (fan-out mode)
         """
         # Input validation
         if event_type is None or callback is None or not callable(callback):
@@ -1051,6 +1053,13 @@ class EventQueue:
             
             # Add subscriber
             self._subscribers[event_type].add(callback)
+            
+            if mailbox_size is not None or backpressure is not None:
+                self._subscriber_options[(event_type, callback)] = (
+                    mailbox_size if mailbox_size is not None else self._mailbox_size,
+                    self._resolve_mailbox_policy(backpressure) if backpressure is not None
+                    else self._mailbox_policy
+                )
         
         # Check if callback is a coroutine function for logging
         is_coroutine = asyncio.iscoroutinefunction(callback)
@@ -1089,6 +1098,15 @@ class EventQueue:
             if event_type in self._subscribers and callback in self._subscribers[event_type]:
                 self._subscribers[event_type].remove(callback)
                 logger.debug(f"Removed subscriber for {event_type} events")
+            self._subscriber_options.pop((event_type, callback), None)
+        
+        # Drop the subscriber's mailbox inside the processor loop that owns it
+        loop = self._processor_loop
+        if loop is not None and (event_type, callback) in self._mailboxes:
+            try:
+                loop.call_soon_threadsafe(self._close_mailbox, event_type, callback)
+            except RuntimeError:
+                pass
     
     async def emit_error(self,
                        error,
@@ -1122,10 +1140,119 @@ class EventQueue:
             event_data
         )
     
+    async def _invoke_subscriber(self, event_type: str, payload: Dict[str, Any], callback) -> bool:
+        """
+        Make a single delivery attempt to a subscriber.
+        
+        Coroutine callbacks are awaited directly; plain callables run in an
+        executor so they cannot block the processor loop.
+        
+        Args:
+            event_type: The event type being delivered
+            payload: Event data (or batch payload)
+            callback: The subscriber callback
+            
+        Returns:
+            bool: False if the subscriber has gone away and was removed
+            
+        Raises:
+            Exception: Whatever the callback raised
+        """
+        # Check for None callback before attempting to call
+        if callback is None:
+            logger.warning(f"Cannot deliver event {event_type}: callback is None")
+            return False
+        
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                logger.debug(f"Calling async callback {callback} with {event_type}")
+                await callback(event_type, payload)
+                logger.debug(f"Async callback completed for {event_type}")
+            else:
+                # If not async, run in the event type's delivery pool to avoid blocking
+                logger.debug(f"Calling sync callback {callback} with {event_type}")
+                pool_name, pool_size = self._sync_pool_for(event_type)
+                await asyncio.wrap_future(self._executor_manager.submit(
+                    pool_name, callback, event_type, payload, max_workers=pool_size
+                ))
+                logger.debug(f"Sync callback completed for {event_type}")
+        except TypeError as te:
+            if "object NoneType can't be used in 'await' expression" in str(te):
+                logger.warning(f"Callback became None during processing for {event_type}: {callback} (type: {type(callback)})")
+                logger.warning("This may indicate object cleanup during event processing - skipping this callback")
+                # Clean up this None handler from the subscribers
+                with self._queue_lock:
+                    if event_type in self._subscribers:
+                        self._subscribers[event_type].discard(None)
+                        self._subscribers[event_type].discard(callback)
+                return False  # Skip this callback
+            raise  # Re-raise other TypeErrors
+        
+        return True
+    
+    async def _invoke_subscriber_batch(self, event_type: str, payloads: List[Dict[str, Any]],
+                                       callback) -> List[Optional[Exception]]:
+        """
+        Deliver several payloads to a sync subscriber in one executor submission.
+        
+        Args:
+            event_type: The event type being delivered
+            payloads: Event payloads in delivery order
+            callback: The (non-coroutine) subscriber callback
+            
+        Returns:
+            List[Optional[Exception]]: The exception raised for each payload, or None
+        """
+        pool_name, pool_size = self._sync_pool_for(event_type)
+        return await asyncio.wrap_future(self._executor_manager.submit(
+            pool_name, _call_sync_batch, callback, event_type, payloads, max_workers=pool_size
+        ))
+    
+    def _sync_pool_for(self, event_type: str) -> Tuple[str, int]:
+        """Resolve (and cache) the delivery pool name and size for an event type."""
+        pool = self._sync_pool_cache.get(event_type)
+        if pool is None:
+            prefix = max((p for p in self._sync_delivery_pools if event_type.startswith(p)), key=len)
+            suffix = prefix.rstrip(":_")
+            name = f"event_delivery_{suffix}" if suffix else "event_delivery"
+            pool = (name, self._sync_delivery_pools[prefix])
+            self._sync_pool_cache[event_type] = pool
+        return pool
+    
+    def get_delivery_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get queue-depth statistics for the sync-callback delivery pools.
+        
+        Returns:
+            Dict[str, Dict[str, int]]: Per pool: max workers, submitted/completed
+                counts and the number of calls running and waiting
+        """
+        pool_names = {name for name, _ in list(self._sync_pool_cache.values())}
+        stats = self._executor_manager.get_executor_stats()
+        return {name: pool_stats for name, pool_stats in stats.items() if name in pool_names}
+    
+    def _retry_backoff(self, attempt: int) -> Optional[float]:
+        """
+        Get the delay before retrying a failed delivery.
+        
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            
+        Returns:
+            Optional[float]: Delay in seconds, or None if retries are exhausted
+        """
+        if attempt >= self._max_retries:
+            return None
+        # Exponential backoff with jitter
+        base_delay = self._retry_delay * (2 ** attempt)
+        return base_delay + random.uniform(0, base_delay * 0.1)
+    
     async def _deliver_event(self, event: Event, callback, event_id: str) -> None:
         """
         Deliver event to a subscriber with retry handling.
         
+        Used by the sequential delivery mode; retries happen in line.
+        
         Args:
             event: The event to deliver
             callback: The callback function
@@ -1134,68 +1261,22 @@ class EventQueue:
         # Attempt delivery with retries
         for attempt in range(self._max_retries + 1):  # 0, 1, 2, 3 (4 total attempts)
             try:
-                # Check for None callback before attempting to call
-                if callback is None:
-                    logger.warning(f"Cannot deliver event {event.event_type}: callback is None")
-                    return
-                    
-                # Direct async call to the callback
-                if asyncio.iscoroutinefunction(callback):
-                    logger.debug(f"Calling async callback {callback} with {event.event_type}")
-                    try:
-                        await callback(event.event_type, event.data)
-                    except TypeError as te:
-                        if "object NoneType can't be used in 'await' expression" in str(te):
-                            logger.warning(f"Callback became None during processing for {event.event_type}: {callback} (type: {type(callback)})")
-                            logger.warning("This may indicate object cleanup during event processing - skipping this callback")
-                            # Clean up this None handler from the subscribers
-                            with self._queue_lock:
-                                if event.event_type in self._subscribers:
-                                    self._subscribers[event.event_type].discard(None)
-                                    self._subscribers[event.event_type].discard(callback)
-                            return  # Skip this callback
-                        else:
-                            raise  # Re-raise other TypeErrors
-                    logger.debug(f"Async callback completed for {event.event_type}")
-                else:
-                    # If not async, run in executor to avoid blocking
-                    logger.debug(f"Calling sync callback {callback} with {event.event_type}")
-                    loop = asyncio.get_event_loop()
-                    try:
-                        await loop.run_in_executor(
-                            None, 
-                            lambda: callback(event.event_type, event.data)
-                        )
-                    except TypeError as te:
-                        if "object NoneType can't be used in 'await' expression" in str(te):
-                            logger.warning(f"Callback became None during processing for {event.event_type}: {callback} (type: {type(callback)})")
-                            logger.warning("This may indicate object cleanup during event processing - skipping this callback")
-                            # Clean up this None handler from the subscribers
-                            with self._queue_lock:
-                                if event.event_type in self._subscribers:
-                                    self._subscribers[event.event_type].discard(None)
-                                    self._subscribers[event.event_type].discard(callback)
-                            return  # Skip this callback
-                        else:
-                            raise  # Re-raise other TypeErrors
-                    logger.debug(f"Sync callback completed for {event.event_type}")
+                await self._invoke_subscriber(event.event_type, event.data, callback)
                 
-                # Success
+                # Success (or subscriber gone)
                 logger.debug(f"Event {event_id} delivered successfully")
                 return
                 
             except Exception as e:
-                if attempt < self._max_retries:
+                delay = self._retry_backoff(attempt)
+                if delay is not None:
                     # Log error and retry
                     logger.warning(f"Error delivering event {event_id}: {e}, retry {attempt+1}/{self._max_retries}")
-                    
-                    # Exponential backoff with jitter
-                    base_delay = self._retry_delay * (2 ** attempt)
-                    jitter = random.uniform(0, base_delay * 0.1)
-                    await asyncio.sleep(base_delay + jitter)
+                    await asyncio.sleep(delay)
                 else:
                     # Max retries reached
                     logger.error(f"Event {event_id} failed after {self._max_retries} retries: {e}")
+                    break
         
         # Max retries reached, clear retry counter
         with self._queue_lock:
@@ -1204,6 +1285,96 @@ class EventQueue:
         
         logger.error(f"Max retries reached for event {event_id}")
     
+    @staticmethod
+    def _resolve_mailbox_policy(policy: Union[str, MailboxPolicy]) -> MailboxPolicy:
+        """Convert a policy name to a MailboxPolicy, defaulting to BLOCK."""
+        if isinstance(policy, MailboxPolicy):
+            return policy
+        try:
+            return MailboxPolicy(policy)
+        except ValueError:
+            logger.error(f"Unknown subscriber backpressure policy '{policy}', using block")
+            return MailboxPolicy.BLOCK
+    
+    def _get_mailbox(self, event_type: str, callback) -> SubscriberMailbox:
+        """Get or create the mailbox for a subscription (processor loop only)."""
+        key = (event_type, callback)
+        mailbox = self._mailboxes.get(key)
+        if mailbox is None or mailbox.closed:
+            with self._queue_lock:
+                capacity, policy = self._subscriber_options.get(
+                    key, (self._mailbox_size, self._mailbox_policy)
+                )
+            mailbox = SubscriberMailbox(
+                event_type,
+                callback,
+                deliver=self._invoke_subscriber,
+                retry_backoff=self._retry_backoff,
+                capacity=capacity,
+                policy=policy,
+                on_closed=self._on_mailbox_closed,
+                deliver_batch=self._invoke_subscriber_batch,
+                batch_size=1 if asyncio.iscoroutinefunction(callback) else self._sync_batch_size,
+            )
+            self._mailboxes[key] = mailbox
+        return mailbox
+    
+    def _on_mailbox_closed(self, mailbox: SubscriberMailbox) -> None:
+        """Forget a mailbox whose subscriber went away."""
+        key = (mailbox.event_type, mailbox.callback)
+        if self._mailboxes.get(key) is mailbox:
+            del self._mailboxes[key]
+    
+    def _close_mailbox(self, event_type: str, callback) -> None:
+        """Close a subscription's mailbox (processor loop only)."""
+        mailbox = self._mailboxes.pop((event_type, callback), None)
+        if mailbox is not None:
+            mailbox.close()
+    
+    async def _fan_out(self, event_type: str, payload: Dict[str, Any], subscribers) -> None:
+        """
+        Hand an event to every subscriber's mailbox.
+        
+        Delivery itself happens in each mailbox's worker, so subscribers run
+        concurrently and a slow one only backs up its own mailbox. Mailboxes
+        using the block policy make this wait when full.
+        """
+        for callback in subscribers:
+            if callback is None or not callable(callback):
+                continue
+            try:
+                await self._get_mailbox(event_type, callback).put(payload)
+            except Exception as e:
+                logger.error(f"Error queueing {event_type} for subscriber {callback}: {e}")
+    
+    def _mailbox_backlog(self) -> int:
+        """Number of events queued in or being delivered by subscriber mailboxes."""
+        return sum(mailbox.depth for mailbox in list(self._mailboxes.values()))
+    
+    def get_subscriber_stats(self, event_type: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get per-subscriber delivery statistics.
+        
+        Only subscriptions that have received events in fan-out mode have
+        mailbox statistics.
+        
+        Args:
+            event_type: Optional specific event type to report
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Per event type, one entry per subscriber
+                with queue depth, delivered/failed/retried/dropped counts and latency
+        """
+        if hasattr(event_type, 'value'):
+            event_type = event_type.value
+        
+        stats: Dict[str, List[Dict[str, Any]]] = {}
+        for (mailbox_event_type, _), mailbox in list(self._mailboxes.items()):
+            if event_type and mailbox_event_type != event_type:
+                continue
+            stats.setdefault(mailbox_event_type, []).append(mailbox.get_stats())
+        return stats
+    
     def get_queue_size(self) -> Dict[str, int]:
         """
         Get current queue sizes for all priority levels.
@@ -1258,16 +1429,37 @@ class EventQueue:
         Returns:
             List[Event]: List of recent events
         """
-        with self._queue_lock:
-            events = list(self._event_history)
-            
         if event_type:
             # Convert enum to string if needed
             if hasattr(event_type, 'value'):
                 event_type = event_type.value
-            events = [e for e in events if e.event_type == event_type]
+            return self._event_history.get_recent(event_type, limit)
             
-        return events[-limit:]
+        return self._event_history.get_recent(limit=limit)
+    
+    async def get_correlated_events(self,
+                                    correlation_id: str,
+                                    limit: Optional[int] = None) -> List[Event]:
+        """
+        Get recent events sharing a correlation ID.
+        
+        Args:
+            correlation_id: The correlation ID to look up
+            limit: Optional maximum number of events to return
+            
+        Returns:
+            List[Event]: Matching events, oldest first
+        """
+        return self._event_history.get_by_correlation(correlation_id, limit)
+    
+    def get_history_stats(self) -> Dict[str, Any]:
+        """
+        Get event history size and spill statistics.
+        
+        Returns:
+            Dict[str, Any]: Capacity, current size, per-index counts and spill counters
+        """
+        return self._event_history.get_stats()
     
     def _track_event_processed(self) -> None:
         """Track processed events and log summaries."""
@@ -0,0 +1,259 @@
+"""
+Precompiled event payload schema registry for the FFTT event system.
+
+This module maps event types to their payload dataclasses from
+``resources.schemas`` and compiles each dataclass once into a lightweight
+descriptor holding its field defaults and a validator, so that
+``EventQueue.emit`` does not have to introspect or instantiate schema
+classes on the hot path.
+"""
+import dataclasses
+import inspect
+import logging
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Type, Union
+
+from .types import ResourceEventTypes
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaValidationMode(Enum):
+    """How thoroughly emitted payloads are checked against their schema."""
+    OFF = "off"          # Fill defaults only, never validate
+    SAMPLED = "sampled"  # Validate one payload in every ``sample_rate`` per event type
+    STRICT = "strict"    # Validate every payload
+
+
+# Event type -> name of the payload class in resources.schemas
+_EVENT_SCHEMA_NAMES: Dict[str, str] = {
+    # Phase 0 Earth Agent events
+    ResourceEventTypes.EARTH_VALIDATION_COMPLETE.value: "ValidationEventPayload",
+    ResourceEventTypes.EARTH_VALIDATION_STARTED.value: "ValidationEventPayload",
+    ResourceEventTypes.EARTH_VALIDATION_FAILED.value: "ValidationEventPayload",
+
+    # Phase One validation events
+    ResourceEventTypes.PHASE_ONE_VALIDATION_STATE_CHANGED.value: "ValidationStateChangedPayload",
+    ResourceEventTypes.PHASE_ONE_VALIDATION_COMPLETED.value: "ValidationStateChangedPayload",
+    ResourceEventTypes.PHASE_ONE_VALIDATION_FAILED.value: "ValidationStateChangedPayload",
+
+    # Phase One refinement events
+    ResourceEventTypes.PHASE_ONE_REFINEMENT_CREATED.value: "RefinementContextPayload",
+    ResourceEventTypes.PHASE_ONE_REFINEMENT_UPDATED.value: "RefinementContextPayload",
+    ResourceEventTypes.PHASE_ONE_REFINEMENT_COMPLETED.value: "RefinementContextPayload",
+    ResourceEventTypes.PHASE_ONE_REFINEMENT_ITERATION.value: "RefinementIterationPayload",
+
+    # Agent update events
+    ResourceEventTypes.AGENT_UPDATE_REQUEST.value: "AgentUpdateRequestPayload",
+    ResourceEventTypes.AGENT_UPDATE_COMPLETE.value: "AgentUpdateRequestPayload",
+    ResourceEventTypes.AGENT_UPDATE_FAILED.value: "AgentUpdateRequestPayload",
+
+    # Phase Two component events
+    ResourceEventTypes.PHASE_TWO_COMPONENT_CREATED.value: "ComponentEventPayload",
+    ResourceEventTypes.PHASE_TWO_COMPONENT_UPDATED.value: "ComponentEventPayload",
+    ResourceEventTypes.PHASE_TWO_COMPONENT_DELETED.value: "ComponentEventPayload",
+
+    # Phase Two test events
+    ResourceEventTypes.PHASE_TWO_TEST_CREATED.value: "TestEventPayload",
+    ResourceEventTypes.PHASE_TWO_TEST_EXECUTED.value: "TestEventPayload",
+    ResourceEventTypes.PHASE_TWO_TEST_FAILED.value: "TestEventPayload",
+    ResourceEventTypes.PHASE_TWO_TEST_PASSED.value: "TestEventPayload",
+
+    # Phase Two integration events
+    ResourceEventTypes.PHASE_TWO_INTEGRATION_STARTED.value: "IntegrationEventPayload",
+    ResourceEventTypes.PHASE_TWO_INTEGRATION_COMPLETED.value: "IntegrationEventPayload",
+    ResourceEventTypes.PHASE_TWO_INTEGRATION_FAILED.value: "IntegrationEventPayload",
+    ResourceEventTypes.PHASE_TWO_SYSTEM_TEST_STARTED.value: "IntegrationEventPayload",
+    ResourceEventTypes.PHASE_TWO_SYSTEM_TEST_COMPLETED.value: "IntegrationEventPayload",
+
+    # Phase Three feature events
+    ResourceEventTypes.PHASE_THREE_FEATURE_REQUESTED.value: "FeatureEventPayload",
+    ResourceEventTypes.PHASE_THREE_FEATURE_CREATED.value: "FeatureEventPayload",
+    ResourceEventTypes.PHASE_THREE_FEATURE_EVOLVED.value: "FeatureEventPayload",
+    ResourceEventTypes.PHASE_THREE_FEATURE_INTEGRATED.value: "FeatureEventPayload",
+
+    # Phase Three optimization events
+    ResourceEventTypes.PHASE_THREE_OPTIMIZATION_STARTED.value: "OptimizationEventPayload",
+    ResourceEventTypes.PHASE_THREE_OPTIMIZATION_ITERATION.value: "OptimizationEventPayload",
+    ResourceEventTypes.PHASE_THREE_OPTIMIZATION_COMPLETED.value: "OptimizationEventPayload",
+    ResourceEventTypes.PHASE_THREE_NATURAL_SELECTION.value: "OptimizationEventPayload",
+
+    # Phase Four code generation events
+    ResourceEventTypes.PHASE_FOUR_CODE_GENERATION_STARTED.value: "CodeGenerationPayload",
+    ResourceEventTypes.PHASE_FOUR_CODE_GENERATION_COMPLETED.value: "CodeGenerationPayload",
+    ResourceEventTypes.PHASE_FOUR_CODE_GENERATION_FAILED.value: "CodeGenerationPayload",
+
+    # Phase Four compilation events
+    ResourceEventTypes.PHASE_FOUR_COMPILATION_STARTED.value: "CompilationPayload",
+    ResourceEventTypes.PHASE_FOUR_COMPILATION_PASSED.value: "CompilationPayload",
+    ResourceEventTypes.PHASE_FOUR_COMPILATION_FAILED.value: "CompilationPayload",
+
+    # Phase Four refinement events
+    ResourceEventTypes.PHASE_FOUR_REFINEMENT_ITERATION.value: "RefinementIterationPayloadPhase4",
+    ResourceEventTypes.PHASE_FOUR_DEBUG_STARTED.value: "CodeGenerationPayload",
+    ResourceEventTypes.PHASE_FOUR_DEBUG_COMPLETED.value: "CodeGenerationPayload",
+}
+
+
+@dataclass(frozen=True)
+class CompiledEventSchema:
+    """
+    Precomputed view of a payload schema class.
+
+    Holds everything ``emit`` needs to complete and check a payload so the
+    schema class itself never has to be inspected or instantiated per event.
+    """
+    schema_class: Type
+    field_names: FrozenSet[str]
+    required_fields: FrozenSet[str]
+    static_defaults: Tuple[Tuple[str, Any], ...]
+    factory_defaults: Tuple[Tuple[str, Callable[[], Any]], ...]
+
+    @classmethod
+    def compile(cls, schema_class: Type) -> 'CompiledEventSchema':
+        """Build a compiled descriptor for a dataclass or plain schema class."""
+        static_defaults = []
+        factory_defaults = []
+        required = set()
+
+        if dataclasses.is_dataclass(schema_class):
+            init_fields = [f for f in dataclasses.fields(schema_class) if f.init]
+            for f in init_fields:
+                if f.default is not dataclasses.MISSING:
+                    static_defaults.append((f.name, f.default))
+                elif f.default_factory is not dataclasses.MISSING:
+                    factory_defaults.append((f.name, f.default_factory))
+                else:
+                    required.add(f.name)
+            names = frozenset(f.name for f in init_fields)
+        else:
+            # Fall back to the constructor signature for non-dataclass schemas
+            params = inspect.signature(schema_class.__init__).parameters
+            names = set()
+            for name, param in params.items():
+                if name == 'self' or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                    continue
+                names.add(name)
+                if param.default is inspect.Parameter.empty:
+                    required.add(name)
+                else:
+                    static_defaults.append((name, param.default))
+            names = frozenset(names)
+
+        return cls(
+            schema_class=schema_class,
+            field_names=names,
+            required_fields=frozenset(required),
+            static_defaults=tuple(static_defaults),
+            factory_defaults=tuple(factory_defaults),
+        )
+
+    def fill_defaults(self, data: Dict[str, Any]) -> None:
+        """Add default values for any schema fields missing from ``data`` (in place)."""
+        for name, value in self.static_defaults:
+            if name not in data:
+                data[name] = value
+        for name, factory in self.factory_defaults:
+            if name not in data:
+                data[name] = factory()
+
+    def validate(self, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Check a payload against the schema without instantiating it.
+
+        Returns:
+            None if the payload is acceptable, otherwise an error description
+        """
+        unexpected = data.keys() - self.field_names
+        if unexpected:
+            return f"unexpected field(s): {', '.join(sorted(unexpected))}"
+        missing = self.required_fields - data.keys()
+        if missing:
+            return f"missing required field(s): {', '.join(sorted(missing))}"
+        return None
+
+
+class EventSchemaRegistry:
+    """
+    Process-wide registry of compiled event payload schemas.
+
+    The event type mapping is resolved against ``resources.schemas`` on first
+    use (importing it at module load would be circular through ``resources``)
+    and is never rebuilt afterwards.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_event_type: Dict[str, CompiledEventSchema] = {}
+        self._by_class: Dict[Type, CompiledEventSchema] = {}
+        self._built = False
+
+    @classmethod
+    def get_instance(cls) -> 'EventSchemaRegistry':
+        """Get the shared registry instance."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        with self._lock:
+            if self._built:
+                return
+            try:
+                from resources import schemas
+            except ImportError:
+                logger.debug("resources.schemas not available, event schema validation disabled")
+                self._built = True
+                return
+
+            for event_type, class_name in _EVENT_SCHEMA_NAMES.items():
+                schema_class = getattr(schemas, class_name, None)
+                if schema_class is None:
+                    logger.warning(f"Schema class {class_name} for event {event_type} not found")
+                    continue
+                # Explicit registrations made before the first build take precedence
+                self._by_event_type.setdefault(event_type, self.compile(schema_class))
+            self._built = True
+            logger.debug(f"Event schema registry built with {len(self._by_event_type)} event types")
+
+    def compile(self, schema_class: Type) -> CompiledEventSchema:
+        """Get the compiled descriptor for a schema class, compiling it once."""
+        compiled = self._by_class.get(schema_class)
+        if compiled is None:
+            with self._lock:
+                compiled = self._by_class.get(schema_class)
+                if compiled is None:
+                    compiled = CompiledEventSchema.compile(schema_class)
+                    self._by_class[schema_class] = compiled
+        return compiled
+
+    def register(self, event_type: Union[str, Enum], schema_class: Type) -> None:
+        """Register (or replace) the payload schema for an event type."""
+        event_type_str = event_type.value if hasattr(event_type, 'value') else str(event_type)
+        compiled = self.compile(schema_class)
+        with self._lock:
+            self._by_event_type[event_type_str] = compiled
+
+    def get(self, event_type: str) -> Optional[CompiledEventSchema]:
+        """Get the compiled schema for an event type, or None if unmapped."""
+        self._ensure_built()
+        return self._by_event_type.get(event_type)
+
+    def get_event_types(self) -> Dict[str, str]:
+        """Get the mapping of event types to schema class names."""
+        self._ensure_built()
+        with self._lock:
+            return {et: c.schema_class.__name__ for et, c in self._by_event_type.items()}
+
+
+def get_schema_registry() -> EventSchemaRegistry:
+    """Get the shared event schema registry."""
+    return EventSchemaRegistry.get_instance()
@@ -142,6 +142,9 @@ class ResourceEventTypes(Enum):
     PHASE_TWO_DEPLOYMENT_STARTED = "phase_two:deployment_started"
     PHASE_TWO_DEPLOYMENT_COMPLETED = "phase_two:deployment_completed"
     
+    # Phase Two coordination events (nested phases, parallel features, checkpoints)
+    PHASE_COORDINATION_EVENT = "phase_two:coordination_event"
+    
     # System testing events
     SYSTEM_TESTING_STARTED = "system_testing:started"
     SYSTEM_TESTING_COMPLETED = "system_testing:completed"
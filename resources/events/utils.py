@@ -277,6 +277,8 @@ class ThreadPoolExecutorManager:
     def __init__(self):
         """Initialize manager."""
         self._executors = {}
+        self._executor_stats = {}
+        self._stats_lock = threading.Lock()
         self._shutdown_in_progress = False
         
     @classmethod
@@ -308,7 +310,72 @@ class ThreadPoolExecutorManager:
                 thread_name_prefix=name
             )
             self._executors[name] = executor
+            self._executor_stats[name] = {
+                "max_workers": executor._max_workers,
+                "submitted": 0,
+                "completed": 0,
+                "active": 0,
+            }
             return executor
+    
+    def submit(self, name: str, fn: Callable[..., T], *args,
+               max_workers: Optional[int] = None, **kwargs) -> concurrent.futures.Future:
+        """
+        Submit a call to a named executor, tracking its queue depth.
+        
+        Args:
+            name: Name of the executor (created on first use)
+            fn: Function to execute
+            *args: Args to pass to fn
+            max_workers: Worker count used if the executor has to be created
+            **kwargs: Kwargs to pass to fn
+            
+        Returns:
+            Future: Future for the call's result
+        """
+        with self._lock:
+            executor = self.get_executor(name, max_workers)
+            stats = self._executor_stats[name]
+        with self._stats_lock:
+            stats["submitted"] += 1
+        return executor.submit(self._run_tracked, stats, fn, args, kwargs)
+    
+    def _run_tracked(self, stats: Dict[str, int], fn: Callable[..., T], args, kwargs) -> T:
+        """Run a submitted call inside a worker thread, updating its executor's counters."""
+        with self._stats_lock:
+            stats["active"] += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                stats["active"] -= 1
+                stats["completed"] += 1
+    
+    def get_executor_stats(self, name: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Get queue-depth statistics for executors used through submit().
+        
+        Args:
+            name: Optional executor name to report
+            
+        Returns:
+            Dict[str, Dict[str, int]]: Per executor: max workers, submitted and
+                completed counts, calls running (active) and waiting (queued)
+        """
+        with self._lock, self._stats_lock:
+            names = [name] if name else list(self._executor_stats)
+            result = {}
+            for executor_name in names:
+                stats = self._executor_stats.get(executor_name)
+                if stats is None:
+                    continue
+                pending = stats["submitted"] - stats["completed"]
+                result[executor_name] = {
+                    **stats,
+                    "pending": pending,
+                    "queued": max(0, pending - stats["active"]),
+                }
+            return result
             
     def shutdown(self, wait: bool = True) -> None:
         """
@@ -328,6 +395,7 @@ class ThreadPoolExecutorManager:
                     logger.error(f"Error shutting down executor {name}: {e}")
                     
             self._executors.clear()
+            self._executor_stats.clear()
             self._shutdown_in_progress = False
 
 def run_in_executor(func: Callable[..., T], *args, **kwargs) -> T:
@@ -608,7 +676,7 @@ async def get_llm_client():
 class _MockLLMClient:
     """Mock LLM client implementation for testing or when API is unavailable."""
     
-    async def call(self, conversation, system_prompt_info, schema=None, current_phase=None, max_tokens=None):
+    async def call(self, conversation, system_prompt_info, schema=None, current_phase=None, max_tokens=None, priority=None):
         """Mock implementation of the call method."""
         logger.warning("Using mock LLM client - this is only for testing/development")
         return json.dumps({
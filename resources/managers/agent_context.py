@@ -17,6 +17,7 @@ from resources.errors import (
 from resources.events import ResourceEventTypes, EventQueue
 from resources.base import (
     BaseManager, 
+    OperationMode,
     MemoryThresholds,
     CleanupConfig,
     CleanupPolicy,
@@ -218,7 +219,7 @@ class AgentContextManager(BaseManager):
                 self._memory_monitor._resource_sizes[f"context_{context_id}"] = size
             return context
             
-        return await self.protected_operation("get_context", _get)
+        return await self.protected_operation("get_context", _get, mode=OperationMode.READ)
 
     async def update_context(self, 
                         context_id: str,
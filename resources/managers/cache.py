@@ -1,7 +1,12 @@
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
+from enum import Enum, auto
+from itertools import islice
 from typing import Dict, Any, Optional, List, Union, Set
 import asyncio
+import hashlib
 import sys
+import time
 import logging
 
 from resources.common import ResourceState, ResourceType, InterfaceState, HealthStatus
@@ -14,7 +19,8 @@ from resources.errors import (
 )
 from resources.events import ResourceEventTypes, EventQueue
 from resources.base import (
-    BaseManager, 
+    BaseManager,
+    OperationMode,
     MemoryThresholds,
     CleanupConfig,
     CleanupPolicy,
@@ -23,12 +29,252 @@ from resources.base import (
 
 logger = logging.getLogger(__name__)
 
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def estimate_size(value: Any, sample_size: int = 64, max_depth: int = 8) -> int:
+    """Estimate the deep memory footprint of a value in bytes.
+    
+    Containers with more than ``sample_size`` items are sized from their first
+    ``sample_size`` items and extrapolated. Objects reachable more than once
+    are counted once.
+    """
+    seen: Set[int] = set()
+
+    def _size(obj: Any, depth: int) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        if depth >= max_depth or isinstance(obj, _ATOMIC_TYPES):
+            return size
+        
+        if isinstance(obj, dict):
+            total = len(obj)
+            children = sum(_size(k, depth + 1) + _size(v, depth + 1)
+                           for k, v in islice(obj.items(), sample_size))
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            total = len(obj)
+            children = sum(_size(item, depth + 1) for item in islice(obj, sample_size))
+        elif hasattr(obj, "__dict__"):
+            return size + _size(vars(obj), depth + 1)
+        elif hasattr(obj, "__slots__"):
+            return size + sum(_size(getattr(obj, name), depth + 1)
+                              for name in obj.__slots__ if hasattr(obj, name))
+        else:
+            return size
+        
+        sampled = min(total, sample_size)
+        if sampled and total > sampled:
+            children = children * total // sampled
+        return size + children
+    
+    return _size(value, 0)
+
+
+class EvictionPolicy(Enum):
+    """Order in which CacheManager evicts entries when over budget"""
+    LRU = auto()        # Least recently used first
+    TINY_LFU = auto()   # W-TinyLFU: frequency-based admission in front of a segmented LRU
+
+
+class LRUEviction:
+    """Least-recently-used eviction order with O(1) updates"""
+
+    def __init__(self):
+        self._order: OrderedDict = OrderedDict()
+
+    def insert(self, key: str) -> None:
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def access(self, key: str) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        """Next key to evict, or None if empty"""
+        return next(iter(self._order), None)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class FrequencySketch:
+    """Count-min sketch of 4-bit access counters, halved periodically so old
+    popularity fades
+    
+    Row indexes come from disjoint slices of one BLAKE2b digest, so they are
+    independent per row and stable across processes (unlike the salted
+    built-in ``hash``).
+    """
+
+    def __init__(self, capacity: int = 1024, depth: int = 4):
+        width = 1 << (max(4 * capacity, 64) - 1).bit_length()
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(depth)]
+        self._additions = 0
+        self._sample_size = 10 * width
+
+    def _indexes(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * len(self._rows)).digest()
+        return [
+            int.from_bytes(digest[4 * i:4 * i + 4], "little") & self._mask
+            for i in range(len(self._rows))
+        ]
+
+    def increment(self, key: str) -> None:
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            for row in self._rows:
+                row[:] = bytes(count >> 1 for count in row)
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+
+class TinyLFUEviction:
+    """W-TinyLFU eviction order with O(1) updates
+    
+    New keys enter a small LRU window. Keys leaving the window join the
+    probation segment of the main area, and a probation hit promotes a key to
+    the protected segment. On eviction the key most recently admitted from
+    the window competes with the probation victim and the one the frequency
+    sketch has seen less often is evicted, so one-off scans do not flush
+    frequently used entries.
+    """
+
+    def __init__(self, capacity: int = 1024, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        self._window: OrderedDict = OrderedDict()
+        self._probation: OrderedDict = OrderedDict()
+        self._protected: OrderedDict = OrderedDict()
+        self._admitted: deque = deque(maxlen=capacity)
+        self._sketch = FrequencySketch(capacity)
+        self._window_ratio = window_ratio
+        self._protected_ratio = protected_ratio
+
+    def insert(self, key: str) -> None:
+        if key in self._window or key in self._probation or key in self._protected:
+            self.access(key)
+            return
+        self._sketch.increment(key)
+        self._window[key] = None
+        
+        # Move window overflow into probation, remembering it as an admission candidate
+        window_limit = max(1, int(len(self) * self._window_ratio))
+        while len(self._window) > window_limit:
+            candidate, _ = self._window.popitem(last=False)
+            self._probation[candidate] = None
+            self._admitted.append(candidate)
+
+    def access(self, key: str) -> None:
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            protected_limit = max(1, int((len(self._probation) + len(self._protected)) * self._protected_ratio))
+            while len(self._protected) > protected_limit:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        """Next key to evict, or None if empty"""
+        main = self._probation or self._protected
+        if not main:
+            return next(iter(self._window), None)
+        victim = next(iter(main))
+        
+        # Most recently admitted key still on probation, skipping stale entries
+        while self._admitted:
+            candidate = self._admitted.pop()
+            if candidate in self._probation and candidate != victim:
+                if self._sketch.frequency(candidate) <= self._sketch.frequency(victim):
+                    return candidate
+                break
+        return victim
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+
+class TimerWheel:
+    """Hashed timer wheel of key expiry times
+    
+    Keys are bucketed by expiry at ``resolution`` seconds per slot, so
+    advancing the clock only visits the slots that elapsed instead of
+    scanning every entry.
+    """
+
+    def __init__(self, resolution: float = 1.0, slots: int = 512):
+        self._resolution = resolution
+        self._slots: List[Dict[str, float]] = [{} for _ in range(slots)]
+        self._slot_of: Dict[str, int] = {}
+        self._tick = int(time.time() // resolution)
+
+    def schedule(self, key: str, expires_at: float) -> None:
+        self.cancel(key)
+        # Keys already due go in the current slot so the next advance finds them
+        tick = max(int(expires_at // self._resolution), self._tick)
+        slot = tick % len(self._slots)
+        self._slots[slot][key] = expires_at
+        self._slot_of[key] = slot
+
+    def cancel(self, key: str) -> None:
+        slot = self._slot_of.pop(key, None)
+        if slot is not None:
+            del self._slots[slot][key]
+
+    def advance(self, now: Optional[float] = None) -> List[str]:
+        """Remove and return the keys that expired up to ``now``"""
+        now = time.time() if now is None else now
+        now_tick = int(now // self._resolution)
+        expired = []
+        for tick in range(self._tick, min(now_tick, self._tick + len(self._slots) - 1) + 1):
+            slot = self._slots[tick % len(self._slots)]
+            due = [key for key, expires_at in slot.items() if expires_at <= now]
+            for key in due:
+                del slot[key]
+                del self._slot_of[key]
+            expired.extend(due)
+        self._tick = max(self._tick, now_tick)
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+
 class CacheManager(BaseManager):
-    """Manages cache operations with memory monitoring and cleanup"""
-    def __init__(self, 
+    """Manages cache operations with memory monitoring and cleanup
+    
+    Entries are sized with a deep size estimate and evicted in LRU or
+    W-TinyLFU order once ``max_size`` entries or ``max_bytes`` bytes are
+    exceeded. TTL expiry is tracked in a timer wheel. When
+    ``event_coalesce_interval`` is set, CACHE_UPDATED events are batched and
+    emitted at most once per interval instead of per change.
+    """
+    def __init__(self,
                  event_queue: EventQueue,
                  cleanup_config: Optional[CleanupConfig] = None,
-                 memory_thresholds: Optional[MemoryThresholds] = None):
+                 memory_thresholds: Optional[MemoryThresholds] = None,
+                 max_bytes: Optional[int] = None,
+                 eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+                 event_coalesce_interval: Optional[float] = None):
         super().__init__(
             event_queue=event_queue,
             circuit_breaker_config=DEFAULT_CACHE_CIRCUIT_CONFIG,
@@ -46,58 +292,85 @@ class CacheManager(BaseManager):
         self._cache: Dict[str, Any] = {}
         self._cache_metadata: Dict[str, Dict[str, Any]] = {}
         self._last_cleanup = datetime.now()
-    
-    async def set_cache(self, 
+        
+        # Byte budget and eviction order
+        self._max_bytes = max_bytes
+        self._entry_sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        if eviction_policy == EvictionPolicy.TINY_LFU:
+            self._eviction = TinyLFUEviction(self._cleanup_config.max_size or 1024)
+        else:
+            self._eviction = LRUEviction()
+        self._expiry_wheel = TimerWheel()
+        
+        # Pending coalesced changes per key
+        self._event_coalesce_interval = event_coalesce_interval
+        self._pending_events: Dict[str, str] = {}
+        self._last_event_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def set_cache(self,
                        key: str,
                        value: Any,
-                       metadata: Optional[Dict[str, Any]] = None) -> None:
-        """Set cache value with metadata"""
+                       metadata: Optional[Dict[str, Any]] = None,
+                       ttl: Optional[float] = None) -> None:
+        """Set cache value with metadata
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            metadata: Extra metadata stored with the entry
+            ttl: Seconds until the entry expires, defaults to the cleanup config TTL
+        """
         async def _set():
-            # Check size limit - cleanup before adding if at limit
-            if (self._cleanup_config.max_size is not None and 
-                len(self._cache) >= self._cleanup_config.max_size):
-                # Force removal of oldest entries to make room
-                num_to_remove = len(self._cache) - self._cleanup_config.max_size + 1
-                await self._cleanup_oldest(force_remove_count=num_to_remove)
-
+            value_bytes = estimate_size(value)
+            value_size = value_bytes / (1024 * 1024)
+            
+            # Memory threshold check
+            if self._memory_thresholds and value_size > self._memory_thresholds.per_resource_max_mb:
+                raise ResourceExhaustionError(
+                    resource_id=key,
+                    operation="set_cache",
+                    current_usage=value_size,
+                    limit=self._memory_thresholds.per_resource_max_mb,
+                    resource_type=ResourceType.CACHE.name,
+                    details={"value_type": type(value).__name__}
+                )
+            
+            self._total_bytes += value_bytes - self._entry_sizes.get(key, 0)
+            self._entry_sizes[key] = value_bytes
             self._cache[key] = value
             self._cache_metadata[key] = {
                 "timestamp": datetime.now().isoformat(),
                 "type": ResourceType.CACHE.name,
                 **(metadata or {})
             }
+            self._eviction.insert(key)
             
             # Monitor memory usage
-            value_size = sys.getsizeof(value) / (1024 * 1024)
             self._memory_monitor._resource_sizes[f"cache_{key}"] = value_size
             
-            # Memory threshold check
-            if self._memory_thresholds and value_size > self._memory_thresholds.per_resource_max_mb:
-                # Try to clean up first before failing
-                await self._cleanup_oldest()
-                
-                # Recheck size after cleanup
-                if value_size > self._memory_thresholds.per_resource_max_mb:
-                    raise ResourceExhaustionError(
-                        resource_id=key,
-                        operation="set_cache",
-                        current_usage=value_size,
-                        limit=self._memory_thresholds.per_resource_max_mb,
-                        resource_type=ResourceType.CACHE.name,
-                        details={"value_type": type(value).__name__}
-                    )
-    
-            await self.event_bus.emit(
-                ResourceEventTypes.CACHE_UPDATED.value,
-                {
-                    "key": key,
-                    "operation": "set",
-                    "metadata": self._cache_metadata[key]
-                }
-            )
-                
-        await self.protected_operation("set_cache", _set)
-   
+            entry_ttl = ttl if ttl is not None else self._cleanup_config.ttl_seconds
+            if entry_ttl is not None and entry_ttl > 0:
+                self._expiry_wheel.schedule(key, time.time() + entry_ttl)
+            else:
+                self._expiry_wheel.cancel(key)
+            
+            # Evict until back within the entry and byte budgets
+            evicted = []
+            while self._over_budget():
+                victim = self._eviction.victim()
+                if victim is None or victim == key:
+                    break
+                self._remove_entry(victim)
+                evicted.append(victim)
+            
+            await self._emit_change(key, "set", self._cache_metadata[key])
+            for victim in evicted:
+                await self._emit_change(victim, "evicted")
+        
+        await self.protected_operation("set_cache", _set, mode=OperationMode.WRITE, key=key)
+
     async def get_cache(self, key: str) -> Optional[Any]:
         """Get cached value"""
         async def _get():
@@ -105,29 +378,76 @@ class CacheManager(BaseManager):
             if value is not None:
                 # Update access timestamp
                 self._cache_metadata[key]["last_accessed"] = datetime.now().isoformat()
+                self._eviction.access(key)
             return value
-            
-        return await self.protected_operation("get_cache", _get)
         
+        return await self.protected_operation("get_cache", _get, mode=OperationMode.READ)
+
     async def invalidate(self, key: str) -> None:
         """Invalidate cache entry"""
         async def _invalidate():
-            self._cache.pop(key, None)
-            self._cache_metadata.pop(key, None)
-            self._memory_monitor._resource_sizes.pop(f"cache_{key}", None)
-            
+            self._remove_entry(key)
+            await self._emit_change(key, "invalidated")
+        
+        await self.protected_operation("invalidate_cache", _invalidate, mode=OperationMode.WRITE, key=key)
+
+    def _over_budget(self) -> bool:
+        max_size = self._cleanup_config.max_size
+        return ((max_size is not None and len(self._cache) > max_size) or
+                (self._max_bytes is not None and self._total_bytes > self._max_bytes))
+
+    def _remove_entry(self, key: str) -> None:
+        """Drop an entry and its bookkeeping without emitting an event"""
+        self._cache.pop(key, None)
+        self._cache_metadata.pop(key, None)
+        self._total_bytes -= self._entry_sizes.pop(key, 0)
+        self._eviction.remove(key)
+        self._expiry_wheel.cancel(key)
+        self._memory_monitor._resource_sizes.pop(f"cache_{key}", None)
+
+    async def _emit_change(self, key: str, operation: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Emit a CACHE_UPDATED event, or queue it when events are coalesced"""
+        if self._event_coalesce_interval is None:
+            event = {"key": key, "operation": operation}
+            if metadata is not None:
+                event["metadata"] = metadata
+            await self.event_bus.emit(ResourceEventTypes.CACHE_UPDATED.value, event)
+            return
+        
+        self._pending_events[key] = operation
+        if time.monotonic() - self._last_event_flush >= self._event_coalesce_interval:
+            await self.flush_cache_events()
+        elif self._flush_task is None or self._flush_task.done():
+            # Make sure changes made just before a quiet period are still reported
+            self._flush_task = asyncio.create_task(self._flush_after(self._event_coalesce_interval))
+            self._add_task(self._flush_task)
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.flush_cache_events()
+
+    async def flush_cache_events(self) -> int:
+        """Emit one CACHE_UPDATED event with the last change of every pending key
+        
+        Returns:
+            Number of keys reported
+        """
+        pending_events, self._pending_events = self._pending_events, {}
+        self._last_event_flush = time.monotonic()
+        if pending_events:
             await self.event_bus.emit(
                 ResourceEventTypes.CACHE_UPDATED.value,
                 {
-                    "key": key,
-                    "operation": "invalidated"
+                    "operation": "batch",
+                    "changes": pending_events,
+                    "count": len(pending_events),
+                    "coalesced": True
                 }
             )
-            
-        await self.protected_operation("invalidate_cache", _invalidate)
+        return len(pending_events)
 
     async def _cleanup_oldest(self, force_remove_count: Optional[int] = None) -> None:
-        """Remove oldest cache entries
+        """Evict entries in eviction policy order
         
         Args:
             force_remove_count: If specified, remove exactly this many entries regardless of size limits
@@ -135,23 +455,22 @@ class CacheManager(BaseManager):
         try:
             if not self._cache:
                 return
-                    
-            # Sort by timestamp and remove oldest
-            sorted_entries = sorted(
-                self._cache_metadata.items(),
-                key=lambda x: x[1]["timestamp"]
-            )
             
             # Determine how many entries to remove
             if force_remove_count is not None:
-                num_to_remove = min(force_remove_count, len(sorted_entries))
+                num_to_remove = min(force_remove_count, len(self._cache))
             elif self._cleanup_config.max_size is not None:
-                num_to_remove = max(0, len(sorted_entries) - self._cleanup_config.max_size)
+                num_to_remove = max(0, len(self._cache) - self._cleanup_config.max_size)
             else:
                 # If no max_size set, remove oldest 10% as fallback
-                num_to_remove = max(1, len(sorted_entries) // 10)
-            for key, _ in sorted_entries[:num_to_remove]:
-                await self.invalidate(key)
+                num_to_remove = max(1, len(self._cache) // 10)
+            
+            for _ in range(num_to_remove):
+                victim = self._eviction.victim()
+                if victim is None:
+                    break
+                self._remove_entry(victim)
+                await self._emit_change(victim, "evicted")
         except Exception as e:
             # Convert generic exception to ResourceOperationError
             raise ResourceOperationError(
@@ -161,23 +480,27 @@ class CacheManager(BaseManager):
                 operation="cleanup_oldest"
             )
 
-    async def _cleanup_expired(self) -> None:
-        """Remove expired cache entries based on TTL"""
+    async def _cleanup_expired(self, full_scan: bool = False) -> None:
+        """Remove expired cache entries
+        
+        Args:
+            full_scan: Also check every entry's timestamp against the configured TTL
+                instead of only the timer wheel slots that elapsed
+        """
         try:
-            now = datetime.now()
-            expired_keys = []
+            expired_keys = set(self._expiry_wheel.advance())
             
-            # Only proceed if TTL is set
-            if self._cleanup_config.ttl_seconds is None or self._cleanup_config.ttl_seconds <= 0:
-                return
-                    
-            for key, metadata in self._cache_metadata.items():
-                timestamp = datetime.fromisoformat(metadata.get("timestamp", now.isoformat()))
-                if (now - timestamp).total_seconds() > self._cleanup_config.ttl_seconds:
-                    expired_keys.append(key)
+            if (full_scan and self._cleanup_config.ttl_seconds is not None
+                    and self._cleanup_config.ttl_seconds > 0):
+                now = datetime.now()
+                for key, metadata in self._cache_metadata.items():
+                    timestamp = datetime.fromisoformat(metadata.get("timestamp", now.isoformat()))
+                    if (now - timestamp).total_seconds() > self._cleanup_config.ttl_seconds:
+                        expired_keys.add(key)
             
             for key in expired_keys:
-                await self.invalidate(key)
+                self._remove_entry(key)
+                await self._emit_change(key, "expired")
         except Exception as e:
             # Convert generic exception to ResourceOperationError
             raise ResourceOperationError(
@@ -186,7 +509,7 @@ class CacheManager(BaseManager):
                 severity=ErrorSeverity.DEGRADED,
                 operation="cleanup_expired"
             )
-    
+
     async def _cleanup_resources(self, force: bool = False) -> None:
         """Implement cache-specific resource cleanup
         
@@ -196,14 +519,14 @@ class CacheManager(BaseManager):
         now = datetime.now()
         if not force and (now - self._last_cleanup).total_seconds() < self._cleanup_config.check_interval:
             return
-                
+        
         self._last_cleanup = now
         
         cleaned_items = 0
         
         # Size-based cleanup
         if force or self._cleanup_config.policy in [CleanupPolicy.MAX_SIZE, CleanupPolicy.HYBRID]:
-            if (self._cleanup_config.max_size is not None and 
+            if (self._cleanup_config.max_size is not None and
                 len(self._cache) > self._cleanup_config.max_size * 0.8): # Start cleaning at 80% fill
                 old_count = len(self._cache)
                 await self._cleanup_oldest()
@@ -212,9 +535,13 @@ class CacheManager(BaseManager):
         # TTL-based cleanup
         if force or self._cleanup_config.policy in [CleanupPolicy.TTL, CleanupPolicy.HYBRID]:
             old_count = len(self._cache)
-            await self._cleanup_expired()
+            await self._cleanup_expired(full_scan=force)
             cleaned_items += old_count - len(self._cache)
-            
+        
+        # Report coalesced changes still waiting for their interval
+        if self._pending_events:
+            await self.flush_cache_events()
+        
         # Report cleanup statistics
         await self.event_bus.emit(
             ResourceEventTypes.METRIC_RECORDED.value,
@@ -231,10 +558,7 @@ class CacheManager(BaseManager):
         """Get cache health status"""
         async def _get_health_operation():
             total_entries = len(self._cache)
-            total_memory = sum(
-                self._memory_monitor._resource_sizes.get(f"cache_{key}", 0)
-                for key in self._cache
-            )
+            total_memory = self._total_bytes / (1024 * 1024)
             
             status = "HEALTHY"
             description = "Cache operating normally"
@@ -243,15 +567,19 @@ class CacheManager(BaseManager):
                 total_entries >= self._cleanup_config.max_size * 0.8):
                 status = "DEGRADED"
                 description = "Cache near capacity"
-                
+            elif self._max_bytes is not None and self._total_bytes >= self._max_bytes * 0.8:
+                status = "DEGRADED"
+                description = "Cache near memory budget"
+            
             return HealthStatus(
                 status=status,
                 source="cache_manager",
                 description=description,
                 metadata={
                     "total_entries": total_entries,
-                    "total_memory_mb": total_memory
+                    "total_memory_mb": total_memory,
+                    "max_bytes": self._max_bytes
                 }
             )
         
-        return await self.protected_operation("get_health_status", _get_health_operation)
\ No newline at end of file
+        return await self.protected_operation("get_health_status", _get_health_operation)
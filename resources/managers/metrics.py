@@ -1,9 +1,14 @@
-from collections import deque, defaultdict
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union, Set
+from typing import Dict, Any, Optional, List, Union, Set, Iterable, Sequence
+import asyncio
+import math
 import sys
+import time
 import logging
 
+import numpy as np
+
 from resources.common import ResourceState, ResourceType, InterfaceState, HealthStatus
 from resources.errors import (
     ErrorSeverity,
@@ -15,6 +20,7 @@ from resources.errors import (
 from resources.events import ResourceEventTypes, EventQueue
 from resources.base import (
     BaseManager, 
+    OperationMode,
     MemoryThresholds,
     CleanupConfig,
     CleanupPolicy
@@ -22,12 +28,243 @@ from resources.base import (
 
 logger = logging.getLogger(__name__)
 
+# Rollup resolutions in seconds, and how many buckets of each are retained
+ROLLUP_RESOLUTIONS = {"1s": 1, "1m": 60, "1h": 3600}
+ROLLUP_RETENTION = {"1s": 3600, "1m": 1440, "1h": 720}
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+def _to_epoch(timestamp: Union[str, datetime, float, int, None]) -> float:
+    """Convert an ISO string, datetime or epoch value to epoch seconds."""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+class MetricRollup:
+    """Fixed-resolution count/sum/min/max buckets for one metric series.
+    
+    Buckets are ``[start, count, sum, min, max]`` lists in time order. Points
+    arriving after a newer bucket was opened are folded into their bucket if
+    it is still retained, otherwise into the newest bucket.
+    """
+    __slots__ = ("resolution", "buckets")
+
+    # A bucket list of five floats plus its deque slot
+    BUCKET_BYTES = sys.getsizeof([0.0] * 5) + 5 * sys.getsizeof(0.0) + 8
+
+    def __init__(self, resolution: int, retention: int):
+        self.resolution = resolution
+        self.buckets: deque = deque(maxlen=retention)
+
+    def add(self, timestamp: float, value: float) -> None:
+        start = timestamp - timestamp % self.resolution
+        bucket = None
+        if self.buckets and self.buckets[-1][0] <= start:
+            if self.buckets[-1][0] == start:
+                bucket = self.buckets[-1]
+        elif self.buckets:
+            bucket = next((b for b in reversed(self.buckets) if b[0] <= start), self.buckets[-1])
+        if bucket is None:
+            self.buckets.append([start, 1, value, value, value])
+            return
+        bucket[1] += 1
+        bucket[2] += value
+        if value < bucket[3]:
+            bucket[3] = value
+        if value > bucket[4]:
+            bucket[4] = value
+
+    def trim(self, keep: int) -> None:
+        """Drop the oldest buckets, keeping the most recent ``keep``."""
+        for _ in range(max(len(self.buckets) - keep, 0)):
+            self.buckets.popleft()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the retained buckets."""
+        return len(self.buckets) * self.BUCKET_BYTES
+
+
+class MetricSeries:
+    """Fixed-capacity ring buffer of one metric's points, stored column-wise.
+    
+    Timestamps (epoch seconds) and values live in NumPy arrays so window
+    queries and statistics are vectorized; metadata is kept in a parallel
+    list. Indexing and iteration return point dicts in the same shape as the
+    previous deque entries, oldest first. Every point also feeds the 1s/1m/1h
+    rollups, which outlive the raw points for long-running phases.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._metadata: List[Optional[Dict[str, Any]]] = [None] * capacity
+        # Original non-numeric values (e.g. None), keyed by slot
+        self._raw: Dict[int, Any] = {}
+        self._start = 0
+        self._size = 0
+        self.rollups = {
+            name: MetricRollup(resolution, ROLLUP_RETENTION[name])
+            for name, resolution in ROLLUP_RESOLUTIONS.items()
+        }
+
+    @classmethod
+    def from_points(cls, points: Iterable[Dict[str, Any]], capacity: int = 1000) -> "MetricSeries":
+        """Build a series from point dicts with value, timestamp and metadata."""
+        series = cls(capacity)
+        for point in points:
+            series.append(point.get("value"), point.get("timestamp"), point.get("metadata"))
+        return series
+
+    @property
+    def maxlen(self) -> int:
+        return self.capacity
+
+    def append(self, value: Any, timestamp: Union[str, datetime, float, None] = None,
+               metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Append a point, overwriting the oldest one when the buffer is full."""
+        timestamp = _to_epoch(timestamp)
+        if self._size < self.capacity:
+            slot = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        try:
+            numeric = float(value)
+        except (TypeError, ValueError):
+            numeric = math.nan
+        if math.isnan(numeric) and not isinstance(value, float):
+            self._raw[slot] = value
+        else:
+            self._raw.pop(slot, None)
+        self._timestamps[slot] = timestamp
+        self._values[slot] = numeric
+        self._metadata[slot] = metadata or None
+
+        if not math.isnan(numeric):
+            for rollup in self.rollups.values():
+                rollup.add(timestamp, numeric)
+
+    def trim(self, keep: int) -> None:
+        """Drop the oldest points, keeping the most recent ``keep``."""
+        for _ in range(max(self._size - keep, 0)):
+            self._metadata[self._start] = None
+            self._raw.pop(self._start, None)
+            self._start = (self._start + 1) % self.capacity
+            self._size -= 1
+
+    def clear(self) -> None:
+        self.trim(0)
+        self._start = 0
+
+    def slots(self, window: Optional[timedelta] = None, limit: Optional[int] = None) -> np.ndarray:
+        """Buffer slots of the points newer than the window, oldest first."""
+        slots = (self._start + np.arange(self._size)) % self.capacity
+        if window is not None:
+            cutoff = time.time() - window.total_seconds()
+            slots = slots[self._timestamps[slots] > cutoff]
+        if limit:
+            slots = slots[-limit:]
+        return slots
+
+    def point(self, slot: int) -> Dict[str, Any]:
+        return {
+            "value": self._raw.get(slot, float(self._values[slot])),
+            "timestamp": datetime.fromtimestamp(float(self._timestamps[slot])).isoformat(),
+            "metadata": self._metadata[slot] or {}
+        }
+
+    def points(self, window: Optional[timedelta] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return [self.point(int(slot)) for slot in self.slots(window, limit)]
+
+    def values(self, window: Optional[timedelta] = None) -> np.ndarray:
+        """Numeric values of the points in the window, oldest first."""
+        values = self._values[self.slots(window)]
+        return values[~np.isnan(values)]
+
+    def latest_timestamp(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return float(self._timestamps[(self._start + self._size - 1) % self.capacity])
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the stored points and their rollups."""
+        points = self._size * (self._timestamps.itemsize + self._values.itemsize + 8)
+        return points + sum(rollup.nbytes for rollup in self.rollups.values())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("metric series index out of range")
+        return self.point((self._start + index) % self.capacity)
+
+    def __iter__(self):
+        return iter(self.points())
+
+
+class MetricStore(dict):
+    """Metric name to MetricSeries mapping that creates series on first use.
+    
+    Assigning a list or deque of point dicts converts it to a series.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__()
+        self.capacity = capacity
+
+    def __missing__(self, metric_name: str) -> MetricSeries:
+        series = MetricSeries(self.capacity)
+        super().__setitem__(metric_name, series)
+        return series
+
+    def __setitem__(self, metric_name: str, series: Union[MetricSeries, Iterable[Dict[str, Any]]]) -> None:
+        if not isinstance(series, MetricSeries):
+            series = MetricSeries.from_points(series, getattr(series, "maxlen", None) or self.capacity)
+        super().__setitem__(metric_name, series)
+
+
+def summarize_values(values: np.ndarray, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+    """Compute min/max/avg/count and percentiles of a value array."""
+    if not len(values):
+        return {}
+    stats = {
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "avg": float(values.mean()),
+        "count": int(len(values))
+    }
+    if percentiles:
+        for p, result in zip(percentiles, np.percentile(values, percentiles)):
+            stats[f"p{p:g}"] = float(result)
+    return stats
+
 class MetricsManager(BaseManager):
-    """Manages metrics collection and aggregation"""
+    """Manages metrics collection and aggregation
+    
+    Each metric is kept in a MetricSeries ring buffer of the most recent
+    ``max_points_per_metric`` points plus 1s/1m/1h rollups. When
+    ``event_coalesce_interval`` is set, METRIC_RECORDED events are batched
+    per metric and emitted at most once per interval instead of per point.
+    """
     def __init__(self, 
                  event_queue: EventQueue,
                  cleanup_config: Optional[CleanupConfig] = None,
-                 memory_thresholds: Optional[MemoryThresholds] = None):
+                 memory_thresholds: Optional[MemoryThresholds] = None,
+                 max_points_per_metric: int = 1000,
+                 event_coalesce_interval: Optional[float] = None):
         super().__init__(
             event_queue=event_queue,
             cleanup_config=cleanup_config or CleanupConfig(
@@ -37,8 +274,14 @@ class MetricsManager(BaseManager):
             ),
             memory_thresholds=memory_thresholds
         )
-        self._metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self._metrics: MetricStore = MetricStore(max_points_per_metric)
         self._last_cleanup = datetime.now()
+        
+        # Pending coalesced events per metric
+        self._event_coalesce_interval = event_coalesce_interval
+        self._pending_events: Dict[str, Dict[str, Any]] = {}
+        self._last_event_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def record_metric(self, 
                           metric_name: str,
@@ -46,29 +289,26 @@ class MetricsManager(BaseManager):
                           metadata: Optional[Dict[str, Any]] = None) -> None:
         """Record a metric value"""
         async def _record():
-            metric_data = {
-                "value": value,
-                "timestamp": datetime.now().isoformat(),
-                "metadata": metadata or {}
-            }
-            
-            self._metrics[metric_name].append(metric_data)
+            series = self._metrics[metric_name]
+            series.append(value, metadata=metadata)
             
             # Monitor memory usage
-            metrics_size = sys.getsizeof(self._metrics[metric_name]) / (1024 * 1024)
+            metrics_size = series.nbytes / (1024 * 1024)
             self._memory_monitor._resource_sizes[f"metrics_{metric_name}"] = metrics_size
             
             # Memory threshold check
             if self._memory_thresholds and metrics_size > self._memory_thresholds.per_resource_max_mb:
                 # Try to reduce by removing oldest metrics
-                if len(self._metrics[metric_name]) > 10:
+                if len(series) > 10:
                     # Keep only the most recent 75% of metrics
-                    keep_count = int(len(self._metrics[metric_name]) * 0.75)
-                    self._metrics[metric_name] = deque(list(self._metrics[metric_name])[-keep_count:], maxlen=self._metrics[metric_name].maxlen)
+                    series.trim(int(len(series) * 0.75))
+                # Rollup buckets count towards the size too
+                for rollup in series.rollups.values():
+                    rollup.trim(max(int(len(rollup.buckets) * 0.75), 1))
                     
-                    # Recalculate size after reduction
-                    metrics_size = sys.getsizeof(self._metrics[metric_name]) / (1024 * 1024)
-                    self._memory_monitor._resource_sizes[f"metrics_{metric_name}"] = metrics_size
+                # Recalculate size after reduction
+                metrics_size = series.nbytes / (1024 * 1024)
+                self._memory_monitor._resource_sizes[f"metrics_{metric_name}"] = metrics_size
                     
                 # Check if still over threshold after reduction
                 if metrics_size > self._memory_thresholds.per_resource_max_mb:
@@ -78,19 +318,66 @@ class MetricsManager(BaseManager):
                         current_usage=metrics_size,
                         limit=self._memory_thresholds.per_resource_max_mb,
                         resource_type=ResourceType.METRICS.name,
-                        details={"metric_count": len(self._metrics[metric_name])}
+                        details={"metric_count": len(series)}
                     )
     
-            await self.event_bus.emit(
-                ResourceEventTypes.METRIC_RECORDED.value,
-                {
-                    "metric": metric_name,
-                    "value": value,
-                    "metadata": metadata or {}
-                }
-            )
+            if self._event_coalesce_interval is None:
+                await self.event_bus.emit(
+                    ResourceEventTypes.METRIC_RECORDED.value,
+                    {
+                        "metric": metric_name,
+                        "value": value,
+                        "metadata": metadata or {}
+                    }
+                )
+            else:
+                await self._coalesce_event(metric_name, value, metadata)
             
-        await self.protected_operation("write_metrics", _record)
+        await self.protected_operation("write_metrics", _record, mode=OperationMode.WRITE, key=metric_name)
+
+    async def _coalesce_event(self, metric_name: str, value: Any, metadata: Optional[Dict[str, Any]]) -> None:
+        """Fold a point into the metric's pending event and flush when the interval has passed."""
+        pending = self._pending_events.get(metric_name)
+        if pending is None:
+            pending = self._pending_events[metric_name] = {"count": 0, "values": []}
+        pending["count"] += 1
+        pending["value"] = value
+        pending["metadata"] = metadata or {}
+        if isinstance(value, (int, float)):
+            pending["values"].append(value)
+        
+        if time.monotonic() - self._last_event_flush >= self._event_coalesce_interval:
+            await self.flush_metric_events()
+        elif self._flush_task is None or self._flush_task.done():
+            # Make sure points recorded just before a quiet period are still reported
+            self._flush_task = asyncio.create_task(self._flush_after(self._event_coalesce_interval))
+            self._add_task(self._flush_task)
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.flush_metric_events()
+
+    async def flush_metric_events(self) -> int:
+        """Emit one METRIC_RECORDED event per metric with pending coalesced points.
+        
+        Returns:
+            Number of events emitted
+        """
+        pending_events, self._pending_events = self._pending_events, {}
+        self._last_event_flush = time.monotonic()
+        for metric_name, pending in pending_events.items():
+            values = pending["values"]
+            event = {
+                "metric": metric_name,
+                "value": pending["value"],
+                "metadata": pending["metadata"],
+                "count": pending["count"],
+                "coalesced": True
+            }
+            if values:
+                event.update(min=min(values), max=max(values), avg=sum(values) / len(values))
+            await self.event_bus.emit(ResourceEventTypes.METRIC_RECORDED.value, event)
+        return len(pending_events)
 
     async def get_metrics(self, 
                          metric_name: str,
@@ -100,55 +387,84 @@ class MetricsManager(BaseManager):
         async def _get():
             if metric_name not in self._metrics:
                 return []
-                
-            metrics = list(self._metrics[metric_name])
+            return self._metrics[metric_name].points(window, limit)
             
-            if window:
-                cutoff = datetime.now() - window
-                metrics = [
-                    m for m in metrics 
-                    if datetime.fromisoformat(m["timestamp"]) > cutoff
-                ]
-                
-            if limit:
-                metrics = metrics[-limit:]
-                
-            return metrics
-            
-        return await self.protected_operation("read_metrics", _get)
+        return await self.protected_operation("read_metrics", _get, mode=OperationMode.READ)
         
     async def get_metric_average(self, 
                             metric_name: str,
                             window: Optional[timedelta] = None) -> Optional[float]:
         """Calculate average for a metric over time window"""
         async def _get_average_operation():
-            metrics = await self.get_metrics(metric_name, window)
-            if not metrics:
+            if metric_name not in self._metrics:
                 return None
-                    
-            values = [m["value"] for m in metrics]
-            return sum(values) / len(values)
+            values = self._metrics[metric_name].values(window)
+            if not len(values):
+                return None
+            return float(values.mean())
         
-        return await self.protected_operation("get_metric_average", _get_average_operation)
+        return await self.protected_operation("get_metric_average", _get_average_operation, mode=OperationMode.READ)
 
     async def get_metric_stats(self,
                             metric_name: str,
-                            window: Optional[timedelta] = None) -> Dict[str, float]:
-        """Get comprehensive statistics for a metric"""
+                            window: Optional[timedelta] = None,
+                            percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Get comprehensive statistics for a metric
+        
+        Args:
+            metric_name: Name of the metric
+            window: Only include points newer than this
+            percentiles: Percentiles to include as ``p<n>`` keys
+            
+        Returns:
+            Dict with min, max, avg, count and the percentiles, empty if there are no points
+        """
         async def _get_stats_operation():
-            metrics = await self.get_metrics(metric_name, window)
-            if not metrics:
+            if metric_name not in self._metrics:
                 return {}
-                    
-            values = [m["value"] for m in metrics]
-            return {
-                "min": min(values),
-                "max": max(values),
-                "avg": sum(values) / len(values),
-                "count": len(values)
-            }
+            return summarize_values(self._metrics[metric_name].values(window), percentiles)
         
-        return await self.protected_operation("get_metric_stats", _get_stats_operation)
+        return await self.protected_operation("get_metric_stats", _get_stats_operation, mode=OperationMode.READ)
+
+    async def get_metric_rollup(self,
+                                metric_name: str,
+                                resolution: str = "1m",
+                                window: Optional[timedelta] = None) -> List[Dict[str, Any]]:
+        """Get downsampled buckets for a metric
+        
+        Rollups cover far longer periods than the raw points: an hour at 1s,
+        a day at 1m and 30 days at 1h resolution.
+        
+        Args:
+            metric_name: Name of the metric
+            resolution: One of "1s", "1m" or "1h"
+            window: Only include buckets that end after now minus this
+            
+        Returns:
+            Buckets oldest first, each with timestamp, count, sum, min, max and avg
+        """
+        if resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown rollup resolution {resolution}, expected one of {list(ROLLUP_RESOLUTIONS)}")
+            
+        async def _get_rollup_operation():
+            if metric_name not in self._metrics:
+                return []
+            rollup = self._metrics[metric_name].rollups[resolution]
+            cutoff = time.time() - window.total_seconds() if window else None
+            return [
+                {
+                    "timestamp": datetime.fromtimestamp(start).isoformat(),
+                    "count": count,
+                    "sum": total,
+                    "min": minimum,
+                    "max": maximum,
+                    "avg": total / count
+                }
+                for start, count, total, minimum, maximum in rollup.buckets
+                if cutoff is None or start + rollup.resolution > cutoff
+            ]
+        
+        return await self.protected_operation("get_metric_rollup", _get_rollup_operation, mode=OperationMode.READ)
 
     async def _cleanup_resources(self, force: bool = False) -> None:
         """Clean up old metrics with enhanced tracking
@@ -171,6 +487,10 @@ class MetricsManager(BaseManager):
             # Default to 12 hours if ttl_seconds is None and force is True
             ttl_seconds = 43200
         
+        # Report coalesced points still waiting for their interval
+        if self._pending_events:
+            await self.flush_metric_events()
+        
         # Remove metrics for inactive series
         inactive_metrics = []
         for metric_name in self._metrics:
@@ -179,9 +499,8 @@ class MetricsManager(BaseManager):
                 inactive_metrics.append(metric_name)
                 continue
                     
-            latest_metric = self._metrics[metric_name][-1]
-            latest_time = datetime.fromisoformat(latest_metric["timestamp"])
-            if (now - latest_time).total_seconds() > ttl_seconds:
+            latest_time = self._metrics[metric_name].latest_timestamp()
+            if now.timestamp() - latest_time > ttl_seconds:
                 inactive_metrics.append(metric_name)
                     
         # Track cleanup statistics
@@ -21,7 +21,7 @@ from resources.monitoring.circuit_breakers import (
     ReliabilityMetrics,
     CircuitBreakerRegistry,
 )
-from resources.monitoring.memory import MemoryMonitor
+from resources.monitoring.memory import MemoryMonitor, ProcessMemoryGauge
 from resources.monitoring.health import HealthTracker
 from resources.monitoring.system import SystemMonitor, SystemMonitorConfig
 from resources.monitoring.utils import with_memory_checking
@@ -58,6 +58,7 @@ __all__ = [
     
     # Other monitoring classes
     'MemoryMonitor',
+    'ProcessMemoryGauge',
     'HealthTracker',
     'SystemMonitor',
     'SystemMonitorConfig',
@@ -8,6 +8,7 @@ sizes and emits alerts when configurable thresholds are exceeded.
 import asyncio
 import logging
 import threading
+import time
 import psutil
 from datetime import datetime
 from typing import Dict, Any, Optional, Set
@@ -18,6 +19,40 @@ from resources.monitoring.utils import with_memory_checking
 
 logger = logging.getLogger(__name__)
 
+class ProcessMemoryGauge:
+    """Process-wide sampled reading of this process's resident memory
+    
+    Reading RSS through psutil is a system call, so the reading is cached
+    and refreshed at most once per ``refresh_interval`` seconds no matter how
+    many callers ask for it.
+    """
+    _instance = None
+    _instance_lock = threading.RLock()
+    
+    def __new__(cls, refresh_interval: float = 1.0):
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance._process = psutil.Process()
+                instance._refresh_interval = refresh_interval
+                instance._rss_mb = 0.0
+                instance._sampled_at = None
+                cls._instance = instance
+        return cls._instance
+    
+    def rss_mb(self) -> float:
+        """Resident memory in MB, at most ``refresh_interval`` seconds old"""
+        now = time.monotonic()
+        if self._sampled_at is None or now - self._sampled_at >= self._refresh_interval:
+            with self._instance_lock:
+                if self._sampled_at is None or now - self._sampled_at >= self._refresh_interval:
+                    try:
+                        self._rss_mb = self._process.memory_info().rss / (1024 * 1024)
+                    except psutil.Error as e:
+                        logger.debug(f"Failed to sample process memory: {e}")
+                    self._sampled_at = now
+        return self._rss_mb
+
 class MemoryMonitor:
     """Centralized memory monitoring system"""
     _instance = None
@@ -131,6 +166,34 @@ class MemoryMonitor:
             await self._check_component_memory(component_id)
             await self._process_alert_batch()
     
+    async def track_resources(self, sizes: Dict[str, float], component_id: str):
+        """Track several resources of one component in a single update
+        
+        Args:
+            sizes: Resource ID to size in MB
+            component_id: Component owning the resources
+        """
+        if not sizes:
+            return
+            
+        with self._lock:
+            self._operation_count += len(sizes)
+            self._resource_sizes.update(sizes)
+            component_thresholds = self._component_thresholds.get(component_id, self._thresholds)
+            
+        # Ensure event queue is processing events
+        if not getattr(self._event_queue, '_running', False):
+            await self._event_queue.start()
+            
+        for resource_id, size_mb in sizes.items():
+            if size_mb > component_thresholds.per_resource_max_mb:
+                await self._queue_resource_alert(resource_id, size_mb, component_id)
+                
+        now = datetime.now()
+        if (now - self._last_alert_batch).total_seconds() > 30:  # Check every 30 seconds
+            await self._check_component_memory(component_id)
+            await self._process_alert_batch()
+    
     async def untrack_resource(self, resource_id: str, component_id: str = None):
         """Async wrapper for remove_resource"""
         with self._lock:
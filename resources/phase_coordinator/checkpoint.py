@@ -2,10 +2,19 @@
 Forest For The Trees (FFTT) Phase Coordination System - Checkpoint Management
 ---------------------------------------------------
 Handles creation and restoration of phase checkpoints.
+
+Checkpoints are stored as manifests that reference content-addressed chunks
+of the phase context. Top-level context fields are chunked individually and
+dict-valued fields (config, metrics, metadata, ...) per key, so unchanged
+values are shared between checkpoints and phases and each checkpoint only
+writes the chunks that changed.
 """
+import hashlib
+import json
 import logging
 import time
-from typing import Dict, Any, Optional
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from resources.events import EventQueue, ResourceEventTypes
@@ -15,6 +24,115 @@ from resources.phase_coordinator.models import PhaseContext
 
 logger = logging.getLogger(__name__)
 
+CHECKPOINT_FORMAT = "chunked"
+CHECKPOINT_KEY_PREFIX = "phase_checkpoint:"
+CHUNK_KEY_PREFIX = "phase_checkpoint_chunk:"
+
+
+class ChunkStore:
+    """Content-addressed store of JSON-serialized checkpoint chunks with reference counts"""
+    
+    def __init__(self):
+        self._chunks: Dict[str, str] = {}
+        self._refcounts: Dict[str, int] = {}
+    
+    @staticmethod
+    def encode(value: Any) -> Tuple[str, str]:
+        """Serialize a value canonically and return its content hash and data"""
+        data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest(), data
+    
+    def put(self, value: Any) -> Tuple[str, Optional[str]]:
+        """
+        Store a value
+        
+        Returns:
+            Tuple of the chunk hash and the serialized data if the chunk is new, else None
+        """
+        chunk_hash, data = self.encode(value)
+        if chunk_hash in self._chunks:
+            return chunk_hash, None
+        self._chunks[chunk_hash] = data
+        self._refcounts.setdefault(chunk_hash, 0)
+        return chunk_hash, data
+    
+    def add(self, chunk_hash: str, data: str) -> None:
+        """Add a chunk loaded from persistent storage"""
+        if chunk_hash not in self._chunks:
+            self._chunks[chunk_hash] = data
+            self._refcounts.setdefault(chunk_hash, 0)
+    
+    def get(self, chunk_hash: str) -> Any:
+        """Decode a chunk into a new object"""
+        return json.loads(self._chunks[chunk_hash])
+    
+    def __contains__(self, chunk_hash: str) -> bool:
+        return chunk_hash in self._chunks
+    
+    def incref(self, chunk_hashes: List[str]) -> None:
+        for chunk_hash in chunk_hashes:
+            self._refcounts[chunk_hash] = self._refcounts.get(chunk_hash, 0) + 1
+    
+    def decref(self, chunk_hashes: List[str]) -> None:
+        for chunk_hash in chunk_hashes:
+            if chunk_hash in self._refcounts:
+                self._refcounts[chunk_hash] = max(0, self._refcounts[chunk_hash] - 1)
+    
+    def unreferenced(self) -> List[str]:
+        return [chunk_hash for chunk_hash, count in self._refcounts.items() if count == 0]
+    
+    def remove(self, chunk_hash: str) -> None:
+        self._chunks.pop(chunk_hash, None)
+        self._refcounts.pop(chunk_hash, None)
+    
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "chunks": len(self._chunks),
+            "bytes": sum(len(data) for data in self._chunks.values()),
+            "unreferenced": len(self.unreferenced())
+        }
+
+
+class CheckpointData(Mapping):
+    """
+    Read-only view of a checkpointed context dict that decodes fields on first access
+    
+    Each access to a field not yet decoded reads its chunks from the store; the
+    decoded values are copies, so mutating them does not affect the checkpoint.
+    """
+    
+    def __init__(self, manifest: Dict[str, Any], store: ChunkStore):
+        self._fields = manifest["fields"]
+        self._store = store
+        self._decoded: Dict[str, Any] = {}
+    
+    def __getitem__(self, field_name: str) -> Any:
+        if field_name not in self._decoded:
+            ref = self._fields[field_name]
+            if isinstance(ref, dict):
+                self._decoded[field_name] = {key: self._store.get(chunk_hash) for key, chunk_hash in ref["keys"].items()}
+            else:
+                self._decoded[field_name] = self._store.get(ref)
+        return self._decoded[field_name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+    
+    def __len__(self) -> int:
+        return len(self._fields)
+
+
+def _manifest_chunks(manifest: Dict[str, Any]) -> List[str]:
+    """List the chunk hashes a manifest references"""
+    chunks = []
+    for ref in manifest["fields"].values():
+        if isinstance(ref, dict):
+            chunks.extend(ref["keys"].values())
+        else:
+            chunks.append(ref)
+    return chunks
+
+
 class CheckpointManager:
     """Manages checkpoints for phases"""
     
@@ -33,7 +151,42 @@ class CheckpointManager:
         self._event_queue = event_queue
         self._state_manager = state_manager
         self._metrics_manager = metrics_manager
-        self._checkpoint_data: Dict[str, Dict[str, Any]] = {}
+        self._chunks = ChunkStore()
+        self._manifests: Dict[str, Dict[str, Any]] = {}
+    
+    def _new_checkpoint_id(self, phase_id: str) -> str:
+        checkpoint_id = f"checkpoint_{phase_id}_{int(time.time())}"
+        sequence = 1
+        unique_id = checkpoint_id
+        while unique_id in self._manifests:
+            sequence += 1
+            unique_id = f"{checkpoint_id}_{sequence}"
+        return unique_id
+    
+    def _chunk_context(self, context_dict: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Split a context dict into chunks
+        
+        Returns:
+            Tuple of the manifest field references and the chunks not stored before
+        """
+        fields: Dict[str, Any] = {}
+        new_chunks: Dict[str, str] = {}
+        for field_name, value in context_dict.items():
+            if isinstance(value, dict) and value:
+                keys = {}
+                for key, item in value.items():
+                    chunk_hash, data = self._chunks.put(item)
+                    keys[str(key)] = chunk_hash
+                    if data is not None:
+                        new_chunks[chunk_hash] = data
+                fields[field_name] = {"keys": keys}
+            else:
+                chunk_hash, data = self._chunks.put(value)
+                fields[field_name] = chunk_hash
+                if data is not None:
+                    new_chunks[chunk_hash] = data
+        return fields, new_chunks
     
     async def create_checkpoint(self, phase_id: str, context: PhaseContext) -> str:
         """
@@ -51,23 +204,37 @@ class CheckpointManager:
             raise ValueError(f"Phase {phase_id} not found")
             
         # Generate checkpoint ID
-        checkpoint_id = f"checkpoint_{phase_id}_{int(time.time())}"
-        
-        # Store phase context
-        context_dict = context.to_dict()
-        self._checkpoint_data[checkpoint_id] = context_dict
+        checkpoint_id = self._new_checkpoint_id(phase_id)
         
         # Add checkpoint to phase context
         context.checkpoint_ids.append(checkpoint_id)
         
-        # Persist checkpoint
+        # Chunk the phase context; only chunks not seen before need to be written
+        fields, new_chunks = self._chunk_context(context.to_dict())
+        manifest = {
+            "checkpoint_format": CHECKPOINT_FORMAT,
+            "phase_id": phase_id,
+            "fields": fields,
+            "created_at": datetime.now().isoformat()
+        }
+        self._manifests[checkpoint_id] = manifest
+        self._chunks.incref(_manifest_chunks(manifest))
+        
+        # Persist new chunks, then the manifest that references them
+        for chunk_hash, data in new_chunks.items():
+            await self._state_manager.set_state(
+                f"{CHUNK_KEY_PREFIX}{chunk_hash}",
+                {"data": data},
+                resource_type=ResourceType.STATE
+            )
         await self._state_manager.set_state(
-            f"phase_checkpoint:{checkpoint_id}",
-            context_dict,
-            ResourceType.STATE
+            f"{CHECKPOINT_KEY_PREFIX}{checkpoint_id}",
+            manifest,
+            resource_type=ResourceType.STATE
         )
         
-        logger.info(f"Created checkpoint {checkpoint_id} for phase {phase_id}")
+        logger.info(f"Created checkpoint {checkpoint_id} for phase {phase_id} "
+                    f"({len(new_chunks)} new chunks)")
         
         # Determine phase type value for metrics
         phase_type_value = context.phase_type.value if hasattr(context.phase_type, 'value') else str(context.phase_type)
@@ -79,12 +246,46 @@ class CheckpointManager:
             metadata={
                 "phase_id": phase_id,
                 "checkpoint_id": checkpoint_id,
+                "chunks_referenced": len(_manifest_chunks(manifest)),
+                "chunks_written": len(new_chunks),
+                "bytes_written": sum(len(data) for data in new_chunks.values()),
                 "timestamp": datetime.now().isoformat()
             }
         )
         
         return checkpoint_id
     
+    async def _load_checkpoint_data(self, checkpoint_id: str) -> Optional[Mapping]:
+        """Load checkpoint data from memory or the state manager"""
+        manifest = self._manifests.get(checkpoint_id)
+        
+        # If not in memory, try to load from state manager
+        if manifest is None:
+            checkpoint_entry = await self._state_manager.get_state(f"{CHECKPOINT_KEY_PREFIX}{checkpoint_id}")
+            if not checkpoint_entry:
+                logger.error(f"Checkpoint {checkpoint_id} not found")
+                return None
+            
+            manifest = checkpoint_entry.state
+            if not isinstance(manifest, dict) or manifest.get("checkpoint_format") != CHECKPOINT_FORMAT:
+                # Checkpoint stored as a complete context dict
+                return manifest
+            
+            missing = [chunk_hash for chunk_hash in set(_manifest_chunks(manifest)) if chunk_hash not in self._chunks]
+            if missing:
+                entries = await self._state_manager.get_states_many([f"{CHUNK_KEY_PREFIX}{h}" for h in missing])
+                for chunk_hash in missing:
+                    entry = entries.get(f"{CHUNK_KEY_PREFIX}{chunk_hash}")
+                    if entry is None:
+                        logger.error(f"Checkpoint {checkpoint_id} references missing chunk {chunk_hash}")
+                        return None
+                    self._chunks.add(chunk_hash, entry.state["data"])
+            
+            self._manifests[checkpoint_id] = manifest
+            self._chunks.incref(_manifest_chunks(manifest))
+        
+        return CheckpointData(manifest, self._chunks)
+    
     async def restore_from_checkpoint(self, checkpoint_id: str) -> Optional[PhaseContext]:
         """
         Restore a phase from a checkpoint
@@ -95,17 +296,9 @@ class CheckpointManager:
         Returns:
             Optional[PhaseContext]: The restored phase context or None if checkpoint not found
         """
-        # Check if checkpoint exists in memory
-        checkpoint_data = self._checkpoint_data.get(checkpoint_id)
-        
-        # If not in memory, try to load from state manager
-        if not checkpoint_data:
-            checkpoint_entry = await self._state_manager.get_state(f"phase_checkpoint:{checkpoint_id}")
-            if not checkpoint_entry:
-                logger.error(f"Checkpoint {checkpoint_id} not found")
-                return None
-                
-            checkpoint_data = checkpoint_entry.state
+        checkpoint_data = await self._load_checkpoint_data(checkpoint_id)
+        if checkpoint_data is None:
+            return None
             
         # Restore phase context
         context = PhaseContext.from_dict(checkpoint_data)
@@ -190,7 +383,7 @@ class CheckpointManager:
         
         return None
     
-    def get_checkpoint_data(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+    def get_checkpoint_data(self, checkpoint_id: str) -> Optional[Mapping]:
         """
         Get the raw checkpoint data
         
@@ -198,6 +391,88 @@ class CheckpointManager:
             checkpoint_id: The checkpoint identifier
             
         Returns:
-            Optional[Dict[str, Any]]: The checkpoint data or None if not found
+            Optional[Mapping]: Read-only view of the checkpointed context dict that
+            decodes fields on access, or None if not found in memory
+        """
+        manifest = self._manifests.get(checkpoint_id)
+        if manifest is None:
+            return None
+        return CheckpointData(manifest, self._chunks)
+    
+    async def delete_checkpoint(self, checkpoint_id: str) -> bool:
+        """
+        Delete a checkpoint manifest
+        
+        Chunks it referenced are kept until collect_garbage() runs.
+        
+        Args:
+            checkpoint_id: The checkpoint identifier
+            
+        Returns:
+            bool: True if the checkpoint existed
+        """
+        manifest = self._manifests.pop(checkpoint_id, None)
+        if manifest is not None:
+            self._chunks.decref(_manifest_chunks(manifest))
+        deleted = await self._state_manager.delete_state(f"{CHECKPOINT_KEY_PREFIX}{checkpoint_id}")
+        return manifest is not None or deleted
+    
+    async def _persisted_chunk_references(self) -> set:
+        """Collect chunks referenced by persisted manifests this manager has not loaded"""
+        keys = [
+            key for key in await self._state_manager.get_keys_by_prefix(CHECKPOINT_KEY_PREFIX)
+            if key[len(CHECKPOINT_KEY_PREFIX):] not in self._manifests
+        ]
+        if not keys:
+            return set()
+        referenced = set()
+        entries = await self._state_manager.get_states_many(keys)
+        for entry in entries.values():
+            manifest = entry.state
+            if isinstance(manifest, dict) and manifest.get("checkpoint_format") == CHECKPOINT_FORMAT:
+                referenced.update(_manifest_chunks(manifest))
+        return referenced
+    
+    async def collect_garbage(self) -> int:
+        """
+        Delete chunks no longer referenced by any checkpoint
+        
+        Chunks unreferenced by the checkpoints this manager knows about are
+        dropped from memory, but are only deleted from the state manager if
+        no persisted manifest (e.g. one written by another process and not
+        loaded here) references them either.
+        
+        Returns:
+            int: Number of chunks deleted
+        """
+        unreferenced = self._chunks.unreferenced()
+        deleted = 0
+        if unreferenced:
+            persisted = await self._persisted_chunk_references()
+            for chunk_hash in unreferenced:
+                self._chunks.remove(chunk_hash)
+                if chunk_hash not in persisted:
+                    await self._state_manager.delete_state(f"{CHUNK_KEY_PREFIX}{chunk_hash}")
+                    deleted += 1
+        
+        if deleted:
+            logger.info(f"Checkpoint garbage collection removed {deleted} chunks")
+        await self._metrics_manager.record_metric(
+            "phase_coordinator:checkpoint_gc",
+            float(deleted),
+            metadata={"timestamp": datetime.now().isoformat()}
+        )
+        return deleted
+    
+    def get_storage_stats(self) -> Dict[str, int]:
+        """
+        Get checkpoint storage statistics
+        
+        Returns:
+            Dict[str, int]: Checkpoint and chunk counts, stored bytes and the
+            number of chunk references across all checkpoints
         """
-        return self._checkpoint_data.get(checkpoint_id)
\ No newline at end of file
+        stats = self._chunks.get_stats()
+        stats["checkpoints"] = len(self._manifests)
+        stats["chunk_references"] = sum(len(_manifest_chunks(m)) for m in self._manifests.values())
+        return stats
\ No newline at end of file
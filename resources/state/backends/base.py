@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List
 
 from resources.state.models import StateEntry, StateSnapshot
 
@@ -51,4 +51,63 @@ class StateStorageBackend(ABC):
     @abstractmethod
     async def clear_all_states(self) -> int:
         """Clear all states from storage, returns count of removed items"""
-        pass
\ No newline at end of file
+        pass
+        
+    async def get_transition_count(self, resource_id: str) -> int:
+        """
+        Get the number of state transitions recorded for a resource.
+        
+        Backends should override this with a maintained counter; the default
+        falls back to loading the full history.
+        """
+        return len(await self.load_history(resource_id))
+        
+    @staticmethod
+    def state_key(state_entry: StateEntry) -> str:
+        """Key under which a state entry is indexed by state value"""
+        return str(state_entry.state)
+        
+    async def get_states_many(self, resource_ids: Iterable[str]) -> Dict[str, StateEntry]:
+        """
+        Load the latest state for several resources.
+        
+        Returns a mapping of resource ID to state entry; resources without
+        state are omitted. Backends should override this with a bulk lookup.
+        """
+        result = {}
+        for resource_id in resource_ids:
+            state_entry = await self.load_state(resource_id)
+            if state_entry is not None:
+                result[resource_id] = state_entry
+        return result
+        
+    async def delete_states_many(self, resource_ids: Iterable[str]) -> int:
+        """Delete several resources, returns count of resources removed"""
+        count = 0
+        for resource_id in resource_ids:
+            if await self.delete_state(resource_id):
+                count += 1
+        return count
+        
+    async def get_resource_ids_by_state(self, state_key: str) -> List[str]:
+        """
+        Get IDs of resources whose current state has the given key.
+        
+        Backends should override this with an index maintained on write; the
+        default loads every state.
+        """
+        states = await self.get_states_many(await self.get_all_resource_ids())
+        return [rid for rid, entry in states.items() if self.state_key(entry) == state_key]
+        
+    async def count_resources_by_state(self) -> Dict[str, int]:
+        """Count resources by state key"""
+        counts: Dict[str, int] = {}
+        states = await self.get_states_many(await self.get_all_resource_ids())
+        for entry in states.values():
+            key = self.state_key(entry)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+        
+    async def get_resource_ids_by_prefix(self, prefix: str) -> List[str]:
+        """Get IDs of resources starting with the given prefix, in sorted order"""
+        return sorted(rid for rid in await self.get_all_resource_ids() if rid.startswith(prefix))
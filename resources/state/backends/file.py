@@ -3,23 +3,49 @@ import logging
 import os
 import pickle
 import shutil
+import struct
 import time
+import zlib
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from resources.state.backends.base import StateStorageBackend
+from resources.state.backends.index import StateIndex
 from resources.state.models import StateEntry, StateSnapshot
 
 logger = logging.getLogger(__name__)
 
+# History log records are framed as (payload length, CRC32) followed by the
+# pickled StateEntry, so a torn write at the tail can be detected on open.
+_FRAME_HEADER = struct.Struct('>II')
+
 
 class FileStateBackend(StateStorageBackend):
-    """File-based storage backend for persistence"""
+    """
+    File-based storage backend for persistence.
+    
+    The latest state of each resource lives in its own pickle file. History is
+    an append-only log of framed records per resource, so recording a
+    transition is a single append no matter how long the resource has lived.
+    An in-memory offset index per log lets history reads seek straight to the
+    records they need, and each log is compacted with compact_history once
+    compact_threshold records have been appended since its last compaction.
+    """
     
-    def __init__(self, storage_dir: str):
-        """Initialize with a storage directory"""
+    def __init__(self, storage_dir: str,
+                 compact_threshold: Optional[int] = 5000,
+                 compact_keep: int = 1000):
+        """
+        Initialize with a storage directory.
+        
+        Args:
+            storage_dir: Root directory for state, history and snapshot files
+            compact_threshold: Records appended to a history log since its last
+                compaction that trigger automatic compaction (None disables it)
+            compact_keep: Most recent entries kept in full by automatic compaction
+        """
         self.storage_dir = Path(storage_dir)
         self.states_dir = self.storage_dir / "states"
         self.history_dir = self.storage_dir / "history"
@@ -33,6 +59,19 @@ class FileStateBackend(StateStorageBackend):
         # Create file locks to prevent concurrent writes
         self._file_locks = defaultdict(asyncio.Lock)
         
+        # History log index: record start offsets and end of valid data per resource
+        self._log_offsets: Dict[str, List[int]] = {}
+        self._log_ends: Dict[str, int] = {}
+        self._compact_threshold = compact_threshold
+        self._compact_keep = compact_keep
+        self._compacted_sizes: Dict[str, int] = {}
+        
+        # Per-resource transition counters, seeded lazily from the log index
+        self._transition_counts: Dict[str, int] = {}
+        
+        # By-state and by-prefix index, built on first query and maintained on write
+        self._state_index: Optional[StateIndex] = None
+        
     async def _get_file_lock(self, file_path: Path) -> asyncio.Lock:
         """Get a lock for a specific file path"""
         lock_key = str(file_path)
@@ -40,10 +79,184 @@ class FileStateBackend(StateStorageBackend):
             self._file_locks[lock_key] = asyncio.Lock()
         return self._file_locks[lock_key]
         
+    # History log helpers. Callers must hold the history file lock.
+    
+    def _history_file(self, resource_id: str) -> Path:
+        return self.history_dir / f"{resource_id}.log"
+    
+    @staticmethod
+    def _frame(entry: StateEntry) -> bytes:
+        """Encode a state entry as a framed log record"""
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        return _FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+    
+    @staticmethod
+    def _scan_log(log_file: Path) -> Tuple[List[int], int]:
+        """
+        Build the offset index of a history log by walking record headers.
+        
+        An incomplete record at the tail (from an interrupted append) is
+        truncated so later appends start at a record boundary.
+        """
+        if not os.path.exists(log_file):
+            return [], 0
+        
+        size = os.path.getsize(log_file)
+        offsets = []
+        pos = 0
+        with open(log_file, 'rb') as f:
+            while pos + _FRAME_HEADER.size <= size:
+                f.seek(pos)
+                length, _ = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+                end = pos + _FRAME_HEADER.size + length
+                if end > size:
+                    break
+                offsets.append(pos)
+                pos = end
+        
+        if pos < size:
+            logger.warning(f"Truncating {size - pos} bytes of incomplete history records from {log_file}")
+            with open(log_file, 'r+b') as f:
+                f.truncate(pos)
+        return offsets, pos
+    
+    @staticmethod
+    def _read_records(log_file: Path, start: int, end: int) -> List[StateEntry]:
+        """Decode the records stored between two offsets of a history log"""
+        with open(log_file, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        
+        entries = []
+        pos = 0
+        while pos + _FRAME_HEADER.size <= len(data):
+            record_start = pos
+            length, crc = _FRAME_HEADER.unpack_from(data, pos)
+            payload = data[pos + _FRAME_HEADER.size:pos + _FRAME_HEADER.size + length]
+            pos += _FRAME_HEADER.size + length
+            if zlib.crc32(payload) != crc:
+                logger.error(f"Skipping corrupt history record at offset {start + record_start} in {log_file}")
+                continue
+            try:
+                entries.append(pickle.loads(payload))
+            except Exception as e:
+                logger.error(f"Skipping undecodable history record in {log_file}: {e}")
+        return entries
+    
+    def _load_index(self, resource_id: str) -> List[int]:
+        """Get the offset index for a resource's history log, building it on first use"""
+        offsets = self._log_offsets.get(resource_id)
+        if offsets is None:
+            self._migrate_legacy_history(resource_id)
+            offsets, end = self._scan_log(self._history_file(resource_id))
+            self._log_offsets[resource_id] = offsets
+            self._log_ends[resource_id] = end
+        return offsets
+    
+    def _migrate_legacy_history(self, resource_id: str) -> None:
+        """Convert a pickled history list from older versions into a log"""
+        legacy_file = self.history_dir / f"{resource_id}.pickle"
+        if not os.path.exists(legacy_file) or os.path.exists(self._history_file(resource_id)):
+            return
+        try:
+            with open(legacy_file, 'rb') as f:
+                history = pickle.load(f)
+            self._write_log(resource_id, history)
+            os.unlink(legacy_file)
+            logger.info(f"Migrated {len(history)} history entries for {resource_id} to log format")
+        except (pickle.PickleError, EOFError):
+            logger.error(f"Corrupt legacy history file for {resource_id}, starting a new log")
+            backup_file = self.history_dir / f"{resource_id}_corrupt_{int(time.time())}.pickle"
+            shutil.move(legacy_file, backup_file)
+    
+    def _append_records(self, resource_id: str, entries: List[StateEntry]) -> None:
+        """Append entries to a resource's history log and extend its index"""
+        offsets = self._load_index(resource_id)
+        pos = self._log_ends[resource_id]
+        frames = []
+        for entry in entries:
+            frame = self._frame(entry)
+            offsets.append(pos)
+            pos += len(frame)
+            frames.append(frame)
+        
+        with open(self._history_file(resource_id), 'ab') as f:
+            f.write(b"".join(frames))
+        self._log_ends[resource_id] = pos
+    
+    def _write_log(self, resource_id: str, entries: List[StateEntry]) -> None:
+        """Atomically replace a resource's history log with the given entries"""
+        offsets = []
+        pos = 0
+        temp_file = self.temp_dir / f"{resource_id}_history_{int(time.time())}.log"
+        try:
+            with open(temp_file, 'wb') as f:
+                for entry in entries:
+                    frame = self._frame(entry)
+                    f.write(frame)
+                    offsets.append(pos)
+                    pos += len(frame)
+            # Atomic rename
+            os.replace(temp_file, self._history_file(resource_id))
+        finally:
+            if os.path.exists(temp_file):
+                os.unlink(temp_file)
+        self._log_offsets[resource_id] = offsets
+        self._log_ends[resource_id] = pos
+    
+    def _drop_log_head(self, resource_id: str, keep: int) -> int:
+        """Keep only the most recent ``keep`` records by copying the log tail; returns records dropped"""
+        offsets = self._load_index(resource_id)
+        dropped = len(offsets) - keep
+        if dropped <= 0:
+            return 0
+        
+        log_file = self._history_file(resource_id)
+        start = offsets[dropped]
+        with open(log_file, 'rb') as f:
+            f.seek(start)
+            tail = f.read(self._log_ends[resource_id] - start)
+        temp_file = self.temp_dir / f"{resource_id}_history_trim_{int(time.time())}.log"
+        with open(temp_file, 'wb') as f:
+            f.write(tail)
+        # Atomic rename
+        os.replace(temp_file, log_file)
+        
+        self._log_offsets[resource_id] = [offset - start for offset in offsets[dropped:]]
+        self._log_ends[resource_id] -= start
+        return dropped
+    
+    def _forget(self, resource_id: str) -> None:
+        """Drop in-memory index data for a removed resource"""
+        self._log_offsets.pop(resource_id, None)
+        self._log_ends.pop(resource_id, None)
+        self._compacted_sizes.pop(resource_id, None)
+        self._transition_counts.pop(resource_id, None)
+        if self._state_index is not None:
+            self._state_index.remove(resource_id)
+        
+    def _get_state_index(self) -> StateIndex:
+        """
+        Get the state index, building it from the state files on first use.
+        
+        The build reads files synchronously so no save can interleave with it.
+        """
+        if self._state_index is None:
+            index = StateIndex()
+            for state_file in self.states_dir.glob("*.pickle"):
+                try:
+                    with open(state_file, 'rb') as f:
+                        state_entry = pickle.load(f)
+                    index.update(state_file.stem, self.state_key(state_entry))
+                except Exception as e:
+                    logger.debug(f"Not indexing unreadable state file {state_file}: {e}")
+            self._state_index = index
+        return self._state_index
+        
     async def save_state(self, resource_id: str, state_entry: StateEntry) -> bool:
         """Save a state entry to file"""
         state_file = self.states_dir / f"{resource_id}.pickle"
-        history_file = self.history_dir / f"{resource_id}.pickle"
+        history_file = self._history_file(resource_id)
         
         # Get lock for state file
         state_lock = await self._get_file_lock(state_file)
@@ -56,6 +269,8 @@ class FileStateBackend(StateStorageBackend):
                     pickle.dump(state_entry, f)
                 # Atomic rename
                 os.replace(temp_file, state_file)
+                if self._state_index is not None:
+                    self._state_index.update(resource_id, self.state_key(state_entry))
             except Exception as e:
                 logger.error(f"Error saving state to file: {e}")
                 if os.path.exists(temp_file):
@@ -67,35 +282,23 @@ class FileStateBackend(StateStorageBackend):
         # Append to history with lock
         async with file_lock:
             try:
-                # Load existing history
-                history = []
-                if os.path.exists(history_file):
-                    try:
-                        with open(history_file, 'rb') as f:
-                            history = pickle.load(f)
-                    except (pickle.PickleError, EOFError):
-                        logger.error(f"Corrupt history file for {resource_id}, creating new one")
-                        # Backup corrupt file
-                        if os.path.exists(history_file):
-                            backup_file = self.history_dir / f"{resource_id}_corrupt_{int(time.time())}.pickle"
-                            shutil.copy2(history_file, backup_file)
-                
-                # Append new entry
-                history.append(state_entry)
-                
-                # Write using atomic temp file pattern
-                temp_file = self.temp_dir / f"{resource_id}_history_{int(time.time())}.pickle"
-                with open(temp_file, 'wb') as f:
-                    pickle.dump(history, f)
-                # Atomic rename
-                os.replace(temp_file, history_file)
+                self._append_records(resource_id, [state_entry])
+                record_count = len(self._log_offsets[resource_id])
                 
-                return True
+                count = self._transition_counts.get(resource_id)
+                self._transition_counts[resource_id] = record_count if count is None else count + 1
             except Exception as e:
-                logger.error(f"Error saving to history file: {e}")
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+                logger.error(f"Error appending to history log: {e}")
+                # The index may no longer match the file; rebuild it on next access
+                self._log_offsets.pop(resource_id, None)
                 return False
+            
+            # Periodic compaction keeps logs of long-lived resources bounded
+            if (self._compact_threshold and
+                    record_count - self._compacted_sizes.get(resource_id, 0) >= self._compact_threshold):
+                await self._compact_locked(resource_id, self._compact_keep)
+            
+            return True
         
     async def save_snapshot(self, resource_id: str, snapshot: StateSnapshot) -> bool:
         """Save a state snapshot to file"""
@@ -182,30 +385,33 @@ class FileStateBackend(StateStorageBackend):
                 return None
         
     async def load_history(self, resource_id: str, limit: Optional[int] = None) -> List[StateEntry]:
-        """Load state history for a resource from file"""
-        history_file = self.history_dir / f"{resource_id}.pickle"
-        if not os.path.exists(history_file):
-            return []
+        """Load state history for a resource from file, reading only the requested tail"""
+        history_file = self._history_file(resource_id)
         
         lock = await self._get_file_lock(history_file)
         async with lock:
             try:
-                with open(history_file, 'rb') as f:
-                    history = pickle.load(f)
-                    
-                if limit:
-                    return history[-limit:]
-                return history
-            except (pickle.PickleError, EOFError) as e:
-                logger.error(f"Error loading history from file (corrupt pickle): {e}")
-                # Backup corrupt file
-                backup_file = self.history_dir / f"{resource_id}_corrupt_{int(time.time())}.pickle"
-                shutil.copy2(history_file, backup_file)
-                return []
+                offsets = self._load_index(resource_id)
+                if not offsets:
+                    return []
+                
+                start = offsets[-limit] if limit and limit < len(offsets) else offsets[0]
+                return self._read_records(history_file, start, self._log_ends[resource_id])
             except Exception as e:
                 logger.error(f"Error loading history from file: {e}")
                 return []
         
+    async def get_transition_count(self, resource_id: str) -> int:
+        """Get the number of recorded transitions, indexing the log only on first access"""
+        count = self._transition_counts.get(resource_id)
+        if count is None:
+            lock = await self._get_file_lock(self._history_file(resource_id))
+            async with lock:
+                count = self._transition_counts.setdefault(
+                    resource_id, len(self._load_index(resource_id))
+                )
+        return count
+        
     async def load_snapshots(self, resource_id: str, limit: Optional[int] = None) -> List[StateSnapshot]:
         """Load snapshots for a resource from file"""
         snapshot_file = self.snapshots_dir / f"{resource_id}.pickle"
@@ -242,6 +448,57 @@ class FileStateBackend(StateStorageBackend):
             
         return list(resource_ids)
         
+    async def get_resource_ids_by_state(self, state_key: str) -> List[str]:
+        """Get IDs of resources in the given state from the index"""
+        return self._get_state_index().ids_by_state(state_key)
+        
+    async def count_resources_by_state(self) -> Dict[str, int]:
+        """Count resources by state key from the index"""
+        return self._get_state_index().count_by_state()
+        
+    async def get_resource_ids_by_prefix(self, prefix: str) -> List[str]:
+        """Get IDs of resources starting with prefix from the sorted index"""
+        return self._get_state_index().ids_with_prefix(prefix)
+        
+    async def delete_state(self, resource_id: str) -> bool:
+        """Delete a resource's state, history and snapshot files"""
+        state_file = self.states_dir / f"{resource_id}.pickle"
+        history_file = self._history_file(resource_id)
+        snapshot_file = self.snapshots_dir / f"{resource_id}.pickle"
+        existed = False
+        
+        try:
+            state_lock = await self._get_file_lock(state_file)
+            async with state_lock:
+                if os.path.exists(state_file):
+                    os.unlink(state_file)
+                    existed = True
+            
+            file_lock = await self._get_file_lock(history_file)
+            async with file_lock:
+                for path in (history_file, self.history_dir / f"{resource_id}.pickle"):
+                    if os.path.exists(path):
+                        os.unlink(path)
+                self._forget(resource_id)
+            
+            snap_lock = await self._get_file_lock(snapshot_file)
+            async with snap_lock:
+                if os.path.exists(snapshot_file):
+                    os.unlink(snapshot_file)
+        except Exception as e:
+            logger.error(f"Error deleting state files for {resource_id}: {e}")
+            return False
+        
+        return existed
+    
+    async def clear_all_states(self) -> int:
+        """Delete all resources from storage, returns count of removed resources"""
+        count = 0
+        for resource_id in await self.get_all_resource_ids():
+            if await self.delete_state(resource_id):
+                count += 1
+        return count
+    
     async def cleanup(self, older_than: Optional[datetime] = None) -> int:
         """
         Clean up old entries, returns count of removed items.
@@ -274,7 +531,7 @@ class FileStateBackend(StateStorageBackend):
         
         for resource_id in resource_ids:
             state_file = self.states_dir / f"{resource_id}.pickle"
-            history_file = self.history_dir / f"{resource_id}.pickle"
+            history_file = self._history_file(resource_id)
             snapshot_file = self.snapshots_dir / f"{resource_id}.pickle"
             
             # Check if the resource can be cleaned up completely
@@ -298,6 +555,7 @@ class FileStateBackend(StateStorageBackend):
                                 if os.path.exists(history_file):
                                     os.unlink(history_file)
                                     items_removed += 1
+                                self._forget(resource_id)
                             
                             snap_lock = await self._get_file_lock(snapshot_file)
                             async with snap_lock:
@@ -322,22 +580,10 @@ class FileStateBackend(StateStorageBackend):
                         
                         # If history file is larger than 10MB, trim it
                         if file_size > 10 * 1024 * 1024:  # 10MB
-                            with open(history_file, 'rb') as f:
-                                history = pickle.load(f)
-                            
                             # Keep the most recent 100 entries
-                            if len(history) > 100:
-                                trimmed = len(history) - 100
-                                history = history[-100:]
+                            trimmed = self._drop_log_head(resource_id, 100)
+                            if trimmed:
                                 items_removed += trimmed
-                                
-                                # Write back the trimmed history
-                                temp_file = self.temp_dir / f"{resource_id}_history_trim_{int(time.time())}.pickle"
-                                with open(temp_file, 'wb') as f:
-                                    pickle.dump(history, f)
-                                # Atomic rename
-                                os.replace(temp_file, history_file)
-                                
                                 logger.info(f"Trimmed history for {resource_id}: removed {trimmed} old entries")
             except Exception as e:
                 logger.error(f"Error trimming history for {resource_id}: {e}")
@@ -374,49 +620,54 @@ class FileStateBackend(StateStorageBackend):
         Compact the history file for a resource to reduce its size.
         Keeps the first entry, the most recent max_entries, and one entry per day for the rest.
         """
-        history_file = self.history_dir / f"{resource_id}.pickle"
-        if not os.path.exists(history_file):
-            return False
+        history_file = self._history_file(resource_id)
         
         lock = await self._get_file_lock(history_file)
         async with lock:
-            try:
-                with open(history_file, 'rb') as f:
-                    history = pickle.load(f)
-                
-                if len(history) <= max_entries:
-                    return True  # Nothing to compact
-                
-                # Keep first entry for historical context
-                first_entry = history[0]
-                
-                # Keep most recent entries
-                recent_entries = history[-max_entries:]
-                
-                # For the middle part, keep one entry per day
-                middle_entries = history[1:-max_entries]
-                if middle_entries:
-                    by_day = {}
-                    for entry in middle_entries:
-                        day_key = entry.timestamp.strftime('%Y-%m-%d')
-                        if day_key not in by_day:
-                            by_day[day_key] = entry
-                    
-                    # Reconstruct compacted history
-                    compacted = [first_entry] + list(by_day.values()) + recent_entries
-                    
-                    # Save compacted history
-                    temp_file = self.temp_dir / f"{resource_id}_history_compact_{int(time.time())}.pickle"
-                    with open(temp_file, 'wb') as f:
-                        pickle.dump(compacted, f)
-                    # Atomic rename
-                    os.replace(temp_file, history_file)
-                    
-                    logger.info(f"Compacted history for {resource_id}: from {len(history)} to {len(compacted)} entries")
-                    return True
-            except Exception as e:
-                logger.error(f"Error compacting history for {resource_id}: {e}")
+            return await self._compact_locked(resource_id, max_entries)
+    
+    async def _compact_locked(self, resource_id: str, max_entries: int) -> bool:
+        """Compact a history log; the caller holds its file lock"""
+        try:
+            offsets = self._load_index(resource_id)
+            if not offsets:
                 return False
+            
+            if len(offsets) <= max_entries:
+                self._compacted_sizes[resource_id] = len(offsets)
+                return True  # Nothing to compact
+            
+            history = self._read_records(self._history_file(resource_id), offsets[0],
+                                         self._log_ends[resource_id])
+            
+            # Keep first entry for historical context
+            first_entry = history[0]
+            
+            # Keep most recent entries
+            recent_entries = history[-max_entries:]
+            
+            # For the middle part, keep one entry per day
+            by_day = {}
+            for entry in history[1:-max_entries]:
+                timestamp = entry.timestamp
+                if not isinstance(timestamp, datetime):
+                    timestamp = datetime.fromtimestamp(timestamp)
+                day_key = timestamp.strftime('%Y-%m-%d')
+                if day_key not in by_day:
+                    by_day[day_key] = entry
+            
+            # Reconstruct compacted history and rewrite the log
+            compacted = [first_entry] + list(by_day.values()) + recent_entries
+            self._write_log(resource_id, compacted)
+            self._compacted_sizes[resource_id] = len(compacted)
+            
+            logger.info(f"Compacted history for {resource_id}: from {len(history)} to {len(compacted)} entries")
+            return True
+        except Exception as e:
+            logger.error(f"Error compacting history for {resource_id}: {e}")
+            # Rebuild the index from disk on next access
+            self._log_offsets.pop(resource_id, None)
+            return False
     
     async def repair_corrupt_files(self) -> Dict[str, int]:
         """
@@ -453,24 +704,22 @@ class FileStateBackend(StateStorageBackend):
                 
                 try:
                     # Try to get most recent history entry
-                    history_file = self.history_dir / f"{resource_id}.pickle"
-                    if os.path.exists(history_file) and not await is_corrupt(history_file):
-                        with open(history_file, 'rb') as f:
-                            history = pickle.load(f)
+                    history = await self.load_history(resource_id, limit=1)
+                    if history:
+                        most_recent = history[-1]
                         
-                        if history:
-                            most_recent = history[-1]
-                            
-                            # Write repaired state file
-                            temp_file = self.temp_dir / f"{resource_id}_state_repair_{int(time.time())}.pickle"
-                            with open(temp_file, 'wb') as f:
-                                pickle.dump(most_recent, f)
-                            # Atomic rename
-                            os.replace(temp_file, state_file)
-                            
-                            results["state_repaired"] += 1
-                            logger.info(f"Repaired state file for {resource_id} from history")
-                            continue
+                        # Write repaired state file
+                        temp_file = self.temp_dir / f"{resource_id}_state_repair_{int(time.time())}.pickle"
+                        with open(temp_file, 'wb') as f:
+                            pickle.dump(most_recent, f)
+                        # Atomic rename
+                        os.replace(temp_file, state_file)
+                        if self._state_index is not None:
+                            self._state_index.update(resource_id, self.state_key(most_recent))
+                        
+                        results["state_repaired"] += 1
+                        logger.info(f"Repaired state file for {resource_id} from history")
+                        continue
                 except Exception as e:
                     logger.error(f"Error repairing state file for {resource_id}: {e}")
                 
@@ -479,6 +728,8 @@ class FileStateBackend(StateStorageBackend):
                     backup_file = self.states_dir / f"{resource_id}_corrupt_{int(time.time())}.pickle"
                     shutil.copy2(state_file, backup_file)
                     os.unlink(state_file)
+                    if self._state_index is not None:
+                        self._state_index.remove(resource_id)
                     results["failed"] += 1
                     logger.warning(f"Could not repair state file for {resource_id}, backed up and removed")
                 except Exception as e:
@@ -0,0 +1,74 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Set
+
+
+class StateIndex:
+    """
+    Secondary indexes over the current state of each resource.
+
+    Maps state keys to resource IDs and keeps resource IDs sorted so prefix
+    queries are a binary search plus a range scan. Not thread-safe; callers
+    serialize access with their own lock.
+    """
+
+    def __init__(self):
+        self._keys: Dict[str, str] = {}  # resource_id -> state key
+        self._by_state: Dict[str, Set[str]] = {}
+        self._sorted_ids: List[str] = []
+
+    def update(self, resource_id: str, state_key: str) -> None:
+        """Record the current state key of a resource"""
+        old_key = self._keys.get(resource_id)
+        if old_key == state_key:
+            return
+        if old_key is None:
+            insort(self._sorted_ids, resource_id)
+        else:
+            self._discard(old_key, resource_id)
+        self._keys[resource_id] = state_key
+        self._by_state.setdefault(state_key, set()).add(resource_id)
+
+    def remove(self, resource_id: str) -> None:
+        """Drop a resource from the indexes"""
+        old_key = self._keys.pop(resource_id, None)
+        if old_key is None:
+            return
+        self._discard(old_key, resource_id)
+        pos = bisect_left(self._sorted_ids, resource_id)
+        if pos < len(self._sorted_ids) and self._sorted_ids[pos] == resource_id:
+            del self._sorted_ids[pos]
+
+    def _discard(self, state_key: str, resource_id: str) -> None:
+        ids = self._by_state.get(state_key)
+        if ids is not None:
+            ids.discard(resource_id)
+            if not ids:
+                del self._by_state[state_key]
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._by_state.clear()
+        self._sorted_ids.clear()
+
+    def ids_by_state(self, state_key: str) -> List[str]:
+        """Resource IDs currently in the given state"""
+        return list(self._by_state.get(state_key, ()))
+
+    def count_by_state(self) -> Dict[str, int]:
+        """Number of resources per state key"""
+        return {key: len(ids) for key, ids in self._by_state.items()}
+
+    def ids_with_prefix(self, prefix: str) -> List[str]:
+        """Resource IDs starting with prefix, in sorted order"""
+        ids = self._sorted_ids
+        start = bisect_left(ids, prefix)
+        end = start
+        while end < len(ids) and ids[end].startswith(prefix):
+            end += 1
+        return ids[start:end]
+
+    def __contains__(self, resource_id: str) -> bool:
+        return resource_id in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -1,9 +1,10 @@
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import threading
 
 from resources.state.backends.base import StateStorageBackend
+from resources.state.backends.index import StateIndex
 from resources.state.models import StateEntry, StateSnapshot
 
 
@@ -16,12 +17,14 @@ class MemoryStateBackend(StateStorageBackend):
         self._history: Dict[str, List[StateEntry]] = defaultdict(list)
         self._snapshots: Dict[str, List[StateSnapshot]] = defaultdict(list)
         self._lock = threading.RLock()  # Add thread-safe lock
+        self._index = StateIndex()  # By-state and by-prefix lookups
         
     async def save_state(self, resource_id: str, state_entry: StateEntry) -> bool:
         """Save a state entry to memory with thread safety"""
         with self._lock:
             self._states[resource_id] = state_entry
             self._history[resource_id].append(state_entry)
+            self._index.update(resource_id, self.state_key(state_entry))
             return True
         
     async def save_snapshot(self, resource_id: str, snapshot: StateSnapshot) -> bool:
@@ -51,6 +54,11 @@ class MemoryStateBackend(StateStorageBackend):
                 return snapshots[-limit:]
             return snapshots.copy()  # Return a copy to prevent modification during iteration
         
+    async def get_transition_count(self, resource_id: str) -> int:
+        """Get the number of recorded transitions for a resource"""
+        with self._lock:
+            return len(self._history.get(resource_id, ()))
+        
     async def get_all_resource_ids(self) -> List[str]:
         """Get all resource IDs in memory with thread safety"""
         with self._lock:
@@ -66,6 +74,7 @@ class MemoryStateBackend(StateStorageBackend):
         with self._lock:
             if resource_id in self._states:
                 del self._states[resource_id]
+                self._index.remove(resource_id)
                 # Also clear history and snapshots for this resource
                 if resource_id in self._history:
                     del self._history[resource_id]
@@ -81,4 +90,34 @@ class MemoryStateBackend(StateStorageBackend):
             self._states.clear()
             self._history.clear()
             self._snapshots.clear()
-            return count
\ No newline at end of file
+            self._index.clear()
+            return count
+            
+    async def get_states_many(self, resource_ids: Iterable[str]) -> Dict[str, StateEntry]:
+        """Load the latest state for several resources with thread safety"""
+        with self._lock:
+            return {rid: self._states[rid] for rid in resource_ids if rid in self._states}
+            
+    async def delete_states_many(self, resource_ids: Iterable[str]) -> int:
+        """Delete several resources from memory with thread safety"""
+        with self._lock:
+            count = 0
+            for resource_id in resource_ids:
+                if await self.delete_state(resource_id):
+                    count += 1
+            return count
+            
+    async def get_resource_ids_by_state(self, state_key: str) -> List[str]:
+        """Get IDs of resources in the given state from the index"""
+        with self._lock:
+            return self._index.ids_by_state(state_key)
+            
+    async def count_resources_by_state(self) -> Dict[str, int]:
+        """Count resources by state key from the index"""
+        with self._lock:
+            return self._index.count_by_state()
+            
+    async def get_resource_ids_by_prefix(self, prefix: str) -> List[str]:
+        """Get IDs of resources starting with prefix from the sorted index"""
+        with self._lock:
+            return self._index.ids_with_prefix(prefix)
\ No newline at end of file
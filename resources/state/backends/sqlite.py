@@ -1,12 +1,12 @@
 import asyncio
 import json
 import logging
+import queue
 import sqlite3
 import threading
-import time
-from contextlib import asynccontextmanager
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from resources.common import ResourceState, InterfaceState, ResourceType
 from resources.state.backends.base import StateStorageBackend
@@ -14,24 +14,109 @@ from resources.state.models import StateEntry, StateSnapshot
 
 logger = logging.getLogger(__name__)
 
+_STATE_COLUMNS = ('state_type, state_value, resource_type, timestamp, metadata, '
+                  'version, previous_state, transition_reason, failure_info')
+
+# Statements are kept as module constants so every connection's statement
+# cache reuses the same prepared statements.
+_UPSERT_STATE_SQL = (f'INSERT OR REPLACE INTO states (resource_id, {_STATE_COLUMNS}, state_key) '
+                     'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
+_INSERT_HISTORY_SQL = (f'INSERT INTO state_history (resource_id, {_STATE_COLUMNS}) '
+                       'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
+_INSERT_SNAPSHOT_SQL = ('INSERT INTO snapshots (resource_id, state, timestamp, metadata, resource_type, version) '
+                        'VALUES (?, ?, ?, ?, ?, ?)')
+_SELECT_STATE_SQL = 'SELECT * FROM states WHERE resource_id = ?'
+_SELECT_HISTORY_SQL = 'SELECT * FROM state_history WHERE resource_id = ? ORDER BY timestamp, id'
+_SELECT_HISTORY_TAIL_SQL = ('SELECT * FROM state_history WHERE resource_id = ? '
+                            'ORDER BY timestamp DESC, id DESC LIMIT ?')
+_SELECT_SNAPSHOTS_SQL = 'SELECT * FROM snapshots WHERE resource_id = ? ORDER BY timestamp, id'
+_SELECT_SNAPSHOTS_TAIL_SQL = ('SELECT * FROM snapshots WHERE resource_id = ? '
+                              'ORDER BY timestamp DESC, id DESC LIMIT ?')
+_COUNT_HISTORY_SQL = 'SELECT COUNT(*) FROM state_history WHERE resource_id = ?'
+_SELECT_IDS_BY_STATE_SQL = 'SELECT resource_id FROM states WHERE state_key = ?'
+_COUNT_BY_STATE_SQL = 'SELECT state_key, COUNT(*) FROM states GROUP BY state_key'
+_SELECT_IDS_FROM_SQL = 'SELECT resource_id FROM states WHERE resource_id >= ? ORDER BY resource_id'
+
+# Keeps IN (...) lists below SQLite's bound parameter limit
+_MAX_IN_PARAMS = 500
+
+# Sentinel asking the writer thread to exit
+_STOP = object()
+
 
 class SQLiteStateBackend(StateStorageBackend):
-    """SQLite-based storage backend for reliable persistence"""
+    """
+    SQLite-based storage backend for reliable persistence.
+    
+    All writes go through a dedicated writer thread that owns the only write
+    connection. The database runs in WAL mode with synchronous=NORMAL, and the
+    writer drains its queue into a single transaction so many concurrent
+    save_state calls share one commit. Reads run on a small pool of reader
+    threads, each holding its own connection, so neither reads nor writes
+    block the event loop. The writer thread exits after a period of
+    inactivity and is restarted by the next write.
+    """
     
-    def __init__(self, db_path: str):
-        """Initialize with a database path"""
+    def __init__(self, db_path: str,
+                 wait_for_commit: bool = True,
+                 batch_size: int = 256,
+                 read_pool_size: int = 4,
+                 writer_idle_timeout: float = 5.0):
+        """
+        Initialize with a database path.
+        
+        Args:
+            db_path: Path of the SQLite database file
+            wait_for_commit: If True, save_state returns once its transaction has
+                committed. If False, it returns as soon as the write is queued
+                (write-behind); reads of that resource still wait for it.
+            batch_size: Maximum number of queued writes grouped into one transaction
+            read_pool_size: Number of reader threads/connections
+            writer_idle_timeout: Seconds of inactivity before the writer thread exits
+        """
         self.db_path = db_path
-        self._connection_pool = {}  # Thread-local connections
-        self._lock = threading.RLock()  # Lock for connection management
+        self._lock = threading.RLock()  # Guards writer lifecycle and counters
+        self._wait_for_commit = wait_for_commit
+        self._batch_size = max(1, batch_size)
+        self._writer_idle_timeout = writer_idle_timeout
+        
+        # Write-behind queue drained by the writer thread
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # Latest queued write per resource, so reads can wait for their own writes
+        self._pending_writes: Dict[str, Future] = {}
+        
+        # Reader pool: one connection per reader thread
+        self._read_executor = ThreadPoolExecutor(max_workers=max(1, read_pool_size),
+                                                 thread_name_prefix="sqlite_state_reader")
+        self._read_local = threading.local()
+        
+        # Per-resource transition counters, seeded lazily from state_history
+        self._transition_counts: Dict[str, int] = {}
+        
+        # Write statistics
+        self._stats = {"writes": 0, "transactions": 0, "failed_writes": 0, "max_batch": 0}
         
         # Initialize database
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for WAL and explicit transactions"""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30.0,
+                               cached_statements=256)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+    
     def _init_db(self):
         """Initialize database schema if it doesn't exist"""
-        conn = self._get_connection()
+        conn = self._connect()
         try:
+            # WAL is persistent in the database file, so this only needs setting once
+            conn.execute("PRAGMA journal_mode = WAL")
             cursor = conn.cursor()
+            cursor.execute("BEGIN")
             
             # Create states table
             cursor.execute('''
@@ -45,7 +130,8 @@ class SQLiteStateBackend(StateStorageBackend):
                 version INTEGER,
                 previous_state TEXT,
                 transition_reason TEXT,
-                failure_info TEXT
+                failure_info TEXT,
+                state_key TEXT
             )
             ''')
             
@@ -83,62 +169,225 @@ class SQLiteStateBackend(StateStorageBackend):
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_resource_id ON state_history(resource_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_resource_id ON snapshots(resource_id)')
             
-            conn.commit()
+            # Secondary index by state value for by-state queries. Databases
+            # created before the column existed are migrated in place.
+            columns = {row['name'] for row in cursor.execute('PRAGMA table_info(states)')}
+            if 'state_key' not in columns:
+                cursor.execute('ALTER TABLE states ADD COLUMN state_key TEXT')
+            rows = cursor.execute('SELECT * FROM states WHERE state_key IS NULL').fetchall()
+            for row in rows:
+                try:
+                    state_key = self.state_key(self._deserialize_state_entry(row))
+                except Exception as e:
+                    logger.warning(f"Could not index state of {row['resource_id']}: {e}")
+                    continue
+                cursor.execute('UPDATE states SET state_key = ? WHERE resource_id = ?',
+                               (state_key, row['resource_id']))
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_states_state_key ON states(state_key)')
+            
+            cursor.execute("COMMIT")
         finally:
             conn.close()
     
-    def _get_connection(self):
-        """Get a thread-local database connection"""
-        thread_id = threading.get_ident()
+    # Writer thread
+    
+    def _submit_write(self, kind: str, payload: Any, resource_id: Optional[str] = None) -> Future:
+        """
+        Queue a write for the writer thread.
+        
+        Args:
+            kind: "save" for a (resource_id, row) pair that can be group
+                  committed, "call" for a callable run in its own transaction,
+                  or "raw" for a callable run outside any transaction
+            payload: Row data or callable taking the write connection
+            resource_id: Resource the write belongs to, for read-your-writes
+        """
+        future: Future = Future()
         with self._lock:
-            if thread_id not in self._connection_pool:
-                # Create a new connection
-                conn = sqlite3.connect(self.db_path)
-                # Enable foreign keys
-                conn.execute("PRAGMA foreign_keys = ON")
-                # Configure connection
-                conn.row_factory = sqlite3.Row
-                self._connection_pool[thread_id] = conn
-            else:
-                # Check if connection is valid
-                conn = self._connection_pool[thread_id]
+            self._write_queue.put((kind, payload, future, resource_id))
+            if resource_id is not None:
+                self._pending_writes[resource_id] = future
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_main,
+                                                name="sqlite_state_writer", daemon=True)
+                self._writer.start()
+        return future
+    
+    def _writer_main(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
                 try:
-                    # Test if connection is valid with a simple query
-                    conn.execute("SELECT 1")
-                except sqlite3.Error:
-                    # Connection is invalid, create a new one
-                    conn = sqlite3.connect(self.db_path)
-                    conn.execute("PRAGMA foreign_keys = ON")
-                    conn.row_factory = sqlite3.Row
-                    self._connection_pool[thread_id] = conn
-                    
-            return self._connection_pool[thread_id]
+                    op = self._write_queue.get(timeout=self._writer_idle_timeout)
+                except queue.Empty:
+                    with self._lock:
+                        # Checked under the submit lock so no write is stranded
+                        if self._write_queue.empty():
+                            self._writer = None
+                            return
+                    continue
+                
+                # Group everything already queued into this round
+                ops = [op]
+                while len(ops) < self._batch_size:
+                    try:
+                        ops.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                stop = any(o is _STOP for o in ops)
+                self._run_ops(conn, [o for o in ops if o is not _STOP])
+                if stop:
+                    with self._lock:
+                        self._writer = None
+                    return
+        finally:
+            conn.close()
+    
+    def _run_ops(self, conn: sqlite3.Connection, ops: List[Tuple]) -> None:
+        """Run queued writes in order, committing consecutive saves together"""
+        saves = []
+        for op in ops:
+            if op[0] == "save":
+                saves.append(op)
+                continue
+            if saves:
+                self._commit_saves(conn, saves)
+                saves = []
+            self._run_call(conn, op)
+        if saves:
+            self._commit_saves(conn, saves)
+    
+    def _commit_saves(self, conn: sqlite3.Connection, ops: List[Tuple]) -> None:
+        """Group commit a batch of save_state writes"""
+        rows = [(resource_id,) + row for _, (resource_id, row, _), _, _ in ops]
+        state_rows = [(resource_id,) + row + (state_key,)
+                      for _, (resource_id, row, state_key), _, _ in ops]
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(_UPSERT_STATE_SQL, state_rows)
+            conn.executemany(_INSERT_HISTORY_SQL, rows)
+            conn.execute("COMMIT")
+        except Exception as e:
+            self._rollback(conn)
+            if len(ops) == 1:
+                logger.error(f"Error saving state to database: {e}")
+                self._finish(ops[0], False)
+                with self._lock:
+                    self._stats["failed_writes"] += 1
+                    resource_id = ops[0][1][0]
+                    if resource_id in self._transition_counts:
+                        self._transition_counts[resource_id] -= 1
+                return
+            # Retry individually so one bad row does not fail the whole batch
+            for op in ops:
+                self._commit_saves(conn, [op])
+            return
         
-    def __del__(self):
-        """Close all connections when object is deleted"""
+        with self._lock:
+            self._stats["writes"] += len(ops)
+            self._stats["transactions"] += 1
+            self._stats["max_batch"] = max(self._stats["max_batch"], len(ops))
+        for op in ops:
+            self._finish(op, True)
+    
+    def _run_call(self, conn: sqlite3.Connection, op: Tuple) -> None:
+        kind, fn, future, _ = op
+        try:
+            if kind == "call":
+                conn.execute("BEGIN")
+                result = fn(conn)
+                conn.execute("COMMIT")
+                with self._lock:
+                    self._stats["transactions"] += 1
+            else:
+                result = fn(conn)
+        except Exception as e:
+            if kind == "call":
+                self._rollback(conn)
+            self._finish(op, exception=e)
+            return
+        self._finish(op, result)
+    
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection) -> None:
         try:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+        except sqlite3.Error as e:
+            logger.error(f"Error rolling back SQLite transaction: {e}")
+    
+    def _finish(self, op: Tuple, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        _, _, future, resource_id = op
+        if resource_id is not None:
             with self._lock:
-                for conn in self._connection_pool.values():
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
-                self._connection_pool.clear()
-        except Exception:
-            pass  # Ignore errors during cleanup
-    
-    @asynccontextmanager
-    async def _get_db_cursor(self):
-        """Get a database cursor in a context manager"""
-        # This runs the SQLite operations in a thread pool since they're blocking
-        conn = self._get_connection()
-        cursor = conn.cursor()
+                if self._pending_writes.get(resource_id) is future:
+                    del self._pending_writes[resource_id]
         try:
-            yield cursor
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass  # The waiting caller was cancelled
+    
+    async def _write(self, fn: Callable[[sqlite3.Connection], Any], transactional: bool = True,
+                     resource_id: Optional[str] = None) -> Any:
+        """Run a callable on the writer thread and wait for its result"""
+        future = self._submit_write("call" if transactional else "raw", fn, resource_id)
+        return await asyncio.wrap_future(future)
+    
+    async def flush(self) -> None:
+        """Wait until every write queued so far has been committed"""
+        await self._write(lambda conn: None, transactional=False)
+    
+    async def close(self) -> None:
+        """Flush pending writes and stop the writer thread and reader pool"""
+        with self._lock:
+            writer = self._writer
+            if writer is not None:
+                self._write_queue.put(_STOP)
+        if writer is not None:
+            await asyncio.get_running_loop().run_in_executor(None, writer.join)
+        self._read_executor.shutdown(wait=True)
+    
+    # Reader pool
+    
+    def _read_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._read_local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._read_local.conn = conn
+        return conn
+    
+    async def _read(self, fn: Callable[[sqlite3.Connection], Any],
+                    resource_id: Optional[str] = None) -> Any:
+        """
+        Run a read on the reader pool.
+        
+        With resource_id, waits for that resource's queued writes first; without
+        it, waits for all queued writes in write-behind mode.
+        """
+        if resource_id is not None:
+            with self._lock:
+                pending = self._pending_writes.get(resource_id)
+            if pending is not None and not pending.done():
+                await asyncio.wrap_future(pending)
+        elif not self._wait_for_commit and not self._write_queue.empty():
+            await self.flush()
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor,
+                                          lambda: fn(self._read_connection()))
+    
+    def get_write_stats(self) -> Dict[str, Any]:
+        """Get writer thread and group commit statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["queued"] = self._write_queue.qsize()
+            stats["writer_running"] = self._writer is not None
+        stats["mean_batch"] = stats["writes"] / stats["transactions"] if stats["transactions"] else 0.0
+        return stats
     
     def _serialize_state_entry(self, entry: StateEntry) -> dict:
         """Convert a StateEntry to a dictionary for database storage"""
@@ -230,60 +479,41 @@ class SQLiteStateBackend(StateStorageBackend):
             version=row['version']
         )
     
+    @staticmethod
+    def _state_row(data: dict) -> tuple:
+        return (data['state_type'], data['state_value'], data['resource_type'],
+                data['timestamp'], data['metadata'], data['version'],
+                data['previous_state'], data['transition_reason'], data['failure_info'])
+    
     async def save_state(self, resource_id: str, state_entry: StateEntry) -> bool:
         """Save a state entry to the database"""
         try:
             # Serialize the state entry
-            data = self._serialize_state_entry(state_entry)
-            
-            async with self._get_db_cursor() as cursor:
-                # Insert or replace current state
-                cursor.execute('''
-                INSERT OR REPLACE INTO states 
-                (resource_id, state_type, state_value, resource_type, timestamp, 
-                 metadata, version, previous_state, transition_reason, failure_info)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    resource_id, data['state_type'], data['state_value'], 
-                    data['resource_type'], data['timestamp'], data['metadata'],
-                    data['version'], data['previous_state'], 
-                    data['transition_reason'], data['failure_info']
-                ))
-                
-                # Add to history
-                cursor.execute('''
-                INSERT INTO state_history 
-                (resource_id, state_type, state_value, resource_type, timestamp, 
-                 metadata, version, previous_state, transition_reason, failure_info)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    resource_id, data['state_type'], data['state_value'], 
-                    data['resource_type'], data['timestamp'], data['metadata'],
-                    data['version'], data['previous_state'], 
-                    data['transition_reason'], data['failure_info']
-                ))
-            
-            return True
+            row = self._state_row(self._serialize_state_entry(state_entry))
+            state_key = self.state_key(state_entry)
         except Exception as e:
             logger.error(f"Error saving state to database: {e}")
             return False
+        
+        with self._lock:
+            if resource_id in self._transition_counts:
+                self._transition_counts[resource_id] += 1
+        
+        future = self._submit_write("save", (resource_id, row, state_key), resource_id)
+        if not self._wait_for_commit:
+            return True
+        return await asyncio.wrap_future(future)
     
     async def save_snapshot(self, resource_id: str, snapshot: StateSnapshot) -> bool:
         """Save a state snapshot to the database"""
         try:
             # Serialize the snapshot
             data = self._serialize_snapshot(snapshot)
+            params = (resource_id, data['state'], data['timestamp'],
+                      data['metadata'], data['resource_type'], data['version'])
             
-            async with self._get_db_cursor() as cursor:
-                cursor.execute('''
-                INSERT INTO snapshots 
-                (resource_id, state, timestamp, metadata, resource_type, version)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    resource_id, data['state'], data['timestamp'], 
-                    data['metadata'], data['resource_type'], data['version']
-                ))
-            
+            await self._write(lambda conn: conn.execute(_INSERT_SNAPSHOT_SQL, params),
+                              resource_id=resource_id)
             return True
         except Exception as e:
             logger.error(f"Error saving snapshot to database: {e}")
@@ -291,79 +521,64 @@ class SQLiteStateBackend(StateStorageBackend):
     
     async def load_state(self, resource_id: str) -> Optional[StateEntry]:
         """Load the latest state for a resource from the database"""
+        def query(conn):
+            row = conn.execute(_SELECT_STATE_SQL, (resource_id,)).fetchone()
+            return self._deserialize_state_entry(row) if row else None
+        
         try:
-            async with self._get_db_cursor() as cursor:
-                cursor.execute('''
-                SELECT * FROM states WHERE resource_id = ?
-                ''', (resource_id,))
-                
-                row = cursor.fetchone()
-                if not row:
-                    return None
-                
-                return self._deserialize_state_entry(row)
+            return await self._read(query, resource_id)
         except Exception as e:
             logger.error(f"Error loading state from database: {e}")
             return None
     
     async def load_history(self, resource_id: str, limit: Optional[int] = None) -> List[StateEntry]:
         """Load state history for a resource from the database"""
+        def query(conn):
+            if limit:
+                rows = conn.execute(_SELECT_HISTORY_TAIL_SQL, (resource_id, limit)).fetchall()
+                # Fetched in DESC order due to LIMIT, reverse back to chronological
+                rows.reverse()
+            else:
+                rows = conn.execute(_SELECT_HISTORY_SQL, (resource_id,)).fetchall()
+            return [self._deserialize_state_entry(row) for row in rows]
+        
         try:
-            async with self._get_db_cursor() as cursor:
-                if limit:
-                    cursor.execute('''
-                    SELECT * FROM state_history 
-                    WHERE resource_id = ? 
-                    ORDER BY timestamp DESC LIMIT ?
-                    ''', (resource_id, limit))
-                else:
-                    cursor.execute('''
-                    SELECT * FROM state_history 
-                    WHERE resource_id = ? 
-                    ORDER BY timestamp
-                    ''', (resource_id,))
-                
-                rows = cursor.fetchall()
-                
-                # Convert rows to StateEntry objects
-                history = [self._deserialize_state_entry(row) for row in rows]
-                
-                # If we fetched in DESC order due to LIMIT, reverse back to chronological
-                if limit:
-                    history.reverse()
-                
-                return history
+            return await self._read(query, resource_id)
         except Exception as e:
             logger.error(f"Error loading history from database: {e}")
             return []
     
+    async def get_transition_count(self, resource_id: str) -> int:
+        """Get the number of recorded transitions, counting rows only on first access"""
+        with self._lock:
+            count = self._transition_counts.get(resource_id)
+        if count is not None:
+            return count
+        try:
+            count = await self._read(
+                lambda conn: conn.execute(_COUNT_HISTORY_SQL, (resource_id,)).fetchone()[0],
+                resource_id
+            )
+        except Exception as e:
+            logger.error(f"Error counting history in database: {e}")
+            return 0
+        with self._lock:
+            # A concurrent save may have seeded the counter meanwhile
+            return self._transition_counts.setdefault(resource_id, count)
+    
     async def load_snapshots(self, resource_id: str, limit: Optional[int] = None) -> List[StateSnapshot]:
         """Load snapshots for a resource from the database"""
+        def query(conn):
+            if limit:
+                rows = conn.execute(_SELECT_SNAPSHOTS_TAIL_SQL, (resource_id, limit)).fetchall()
+                # Fetched in DESC order due to LIMIT, reverse back to chronological
+                rows.reverse()
+            else:
+                rows = conn.execute(_SELECT_SNAPSHOTS_SQL, (resource_id,)).fetchall()
+            return [self._deserialize_snapshot(row) for row in rows]
+        
         try:
-            async with self._get_db_cursor() as cursor:
-                if limit:
-                    cursor.execute('''
-                    SELECT * FROM snapshots 
-                    WHERE resource_id = ? 
-                    ORDER BY timestamp DESC LIMIT ?
-                    ''', (resource_id, limit))
-                else:
-                    cursor.execute('''
-                    SELECT * FROM snapshots 
-                    WHERE resource_id = ? 
-                    ORDER BY timestamp
-                    ''', (resource_id,))
-                
-                rows = cursor.fetchall()
-                
-                # Convert rows to StateSnapshot objects
-                snapshots = [self._deserialize_snapshot(row) for row in rows]
-                
-                # If we fetched in DESC order due to LIMIT, reverse back to chronological
-                if limit:
-                    snapshots.reverse()
-                
-                return snapshots
+            return await self._read(query, resource_id)
         except Exception as e:
             logger.error(f"Error loading snapshots from database: {e}")
             return []
@@ -371,14 +586,129 @@ class SQLiteStateBackend(StateStorageBackend):
     async def get_all_resource_ids(self) -> List[str]:
         """Get all resource IDs from the database"""
         try:
-            async with self._get_db_cursor() as cursor:
-                cursor.execute('SELECT DISTINCT resource_id FROM states')
-                rows = cursor.fetchall()
-                return [row['resource_id'] for row in rows]
+            rows = await self._read(lambda conn: conn.execute('SELECT resource_id FROM states').fetchall())
+            return [row['resource_id'] for row in rows]
         except Exception as e:
             logger.error(f"Error getting resource IDs from database: {e}")
             return []
     
+    async def get_states_many(self, resource_ids: Iterable[str]) -> Dict[str, StateEntry]:
+        """Load the latest state for several resources with batched IN queries"""
+        resource_ids = list(dict.fromkeys(resource_ids))
+        
+        def query(conn):
+            result = {}
+            for start in range(0, len(resource_ids), _MAX_IN_PARAMS):
+                chunk = resource_ids[start:start + _MAX_IN_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                for row in conn.execute(f'SELECT * FROM states WHERE resource_id IN ({placeholders})', chunk):
+                    result[row['resource_id']] = self._deserialize_state_entry(row)
+            return result
+        
+        if not resource_ids:
+            return {}
+        try:
+            return await self._read(query)
+        except Exception as e:
+            logger.error(f"Error loading states from database: {e}")
+            return {}
+    
+    async def get_resource_ids_by_state(self, state_key: str) -> List[str]:
+        """Get IDs of resources in the given state using the state_key index"""
+        try:
+            rows = await self._read(lambda conn: conn.execute(_SELECT_IDS_BY_STATE_SQL, (state_key,)).fetchall())
+            return [row['resource_id'] for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting resources by state from database: {e}")
+            return []
+    
+    async def count_resources_by_state(self) -> Dict[str, int]:
+        """Count resources by state key using the state_key index"""
+        try:
+            rows = await self._read(lambda conn: conn.execute(_COUNT_BY_STATE_SQL).fetchall())
+            return {row[0]: row[1] for row in rows if row[0] is not None}
+        except Exception as e:
+            logger.error(f"Error counting resources by state in database: {e}")
+            return {}
+    
+    async def get_resource_ids_by_prefix(self, prefix: str) -> List[str]:
+        """Get IDs of resources starting with prefix as a primary key range scan"""
+        def query(conn):
+            result = []
+            # Rows come back in key order, so stop at the first non-matching ID
+            for row in conn.execute(_SELECT_IDS_FROM_SQL, (prefix,)):
+                if not row[0].startswith(prefix):
+                    break
+                result.append(row[0])
+            return result
+        
+        try:
+            return await self._read(query)
+        except Exception as e:
+            logger.error(f"Error getting resources by prefix from database: {e}")
+            return []
+    
+    async def delete_state(self, resource_id: str) -> bool:
+        """Delete a resource's state, history and snapshots from the database"""
+        def delete(conn):
+            deleted = conn.execute('DELETE FROM states WHERE resource_id = ?', (resource_id,)).rowcount
+            conn.execute('DELETE FROM state_history WHERE resource_id = ?', (resource_id,))
+            conn.execute('DELETE FROM snapshots WHERE resource_id = ?', (resource_id,))
+            return deleted > 0
+        
+        try:
+            deleted = await self._write(delete, resource_id=resource_id)
+        except Exception as e:
+            logger.error(f"Error deleting state from database: {e}")
+            return False
+        with self._lock:
+            self._transition_counts.pop(resource_id, None)
+        return deleted
+    
+    async def delete_states_many(self, resource_ids: Iterable[str]) -> int:
+        """Delete several resources in a single transaction, returns count removed"""
+        resource_ids = list(dict.fromkeys(resource_ids))
+        
+        def delete(conn):
+            count = 0
+            for start in range(0, len(resource_ids), _MAX_IN_PARAMS):
+                chunk = resource_ids[start:start + _MAX_IN_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                count += conn.execute(f'DELETE FROM states WHERE resource_id IN ({placeholders})', chunk).rowcount
+                conn.execute(f'DELETE FROM state_history WHERE resource_id IN ({placeholders})', chunk)
+                conn.execute(f'DELETE FROM snapshots WHERE resource_id IN ({placeholders})', chunk)
+            return count
+        
+        if not resource_ids:
+            return 0
+        # Queued saves for these resources run first: the writer is FIFO
+        try:
+            count = await self._write(delete)
+        except Exception as e:
+            logger.error(f"Error deleting states from database: {e}")
+            return 0
+        with self._lock:
+            for resource_id in resource_ids:
+                self._transition_counts.pop(resource_id, None)
+        return count
+    
+    async def clear_all_states(self) -> int:
+        """Delete all states, history and snapshots, returns count of removed resources"""
+        def clear(conn):
+            count = conn.execute('DELETE FROM states').rowcount
+            conn.execute('DELETE FROM state_history')
+            conn.execute('DELETE FROM snapshots')
+            return count
+        
+        try:
+            count = await self._write(clear)
+        except Exception as e:
+            logger.error(f"Error clearing states from database: {e}")
+            return 0
+        with self._lock:
+            self._transition_counts.clear()
+        return count
+    
     async def cleanup(self, older_than: Optional[datetime] = None) -> int:
         """
         Clean up old entries, returns count of removed items.
@@ -388,8 +718,6 @@ class SQLiteStateBackend(StateStorageBackend):
         2. Trims history to prevent excessive growth
         3. Limits the number of snapshots per resource
         """
-        items_removed = 0
-        
         if not older_than:
             # Default to cleaning up entries older than 30 days
             older_than = datetime.now() - timedelta(days=30)
@@ -397,126 +725,115 @@ class SQLiteStateBackend(StateStorageBackend):
         # Format cutoff timestamp for SQL comparison
         cutoff_timestamp = older_than.isoformat()
         
-        try:
-            async with self._get_db_cursor() as cursor:
-                # 1. Find terminated resources to remove completely
-                cursor.execute('''
-                SELECT resource_id FROM states 
-                WHERE state_type = 'ResourceState' 
-                AND state_value = 'TERMINATED' 
-                AND timestamp < ?
-                ''', (cutoff_timestamp,))
-                
-                terminated_resources = [row['resource_id'] for row in cursor.fetchall()]
-                
-                # Remove terminated resources
-                for resource_id in terminated_resources:
-                    # Delete state
-                    cursor.execute('DELETE FROM states WHERE resource_id = ?', (resource_id,))
-                    
-                    # Delete history
-                    cursor.execute('DELETE FROM state_history WHERE resource_id = ?', (resource_id,))
-                    
-                    # Delete snapshots
-                    cursor.execute('DELETE FROM snapshots WHERE resource_id = ?', (resource_id,))
-                    
-                    items_removed += 1
-                    logger.info(f"Cleaned up terminated resource: {resource_id}")
-                
-                # 2. Trim history for each active resource
-                cursor.execute('SELECT DISTINCT resource_id FROM states')
-                active_resources = [row['resource_id'] for row in cursor.fetchall()]
+        def run_cleanup(conn):
+            items_removed = 0
+            cursor = conn.cursor()
+            
+            # 1. Find terminated resources to remove completely
+            cursor.execute('''
+            SELECT resource_id FROM states 
+            WHERE state_type = 'ResourceState' 
+            AND state_value = 'TERMINATED' 
+            AND timestamp < ?
+            ''', (cutoff_timestamp,))
+            
+            terminated_resources = [row['resource_id'] for row in cursor.fetchall()]
+            
+            # Remove terminated resources
+            for resource_id in terminated_resources:
+                cursor.execute('DELETE FROM states WHERE resource_id = ?', (resource_id,))
+                cursor.execute('DELETE FROM state_history WHERE resource_id = ?', (resource_id,))
+                cursor.execute('DELETE FROM snapshots WHERE resource_id = ?', (resource_id,))
                 
-                for resource_id in active_resources:
-                    # Count history entries
-                    cursor.execute('''
-                    SELECT COUNT(*) as count FROM state_history WHERE resource_id = ?
-                    ''', (resource_id,))
-                    count = cursor.fetchone()['count']
-                    
-                    # If more than 1000 entries, keep only the most recent 1000
-                    if count > 1000:
-                        # Find the ID threshold for deletion
-                        cursor.execute('''
-                        SELECT id FROM state_history 
-                        WHERE resource_id = ? 
-                        ORDER BY timestamp DESC 
-                        LIMIT 1 OFFSET 1000
-                        ''', (resource_id,))
-                        result = cursor.fetchone()
-                        if result:
-                            threshold_id = result['id']
-                            
-                            # Delete older entries
-                            cursor.execute('''
-                            DELETE FROM state_history 
-                            WHERE resource_id = ? AND id < ?
-                            ''', (resource_id, threshold_id))
-                            
-                            deleted = cursor.rowcount
-                            items_removed += deleted
-                            logger.info(f"Trimmed history for {resource_id}: removed {deleted} old entries")
-                    
-                    # 3. Limit snapshots to most recent 10
+                items_removed += 1
+                logger.info(f"Cleaned up terminated resource: {resource_id}")
+            
+            # 2. Trim history for each active resource
+            cursor.execute('SELECT resource_id FROM states')
+            active_resources = [row['resource_id'] for row in cursor.fetchall()]
+            
+            for resource_id in active_resources:
+                # If more than 1000 entries, keep only the most recent 1000
+                cursor.execute('''
+                SELECT id FROM state_history 
+                WHERE resource_id = ? 
+                ORDER BY timestamp DESC, id DESC 
+                LIMIT 1 OFFSET 1000
+                ''', (resource_id,))
+                result = cursor.fetchone()
+                if result:
                     cursor.execute('''
-                    SELECT COUNT(*) as count FROM snapshots WHERE resource_id = ?
-                    ''', (resource_id,))
-                    count = cursor.fetchone()['count']
+                    DELETE FROM state_history 
+                    WHERE resource_id = ? AND id <= ?
+                    ''', (resource_id, result['id']))
                     
-                    if count > 10:
-                        # Find the ID threshold for deletion
-                        cursor.execute('''
-                        SELECT id FROM snapshots 
-                        WHERE resource_id = ? 
-                        ORDER BY timestamp DESC 
-                        LIMIT 1 OFFSET 10
-                        ''', (resource_id,))
-                        result = cursor.fetchone()
-                        if result:
-                            threshold_id = result['id']
-                            
-                            # Delete older snapshots
-                            cursor.execute('''
-                            DELETE FROM snapshots 
-                            WHERE resource_id = ? AND id < ?
-                            ''', (resource_id, threshold_id))
-                            
-                            deleted = cursor.rowcount
-                            items_removed += deleted
-                            logger.info(f"Trimmed snapshots for {resource_id}: removed {deleted} old snapshots")
+                    deleted = cursor.rowcount
+                    items_removed += deleted
+                    logger.info(f"Trimmed history for {resource_id}: removed {deleted} old entries")
                 
-                # 4. Vacuum the database periodically to reclaim space
-                # Only do this occasionally as it can be expensive
-                cursor.execute('PRAGMA auto_vacuum')
-                auto_vacuum = cursor.fetchone()[0]
-                if auto_vacuum == 0:  # If auto_vacuum is disabled
-                    # Get database size in pages
-                    cursor.execute('PRAGMA page_count')
-                    page_count = cursor.fetchone()[0]
-                    cursor.execute('PRAGMA page_size')
-                    page_size = cursor.fetchone()[0]
+                # 3. Limit snapshots to most recent 10
+                cursor.execute('''
+                SELECT id FROM snapshots 
+                WHERE resource_id = ? 
+                ORDER BY timestamp DESC, id DESC 
+                LIMIT 1 OFFSET 10
+                ''', (resource_id,))
+                result = cursor.fetchone()
+                if result:
+                    cursor.execute('''
+                    DELETE FROM snapshots 
+                    WHERE resource_id = ? AND id <= ?
+                    ''', (resource_id, result['id']))
                     
-                    # If database is larger than 10MB, vacuum it
-                    if page_count * page_size > 10 * 1024 * 1024:
-                        cursor.execute('VACUUM')
-                        logger.info("Vacuumed SQLite database to reclaim space")
+                    deleted = cursor.rowcount
+                    items_removed += deleted
+                    logger.info(f"Trimmed snapshots for {resource_id}: removed {deleted} old snapshots")
             
-            return items_removed
+            return items_removed, terminated_resources
+        
+        def vacuum_if_large(conn):
+            # Only vacuum large databases without auto_vacuum, as it can be expensive
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 0:
+                return
+            page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+            page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+            if page_count * page_size > 10 * 1024 * 1024:
+                conn.execute('VACUUM')
+                logger.info("Vacuumed SQLite database to reclaim space")
+        
+        try:
+            items_removed, terminated_resources = await self._write(run_cleanup)
         except Exception as e:
             logger.error(f"Error during database cleanup: {e}")
-            return items_removed
+            return 0
+        
+        with self._lock:
+            for resource_id in terminated_resources:
+                self._transition_counts.pop(resource_id, None)
+        
+        # 4. Vacuum the database periodically to reclaim space (not allowed inside a transaction)
+        try:
+            await self._write(vacuum_if_large, transactional=False)
+        except Exception as e:
+            logger.error(f"Error vacuuming database: {e}")
+        
+        return items_removed
     
     async def optimize_database(self) -> bool:
         """
         Optimize the database by running VACUUM and ANALYZE commands.
         This is an expensive operation that should be run during maintenance windows.
         """
+        def optimize(conn):
+            # Rebuild the database to defragment and optimize
+            conn.execute('VACUUM')
+            # Update statistics for the query planner
+            conn.execute('ANALYZE')
+            # Fold the WAL back into the main database file
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        
         try:
-            async with self._get_db_cursor() as cursor:
-                # Rebuild the database to defragment and optimize
-                cursor.execute('VACUUM')
-                # Update statistics for the query planner
-                cursor.execute('ANALYZE')
+            await self._write(optimize, transactional=False)
             logger.info("Database optimization completed successfully")
             return True
         except Exception as e:
@@ -533,38 +850,39 @@ class SQLiteStateBackend(StateStorageBackend):
             "resource_states": {}
         }
         
-        try:
-            async with self._get_db_cursor() as cursor:
-                # Get database file size
-                cursor.execute('PRAGMA page_count')
-                page_count = cursor.fetchone()[0]
-                cursor.execute('PRAGMA page_size')
-                page_size = cursor.fetchone()[0]
-                stats["database_size_bytes"] = page_count * page_size
-                
-                # Count resources
-                cursor.execute('SELECT COUNT(*) FROM states')
-                stats["resources_count"] = cursor.fetchone()[0]
-                
-                # Count history entries
-                cursor.execute('SELECT COUNT(*) FROM state_history')
-                stats["history_entries_count"] = cursor.fetchone()[0]
-                
-                # Count snapshots
-                cursor.execute('SELECT COUNT(*) FROM snapshots')
-                stats["snapshots_count"] = cursor.fetchone()[0]
-                
-                # Count by state
-                cursor.execute('''
-                SELECT state_type, state_value, COUNT(*) as count 
-                FROM states 
-                GROUP BY state_type, state_value
-                ''')
-                for row in cursor.fetchall():
-                    state_key = f"{row['state_type']}:{row['state_value']}"
-                    stats["resource_states"][state_key] = row['count']
+        def collect(conn):
+            cursor = conn.cursor()
+            # Get database file size
+            cursor.execute('PRAGMA page_count')
+            page_count = cursor.fetchone()[0]
+            cursor.execute('PRAGMA page_size')
+            page_size = cursor.fetchone()[0]
+            stats["database_size_bytes"] = page_count * page_size
+            
+            # Count resources
+            cursor.execute('SELECT COUNT(*) FROM states')
+            stats["resources_count"] = cursor.fetchone()[0]
+            
+            # Count history entries
+            cursor.execute('SELECT COUNT(*) FROM state_history')
+            stats["history_entries_count"] = cursor.fetchone()[0]
             
-            return stats
+            # Count snapshots
+            cursor.execute('SELECT COUNT(*) FROM snapshots')
+            stats["snapshots_count"] = cursor.fetchone()[0]
+            
+            # Count by state
+            cursor.execute('''
+            SELECT state_type, state_value, COUNT(*) as count 
+            FROM states 
+            GROUP BY state_type, state_value
+            ''')
+            for row in cursor.fetchall():
+                state_key = f"{row['state_type']}:{row['state_value']}"
+                stats["resource_states"][state_key] = row['count']
+        
+        try:
+            await self._read(collect)
         except Exception as e:
             logger.error(f"Error getting database stats: {e}")
-            return stats
\ No newline at end of file
+        return stats
@@ -2,7 +2,7 @@ import asyncio
 import contextlib
 import logging
 import threading
-from collections import defaultdict
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Union, TypeVar
 
@@ -116,9 +116,10 @@ class StateManager(BaseManager):
                 self._backend = MemoryStateBackend()
                 logger.info("Using in-memory persistence (no persistence between restarts)")
             
-            # LRU cache for frequently accessed state to reduce backend access
-            self._states_cache: Dict[str, StateEntry] = {}
-            self._cache_keys: List[str] = []  # For LRU tracking
+            # LRU cache for frequently accessed state to reduce backend access.
+            # OrderedDict keeps recency order: most recently used at the end.
+            self._states_cache: "OrderedDict[str, StateEntry]" = OrderedDict()
+            self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
             
             # State validator
             self._validator = StateTransitionValidator()
@@ -250,19 +251,34 @@ class StateManager(BaseManager):
     def _update_cache(self, resource_id: str, state_entry: StateEntry):
         """Update the LRU cache with a state entry"""
         with self._global_lock:
-            # Remove existing key if present
-            if resource_id in self._cache_keys:
-                self._cache_keys.remove(resource_id)
-                
-            # Add to cache
             self._states_cache[resource_id] = state_entry
-            self._cache_keys.append(resource_id)
+            self._states_cache.move_to_end(resource_id)
             
             # Enforce cache size limit
-            while len(self._cache_keys) > self._config.cache_size:
-                oldest_key = self._cache_keys.pop(0)
-                if oldest_key in self._states_cache:
-                    del self._states_cache[oldest_key]
+            while len(self._states_cache) > self._config.cache_size:
+                self._states_cache.popitem(last=False)
+                self._cache_stats["evictions"] += 1
+    
+    def _get_cached(self, resource_id: str) -> Optional[StateEntry]:
+        """Look up a state entry in the LRU cache, marking it most recently used"""
+        with self._global_lock:
+            entry = self._states_cache.get(resource_id)
+            if entry is None:
+                self._cache_stats["misses"] += 1
+                return None
+            self._states_cache.move_to_end(resource_id)
+            self._cache_stats["hits"] += 1
+            return entry
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get LRU state cache statistics"""
+        with self._global_lock:
+            stats = dict(self._cache_stats)
+            stats["size"] = len(self._states_cache)
+            stats["capacity"] = self._config.cache_size
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
     
     async def set_state(self,
                         resource_id: str, 
@@ -317,8 +333,7 @@ class StateManager(BaseManager):
         # Use the context manager to handle the resource lock
         with self._resource_lock(resource_id):
             # Get current state (trying cache first)
-            with self._global_lock:
-                current = self._states_cache.get(resource_id)
+            current = self._get_cached(resource_id)
                 
             if not current:
                 try:
@@ -371,10 +386,11 @@ class StateManager(BaseManager):
                     with self._global_lock:
                         self._metrics["backend_errors"] += 1
             
-            # Create periodic snapshot if needed
+            # Create periodic snapshot if needed. The backend keeps a per-resource
+            # transition counter so this never has to load the history.
             try:
-                history = await self._backend.load_history(resource_id)
-                if len(history) % 10 == 0:  # Every 10 transitions
+                transition_count = await self._backend.get_transition_count(resource_id)
+                if transition_count % 10 == 0:  # Every 10 transitions
                     await self._create_snapshot(resource_id, entry)
             except Exception as e:
                 logger.error(f"Error creating snapshot for {resource_id}: {e}")
@@ -456,11 +472,12 @@ class StateManager(BaseManager):
         
         # Try cache first if enabled
         if use_cache:
-            with self._global_lock:
-                if resource_id in self._states_cache:
-                    if self._metrics:
+            cached = self._get_cached(resource_id)
+            if cached is not None:
+                if self._metrics:
+                    with self._global_lock:
                         self._metrics["cache_hits"] += 1
-                    return self._states_cache[resource_id]
+                return cached
         
         # Load from backend
         try:
@@ -720,9 +737,11 @@ class StateManager(BaseManager):
             logger.error(f"Error getting backend stats: {e}")
             
         # Add cache stats
-        with self._global_lock:
-            metrics["cache_size"] = len(self._states_cache)
-            metrics["cache_capacity"] = self._config.cache_size
+        cache_stats = self.get_cache_stats()
+        metrics["cache_size"] = cache_stats["size"]
+        metrics["cache_capacity"] = cache_stats["capacity"]
+        metrics["cache_evictions"] = cache_stats["evictions"]
+        metrics["cache_hit_rate"] = cache_stats["hit_rate"]
         
         return metrics
     
@@ -839,46 +858,59 @@ class StateManager(BaseManager):
         Count resources by their current state.
         Returns a dictionary mapping state names to counts.
         """
-        result = defaultdict(int)
-        
         try:
-            # Get all resource IDs
-            resource_ids = await self._backend.get_all_resource_ids()
-            
-            # Count by state
-            for resource_id in resource_ids:
-                state_entry = await self.get_state(resource_id)
-                if state_entry:
-                    state_name = str(state_entry.state)
-                    result[state_name] += 1
-                    
-            return dict(result)
+            # Answered from the backend's by-state index in one lookup
+            return await self._backend.count_resources_by_state()
         except Exception as e:
             logger.error(f"Error counting resources by state: {e}")
-            return dict(result)
+            return {}
 
     async def get_resources_by_state(self, 
                                    state: Union[ResourceState, InterfaceState, str]) -> List[str]:
         """
         Get IDs of all resources in the specified state.
         """
-        result = []
-        state_str = str(state)
-        
         try:
-            # Get all resource IDs
-            resource_ids = await self._backend.get_all_resource_ids()
-            
-            # Filter by state
-            for resource_id in resource_ids:
-                state_entry = await self.get_state(resource_id)
-                if state_entry and str(state_entry.state) == state_str:
-                    result.append(resource_id)
-                    
-            return result
+            return await self._backend.get_resource_ids_by_state(str(state))
         except Exception as e:
             logger.error(f"Error getting resources by state {state}: {e}")
-            return result
+            return []
+    
+    async def get_states_many(self, resource_ids: List[str]) -> Dict[str, StateEntry]:
+        """
+        Get the current state of several resources.
+        
+        Cached entries are served from the LRU cache and the rest are loaded
+        from the backend in a single bulk lookup.
+        
+        Args:
+            resource_ids: IDs of the resources to look up
+            
+        Returns:
+            Mapping of resource ID to state entry; unknown resources are omitted
+        """
+        result: Dict[str, StateEntry] = {}
+        missing = []
+        for resource_id in resource_ids:
+            cached = self._get_cached(resource_id)
+            if cached is not None:
+                result[resource_id] = cached
+            else:
+                missing.append(resource_id)
+        
+        if missing:
+            try:
+                loaded = await self._backend.get_states_many(missing)
+            except Exception as e:
+                logger.error(f"Error loading states from backend: {e}")
+                if self._metrics:
+                    with self._global_lock:
+                        self._metrics["backend_errors"] += 1
+                loaded = {}
+            for resource_id, state_entry in loaded.items():
+                self._update_cache(resource_id, state_entry)
+            result.update(loaded)
+        return result
 
     async def terminate_resource(self, 
                                resource_id: str, 
@@ -978,8 +1010,7 @@ class StateManager(BaseManager):
     async def get_keys_by_prefix(self, prefix: str) -> List[str]:
         """Get all keys that start with the given prefix."""
         try:
-            resource_ids = await self._backend.get_all_resource_ids()
-            return [rid for rid in resource_ids if rid.startswith(prefix)]
+            return await self._backend.get_resource_ids_by_prefix(prefix)
         except Exception as e:
             logger.error(f"Error getting keys by prefix: {e}")
             return []
@@ -998,8 +1029,7 @@ class StateManager(BaseManager):
         try:
             # Remove from cache first
             with self._global_lock:
-                if resource_id in self._states_cache:
-                    del self._states_cache[resource_id]
+                self._states_cache.pop(resource_id, None)
             
             # Delete from backend
             result = await self._backend.delete_state(resource_id)
@@ -1054,13 +1084,17 @@ class StateManager(BaseManager):
             Number of states cleared
         """
         try:
-            all_ids = await self.get_all_states()
-            matching_ids = [rid for rid in all_ids if rid.startswith(pattern)]
+            matching_ids = await self._backend.get_resource_ids_by_prefix(pattern)
             
-            count = 0
-            for resource_id in matching_ids:
-                if await self.delete_state(resource_id):
-                    count += 1
+            # Remove from cache first, then delete from the backend in bulk
+            with self._global_lock:
+                for resource_id in matching_ids:
+                    self._states_cache.pop(resource_id, None)
+            count = await self._backend.delete_states_many(matching_ids)
+            
+            if count and self._metrics:
+                with self._global_lock:
+                    self._metrics["delete_state_count"] = self._metrics.get("delete_state_count", 0) + count
             
             logger.info(f"Cleared {count} workflow states matching pattern: {pattern}")
             return count
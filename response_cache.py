@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class CacheMode(Enum):
+    """How AnthropicAPI uses the response cache."""
+    OFF = "off"                # No caching
+    READ_WRITE = "read_write"  # Serve hits, call the API and record on misses
+    RECORD = "record"          # Always call the API and record the response
+    REPLAY = "replay"          # Serve recorded responses only; misses are errors
+
+
+class ReplayMissError(RuntimeError):
+    """Raised in replay mode when no recorded response matches a request."""
+
+
+class LLMResponseCache:
+    """
+    Persistent, content-addressed cache of LLM responses.
+
+    Each response is stored as ``<key>.json`` in the cache directory, where the
+    key is a SHA-256 hash of the model, system prompt blocks, schema,
+    conversation and max_tokens. Entries are evicted least-recently-used once
+    the entry or byte cap is exceeded; file modification times record recency
+    across runs.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        mode: Union[CacheMode, str] = CacheMode.READ_WRITE,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = CacheMode(mode)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # key -> size in bytes, least recently used first; built on first use
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "replay_misses": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional['LLMResponseCache']:
+        """
+        Create a cache from FFTT_LLM_CACHE_MODE and FFTT_LLM_CACHE_DIR.
+
+        Returns None when the mode is unset or "off".
+        """
+        mode = os.getenv("FFTT_LLM_CACHE_MODE", CacheMode.OFF.value).strip().lower()
+        if mode == CacheMode.OFF.value:
+            return None
+        cache_dir = os.getenv("FFTT_LLM_CACHE_DIR", ".fftt_llm_cache")
+        return cls(cache_dir, mode=mode)
+
+    @property
+    def reads_enabled(self) -> bool:
+        return self.mode in (CacheMode.READ_WRITE, CacheMode.REPLAY)
+
+    @property
+    def writes_enabled(self) -> bool:
+        return self.mode in (CacheMode.READ_WRITE, CacheMode.RECORD)
+
+    @property
+    def replay_only(self) -> bool:
+        return self.mode == CacheMode.REPLAY
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system: List[Dict[str, Any]],
+        schema: Dict[str, Any],
+        conversation: str,
+        max_tokens: Optional[int]
+    ) -> str:
+        """Hash the request parameters that determine an LLM response."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "system": [block.get("text") for block in system],
+                "schema": schema,
+                "conversation": conversation,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _ensure_index(self) -> "OrderedDict[str, int]":
+        if self._index is None:
+            entries: List[Tuple[float, str, int]] = []
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self._total_bytes = sum(size for _, _, size in entries)
+        return self._index
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the recorded response for key, counting a hit or miss."""
+        with self._lock:
+            index = self._ensure_index()
+            if key not in index:
+                self._stats["misses"] += 1
+                if self.replay_only:
+                    self._stats["replay_misses"] += 1
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                response = record["response"]
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Discarding unreadable cached response {key}: {e}")
+                self._remove_locked(key)
+                self._stats["misses"] += 1
+                if self.replay_only:
+                    self._stats["replay_misses"] += 1
+                return None
+
+            self._stats["hits"] += 1
+            index.move_to_end(key)
+            if not self.replay_only:
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+            return response
+
+    def put(self, key: str, response: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Record a response and evict least-recently-used entries over the caps."""
+        record = {"key": key, "created": time.time(), "response": response}
+        if metadata:
+            record.update(metadata)
+        data = json.dumps(record).encode("utf-8")
+
+        with self._lock:
+            index = self._ensure_index()
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            self._total_bytes += len(data) - index.pop(key, 0)
+            index[key] = len(data)
+            self._stats["writes"] += 1
+
+            while len(index) > 1 and (len(index) > self.max_entries or self._total_bytes > self.max_bytes):
+                oldest = next(iter(index))
+                self._remove_locked(oldest)
+                self._stats["evictions"] += 1
+
+    def _remove_locked(self, key: str) -> None:
+        self._total_bytes -= self._index.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> int:
+        """Remove all recorded responses and return how many were removed."""
+        with self._lock:
+            index = self._ensure_index()
+            count = len(index)
+            for key in list(index):
+                self._remove_locked(key)
+            return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size."""
+        with self._lock:
+            index = self._ensure_index()
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats.update({
+                "mode": self.mode.value,
+                "entries": len(index),
+                "bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+            })
+            return stats
@@ -0,0 +1,188 @@
+"""
+Tests for the Air Agent time-partitioned history store.
+
+Covers indexed range-and-filter queries for decision history and Fire
+interventions, bulk record reads, retention by dropping whole daily
+partitions, and indexing of records stored before partitioning.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from resources.air_agent import clear_old_history, get_decision_history, track_decision_event
+from resources.air_agent.history_store import HistoryStore, serialize_record
+from resources.air_agent.history_tracker import (
+    _decision_store,
+    _get_fire_intervention_keys,
+    _store_decision_event,
+    _store_fire_intervention
+)
+from resources.air_agent.models import DecisionEvent, DecisionType, FireIntervention
+from tests.doubles.in_memory_history_state import InMemoryHistoryStateManager
+
+
+def make_event(index, timestamp, agent="natural_selection", phase="phase_three",
+               decision_type=DecisionType.NATURAL_SELECTION):
+    return DecisionEvent(
+        event_id=f"event_{index}",
+        decision_agent=agent,
+        decision_type=decision_type,
+        timestamp=timestamp,
+        input_context={},
+        decision_rationale="rationale",
+        decision_details={"index": index},
+        phase_context=phase
+    )
+
+
+def make_intervention(index, timestamp, context="phase_three_feature"):
+    return FireIntervention(
+        intervention_id=f"fire_{index}",
+        intervention_context=context,
+        timestamp=timestamp,
+        decomposition_strategy="responsibility_extraction",
+        success=True,
+        original_complexity_score=80.0,
+        intervention_duration=timedelta(seconds=5)
+    )
+
+
+@pytest.fixture
+def state_manager():
+    return InMemoryHistoryStateManager()
+
+
+class TestDecisionHistoryQueries:
+    """Tests for indexed decision history retrieval."""
+
+    @pytest.mark.asyncio
+    async def test_filters_and_order(self, state_manager):
+        now = datetime.now()
+        for i in range(30):
+            agent = "evolution" if i % 3 == 0 else "natural_selection"
+            await _store_decision_event(state_manager, make_event(i, now - timedelta(hours=i), agent=agent))
+
+        events = await get_decision_history(agent_filter="evolution", max_events=4, state_manager=state_manager)
+
+        assert [event.event_id for event in events] == ["event_0", "event_3", "event_6", "event_9"]
+        assert all(event.decision_type == DecisionType.NATURAL_SELECTION for event in events)
+        # Records are fetched in one bulk read, never one by one
+        assert state_manager.single_reads == 0
+        assert state_manager.bulk_reads[-1] == [f"air_agent:decision_event:event_{i}" for i in (0, 3, 6, 9)]
+
+    @pytest.mark.asyncio
+    async def test_lookback_reads_only_partitions_in_range(self, state_manager):
+        now = datetime.now()
+        for day in range(10):
+            await _store_decision_event(state_manager, make_event(day, now - timedelta(days=day)))
+        store = _decision_store(state_manager)
+        store._partitions.clear()
+        state_manager.bulk_reads.clear()
+
+        events = await get_decision_history(lookback_period=timedelta(hours=36), state_manager=state_manager)
+
+        assert [event.event_id for event in events] == ["event_0", "event_1"]
+        partition_reads = [key for keys in state_manager.bulk_reads for key in keys if "partition" in key]
+        assert 2 <= len(partition_reads) <= 3
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_timestamps_are_indexed(self, state_manager):
+        now = datetime.now().replace(hour=12)
+        await _store_decision_event(state_manager, make_event(1, now, phase="phase_one"))
+        await _store_decision_event(state_manager, make_event(2, now - timedelta(minutes=30), phase="phase_two"))
+        await _store_decision_event(state_manager, make_event(3, now + timedelta(minutes=5), phase="phase_one"))
+
+        events = await get_decision_history(phase_filter="phase_one", state_manager=state_manager)
+
+        assert [event.event_id for event in events] == ["event_3", "event_1"]
+
+    @pytest.mark.asyncio
+    async def test_tracked_events_are_retrievable(self, state_manager):
+        result = await track_decision_event(
+            decision_agent="garden_foundation_refinement",
+            decision_type="refinement_strategy",
+            decision_details={"rationale": "test"},
+            decision_outcome={"success": True},
+            state_manager=state_manager
+        )
+
+        events = await get_decision_history(decision_type_filter="refinement_strategy", state_manager=state_manager)
+
+        assert [event.event_id for event in events] == [result["event_id"]]
+        assert events[0].phase_context == "phase_one"
+
+    @pytest.mark.asyncio
+    async def test_partitions_are_reloaded_from_state(self, state_manager):
+        await _store_decision_event(state_manager, make_event(1, datetime.now()))
+
+        fresh_store = HistoryStore(state_manager, "decision_event", ["decision_agent", "decision_type", "phase_context"])
+
+        assert await fresh_store.query(filters={"decision_agent": "natural_selection"}) == [
+            "air_agent:decision_event:event_1"
+        ]
+
+
+class TestFireInterventionQueries:
+    """Tests for indexed Fire intervention retrieval."""
+
+    @pytest.mark.asyncio
+    async def test_context_filter_and_limit(self, state_manager):
+        now = datetime.now()
+        for i in range(6):
+            context = "phase_one_guideline" if i % 2 else "phase_three_feature"
+            await _store_fire_intervention(state_manager, make_intervention(i, now - timedelta(minutes=i), context))
+
+        keys = await _get_fire_intervention_keys(state_manager, timedelta(days=1), context_filter="phase_three",
+                                                 max_results=2)
+
+        assert keys == ["air_agent:fire_intervention:fire_0", "air_agent:fire_intervention:fire_2"]
+        assert state_manager.data[keys[0]]["intervention_duration"] == 5.0
+
+
+class TestHistoryRetention:
+    """Tests for partition-based history cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_old_partitions_are_dropped(self, state_manager):
+        now = datetime.now()
+        for i, age in enumerate((1, 40, 41)):
+            await _store_decision_event(state_manager, make_event(i, now - timedelta(days=age)))
+            await _store_fire_intervention(state_manager, make_intervention(i, now - timedelta(days=age)))
+
+        result = await clear_old_history(retention_days=30, state_manager=state_manager)
+
+        assert result["success"]
+        assert result["decisions_cleaned"] == 2
+        assert result["interventions_cleaned"] == 2
+        assert result["partitions_dropped"] == 4
+        assert sorted(key for key in state_manager.data if key.startswith("air_agent:decision_event:")) == [
+            "air_agent:decision_event:event_0"
+        ]
+        events = await get_decision_history(state_manager=state_manager)
+        assert [event.event_id for event in events] == ["event_0"]
+
+
+class TestUnpartitionedRecords:
+    """Tests for records stored before history was partitioned."""
+
+    @pytest.mark.asyncio
+    async def test_records_are_indexed_on_first_use(self, state_manager):
+        now = datetime.now()
+        for i, age in enumerate((0, 2, 40)):
+            event = make_event(i, now - timedelta(days=age))
+            state_manager.data[f"air_agent:decision_event:{event.event_id}"] = serialize_record(event)
+        intervention = make_intervention(0, now - timedelta(days=40))
+        state_manager.data["air_agent:fire_intervention:fire_0"] = serialize_record(intervention)
+
+        events = await get_decision_history(state_manager=state_manager)
+        assert [event.event_id for event in events] == ["event_0", "event_1", "event_2"]
+
+        result = await clear_old_history(retention_days=30, state_manager=state_manager)
+
+        assert result["decisions_cleaned"] == 1
+        assert result["interventions_cleaned"] == 1
+        assert "air_agent:decision_event:event_2" not in state_manager.data
+        assert "air_agent:fire_intervention:fire_0" not in state_manager.data
+
+        # The backfill is recorded so later processes skip the scan
+        assert _decision_store(state_manager).backfill_key in state_manager.data
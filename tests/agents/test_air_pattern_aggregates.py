@@ -0,0 +1,179 @@
+"""
+Tests for incrementally maintained Air Agent pattern statistics.
+
+Covers agreement between incremental and batch statistics, scoped and
+windowed snapshots, feeding from decision tracking, rebuilding from stored
+history, and refinement context built from the precomputed statistics.
+"""
+
+import random
+import pytest
+from datetime import datetime, timedelta
+
+from resources.air_agent import (
+    analyze_decision_patterns,
+    identify_failure_patterns,
+    identify_success_patterns,
+    provide_refinement_context,
+    track_decision_event
+)
+from resources.air_agent.history_tracker import _store_decision_event, get_decision_aggregates
+from resources.air_agent.models import DecisionEvent, DecisionOutcome, DecisionType
+from resources.air_agent.pattern_analyzer import (
+    PatternAggregates,
+    failure_patterns_from_snapshot,
+    get_pattern_aggregates,
+    patterns_from_snapshot,
+    success_patterns_from_snapshot
+)
+from tests.doubles.in_memory_history_state import InMemoryHistoryStateManager
+
+AGENTS = ["garden_foundation_refinement", "natural_selection", "evolution"]
+PHASES = ["phase_one", "phase_three", None]
+RATIONALES = ["complexity is critical", "performance optimization", "necessary refinement", "no reason"]
+
+
+def random_events(count, seed=3, start=None):
+    rng = random.Random(seed)
+    start = start or datetime.now() - timedelta(days=5)
+    events = []
+    for i in range(count):
+        outcome = rng.choice([DecisionOutcome.SUCCESS, DecisionOutcome.SUCCESS, DecisionOutcome.FAILURE,
+                              DecisionOutcome.UNKNOWN])
+        events.append(DecisionEvent(
+            event_id=f"event_{i}",
+            decision_agent=rng.choice(AGENTS),
+            decision_type=rng.choice([DecisionType.REFINEMENT_NECESSITY, DecisionType.REFINEMENT_STRATEGY,
+                                      DecisionType.NATURAL_SELECTION]),
+            timestamp=start + timedelta(minutes=rng.randint(0, 5 * 24 * 60)),
+            input_context={},
+            decision_rationale=rng.choice(RATIONALES),
+            decision_details={"status": "failed"} if outcome == DecisionOutcome.FAILURE else {},
+            decision_outcome=outcome,
+            phase_context=rng.choice(PHASES),
+            failure_factors=["timeout waiting for agent"] if outcome == DecisionOutcome.FAILURE else []
+        ))
+    return events
+
+
+def summary(patterns):
+    return sorted((p.pattern_id, p.frequency, round(p.success_rate, 6)) for p in patterns)
+
+
+class TestPatternAggregates:
+    """Tests for PatternAggregates."""
+
+    def test_incremental_matches_batch(self):
+        events = random_events(400)
+        aggregates = PatternAggregates(max_event_ids=1000)
+        for event in events:
+            aggregates.observe(event)
+
+        assert aggregates.verify(events) == []
+        assert aggregates.verify(events, agent="evolution", phase="phase_one") == []
+
+        snapshot = aggregates.snapshot()
+        batch = PatternAggregates.from_events(events).snapshot()
+        assert summary(patterns_from_snapshot(snapshot)) == summary(patterns_from_snapshot(batch))
+        assert summary(success_patterns_from_snapshot(snapshot, 0.5)) == summary(success_patterns_from_snapshot(batch, 0.5))
+        assert summary(failure_patterns_from_snapshot(snapshot, 0.6)) == summary(failure_patterns_from_snapshot(batch, 0.6))
+
+    def test_verify_reports_differences(self):
+        events = random_events(50)
+        aggregates = PatternAggregates()
+        for event in events[:-1]:
+            aggregates.observe(event)
+
+        assert aggregates.verify(events)
+
+    def test_snapshot_scope_and_window(self):
+        now = datetime.now()
+        events = random_events(300, start=now - timedelta(days=10))
+        aggregates = PatternAggregates(window=None)
+        for event in events:
+            aggregates.observe(event)
+
+        start = now - timedelta(days=3)
+        scoped = aggregates.snapshot(agent="evolution", decision_types=["natural_selection"], start=start)
+        expected = [
+            e for e in events
+            if e.decision_agent == "evolution" and e.decision_type == DecisionType.NATURAL_SELECTION
+            and e.timestamp.date() >= start.date()
+        ]
+        assert scoped.total == len(expected)
+        assert set(scoped.outcome_counts.elements()) == {e.decision_outcome.value for e in expected}
+
+    def test_buckets_outside_window_are_dropped(self):
+        now = datetime.now()
+        aggregates = PatternAggregates(window=timedelta(days=7))
+        aggregates.observe(random_events(1, start=now - timedelta(days=1))[0])
+        # Expiry runs on the first observation of each day
+        aggregates.observe(random_events(1, seed=4, start=now - timedelta(days=30))[0])
+        assert aggregates.get_stats()["buckets"] == 2
+
+        assert aggregates.expire_before(now - timedelta(days=7)) == 1
+
+        assert aggregates.get_stats()["buckets"] == 1
+        assert aggregates.snapshot(start=now - timedelta(days=30)).total == 1
+
+
+class TestListBasedAnalysis:
+    """The list-based analysis functions use the batch statistics."""
+
+    @pytest.mark.asyncio
+    async def test_patterns_are_built(self):
+        events = random_events(200)
+
+        patterns = await analyze_decision_patterns(events)
+        success_patterns = await identify_success_patterns(events, success_threshold=0.5)
+        failure_patterns = await identify_failure_patterns(events, failure_threshold=0.6)
+
+        assert {p.pattern_id for p in patterns} >= {"agent_evolution", "type_natural_selection", "context_unknown"}
+        assert success_patterns and all(p.pattern_type == "success_pattern" for p in success_patterns)
+        assert any(p.pattern_id == "failure_by_error_keywords_timeout" for p in failure_patterns)
+        timeout = next(p for p in failure_patterns if p.pattern_id == "failure_by_error_keywords_timeout")
+        assert timeout.frequency == sum(1 for e in events if e.decision_outcome == DecisionOutcome.FAILURE)
+
+
+class TestAggregatesFromTracking:
+    """Tests for statistics fed by decision tracking."""
+
+    @pytest.mark.asyncio
+    async def test_tracked_decisions_update_aggregates(self):
+        state_manager = InMemoryHistoryStateManager()
+        for i in range(4):
+            await track_decision_event(
+                decision_agent="garden_foundation_refinement",
+                decision_type="refinement_necessity",
+                decision_details={"rationale": "complexity too high", "phase_context": "phase_one"},
+                decision_outcome={"success": i != 0},
+                state_manager=state_manager
+            )
+
+        aggregates = get_pattern_aggregates(state_manager)
+        snapshot = aggregates.snapshot(agent="garden_foundation_refinement")
+        assert snapshot.total == 4
+        assert snapshot.outcome_counts["success"] == 3
+
+        context = await provide_refinement_context(
+            requesting_agent="garden_foundation_refinement",
+            refinement_context={},
+            state_manager=state_manager
+        )
+        assert "Successful garden_foundation_refinement" in context.success_patterns
+        assert context.events_analyzed == 4
+
+    @pytest.mark.asyncio
+    async def test_aggregates_are_rebuilt_from_stored_history(self):
+        state_manager = InMemoryHistoryStateManager()
+        events = random_events(60, start=datetime.now() - timedelta(days=2))
+        for event in events:
+            await _store_decision_event(state_manager, event)
+
+        # Simulate a new process: statistics start empty and are rebuilt once
+        get_pattern_aggregates(state_manager).rebuild([])
+        get_pattern_aggregates(state_manager).warmed = False
+        aggregates = await get_decision_aggregates(state_manager)
+
+        assert aggregates.warmed
+        assert aggregates.verify(events) == []
@@ -0,0 +1,103 @@
+"""
+FakeAnthropicClient - A local stand-in for anthropic.Anthropic.
+
+Implements the blocking ``client.messages.create`` call used by AnthropicAPI
+with configurable latency and injected 429 rate-limit errors, so the LLM
+call scheduler can be exercised without network access.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import anthropic
+import httpx
+
+
+@dataclass
+class FakeUsage:
+    input_tokens: int
+    output_tokens: int
+
+
+@dataclass
+class FakeTextBlock:
+    text: str
+    type: str = "text"
+
+
+@dataclass
+class FakeMessage:
+    content: List[FakeTextBlock]
+    usage: FakeUsage
+    model: str
+
+
+def make_rate_limit_error(retry_after: Optional[float] = None) -> anthropic.RateLimitError:
+    """Build an anthropic.RateLimitError as raised by the real client on HTTP 429."""
+    headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(429, headers=headers, request=request)
+    return anthropic.RateLimitError("rate limited", response=response, body=None)
+
+
+class _FakeMessages:
+    def __init__(self, client: "FakeAnthropicClient"):
+        self._client = client
+
+    def create(self, model: str, max_tokens: int, messages: List[Dict[str, Any]], system: Any = None, **kwargs):
+        return self._client._create(model, max_tokens, messages, system)
+
+
+class FakeAnthropicClient:
+    """
+    Thread-safe fake of the synchronous Anthropic client.
+
+    Args:
+        latency: Seconds each call blocks, simulating network and generation time
+        response_text: Text returned in the single content block
+        rate_limit_first: Number of initial calls that fail with a 429
+        retry_after: Optional retry-after header sent with injected 429s
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        response_text: str = '{"ok": true}',
+        rate_limit_first: int = 0,
+        retry_after: Optional[float] = None
+    ):
+        self.latency = latency
+        self.response_text = response_text
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.messages = _FakeMessages(self)
+
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests: List[Dict[str, Any]] = []
+
+    def _create(self, model, max_tokens, messages, system):
+        with self._lock:
+            self.calls += 1
+            call_number = self.calls
+            self.requests.append({"model": model, "max_tokens": max_tokens, "messages": messages})
+            if call_number <= self.rate_limit_first:
+                raise make_rate_limit_error(self.retry_after)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        prompt = " ".join(str(message.get("content", "")) for message in messages)
+        return FakeMessage(
+            content=[FakeTextBlock(self.response_text)],
+            usage=FakeUsage(input_tokens=len(prompt) // 4, output_tokens=len(self.response_text) // 4),
+            model=model,
+        )
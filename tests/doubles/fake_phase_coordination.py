@@ -0,0 +1,34 @@
+"""
+Fake PhaseCoordinationIntegration for feature scheduling tests.
+
+Runs each nested Phase Three execution as a sleep whose length comes from the
+feature's "duration" field, and fails features listed in fail_features.
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class FakePhaseCoordination:
+    """Records nested executions and simulates their duration and outcome."""
+
+    def __init__(self, fail_features: Optional[Iterable[str]] = None, default_duration: float = 0.01):
+        self.fail_features = set(fail_features or ())
+        self.default_duration = default_duration
+        self.started: List[str] = []
+        self.running = 0
+        self.peak_running = 0
+
+    async def coordinate_nested_execution(self, parent_phase_id: str, phase_type: Any,
+                                          input_data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        feature = input_data["feature"]
+        self.started.append(feature["id"])
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        try:
+            await asyncio.sleep(feature.get("duration", self.default_duration))
+        finally:
+            self.running -= 1
+        if feature["id"] in self.fail_features:
+            return {"error": f"Feature {feature['id']} failed"}
+        return {"implementation": f"def {feature['id']}():\n    pass\n"}
@@ -0,0 +1,33 @@
+"""
+In-memory state manager double for Air agent history tests.
+
+Implements the subset of the state manager interface the Air agent uses -
+set/get/delete by key, prefix listing and bulk reads - and records reads so
+tests can check how history queries access storage.
+"""
+
+
+class InMemoryHistoryStateManager:
+    """State manager double with prefix listing and bulk reads that counts reads."""
+
+    def __init__(self):
+        self.data = {}
+        self.single_reads = 0
+        self.bulk_reads = []
+
+    async def set_state(self, key, value, *args):
+        self.data[key] = value
+
+    async def get_state(self, key, *args):
+        self.single_reads += 1
+        return self.data.get(key)
+
+    async def get_states_many(self, keys):
+        self.bulk_reads.append(list(keys))
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    async def delete_state(self, key, *args):
+        return self.data.pop(key, None) is not None
+
+    async def list_keys(self, prefix):
+        return [key for key in self.data if key.startswith(prefix)]
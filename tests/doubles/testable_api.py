@@ -82,7 +82,8 @@ class TestableAnthropicAPI:
         system_prompt_info: Tuple[str, str],
         schema: Dict[str, Any],
         current_phase: Optional[str] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        priority: Optional[int] = None
     ) -> str:
         """
         Generate a realistic API response based on the conversation and schema.
@@ -0,0 +1,54 @@
+"""
+Benchmark of refinement context pattern statistics.
+
+Compares building success/failure patterns from a scoped snapshot of the
+incrementally maintained aggregates against regrouping the decision list on
+every request, as context provision did before.
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from resources.air_agent.pattern_analyzer import (
+    PatternAggregates,
+    failure_patterns_from_snapshot,
+    identify_failure_patterns,
+    identify_success_patterns,
+    success_patterns_from_snapshot
+)
+from tests.agents.test_air_pattern_aggregates import random_events
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.performance
+
+
+def test_snapshot_reads_beat_regrouping():
+    events = random_events(5000)
+    aggregates = PatternAggregates()
+    start = time.perf_counter()
+    for event in events:
+        aggregates.observe(event)
+    observe_time = (time.perf_counter() - start) / len(events)
+
+    rounds = 5
+    start = time.perf_counter()
+    for _ in range(rounds):
+        snapshot = aggregates.snapshot()
+        success_patterns_from_snapshot(snapshot)
+        failure_patterns_from_snapshot(snapshot)
+    snapshot_time = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        asyncio.run(identify_success_patterns(events))
+        asyncio.run(identify_failure_patterns(events))
+    regroup_time = (time.perf_counter() - start) / rounds
+
+    logger.info(f"{len(events)} decisions: observe {observe_time * 1e6:.1f}us per decision, "
+                f"patterns from snapshot {snapshot_time * 1000:.2f}ms, "
+                f"regrouping decision list {regroup_time * 1000:.2f}ms")
+    assert snapshot_time < regroup_time
@@ -0,0 +1,78 @@
+"""
+Benchmark of cache eviction under a full cache.
+
+Compares O(1) policy eviction against the previous approach of sorting all
+entry metadata by ISO timestamp every time an entry had to be evicted, and
+reports hit rates of LRU and W-TinyLFU on a skewed workload with scans.
+"""
+
+import logging
+import random
+import time
+from datetime import datetime
+
+import pytest
+
+from resources.managers.cache import LRUEviction, TinyLFUEviction
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.performance
+
+CAPACITY = 2000
+OPERATIONS = 5000
+
+
+def _legacy_evict(metadata):
+    oldest = sorted(metadata.items(), key=lambda item: item[1]["timestamp"])[0][0]
+    del metadata[oldest]
+
+
+def test_eviction_throughput():
+    metadata = {f"key_{i}": {"timestamp": datetime.now().isoformat()} for i in range(CAPACITY)}
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        _legacy_evict(metadata)
+        metadata[f"new_{i}"] = {"timestamp": datetime.now().isoformat()}
+    legacy_time = time.perf_counter() - start
+
+    policy = LRUEviction()
+    for i in range(CAPACITY):
+        policy.insert(f"key_{i}")
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        policy.remove(policy.victim())
+        policy.insert(f"new_{i}")
+    policy_time = time.perf_counter() - start
+
+    logger.info(f"{OPERATIONS} evictions at {CAPACITY} entries: policy {policy_time / OPERATIONS * 1e6:.1f}us, "
+                f"sorted scan {legacy_time / OPERATIONS * 1e6:.1f}us per eviction")
+    assert len(policy) == CAPACITY
+    assert policy_time < legacy_time
+
+
+def _hit_rate(policy, capacity=200, requests=50000):
+    rng = random.Random(7)
+    cached = set()
+    hits = 0
+    for i in range(requests):
+        # Skewed popularity mixed with one-off scan keys
+        key = f"key_{int(rng.paretovariate(1.1))}" if rng.random() < 0.7 else f"scan_{i}"
+        if key in cached:
+            hits += 1
+            policy.access(key)
+            continue
+        cached.add(key)
+        policy.insert(key)
+        while len(cached) > capacity:
+            victim = policy.victim()
+            cached.discard(victim)
+            policy.remove(victim)
+    return hits / requests
+
+
+def test_hit_rate_with_scans():
+    lru = _hit_rate(LRUEviction())
+    tinylfu = _hit_rate(TinyLFUEviction(capacity=200))
+    logger.info(f"hit rate with scans: LRU {lru:.3f}, W-TinyLFU {tinylfu:.3f}")
+    assert tinylfu >= lru
@@ -0,0 +1,58 @@
+"""
+Benchmark of ErrorTracebackGraph.prune_old_entries on a 100k-edge graph.
+
+Pruning previously removed edges one at a time from a list and rewrote every
+stored edge index after each removal; with stable edge IDs and time-ordered
+indices it only touches the expired entries.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from resources.error_traceback import (
+    ErrorTracebackGraph,
+    TracebackEdge,
+    TracebackNode,
+    TracebackNodeType
+)
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.performance
+
+EDGES = 100000
+COMPONENTS = 50
+
+
+@pytest.mark.asyncio
+async def test_prune_100k_edge_graph():
+    graph = ErrorTracebackGraph()
+    now = datetime.now()
+    old = now - timedelta(days=10)
+    for c in range(COMPONENTS):
+        await graph.add_node(TracebackNode(f"component_{c}", TracebackNodeType.COMPONENT, "component"))
+    # Half of the errors (and their edges) are older than the retention window
+    for i in range(EDGES):
+        timestamp = old if i < EDGES // 2 else now
+        await graph.add_node(TracebackNode(
+            f"error_{i}", TracebackNodeType.ERROR, "error", timestamp=timestamp,
+            metadata={"error_type": f"Error{i % 10}", "component_id": f"component_{i % COMPONENTS}"}
+        ))
+        await graph.add_edge(TracebackEdge(f"error_{i}", f"component_{i % COMPONENTS}", "detected_in", timestamp=timestamp))
+
+    start = time.perf_counter()
+    await graph.prune_old_entries()
+    prune_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    similar = await graph.get_errors_since(now - timedelta(hours=1), "Error0", "component_0")
+    query_time = time.perf_counter() - start
+
+    logger.info(f"Pruned {EDGES // 2} of {EDGES} edges in {prune_time * 1000:.0f}ms, "
+                f"similar-error query {query_time * 1e6:.0f}us")
+    assert len(graph._edges) == EDGES // 2
+    assert len(similar) == EDGES // 2 // COMPONENTS
+    assert prune_time < 2.0
@@ -0,0 +1,131 @@
+"""
+Latency benchmark for the EventQueue dispatcher.
+
+Measures emit-to-deliver latency (p50/p99) per priority lane and checks that
+an idle queue does not wake the processor thread.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from typing import Dict, List
+
+import pytest
+import pytest_asyncio
+
+from resources.events import EventQueue
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.performance]
+
+PRIORITIES = ("high", "normal", "low")
+SAMPLES_PER_PRIORITY = 200
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@pytest_asyncio.fixture
+async def bench_queue():
+    """Event queue with throttling and rate limiting out of the way."""
+    # The high lane holds max_size // 10 events; size it for a whole burst
+    queue = EventQueue(max_size=SAMPLES_PER_PRIORITY * 10 * 2, queue_id="latency_bench")
+    queue._throttling_enabled = False
+    queue._backpressure_manager.prioritized_events.update(
+        f"latency_{priority}" for priority in PRIORITIES
+    )
+    await queue.start()
+    await asyncio.sleep(0.1)
+    yield queue
+    await queue.stop()
+
+
+async def _collect_latencies(queue: EventQueue, paced: bool) -> Dict[str, List[float]]:
+    latencies: Dict[str, List[float]] = {p: [] for p in PRIORITIES}
+    done = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    expected = SAMPLES_PER_PRIORITY * len(PRIORITIES)
+    received = 0
+
+    def record(priority, data):
+        nonlocal received
+        now = time.perf_counter()
+        items = data["items"] if data.get("batch") else [data]
+        for item in items:
+            latencies[priority].append((now - item["sent_at"]) * 1000)
+        received += len(items)
+        if received >= expected:
+            loop.call_soon_threadsafe(done.set)
+
+    for priority in PRIORITIES:
+        async def handler(event_type, data, priority=priority):
+            record(priority, data)
+        await queue.subscribe(f"latency_{priority}", handler)
+
+    for i in range(SAMPLES_PER_PRIORITY):
+        for priority in PRIORITIES:
+            await queue.emit(
+                f"latency_{priority}",
+                {"sent_at": time.perf_counter(), "seq": i},
+                priority=priority,
+            )
+            if paced:
+                await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(done.wait(), timeout=30)
+    return latencies
+
+
+def _report(label: str, latencies: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    summary = {}
+    for priority, values in latencies.items():
+        summary[priority] = {
+            "p50": _percentile(values, 50),
+            "p99": _percentile(values, 99),
+            "mean": statistics.mean(values),
+        }
+        logger.info(f"[{label}] {priority}: p50={summary[priority]['p50']:.3f}ms "
+                    f"p99={summary[priority]['p99']:.3f}ms n={len(values)}")
+    return summary
+
+
+async def test_paced_emit_to_deliver_latency(bench_queue):
+    """Events emitted onto an idle queue are delivered without polling delay."""
+    summary = _report("paced", await _collect_latencies(bench_queue, paced=True))
+
+    for priority in PRIORITIES:
+        # The old bridge waited up to 100-500ms on empty lanes; the dispatcher
+        # is woken directly so delivery should take a few milliseconds at most.
+        assert summary[priority]["p50"] < 20, summary
+        assert summary[priority]["p99"] < 100, summary
+
+
+async def test_burst_latency_respects_priority(bench_queue):
+    """Under a burst, high priority events are not delayed behind lower lanes."""
+    summary = _report("burst", await _collect_latencies(bench_queue, paced=False))
+
+    assert summary["high"]["p50"] <= summary["low"]["p50"], summary
+
+
+async def test_idle_queue_has_no_wakeups(bench_queue):
+    """An idle dispatcher sleeps until an event arrives."""
+    await asyncio.sleep(0.05)
+    before = bench_queue.get_dispatch_stats()["wakeups"]
+    await asyncio.sleep(0.5)
+    assert bench_queue.get_dispatch_stats()["wakeups"] == before
+
+    received = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    async def handler(event_type, data):
+        loop.call_soon_threadsafe(received.set)
+
+    await bench_queue.subscribe("latency_high", handler)
+    await bench_queue.emit("latency_high", {"sent_at": time.perf_counter()}, priority="high")
+    await asyncio.wait_for(received.wait(), timeout=5)
+    assert bench_queue.get_dispatch_stats()["wakeups"] == before + 1
@@ -227,7 +227,10 @@ async def test_event_queue_get_nowait_cross_context(event_queue):
     thread.start()
     thread.join()
     
-    # Now emit an event and verify it can be received
+    # Now emit an event and verify it can be received. The running dispatcher
+    # takes events as soon as they are emitted, so use a queue without a
+    # processor thread to observe the event through get_nowait.
+    event_queue = EventQueue(max_size=100, queue_id="test_idle_event_queue")
     test_data = {"cross_context_test": True}
     await event_queue.emit("test_event", test_data)
     
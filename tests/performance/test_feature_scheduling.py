@@ -0,0 +1,85 @@
+"""
+Benchmark of ParallelFeatureCoordinator scheduling modes.
+
+Runs the same randomly generated feature DAGs, with skewed feature durations,
+through the layered scheduler and the dependency-driven ready-queue scheduler
+and compares makespan and concurrency from their schedule traces.
+"""
+
+import asyncio
+import logging
+import random
+from unittest.mock import AsyncMock
+
+import pytest
+
+from phase_two.coordination.parallel import ParallelFeatureCoordinator
+from resources import EventQueue, MetricsManager, StateManager
+from tests.doubles.fake_phase_coordination import FakePhaseCoordination
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.performance
+
+
+def _random_features(seed, count=30, max_dependencies=3):
+    """Features in topological order with a few slow ones and random earlier dependencies."""
+    rng = random.Random(seed)
+    features = []
+    for index in range(count):
+        earlier = [f"feature_{i}" for i in range(index)]
+        dependencies = rng.sample(earlier, min(len(earlier), rng.randint(0, max_dependencies)))
+        duration = 0.15 if rng.random() < 0.15 else rng.uniform(0.005, 0.03)
+        features.append({
+            "id": f"feature_{index}",
+            "dependencies": dependencies,
+            "duration": duration,
+            "estimated_duration": duration
+        })
+    return features
+
+
+async def _run(scheduling_mode, features):
+    coordinator = ParallelFeatureCoordinator(
+        AsyncMock(spec=EventQueue),
+        AsyncMock(spec=StateManager),
+        AsyncMock(spec=MetricsManager),
+        FakePhaseCoordination(),
+        max_concurrent_features=4,
+        scheduling_mode=scheduling_mode
+    )
+    started = await coordinator.start_parallel_feature_development("phase_two", "component", features, {})
+    operation = coordinator._active_operations[started["operation_id"]]
+    while "end_time" not in operation:
+        await asyncio.sleep(0.005)
+    assert operation["status"] == "completed"
+    return coordinator.get_schedule_trace(started["operation_id"])
+
+
+def _average_concurrency(trace):
+    busy = 0.0
+    starts = {}
+    for event in trace["events"]:
+        if event["event"] == "start":
+            starts[event["feature_id"]] = event["offset"]
+        elif event["event"] == "end":
+            busy += event["offset"] - starts[event["feature_id"]]
+    return busy / trace["makespan"]
+
+
+@pytest.mark.asyncio
+async def test_dag_scheduler_makespan():
+    layered_total = dag_total = 0.0
+    for seed in range(3):
+        features = _random_features(seed)
+        layered = await _run("layered", features)
+        dag = await _run("dag", features)
+
+        logger.info(f"seed {seed}: layered makespan {layered['makespan']:.3f}s "
+                    f"(avg concurrency {_average_concurrency(layered):.2f}), "
+                    f"dag makespan {dag['makespan']:.3f}s "
+                    f"(avg concurrency {_average_concurrency(dag):.2f})")
+        layered_total += layered["makespan"]
+        dag_total += dag["makespan"]
+
+    assert dag_total < layered_total
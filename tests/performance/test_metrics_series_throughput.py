@@ -0,0 +1,93 @@
+"""
+Benchmark of metric recording and windowed statistics.
+
+Fills a full 1000-point series and compares windowed statistics from the
+columnar ring buffer against the previous approach of filtering a deque of
+point dicts by re-parsing each ISO timestamp and aggregating in Python. Also
+compares METRIC_RECORDED event volume with and without coalescing.
+"""
+
+import logging
+import statistics
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from resources.events import EventQueue, ResourceEventTypes
+from resources.managers.metrics import MetricSeries, MetricsManager, summarize_values
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.performance
+
+POINTS = 1000
+QUERIES = 500
+
+
+def _legacy_stats(points, window):
+    cutoff = datetime.now() - window
+    values = [p["value"] for p in points if datetime.fromisoformat(p["timestamp"]) > cutoff]
+    ordered = sorted(values)
+    return {
+        "min": min(values),
+        "max": max(values),
+        "avg": sum(values) / len(values),
+        "count": len(values),
+        "p95": statistics.quantiles(ordered, n=100, method="inclusive")[94]
+    }
+
+
+def test_windowed_stats_throughput():
+    now = datetime.now()
+    legacy = deque(maxlen=POINTS)
+    series = MetricSeries(POINTS)
+    for i in range(POINTS):
+        timestamp = (now - timedelta(seconds=POINTS - i)).isoformat()
+        legacy.append({"value": float(i % 97), "timestamp": timestamp, "metadata": {}})
+        series.append(float(i % 97), timestamp)
+    window = timedelta(seconds=POINTS // 2)
+
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        stats = summarize_values(series.values(window))
+    columnar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        legacy_stats = _legacy_stats(legacy, window)
+    legacy_time = time.perf_counter() - start
+
+    logger.info(f"windowed stats over {POINTS} points: columnar {columnar_time / QUERIES * 1e6:.0f}us, "
+                f"legacy {legacy_time / QUERIES * 1e6:.0f}us per query")
+    assert stats["count"] == legacy_stats["count"]
+    assert stats["avg"] == pytest.approx(legacy_stats["avg"])
+    assert stats["p95"] == pytest.approx(legacy_stats["p95"])
+    assert columnar_time < legacy_time
+
+
+@pytest.mark.asyncio
+async def test_coalesced_event_volume():
+    results = {}
+    for interval in (None, 60):
+        event_queue = AsyncMock(spec=EventQueue)
+        manager = MetricsManager(event_queue=event_queue, event_coalesce_interval=interval)
+        manager.event_bus = event_queue
+        start = time.perf_counter()
+        for i in range(POINTS):
+            await manager.record_metric(f"metric_{i % 10}", float(i))
+        await manager.flush_metric_events()
+        elapsed = time.perf_counter() - start
+        events = sum(
+            1 for call in event_queue.emit.await_args_list
+            if call.args[0] == ResourceEventTypes.METRIC_RECORDED.value
+        )
+        results[interval] = events
+        logger.info(f"{POINTS} points over 10 metrics, coalesce interval {interval}: "
+                    f"{events} events, {elapsed / POINTS * 1e6:.0f}us per point")
+        await manager.terminate()
+
+    assert results[None] == POINTS
+    assert results[60] == 10
@@ -0,0 +1,106 @@
+"""
+Throughput benchmark for SQLiteStateBackend.
+
+Compares sustained save_state calls per second of the writer-thread backend
+(WAL, group commit) against the previous design, which committed every call
+synchronously on the event loop thread in rollback-journal mode.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+
+import pytest
+
+from resources.state import SQLiteStateBackend, StateEntry
+from resources.common import ResourceState, ResourceType
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.performance]
+
+WRITES = 2000
+CONCURRENCY = 50
+
+
+class _PerCallCommitBackend:
+    """Minimal reproduction of the previous save path: one blocking commit per call."""
+
+    def __init__(self, db_path):
+        # Share the schema, then reopen in the default rollback-journal mode
+        SQLiteStateBackend(db_path)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA journal_mode = DELETE")
+        self._serializer = SQLiteStateBackend._serialize_state_entry
+
+    async def save_state(self, resource_id, entry):
+        data = self._serializer(self, entry)
+        row = (resource_id, data['state_type'], data['state_value'], data['resource_type'],
+               data['timestamp'], data['metadata'], data['version'], data['previous_state'],
+               data['transition_reason'], data['failure_info'])
+        cursor = self._conn.cursor()
+        cursor.execute('INSERT OR REPLACE INTO states (resource_id, state_type, state_value, resource_type, '
+                       'timestamp, metadata, version, previous_state, transition_reason, failure_info, state_key) '
+                       'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', row + (SQLiteStateBackend.state_key(entry),))
+        cursor.execute('INSERT INTO state_history (resource_id, state_type, state_value, resource_type, '
+                       'timestamp, metadata, version, previous_state, transition_reason, failure_info) '
+                       'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+        self._conn.commit()
+        return True
+
+    async def close(self):
+        self._conn.close()
+
+
+def _entry(i):
+    return StateEntry(
+        state=ResourceState.ACTIVE if i % 2 == 0 else ResourceState.PAUSED,
+        resource_type=ResourceType.COMPUTE,
+        metadata={"index": i},
+    )
+
+
+async def _throughput(backend, concurrency):
+    start = time.perf_counter()
+    for base in range(0, WRITES, concurrency):
+        results = await asyncio.gather(*(
+            backend.save_state(f"resource-{(base + i) % 100}", _entry(base + i))
+            for i in range(concurrency)
+        ))
+        assert all(results)
+    return WRITES / (time.perf_counter() - start)
+
+
+async def test_sqlite_save_state_throughput(tmp_path):
+    legacy = _PerCallCommitBackend(str(tmp_path / "legacy.db"))
+    legacy_rate = await _throughput(legacy, CONCURRENCY)
+    await legacy.close()
+
+    backend = SQLiteStateBackend(str(tmp_path / "state.db"))
+    sequential_rate = await _throughput(backend, 1)
+    concurrent_rate = await _throughput(backend, CONCURRENCY)
+    stats = backend.get_write_stats()
+    await backend.close()
+
+    logger.info(f"per-call commit: {legacy_rate:.0f} set_state/s")
+    logger.info(f"writer thread, sequential: {sequential_rate:.0f} set_state/s")
+    logger.info(f"writer thread, {CONCURRENCY} concurrent: {concurrent_rate:.0f} set_state/s "
+                f"(mean batch {stats['mean_batch']:.1f})")
+
+    assert stats["max_batch"] > 1
+    assert concurrent_rate > legacy_rate
+
+
+async def test_write_behind_throughput(tmp_path):
+    backend = SQLiteStateBackend(str(tmp_path / "state.db"), wait_for_commit=False)
+    start = time.perf_counter()
+    for i in range(WRITES):
+        await backend.save_state(f"resource-{i % 100}", _entry(i))
+    queued_rate = WRITES / (time.perf_counter() - start)
+    await backend.flush()
+    committed_rate = WRITES / (time.perf_counter() - start)
+    await backend.close()
+
+    logger.info(f"write-behind: {queued_rate:.0f} queued/s, {committed_rate:.0f} committed/s")
+    assert committed_rate > 0
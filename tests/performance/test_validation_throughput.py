@@ -0,0 +1,125 @@
+"""
+Micro-benchmark for Validator JSON extraction and schema validation.
+
+Runs over LLM outputs shaped like recorded garden planner responses at
+realistic sizes, in the forms agents actually return them: bare JSON, JSON
+wrapped in markdown and prose, and JSON carrying escape-heavy code snippets.
+Compares the previous char-by-char bracket counter and per-call
+jsonschema.validate against the linear extractor and cached validators.
+"""
+
+import json
+import logging
+import time
+
+import jsonschema
+import pytest
+
+from agent_validation import SchemaValidatorCache, Validator
+from prompt_registry import PromptRegistry
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.performance
+
+SCHEMA_MODULE = "FFTT_system_prompts/phase_one/garden_planner_agent"
+SCHEMA_NAME = "initial_task_elaboration_schema"
+SIZES = {"small": 4, "medium": 40, "large": 300}  # items per array
+CODE_SNIPPET = 'print(\\"{\\\\\\"key\\\\\\": \\\\\\"value\\\\\\"}\\")\\n' * 4
+
+
+def _legacy_bracket_counting(content):
+    """The previous extractor: rescans backslashes before every quote."""
+    start_idx = content.find('{')
+    if start_idx == -1:
+        return None
+    brace_count = 0
+    in_string = False
+    i = start_idx
+    while i < len(content):
+        char = content[i]
+        if char == '"':
+            backslash_count = 0
+            j = i - 1
+            while j >= 0 and content[j] == '\\':
+                backslash_count += 1
+                j -= 1
+            if backslash_count % 2 == 0:
+                in_string = not in_string
+        elif not in_string:
+            if char == '{':
+                brace_count += 1
+            elif char == '}':
+                brace_count -= 1
+                if brace_count == 0:
+                    return content[start_idx:i + 1]
+        i += 1
+    return None
+
+
+def _instance(schema, items, text):
+    """Build an instance of schema with the given array length and string filler."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if kind == "object":
+        return {name: _instance(sub, items, text) for name, sub in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [_instance(schema.get("items", {}), max(1, items // 10), text) for _ in range(items)]
+    if kind in ("integer", "number"):
+        return 1
+    if kind == "boolean":
+        return True
+    return text
+
+
+def _outputs(schema):
+    outputs = {}
+    for size, items in SIZES.items():
+        plain = json.dumps(_instance(schema, items, "Detailed requirement description. " * 3), indent=2)
+        escaped = json.dumps(_instance(schema, items, CODE_SNIPPET), indent=2)
+        outputs[f"{size}/plain"] = plain
+        outputs[f"{size}/markdown"] = f"Here is the analysis:\n```json\n{plain}\n```\nLet me know if you need changes."
+        outputs[f"{size}/escaped"] = f"Analysis complete.\n{escaped}\nAll snippets are escaped."
+    return outputs
+
+
+def _rate(fn, arg, seconds=0.2):
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn(arg)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return calls / elapsed
+
+
+def test_json_extraction_throughput():
+    schema = PromptRegistry.get_instance().get_schema(SCHEMA_MODULE, SCHEMA_NAME)
+    validator = object.__new__(Validator)
+
+    for name, output in _outputs(schema).items():
+        content = output[output.find("{"):]
+        assert validator._extract_json_with_bracket_counting(content) == _legacy_bracket_counting(content)
+
+        legacy_rate = _rate(_legacy_bracket_counting, content)
+        counting_rate = _rate(validator._extract_json_with_bracket_counting, content)
+        extract_rate = _rate(validator.extract_json_from_response, output)
+        logger.info(f"{name:16s} {len(output) / 1024:8.1f}KB  legacy {legacy_rate:9.0f}/s  "
+                    f"linear {counting_rate:9.0f}/s  extract_json_from_response {extract_rate:9.0f}/s")
+        if name.endswith("escaped") and not name.startswith("small"):
+            assert counting_rate > legacy_rate
+
+
+def test_schema_validation_throughput():
+    schema = PromptRegistry.get_instance().get_schema(SCHEMA_MODULE, SCHEMA_NAME)
+    cache = SchemaValidatorCache()
+    instance = json.loads(_outputs(schema)["small/plain"])
+
+    per_call_rate = _rate(lambda obj: jsonschema.validate(obj, schema), instance)
+    cached_rate = _rate(lambda obj: cache.validate(obj, schema), instance)
+    logger.info(f"jsonschema.validate {per_call_rate:.0f}/s, cached validator {cached_rate:.0f}/s")
+
+    assert cache.get_stats()["misses"] == 1
+    assert cached_rate > per_call_rate
@@ -0,0 +1,92 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from interfaces.agent import cache as interface_cache
+from interfaces.agent.cache import InterfaceCache, MemoryPressureController
+from resources.events import EventQueue, ResourceEventTypes
+from resources.managers import CacheManager
+from resources.monitoring import MemoryMonitor, ProcessMemoryGauge
+
+
+@pytest.fixture
+def event_queue():
+    return AsyncMock(spec=EventQueue)
+
+@pytest.fixture
+def memory_monitor():
+    monitor = MagicMock(spec=MemoryMonitor)
+    monitor.track_resources = AsyncMock()
+    monitor.untrack_resource = AsyncMock()
+    return monitor
+
+@pytest.fixture
+def cache_manager():
+    manager = MagicMock(spec=CacheManager)
+    manager.set_cache = AsyncMock()
+    manager.invalidate = AsyncMock()
+    manager.cleanup = AsyncMock()
+    return manager
+
+
+def test_gauge_samples_rss_once_per_interval():
+    """Test that repeated reads within the refresh interval reuse one sample."""
+    gauge = ProcessMemoryGauge()
+    gauge._sampled_at = None
+    with patch.object(gauge._process, "memory_info", wraps=gauge._process.memory_info) as memory_info:
+        readings = [gauge.rss_mb() for _ in range(100)]
+
+    assert memory_info.call_count == 1
+    assert readings[0] > 0
+    assert ProcessMemoryGauge() is gauge
+
+
+@pytest.mark.asyncio
+async def test_tracking_is_batched(event_queue, cache_manager, memory_monitor):
+    """Test that cache writes reach the memory monitor in one batched update."""
+    cache = InterfaceCache(event_queue, "batched_cache", cache_manager, memory_monitor)
+    for i in range(5):
+        await cache.set_cache(f"key_{i}", f"value_{i}")
+    await cache.invalidate("key_4")
+
+    memory_monitor.track_resources.assert_not_awaited()
+    await cache.flush_memory_tracking()
+
+    memory_monitor.track_resources.assert_awaited_once()
+    sizes, component_id = memory_monitor.track_resources.await_args.args
+    assert set(sizes) == {f"cache:key_{i}" for i in range(4)}
+    assert component_id == "batched_cache"
+    cache._tracking_flush_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_pressure_cleanup_is_debounced(event_queue, cache_manager):
+    """Test that concurrent pressure reports from many caches trigger one cleanup."""
+    controller = MemoryPressureController(threshold_mb=0.0, cooldown=60.0)
+    controller.register(cache_manager)
+    other_manager = MagicMock(spec=CacheManager)
+    other_manager.cleanup = AsyncMock()
+    controller.register(other_manager)
+
+    started = await asyncio.gather(*[controller.check(event_queue, f"interface_{i}") for i in range(10)])
+    await controller._cleanup_task
+
+    assert started.count(True) == 1
+    cache_manager.cleanup.assert_awaited_once_with(force=True)
+    other_manager.cleanup.assert_awaited_once_with(force=True)
+    alerts = [
+        call.args[1] for call in event_queue.emit.await_args_list
+        if call.args[0] == ResourceEventTypes.RESOURCE_ALERT_CREATED.value
+    ]
+    assert len(alerts) == 1
+
+    # Still within the cooldown after the cleanup finished
+    assert not await controller.check(event_queue, "interface_0")
+
+
+@pytest.mark.asyncio
+async def test_caches_share_the_controller(event_queue, cache_manager, memory_monitor):
+    """Test that every InterfaceCache registers its manager with the shared controller."""
+    InterfaceCache(event_queue, "shared_cache", cache_manager, memory_monitor)
+    assert cache_manager in interface_cache.memory_pressure_controller._cache_managers
@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+import anthropic
+import pytest
+import pytest_asyncio
+
+from api import AnthropicAPI, CallPriority, LLMCallScheduler, LLMConcurrencyConfig, ModelRateLimit
+from tests.doubles.fake_anthropic_client import FakeAnthropicClient
+
+PROMPT_INFO = ("FFTT_system_prompts/validation/error_analysis_agent", "error_analysis_prompt")
+SCHEMA = {"type": "object"}
+
+
+@pytest_asyncio.fixture
+async def make_scheduler():
+    schedulers = []
+
+    def factory(**config):
+        scheduler = LLMCallScheduler(LLMConcurrencyConfig(**config))
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield factory
+    for scheduler in schedulers:
+        scheduler._executor.shutdown(wait=True)
+
+
+class TestLLMCallScheduler:
+    """Tests for concurrent LLM call execution in AnthropicAPI."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_limit(self, make_scheduler):
+        scheduler = make_scheduler(max_in_flight=3)
+        client = FakeAnthropicClient(latency=0.05)
+        api = AnthropicAPI(client=client, scheduler=scheduler)
+
+        results = await asyncio.gather(*(
+            api.call(f"request {i}", PROMPT_INFO, SCHEMA, max_tokens=100) for i in range(10)
+        ))
+
+        assert results == ['{"ok": true}'] * 10
+        assert client.peak_in_flight == 3
+        metrics = api.get_metrics()
+        assert metrics["completed"] == 10
+        assert metrics["peak_in_flight"] == 3
+        assert metrics["in_flight"] == 0
+        assert metrics["latency"]["count"] == 10
+        assert metrics["queue_wait"]["max"] > 0
+
+    @pytest.mark.asyncio
+    async def test_instances_share_scheduler_and_run_in_parallel(self, make_scheduler):
+        scheduler = make_scheduler(max_in_flight=8)
+        client = FakeAnthropicClient(latency=0.1)
+        apis = [AnthropicAPI(client=client, scheduler=scheduler) for _ in range(4)]
+
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            api.call(f"request {i}", PROMPT_INFO, SCHEMA, max_tokens=100)
+            for i in range(2) for api in apis
+        ))
+        elapsed = time.perf_counter() - start
+
+        # Eight 100ms calls would take 0.8s if serialized
+        assert elapsed < 0.4
+        assert client.peak_in_flight == 8
+
+    @pytest.mark.asyncio
+    async def test_high_priority_lane_dispatched_first(self, make_scheduler):
+        scheduler = make_scheduler(max_in_flight=1)
+        order = []
+
+        def work(name):
+            def fn():
+                time.sleep(0.02)
+                order.append(name)
+            return fn
+
+        blocker = asyncio.create_task(scheduler.run(work("blocker"), model="m"))
+        await asyncio.sleep(0.005)
+        low = [asyncio.create_task(scheduler.run(work(f"low-{i}"), model="m", priority=CallPriority.LOW))
+               for i in range(2)]
+        await asyncio.sleep(0)
+        high = asyncio.create_task(scheduler.run(work("high"), model="m", priority=CallPriority.HIGH))
+        await asyncio.sleep(0)
+
+        assert scheduler.get_metrics()["queued_by_priority"] == {"high": 1, "normal": 0, "low": 2}
+        await asyncio.gather(blocker, high, *low)
+        assert order == ["blocker", "high", "low-0", "low-1"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self, make_scheduler):
+        scheduler = make_scheduler(max_in_flight=1)
+        blocker = asyncio.create_task(scheduler.run(lambda: time.sleep(0.05), model="m"))
+        await asyncio.sleep(0.005)
+        waiter = asyncio.create_task(scheduler.run(lambda: None, model="m"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        await blocker
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert await scheduler.run(lambda: "done", model="m") == "done"
+        assert scheduler.get_metrics()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_calls_are_retried(self, make_scheduler):
+        scheduler = make_scheduler(retry_base_delay=0.01)
+        client = FakeAnthropicClient(latency=0.0, rate_limit_first=2)
+        api = AnthropicAPI(client=client, scheduler=scheduler)
+
+        assert await api.call("request", PROMPT_INFO, SCHEMA, max_tokens=100) == '{"ok": true}'
+        metrics = api.get_metrics()
+        assert client.calls == 3
+        assert metrics["rate_limited"] == 2
+        assert metrics["retries"] == 2
+        assert metrics["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_exhausted(self, make_scheduler):
+        scheduler = make_scheduler(retry_base_delay=0.01, max_rate_limit_retries=1)
+        client = FakeAnthropicClient(latency=0.0, rate_limit_first=5)
+
+        with pytest.raises(anthropic.RateLimitError):
+            await scheduler.run(lambda: client.messages.create("m", 10, []), model="m")
+        assert client.calls == 2
+        assert scheduler.get_metrics()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_model_budgets(self, make_scheduler):
+        scheduler = make_scheduler(model_limits={
+            "small": ModelRateLimit(requests_per_minute=2),
+            "tokens": ModelRateLimit(tokens_per_minute=6000),
+        })
+
+        assert scheduler._reserve("small", 0) == 0
+        assert scheduler._reserve("small", 0) == 0
+        assert scheduler._reserve("small", 0) == pytest.approx(30, abs=0.5)
+        # Models without a limit and unrelated models are unaffected
+        assert scheduler._reserve("other", 10 ** 6) == 0
+        assert scheduler._reserve("tokens", 6000) == 0
+        assert scheduler._reserve("tokens", 600) == pytest.approx(6, abs=0.5)
+
+        scheduler.set_model_limit("small", ModelRateLimit(requests_per_minute=600))
+        assert scheduler._reserve("small", 0) == 0
@@ -0,0 +1,127 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dependency import DependencyGraph, DependencyInterface, DependencyType
+
+
+@pytest.fixture
+def interface():
+    interface = DependencyInterface("test")
+    # State writes and events go through the interface's resource manager facade
+    interface._resource_manager = MagicMock()
+    return interface
+
+
+class TestDependencyGraph:
+    """Tests for the incrementally maintained dependency DAG."""
+
+    def test_order_is_repaired_when_edges_contradict_it(self):
+        graph = DependencyGraph()
+        for node in ("app", "service", "db"):
+            graph.add_node(node)
+
+        graph.add_edge("app", "service")
+        graph.add_edge("service", "db")
+
+        assert graph.topological_order() == ["db", "service", "app"]
+        assert graph.get_stats()["reorders"] == 2
+        assert graph.get_layers() == [{"db"}, {"service"}, {"app"}]
+
+    def test_cycles_are_rejected_without_changing_the_graph(self):
+        graph = DependencyGraph()
+        graph.add_edge("a", "b")
+        graph.add_edge("b", "c")
+        order = graph.topological_order()
+
+        assert graph.would_create_cycle("c", "a")
+        assert not graph.would_create_cycle("a", "c")
+        with pytest.raises(ValueError):
+            graph.add_edge("c", "a")
+        with pytest.raises(ValueError):
+            graph.add_edge("a", "a")
+
+        assert graph.topological_order() == order
+        assert "a" not in graph.dependencies["c"]
+
+    def test_layers_update_only_downstream_of_a_change(self):
+        graph = DependencyGraph()
+        for i in range(5):
+            graph.add_edge(f"chain{i + 1}", f"chain{i}")
+        graph.add_edge("other", "base")
+        updates = graph.get_stats()["level_updates"]
+
+        graph.add_edge("chain0", "other")
+        assert graph.get_level("chain5") == 7
+        # chain0..chain5 moved down two layers; base and other did not change
+        assert graph.get_stats()["level_updates"] - updates == 6
+
+        graph.remove_edge("chain0", "other")
+        assert graph.get_level("chain5") == 5
+        assert graph.get_layers()[0] == {"chain0", "base"}
+
+    def test_layers_are_cached_between_changes(self):
+        graph = DependencyGraph()
+        graph.add_edge("b", "a")
+        layers = graph.get_layers()
+        rebuilds = graph.get_stats()["layer_rebuilds"]
+
+        assert graph.get_layers() == layers
+        graph.add_edge("b", "a")  # existing edge, nothing changes
+        graph.get_layers()
+        assert graph.get_stats()["layer_rebuilds"] == rebuilds
+
+        graph.add_edge("c", "b")
+        assert graph.get_layers() == [{"a"}, {"b"}, {"c"}]
+        assert graph.get_stats()["layer_rebuilds"] == rebuilds + 1
+
+    def test_unordered_edges_do_not_constrain_layers(self):
+        graph = DependencyGraph()
+        graph.add_edge("feature", "component")
+        graph.add_edge("component", "feature", allow_cycle=True)
+
+        assert graph.get_stats()["unordered_edges"] == 1
+        assert graph.get_layers() == [{"component"}, {"feature"}]
+        assert graph.would_create_cycle("feature", "component")
+
+
+class TestDependencyInterfaceGraph:
+    """Tests for DependencyInterface on top of the incremental graph."""
+
+    def test_development_order_puts_dependencies_first(self, interface):
+        interface.add_dependency("app", "service")
+        interface.add_dependency("service", "db")
+        interface.add_node("docs")
+
+        assert interface.get_development_order() == [{"db", "docs"}, {"service"}, {"app"}]
+        with pytest.raises(ValueError):
+            interface.add_dependency("db", "app")
+
+    def test_add_dependencies_writes_and_emits_once(self, interface):
+        added = interface.add_dependencies([
+            ("app", "service"),
+            ("service", "db"),
+            ("app", "cache", DependencyType.PRIMARY),
+        ])
+
+        assert added == 3
+        assert interface._resource_manager.set_state.call_count == 1
+        assert interface._resource_manager.emit_event.call_count == 1
+        key, payload = interface._resource_manager.set_state.call_args.args
+        assert key == "dependency:dependency:test:graph"
+        assert payload["types"]["app:cache"] == "PRIMARY"
+        event_type, data = interface._resource_manager.emit_event.call_args.args
+        assert event_type == "dependencies_added"
+        assert len(data["dependencies"]) == 3
+        assert interface.get_development_order() == [{"db", "cache"}, {"service"}, {"app"}]
+
+    def test_add_dependencies_is_atomic(self, interface):
+        interface.add_dependency("b", "a")
+
+        with pytest.raises(ValueError):
+            interface.add_dependencies([("c", "b"), ("new", "c"), ("a", "c")])
+
+        assert interface.get_dependencies("b") == ["a"]
+        assert "c" not in interface._dependency_graph
+        assert "new" not in interface._dependency_graph
+        assert interface.get_development_order() == [{"a"}, {"b"}]
@@ -0,0 +1,112 @@
+import os
+import sys
+import uuid
+
+import pytest
+
+from prompt_registry import PromptRegistry
+
+ERROR_ANALYSIS = "FFTT_system_prompts/validation/error_analysis_agent"
+
+
+def _write_module(path, version):
+    path.write_text(
+        f'prompt = "prompt v{version}"\n'
+        f'prompt_schema = {{"type": "object", "required": ["v{version}"]}}\n'
+    )
+    # Make the change visible to mtime checks and to the bytecode cache
+    stamp = os.path.getmtime(path) + version * 10
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def prompt_package(tmp_path):
+    package = f"prompts_{uuid.uuid4().hex[:8]}"
+    root = tmp_path / package
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    _write_module(root / "agent.py", 1)
+    yield package, root
+    for name in [name for name in sys.modules if name.startswith(package)]:
+        del sys.modules[name]
+
+
+class TestPromptRegistry:
+    """Tests for the process-wide prompt and schema registry."""
+
+    def test_indexes_prompt_root_once(self):
+        registry = PromptRegistry()
+        summary = registry.load_all()
+        assert summary["modules"] >= 20
+        assert summary["prompts"] > 0 and summary["schemas"] > 0
+        imports = registry.get_stats()["imports"]
+
+        from FFTT_system_prompts.validation import error_analysis_agent
+        for ref in (ERROR_ANALYSIS, ERROR_ANALYSIS + ".py", ERROR_ANALYSIS.replace("/", ".")):
+            assert registry.get_prompt(ref, "error_analysis_prompt") == error_analysis_agent.error_analysis_prompt
+
+        assert registry.get_stats()["imports"] == imports
+        assert registry.get_prompt(ERROR_ANALYSIS, "missing_prompt") is None
+        assert registry.get_prompt("FFTT_system_prompts/missing_module", "prompt") is None
+
+    def test_schema_json_and_validator_are_built_once(self, prompt_package):
+        package, root = prompt_package
+        registry = PromptRegistry(root)
+        registry.load_all()
+
+        schema_json = registry.get_schema_json(f"{package}/agent", "prompt_schema")
+        assert schema_json is registry.get_schema_json(f"{package}/agent", "prompt_schema")
+        assert schema_json is registry.schema_to_json(registry.get_schema(f"{package}/agent", "prompt_schema"))
+
+        # Schemas the registry did not serve are serialized on every call
+        other = {"type": "object"}
+        assert registry.schema_to_json(other) == '{"type": "object"}'
+        other["type"] = "array"
+        assert registry.schema_to_json(other) == '{"type": "array"}'
+
+        validator = registry.get_validator(f"{package}/agent", "prompt_schema")
+        assert validator is registry.get_validator(f"{package}/agent", "prompt_schema")
+        assert validator.is_valid({"v1": 1})
+        assert not validator.is_valid({})
+
+    def test_hot_reload_on_mtime_change(self, prompt_package):
+        package, root = prompt_package
+        registry = PromptRegistry(root, check_interval=0)
+        registry.load_all()
+        old_validator = registry.get_validator(f"{package}/agent", "prompt_schema")
+        assert registry.get_prompt(f"{package}/agent", "prompt") == "prompt v1"
+
+        _write_module(root / "agent.py", 2)
+
+        assert registry.get_prompt(f"{package}/agent", "prompt") == "prompt v2"
+        assert registry.get_stats()["reloads"] == 1
+        validator = registry.get_validator(f"{package}/agent", "prompt_schema")
+        assert validator is not old_validator
+        assert validator.is_valid({"v2": 1})
+
+    def test_reload_changed_keeps_last_good_version(self, prompt_package):
+        package, root = prompt_package
+        registry = PromptRegistry(root, check_interval=None)
+        registry.load_all()
+
+        path = root / "agent.py"
+        path.write_text("prompt = (\n")
+        stamp = os.path.getmtime(path) + 100
+        os.utime(path, (stamp, stamp))
+
+        assert registry.reload_changed() == []
+        assert registry.get_prompt(f"{package}/agent", "prompt") == "prompt v1"
+        assert registry.get_stats()["failures"] == 1
+
+    def test_files_outside_sys_path_load_by_location(self, tmp_path):
+        path = tmp_path / "standalone_agent.py"
+        _write_module(path, 1)
+        registry = PromptRegistry(check_interval=0)
+
+        assert registry.get_prompt(str(path), "prompt") == "prompt v1"
+        assert registry.get_prompt(str(path)[:-3], "prompt") == "prompt v1"
+        assert registry.get_validator(str(path), "prompt_schema").is_valid({"v1": 1})
+
+        _write_module(path, 2)
+        assert registry.get_prompt(str(path), "prompt") == "prompt v2"
+        assert registry.get_stats()["imports"] == 1
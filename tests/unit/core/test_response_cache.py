@@ -0,0 +1,126 @@
+import os
+
+import pytest
+import pytest_asyncio
+
+from api import AnthropicAPI, LLMCallScheduler
+from response_cache import CacheMode, LLMResponseCache, ReplayMissError
+from tests.doubles.fake_anthropic_client import FakeAnthropicClient
+
+PROMPT_INFO = ("FFTT_system_prompts/validation/error_analysis_agent", "error_analysis_prompt")
+SCHEMA = {"type": "object"}
+
+
+@pytest_asyncio.fixture
+async def scheduler():
+    scheduler = LLMCallScheduler()
+    yield scheduler
+    scheduler._executor.shutdown(wait=True)
+
+
+class TestLLMResponseCache:
+    """Tests for the content-addressed LLM response cache."""
+
+    def test_key_covers_request_parameters(self):
+        system = [{"type": "text", "text": "prompt"}]
+        key = LLMResponseCache.make_key("model", system, SCHEMA, "hello", 100)
+
+        assert key == LLMResponseCache.make_key("model", list(system), dict(SCHEMA), "hello", 100)
+        assert key != LLMResponseCache.make_key("other", system, SCHEMA, "hello", 100)
+        assert key != LLMResponseCache.make_key("model", system, SCHEMA, "hello", 200)
+        assert key != LLMResponseCache.make_key("model", system, {"type": "array"}, "hello", 100)
+        assert key != LLMResponseCache.make_key("model", [{"text": "other"}], SCHEMA, "hello", 100)
+
+    def test_lru_eviction_and_persistence(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, max_entries=2)
+        cache.put("a", "response a")
+        cache.put("b", "response b")
+        assert cache.get("a") == "response a"  # "b" is now least recently used
+        cache.put("c", "response c")
+
+        assert cache.get("b") is None
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert not (tmp_path / "b.json").exists()
+
+        reopened = LLMResponseCache(tmp_path, max_entries=2)
+        assert reopened.get("c") == "response c"
+        assert reopened.get_stats()["bytes"] == stats["bytes"]
+
+    def test_byte_cap(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, max_bytes=500)
+        for i in range(10):
+            cache.put(str(i), "x" * 100)
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 500
+        assert cache.get("9") is not None
+        assert cache.get("0") is None
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FFTT_LLM_CACHE_MODE", raising=False)
+        assert LLMResponseCache.from_env() is None
+
+        monkeypatch.setenv("FFTT_LLM_CACHE_MODE", "replay")
+        monkeypatch.setenv("FFTT_LLM_CACHE_DIR", str(tmp_path / "llm"))
+        cache = LLMResponseCache.from_env()
+        assert cache.mode == CacheMode.REPLAY
+        assert cache.cache_dir == tmp_path / "llm"
+
+    @pytest.mark.asyncio
+    async def test_api_serves_hits_without_calling_client(self, tmp_path, scheduler):
+        client = FakeAnthropicClient(latency=0.0)
+        api = AnthropicAPI(client=client, scheduler=scheduler, response_cache=LLMResponseCache(tmp_path))
+
+        first = await api.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100)
+        second = await api.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100)
+        await api.call("hello again", PROMPT_INFO, SCHEMA, max_tokens=100)
+
+        assert first == second
+        assert client.calls == 2
+        cache_stats = api.get_metrics()["response_cache"]
+        assert cache_stats["hits"] == 1
+        assert cache_stats["writes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay_offline(self, tmp_path, scheduler):
+        recorder = AnthropicAPI(
+            client=FakeAnthropicClient(latency=0.0, response_text='{"recorded": 1}'),
+            scheduler=scheduler,
+            response_cache=LLMResponseCache(tmp_path, mode="record"),
+        )
+        await recorder.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100)
+        await recorder.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100)
+        assert recorder.client.calls == 2  # record mode never serves hits
+
+        offline_client = FakeAnthropicClient(latency=0.0, response_text="network")
+        replay = AnthropicAPI(
+            client=offline_client,
+            scheduler=scheduler,
+            response_cache=LLMResponseCache(tmp_path, mode=CacheMode.REPLAY),
+        )
+        assert await replay.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100) == '{"recorded": 1}'
+        with pytest.raises(ReplayMissError):
+            await replay.call("unrecorded", PROMPT_INFO, SCHEMA, max_tokens=100)
+
+        assert offline_client.calls == 0
+        stats = replay.get_metrics()["response_cache"]
+        assert stats["replay_misses"] == 1
+        assert stats["writes"] == 0
+        assert len(os.listdir(tmp_path)) == 1
+
+    @pytest.mark.asyncio
+    async def test_deferred_responses_are_recorded_only_when_committed(self, tmp_path, scheduler):
+        client = FakeAnthropicClient(latency=0.0, response_text="not json")
+        api = AnthropicAPI(client=client, scheduler=scheduler, response_cache=LLMResponseCache(tmp_path))
+
+        rejected = await api.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100, record=False)
+        assert await api.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100, record=False) == rejected
+        assert client.calls == 2  # the unvalidated response was never replayed
+        assert os.listdir(tmp_path) == []
+
+        await api.record_response("hello", PROMPT_INFO, SCHEMA, '{"valid": true}', max_tokens=100)
+        assert await api.call("hello", PROMPT_INFO, SCHEMA, max_tokens=100) == '{"valid": true}'
+        assert client.calls == 2
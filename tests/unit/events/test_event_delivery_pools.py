@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from resources.events import EventQueue
+from resources.events.utils import ThreadPoolExecutorManager
+
+
+async def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+def _make_queue(**kwargs):
+    queue = EventQueue(max_size=200, **kwargs)
+    queue._throttling_enabled = False
+    return queue
+
+
+class TestExecutorManagerStats:
+    """Tests for queue-depth tracking in ThreadPoolExecutorManager."""
+
+    def test_submit_tracks_counts(self):
+        manager = ThreadPoolExecutorManager()
+        gate = threading.Event()
+
+        futures = [manager.submit("stats_pool", gate.wait, 5, max_workers=1) for _ in range(3)]
+        time.sleep(0.05)
+        stats = manager.get_executor_stats("stats_pool")["stats_pool"]
+        assert stats["max_workers"] == 1
+        assert stats["submitted"] == 3
+        assert stats["active"] == 1
+        assert stats["queued"] == 2
+
+        gate.set()
+        for f in futures:
+            f.result(timeout=5)
+        stats = manager.get_executor_stats("stats_pool")["stats_pool"]
+        assert stats["completed"] == 3
+        assert stats["pending"] == 0
+        manager.shutdown()
+
+    def test_unknown_executor_has_no_stats(self):
+        assert ThreadPoolExecutorManager().get_executor_stats("missing") == {}
+
+
+class TestSyncDeliveryPools:
+    """Tests for sync-callback delivery through named pools."""
+
+    def test_pool_resolution_by_prefix(self):
+        queue = _make_queue(sync_delivery_pools={"phase_two": 2, "phase_two_test": 1})
+        assert queue._sync_pool_for("phase_two_component_created") == ("event_delivery_phase_two", 2)
+        assert queue._sync_pool_for("phase_two_test_failed") == ("event_delivery_phase_two_test", 1)
+        assert queue._sync_pool_for("system_alert") == ("event_delivery", 4)
+
+    @pytest.mark.asyncio
+    async def test_sync_callback_runs_in_named_pool(self):
+        queue = _make_queue(sync_delivery_pools={"pooled_": 2})
+        queue._backpressure_manager.prioritized_events.add("pooled_event")
+        threads = []
+
+        def handler(event_type, data):
+            threads.append(threading.current_thread().name)
+
+        await queue.start()
+        try:
+            await queue.subscribe("pooled_event", handler)
+            await queue.emit("pooled_event", {"n": 1}, priority="high")
+            assert await _wait_until(lambda: threads)
+            assert threads[0].startswith("event_delivery_pooled")
+            assert queue.get_delivery_pool_stats()["event_delivery_pooled"]["completed"] >= 1
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_sync_batching_reduces_submissions(self):
+        queue = _make_queue(sync_batch_size=10, sync_delivery_pools={"batched_": 1})
+        queue._backpressure_manager.prioritized_events.add("batched_event")
+        received = []
+        release = threading.Event()
+
+        def handler(event_type, data):
+            release.wait(5)
+            received.append(data["n"])
+
+        await queue.start()
+        try:
+            await queue.subscribe("batched_event", handler)
+            for i in range(6):
+                await queue.emit("batched_event", {"n": i}, priority="high")
+            await asyncio.sleep(0.2)
+            release.set()
+
+            assert await _wait_until(lambda: len(received) == 6)
+            assert received == list(range(6))
+
+            pool_stats = queue.get_delivery_pool_stats()["event_delivery_batched"]
+            assert pool_stats["submitted"] < 6
+            mailbox_stats = queue.get_subscriber_stats("batched_event")["batched_event"][0]
+            assert mailbox_stats["batches"] >= 1
+            assert mailbox_stats["delivered"] == 6
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_batch_failures_retry_individually(self):
+        queue = _make_queue(sync_batch_size=10)
+        queue._retry_delay = 0.01
+        queue._backpressure_manager.prioritized_events.add("batched_event")
+        calls = []
+        release = threading.Event()
+
+        def handler(event_type, data):
+            release.wait(5)
+            calls.append(data["n"])
+            if data["n"] == 2 and calls.count(2) == 1:
+                raise RuntimeError("fail once")
+
+        await queue.start()
+        try:
+            await queue.subscribe("batched_event", handler)
+            for i in range(4):
+                await queue.emit("batched_event", {"n": i}, priority="high")
+            await asyncio.sleep(0.1)
+            release.set()
+
+            def all_delivered():
+                stats = queue.get_subscriber_stats("batched_event").get("batched_event")
+                return bool(stats) and stats[0]["delivered"] == 4
+
+            assert await _wait_until(all_delivered)
+            assert calls.count(2) == 2
+        finally:
+            await queue.stop()
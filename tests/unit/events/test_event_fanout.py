@@ -0,0 +1,222 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from resources.events import EventQueue, MailboxPolicy
+from resources.events.fanout import SubscriberMailbox
+
+
+def _make_queue(**kwargs):
+    queue = EventQueue(max_size=100, **kwargs)
+    queue._throttling_enabled = False
+    queue._backpressure_manager.prioritized_events.update({"fanout_event", "fanout_other"})
+    return queue
+
+
+@pytest_asyncio.fixture
+async def fanout_queue():
+    queue = _make_queue()
+    await queue.start()
+    yield queue
+    await queue.stop()
+
+
+async def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+class TestConcurrentFanOut:
+    """Tests for concurrent per-subscriber delivery."""
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_others(self, fanout_queue):
+        fast_received = []
+        slow_started = []
+
+        async def slow(event_type, data):
+            slow_started.append(data["n"])
+            await asyncio.sleep(2.0)
+
+        async def fast(event_type, data):
+            fast_received.append(data["n"])
+
+        await fanout_queue.subscribe("fanout_event", slow)
+        await fanout_queue.subscribe("fanout_event", fast)
+
+        start = time.monotonic()
+        await fanout_queue.emit("fanout_event", {"n": 1}, priority="high")
+        await fanout_queue.emit("fanout_event", {"n": 2}, priority="high")
+
+        assert await _wait_until(lambda: fast_received == [1, 2], timeout=1.5)
+        assert time.monotonic() - start < 1.5
+        assert slow_started == [1]
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_retries_in_own_mailbox(self, fanout_queue):
+        fanout_queue._retry_delay = 0.05
+        attempts = []
+        healthy = []
+
+        async def flaky(event_type, data):
+            attempts.append(data["n"])
+            if len(attempts) < 3:
+                raise RuntimeError("transient failure")
+
+        async def steady(event_type, data):
+            healthy.append(data["n"])
+
+        await fanout_queue.subscribe("fanout_event", flaky)
+        await fanout_queue.subscribe("fanout_event", steady)
+        await fanout_queue.emit("fanout_event", {"n": 1}, priority="high")
+
+        assert await _wait_until(lambda: healthy == [1])
+        assert await _wait_until(lambda: len(attempts) == 3)
+
+        stats = fanout_queue.get_subscriber_stats("fanout_event")["fanout_event"]
+        flaky_stats = next(s for s in stats if s["subscriber"].endswith("flaky"))
+        assert flaky_stats["retried"] == 2
+        assert await _wait_until(
+            lambda: next(s for s in fanout_queue.get_subscriber_stats()["fanout_event"]
+                         if s["subscriber"].endswith("flaky"))["delivered"] == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_counted_as_failed(self, fanout_queue):
+        fanout_queue._retry_delay = 0.01
+        fanout_queue._max_retries = 1
+
+        async def broken(event_type, data):
+            raise RuntimeError("always fails")
+
+        await fanout_queue.subscribe("fanout_event", broken)
+        await fanout_queue.emit("fanout_event", {"n": 1}, priority="high")
+
+        def failed():
+            stats = fanout_queue.get_subscriber_stats("fanout_event").get("fanout_event", [])
+            return bool(stats) and stats[0]["failed"] == 1
+
+        assert await _wait_until(failed)
+
+    @pytest.mark.asyncio
+    async def test_sync_subscriber_receives_events(self, fanout_queue):
+        received = []
+
+        def sync_handler(event_type, data):
+            received.append(data["n"])
+
+        await fanout_queue.subscribe("fanout_event", sync_handler)
+        await fanout_queue.emit("fanout_event", {"n": 7}, priority="high")
+        assert await _wait_until(lambda: received == [7])
+
+    @pytest.mark.asyncio
+    async def test_wait_for_processing_includes_mailboxes(self, fanout_queue):
+        done = []
+
+        async def slowish(event_type, data):
+            await asyncio.sleep(0.3)
+            done.append(data["n"])
+
+        await fanout_queue.subscribe("fanout_event", slowish)
+        await fanout_queue.emit("fanout_event", {"n": 1}, priority="high")
+        assert await fanout_queue.wait_for_processing(timeout=3.0)
+        assert done == [1]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_closes_mailbox(self, fanout_queue):
+        async def handler(event_type, data):
+            pass
+
+        await fanout_queue.subscribe("fanout_event", handler)
+        await fanout_queue.emit("fanout_event", {"n": 1}, priority="high")
+        assert await _wait_until(lambda: "fanout_event" in fanout_queue.get_subscriber_stats())
+
+        await fanout_queue.unsubscribe("fanout_event", handler)
+        assert await _wait_until(lambda: fanout_queue.get_subscriber_stats() == {})
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_still_supported(self):
+        queue = _make_queue(delivery_mode="sequential")
+        await queue.start()
+        try:
+            received = []
+
+            async def handler(event_type, data):
+                received.append(data["n"])
+
+            await queue.subscribe("fanout_event", handler)
+            await queue.emit("fanout_event", {"n": 1}, priority="high")
+            assert await _wait_until(lambda: received == [1])
+            assert queue.get_subscriber_stats() == {}
+        finally:
+            await queue.stop()
+
+
+class TestSubscriberMailbox:
+    """Tests for mailbox backpressure policies."""
+
+    @staticmethod
+    def _mailbox(policy, capacity=2):
+        gate = asyncio.Event()
+        delivered = []
+
+        async def deliver(event_type, payload, callback):
+            await gate.wait()
+            delivered.append(payload["n"])
+            return True
+
+        mailbox = SubscriberMailbox("evt", lambda *a: None, deliver,
+                                    retry_backoff=lambda attempt: None,
+                                    capacity=capacity, policy=policy)
+        return mailbox, gate, delivered
+
+    @pytest.mark.asyncio
+    async def test_drop_newest(self):
+        mailbox, gate, delivered = self._mailbox(MailboxPolicy.DROP_NEWEST)
+        results = [await mailbox.put({"n": i}) for i in range(4)]
+        await asyncio.sleep(0)  # worker takes the first item
+
+        assert results[:2] == [True, True]
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert mailbox.get_stats()["dropped"] >= 1
+        assert delivered[0] == 0
+        mailbox.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        mailbox, gate, delivered = self._mailbox(MailboxPolicy.DROP_OLDEST)
+        await mailbox.put({"n": 0})
+        await asyncio.sleep(0)  # worker holds item 0 in flight
+        for i in range(1, 5):
+            assert await mailbox.put({"n": i})
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert delivered == [0, 3, 4]
+        assert mailbox.get_stats()["dropped"] == 2
+        mailbox.close()
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_space(self):
+        mailbox, gate, delivered = self._mailbox(MailboxPolicy.BLOCK, capacity=1)
+        await mailbox.put({"n": 0})
+        await asyncio.sleep(0)
+        await mailbox.put({"n": 1})
+
+        blocked = asyncio.ensure_future(mailbox.put({"n": 2}))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        gate.set()
+        assert await asyncio.wait_for(blocked, timeout=1.0)
+        await asyncio.sleep(0.05)
+        assert delivered == [0, 1, 2]
+        assert mailbox.get_stats()["dropped"] == 0
+        mailbox.close()
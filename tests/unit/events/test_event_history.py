@@ -0,0 +1,108 @@
+import pytest
+
+from resources.events import Event, EventHistory, EventQueue
+
+
+def _event(event_type="test_event", correlation_id=None, n=0):
+    return Event(event_type=event_type, data={"n": n}, correlation_id=correlation_id)
+
+
+class TestEventHistory:
+    """Tests for the ring-buffer event history."""
+
+    def test_append_and_snapshot_order(self):
+        history = EventHistory(capacity=5)
+        events = [_event(n=i) for i in range(3)]
+        for e in events:
+            history.append(e)
+
+        assert len(history) == 3
+        assert history == events
+        assert list(history) == events
+
+    def test_eviction_keeps_newest(self):
+        history = EventHistory(capacity=3)
+        for i in range(10):
+            history.append(_event(n=i))
+
+        assert len(history) == 3
+        assert [e.data["n"] for e in history] == [7, 8, 9]
+        assert history.get_stats()["total_recorded"] == 10
+
+    def test_get_recent_by_type_uses_index(self):
+        history = EventHistory(capacity=100)
+        for i in range(20):
+            history.append(_event("even" if i % 2 == 0 else "odd", n=i))
+
+        recent = history.get_recent("odd", limit=3)
+        assert [e.data["n"] for e in recent] == [15, 17, 19]
+        assert history.get_recent("missing") == []
+        assert [e.data["n"] for e in history.get_recent(limit=2)] == [18, 19]
+
+    def test_index_entries_evicted_with_events(self):
+        history = EventHistory(capacity=4)
+        history.append(_event("rare", correlation_id="c1"))
+        for i in range(4):
+            history.append(_event("common", n=i))
+
+        assert history.get_recent("rare") == []
+        assert history.get_by_correlation("c1") == []
+        assert history.get_event_types() == {"common": 4}
+
+    def test_get_by_correlation(self):
+        history = EventHistory(capacity=10)
+        history.append(_event(correlation_id="a", n=1))
+        history.append(_event(correlation_id="b", n=2))
+        history.append(_event(correlation_id="a", n=3))
+
+        assert [e.data["n"] for e in history.get_by_correlation("a")] == [1, 3]
+        assert [e.data["n"] for e in history.get_by_correlation("a", limit=1)] == [3]
+
+    def test_clear(self):
+        history = EventHistory(capacity=3)
+        history.append(_event())
+        history.clear()
+        assert history == []
+        assert history.count("test_event") == 0
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            EventHistory(capacity=0)
+
+    def test_spill_and_replay(self, tmp_path):
+        spill_file = tmp_path / "history" / "events.jsonl"
+        history = EventHistory(capacity=3, spill_path=str(spill_file), spill_flush_size=2)
+        for i in range(7):
+            history.append(_event(n=i))
+
+        history.flush()
+        assert history.get_stats()["spilled"] == 4
+        replayed = list(history.replay())
+        assert [e.data["n"] for e in replayed] == list(range(7))
+
+    def test_spill_handles_unserializable_payload(self, tmp_path):
+        spill_file = tmp_path / "events.jsonl"
+        history = EventHistory(capacity=1, spill_path=str(spill_file), spill_flush_size=1)
+        history.append(Event(event_type="odd", data={"obj": object()}))
+        history.append(_event())
+
+        replayed = list(history.replay())
+        assert replayed[0].event_type == "odd"
+        assert len(replayed) == 2
+
+
+class TestEventQueueHistory:
+    """Tests for EventQueue's use of the history."""
+
+    @pytest.mark.asyncio
+    async def test_queue_history_is_bounded(self):
+        queue = EventQueue(max_size=100, history_size=5)
+        queue._throttling_enabled = False
+        queue._backpressure_manager.prioritized_events.add("history_event")
+        for i in range(12):
+            await queue.emit("history_event", {"n": i}, correlation_id="corr")
+
+        recent = await queue.get_recent_events("history_event", limit=3)
+        assert [e.data["n"] for e in recent] == [9, 10, 11]
+        assert len(await queue.get_correlated_events("corr")) == 5
+        assert queue.get_history_stats()["size"] == 5
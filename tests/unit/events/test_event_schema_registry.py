@@ -0,0 +1,131 @@
+import pytest
+import pytest_asyncio
+from dataclasses import dataclass, field
+from typing import List
+
+from resources.events import EventQueue, ResourceEventTypes, SchemaValidationMode
+from resources.events.schema_registry import CompiledEventSchema, EventSchemaRegistry
+from resources.schemas import ValidationEventPayload, ComponentEventPayload
+
+
+@dataclass
+class _SamplePayload:
+    name: str
+    tags: List[str] = field(default_factory=list)
+    retries: int = 3
+
+
+class TestCompiledEventSchema:
+    """Tests for compiled payload schemas."""
+
+    def test_fill_defaults_uses_fresh_factory_values(self):
+        compiled = CompiledEventSchema.compile(_SamplePayload)
+        first, second = {"name": "a"}, {"name": "b"}
+        compiled.fill_defaults(first)
+        compiled.fill_defaults(second)
+
+        assert first == {"name": "a", "tags": [], "retries": 3}
+        assert first["tags"] is not second["tags"]
+
+    def test_fill_defaults_keeps_existing_values(self):
+        compiled = CompiledEventSchema.compile(_SamplePayload)
+        data = {"name": "a", "retries": 7}
+        compiled.fill_defaults(data)
+        assert data["retries"] == 7
+
+    def test_validate_reports_unexpected_and_missing_fields(self):
+        compiled = CompiledEventSchema.compile(_SamplePayload)
+        assert compiled.validate({"name": "a"}) is None
+        assert "unexpected" in compiled.validate({"name": "a", "bogus": 1})
+        assert "missing" in compiled.validate({"tags": []})
+
+    def test_timestamp_and_event_id_are_generated(self):
+        compiled = CompiledEventSchema.compile(ValidationEventPayload)
+        data = {}
+        compiled.fill_defaults(data)
+        assert isinstance(data["timestamp"], str)
+        assert isinstance(data["event_id"], str)
+        assert data["detected_issues"] == []
+
+
+class TestEventSchemaRegistry:
+    """Tests for the shared schema registry."""
+
+    def test_registry_maps_known_event_types(self):
+        registry = EventSchemaRegistry()
+        compiled = registry.get(ResourceEventTypes.PHASE_TWO_COMPONENT_CREATED.value)
+        assert compiled is not None
+        assert compiled.schema_class is ComponentEventPayload
+        assert registry.get("unmapped_event") is None
+
+    def test_compile_is_cached_per_class(self):
+        registry = EventSchemaRegistry()
+        assert registry.compile(_SamplePayload) is registry.compile(_SamplePayload)
+
+    def test_register_overrides_mapping(self):
+        registry = EventSchemaRegistry()
+        registry.register("custom_event", _SamplePayload)
+        assert registry.get("custom_event").schema_class is _SamplePayload
+
+
+@pytest_asyncio.fixture
+async def make_queue():
+    queues = []
+
+    async def _make(**kwargs):
+        q = EventQueue(max_size=100, **kwargs)
+        q._throttling_enabled = False
+        queues.append(q)
+        return q
+
+    yield _make
+    for q in queues:
+        await q.stop()
+
+
+class TestEmitSchemaHandling:
+    """Tests for schema handling on the emit path."""
+
+    @pytest.mark.asyncio
+    async def test_emit_fills_schema_defaults(self, make_queue):
+        queue = await make_queue()
+        data = {"component_id": "c1"}
+        assert await queue.emit(ResourceEventTypes.PHASE_TWO_COMPONENT_CREATED.value, data)
+        assert data["dependency_ids"] == []
+        assert "timestamp" in data
+
+    @pytest.mark.asyncio
+    async def test_strict_mode_validates_every_emit(self, make_queue):
+        queue = await make_queue(schema_validation="strict")
+        for _ in range(5):
+            await queue.emit(ResourceEventTypes.PHASE_TWO_COMPONENT_CREATED.value, {"bogus": 1})
+
+        stats = queue.get_emit_stats()
+        assert stats["emit_count"] == 5
+        assert stats["validations"] == 5
+        assert stats["validation_failures"] == 5
+
+    @pytest.mark.asyncio
+    async def test_sampled_mode_validates_subset(self, make_queue):
+        queue = await make_queue(schema_validation=SchemaValidationMode.SAMPLED, schema_sample_rate=4)
+        for _ in range(8):
+            await queue.emit(ResourceEventTypes.PHASE_TWO_COMPONENT_CREATED.value, {"component_id": "c"})
+        assert queue.get_emit_stats()["validations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_off_mode_skips_validation(self, make_queue):
+        queue = await make_queue(schema_validation="off")
+        data = {"bogus": 1}
+        await queue.emit(ResourceEventTypes.PHASE_TWO_COMPONENT_CREATED.value, data)
+
+        stats = queue.get_emit_stats()
+        assert stats["validations"] == 0
+        assert stats["mean_emit_time_us"] > 0
+        assert "component_id" in data
+
+    @pytest.mark.asyncio
+    async def test_reset_emit_stats(self, make_queue):
+        queue = await make_queue()
+        await queue.emit("plain_event", {"x": 1})
+        queue.reset_emit_stats()
+        assert queue.get_emit_stats()["emit_count"] == 0
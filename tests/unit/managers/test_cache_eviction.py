@@ -0,0 +1,191 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+
+from resources.base import CleanupConfig, CleanupPolicy
+from resources.events import EventQueue, ResourceEventTypes
+from resources.managers.cache import (
+    CacheManager,
+    EvictionPolicy,
+    FrequencySketch,
+    LRUEviction,
+    TimerWheel,
+    TinyLFUEviction,
+    estimate_size
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def cache_events(event_queue):
+    return [
+        call.args[1] for call in event_queue.emit.await_args_list
+        if call.args[0] == ResourceEventTypes.CACHE_UPDATED.value
+    ]
+
+def fill_and_scan(policy, capacity=10):
+    """Access five hot keys repeatedly, then scan 50 one-off keys; return surviving hot keys."""
+    cached = set()
+
+    def put(key):
+        cached.add(key)
+        policy.insert(key)
+        while len(cached) > capacity:
+            victim = policy.victim()
+            cached.discard(victim)
+            policy.remove(victim)
+
+    for i in range(5):
+        put(f"hot_{i}")
+    for _ in range(5):
+        for i in range(5):
+            policy.access(f"hot_{i}")
+    for i in range(50):
+        put(f"scan_{i}")
+    return {key for key in cached if key.startswith("hot_")}
+
+# Tests for cache sizing, eviction policies, TTL expiry and event coalescing
+class TestCacheEngine:
+
+    def test_estimate_size_is_deep(self):
+        """Test that nested contents are counted, unlike sys.getsizeof."""
+        value = {f"key_{i}": [f"{i}-{j}" for j in range(100)] for i in range(200)}
+        estimate = estimate_size(value)
+
+        exact = sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+        assert estimate > exact * 0.8
+        assert estimate_size([value, value]) < 2 * estimate
+
+    def test_lru_order(self):
+        """Test that access moves a key to the back of the eviction order."""
+        policy = LRUEviction()
+        for key in ("a", "b", "c"):
+            policy.insert(key)
+        policy.access("a")
+
+        assert policy.victim() == "b"
+        policy.remove("b")
+        assert policy.victim() == "c"
+
+    def test_sketch_is_stable_across_processes(self):
+        """Test that sketch indexes do not depend on the process hash seed."""
+        script = "from resources.managers.cache import FrequencySketch; print(FrequencySketch(10)._indexes('hot_0'))"
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                cwd=REPO_ROOT, env={**os.environ, "PYTHONHASHSEED": str(seed)}
+            ).stdout
+            for seed in range(3)
+        }
+        assert outputs == {f"{FrequencySketch(10)._indexes('hot_0')}\n"}
+
+    def test_sketch_counts_small_cache(self):
+        """Test that a small cache still gets enough counters to tell hot keys from a scan."""
+        sketch = FrequencySketch(capacity=10)
+        for _ in range(6):
+            for i in range(5):
+                sketch.increment(f"hot_{i}")
+        for i in range(50):
+            sketch.increment(f"scan_{i}")
+
+        assert min(sketch.frequency(f"hot_{i}") for i in range(5)) == 6
+        assert max(sketch.frequency(f"scan_{i}") for i in range(50)) < 6
+
+    def test_tinylfu_resists_scans(self):
+        """Test that frequently used keys survive a scan that flushes an LRU cache."""
+        assert fill_and_scan(LRUEviction()) == set()
+        assert len(fill_and_scan(TinyLFUEviction(capacity=10))) == 5
+
+    def test_timer_wheel(self):
+        """Test that advancing only returns keys whose expiry has passed."""
+        wheel = TimerWheel(resolution=1.0, slots=8)
+        now = time.time()
+        wheel.schedule("soon", now + 0.5)
+        wheel.schedule("later", now + 20)  # More than one rotation ahead
+        wheel.schedule("overdue", now - 5)
+        wheel.schedule("cancelled", now + 1)
+        wheel.cancel("cancelled")
+
+        assert wheel.advance(now) == ["overdue"]
+        assert wheel.advance(now + 2) == ["soon"]
+        assert wheel.advance(now + 10) == []
+        assert wheel.advance(now + 21) == ["later"]
+        assert len(wheel) == 0
+
+
+class TestCacheManagerBudget:
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_evicts_lru(self, event_queue):
+        """Test that entries are evicted least recently used first once over the byte budget."""
+        value = list(range(1000))
+        entry_bytes = estimate_size(value)
+        manager = CacheManager(event_queue=event_queue, max_bytes=int(entry_bytes * 3.5))
+        for key in ("a", "b", "c"):
+            await manager.set_cache(key, list(value))
+        await manager.get_cache("a")
+
+        await manager.set_cache("d", list(value))
+
+        assert set(manager._cache) == {"a", "c", "d"}
+        assert manager._total_bytes <= manager._max_bytes
+        health = await manager.get_health_status()
+        assert health.metadata["total_memory_mb"] == pytest.approx(manager._total_bytes / (1024 * 1024))
+
+    @pytest.mark.asyncio
+    async def test_tinylfu_manager(self, event_queue):
+        """Test that a W-TinyLFU cache keeps hot keys through a scan."""
+        manager = CacheManager(
+            event_queue=event_queue,
+            cleanup_config=CleanupConfig(policy=CleanupPolicy.MAX_SIZE, max_size=10),
+            eviction_policy=EvictionPolicy.TINY_LFU
+        )
+        for i in range(5):
+            await manager.set_cache(f"hot_{i}", i)
+        for _ in range(5):
+            for i in range(5):
+                await manager.get_cache(f"hot_{i}")
+        for i in range(50):
+            await manager.set_cache(f"scan_{i}", i)
+
+        assert len(manager._cache) == 10
+        assert all(f"hot_{i}" in manager._cache for i in range(5))
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_without_scan(self, event_queue):
+        """Test that per-entry TTLs expire through the timer wheel on regular cleanup."""
+        manager = CacheManager(
+            event_queue=event_queue,
+            cleanup_config=CleanupConfig(policy=CleanupPolicy.TTL, ttl_seconds=3600, check_interval=0)
+        )
+        await manager.set_cache("short", 1, ttl=0.01)
+        await manager.set_cache("long", 2)
+        time.sleep(0.02)
+
+        await manager.cleanup()
+
+        assert "short" not in manager._cache
+        assert "long" in manager._cache
+
+    @pytest.mark.asyncio
+    async def test_coalesced_events(self):
+        """Test that coalescing emits one event with the last change per key."""
+        event_queue = AsyncMock(spec=EventQueue)
+        manager = CacheManager(event_queue=event_queue, event_coalesce_interval=60)
+        manager.event_bus = event_queue
+        for i in range(5):
+            await manager.set_cache(f"key_{i}", i)
+        await manager.invalidate("key_0")
+
+        assert cache_events(event_queue) == []
+        assert await manager.flush_cache_events() == 5
+
+        events = cache_events(event_queue)
+        assert len(events) == 1
+        assert events[0]["changes"]["key_0"] == "invalidated"
+        assert events[0]["changes"]["key_4"] == "set"
+        await manager.terminate()
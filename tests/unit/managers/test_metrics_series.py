@@ -0,0 +1,172 @@
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from resources.common import MemoryThresholds
+from resources.events import EventQueue, ResourceEventTypes
+from resources.managers import MetricsManager
+from resources.managers.metrics import MetricSeries, MetricRollup
+
+
+def metric_events(event_queue):
+    return [
+        call.args[1] for call in event_queue.emit.await_args_list
+        if call.args[0] == ResourceEventTypes.METRIC_RECORDED.value
+    ]
+
+# Tests for the columnar metric series, percentiles, rollups and event coalescing
+class TestMetricSeries:
+
+    def test_ring_buffer_wraps(self):
+        """Test that the oldest points are overwritten in order."""
+        series = MetricSeries(capacity=4)
+        for i in range(6):
+            series.append(float(i), metadata={"i": i})
+
+        assert len(series) == 4
+        assert [point["value"] for point in series] == [2.0, 3.0, 4.0, 5.0]
+        assert series[0]["metadata"] == {"i": 2}
+        assert series[-1]["value"] == 5.0
+        with pytest.raises(IndexError):
+            series[4]
+
+    def test_window_and_limit(self):
+        """Test window filtering on points built from dicts."""
+        now = datetime.now()
+        series = MetricSeries.from_points(
+            [{"value": float(i), "timestamp": (now - timedelta(minutes=40 - 10 * i)).isoformat()} for i in range(5)]
+        )
+
+        assert [p["value"] for p in series.points(window=timedelta(minutes=25))] == [2.0, 3.0, 4.0]
+        assert [p["value"] for p in series.points(window=timedelta(minutes=25), limit=1)] == [4.0]
+        assert series[-1]["timestamp"] == now.isoformat()
+
+    def test_non_numeric_values_are_kept(self):
+        """Test that non-numeric values round-trip but are excluded from statistics."""
+        series = MetricSeries()
+        series.append(None)
+        series.append(3)
+
+        assert series[0]["value"] is None
+        assert series[1]["value"] == 3.0
+        assert list(series.values()) == [3.0]
+
+    def test_rollup_buckets(self):
+        """Test 1s/1m/1h aggregation of points."""
+        series = MetricSeries(capacity=10)
+        base = 1_700_000_000.0  # aligned to the hour
+        for offset, value in [(0.1, 1.0), (0.7, 3.0), (1.2, 5.0), (61.0, 7.0)]:
+            series.append(value, timestamp=base + offset)
+
+        assert [b[1:] for b in series.rollups["1s"].buckets] == [[2, 4.0, 1.0, 3.0], [1, 5.0, 5.0, 5.0], [1, 7.0, 7.0, 7.0]]
+        assert [b[1:] for b in series.rollups["1m"].buckets] == [[3, 9.0, 1.0, 5.0], [1, 7.0, 7.0, 7.0]]
+        assert [b[1] for b in series.rollups["1h"].buckets] == [4]
+
+    def test_late_point_joins_its_bucket(self):
+        """Test that a point older than the newest bucket updates its own bucket."""
+        rollup = MetricRollup(resolution=60, retention=10)
+        rollup.add(0.0, 1.0)
+        rollup.add(120.0, 2.0)
+        rollup.add(30.0, 4.0)
+
+        assert [b[:2] for b in rollup.buckets] == [[0.0, 2], [120.0, 1]]
+
+    def test_nbytes_includes_rollups(self):
+        """Test that the memory estimate grows with rollup buckets, not just raw points."""
+        series = MetricSeries(capacity=10)
+        for i in range(100):
+            series.append(float(i), timestamp=1_700_000_000.0 + i)
+
+        point_bytes = len(series) * 24
+        assert len(series.rollups["1s"].buckets) == 100
+        assert series.nbytes == point_bytes + (100 + 2 + 1) * MetricRollup.BUCKET_BYTES
+
+
+class TestMetricsManagerAggregation:
+
+    @pytest.mark.asyncio
+    async def test_percentiles(self, metrics_manager):
+        """Test that stats include percentiles matching NumPy."""
+        values = [float(v) for v in range(1, 101)]
+        for value in values:
+            await metrics_manager.record_metric("latency", value)
+
+        stats = await metrics_manager.get_metric_stats("latency")
+
+        assert stats["count"] == 100
+        assert stats["p50"] == pytest.approx(np.percentile(values, 50))
+        assert stats["p95"] == pytest.approx(np.percentile(values, 95))
+        assert stats["p99"] == pytest.approx(np.percentile(values, 99))
+        custom = await metrics_manager.get_metric_stats("latency", percentiles=(90,))
+        assert "p90" in custom and "p50" not in custom
+
+    @pytest.mark.asyncio
+    async def test_rollups_outlive_raw_points(self, event_queue):
+        """Test that rollups still cover points dropped from the ring buffer."""
+        manager = MetricsManager(event_queue=event_queue, max_points_per_metric=10)
+        for i in range(50):
+            await manager.record_metric("phase_tokens", float(i))
+
+        assert len(await manager.get_metrics("phase_tokens")) == 10
+        buckets = await manager.get_metric_rollup("phase_tokens", "1h")
+        assert sum(bucket["count"] for bucket in buckets) == 50
+        assert max(bucket["max"] for bucket in buckets) == 49.0
+        assert await manager.get_metric_rollup("missing", "1s") == []
+        with pytest.raises(ValueError):
+            await manager.get_metric_rollup("phase_tokens", "5m")
+
+    @pytest.mark.asyncio
+    async def test_memory_threshold_trims_rollups(self, event_queue):
+        """Test that exceeding the per-metric threshold also drops old rollup buckets."""
+        manager = MetricsManager(
+            event_queue=event_queue,
+            memory_thresholds=MemoryThresholds(per_resource_max_mb=0.2, total_memory_mb=1024),
+            max_points_per_metric=10
+        )
+        series = manager._metrics["phase_tokens"]
+        for i in range(1000):
+            series.append(float(i), timestamp=1_700_000_000.0 + i)
+        assert series.nbytes / (1024 * 1024) > 0.2
+
+        await manager.record_metric("phase_tokens", 1.0)
+
+        assert series.nbytes / (1024 * 1024) <= 0.2
+        assert len(series.rollups["1s"].buckets) < 1000
+        assert series.rollups["1h"].buckets
+
+    @pytest.mark.asyncio
+    async def test_coalesced_events(self):
+        """Test that coalescing emits one summary event per metric and interval."""
+        event_queue = AsyncMock(spec=EventQueue)
+        manager = MetricsManager(event_queue=event_queue, event_coalesce_interval=60)
+        manager.event_bus = event_queue
+        for i in range(5):
+            await manager.record_metric("requests", float(i), metadata={"i": i})
+        await manager.record_metric("errors", 1.0)
+
+        assert metric_events(event_queue) == []
+        assert await manager.flush_metric_events() == 2
+
+        events = {event["metric"]: event for event in metric_events(event_queue)}
+        assert events["requests"]["count"] == 5
+        assert events["requests"]["value"] == 4.0
+        assert events["requests"]["metadata"] == {"i": 4}
+        assert events["requests"]["avg"] == 2.0
+        assert await manager.flush_metric_events() == 0
+        await manager.terminate()
+
+    @pytest.mark.asyncio
+    async def test_coalesced_events_flush_after_interval(self):
+        """Test that pending points are reported once the interval passes without new points."""
+        event_queue = AsyncMock(spec=EventQueue)
+        manager = MetricsManager(event_queue=event_queue, event_coalesce_interval=0.05)
+        manager.event_bus = event_queue
+        await manager.record_metric("requests", 1.0)
+
+        await manager._flush_task
+
+        events = metric_events(event_queue)
+        assert len(events) == 1
+        assert events[0]["count"] == 1
+        await manager.terminate()
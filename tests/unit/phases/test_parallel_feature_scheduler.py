@@ -0,0 +1,186 @@
+"""
+Unit tests for ParallelFeatureCoordinator scheduling.
+
+Covers the dependency-driven ready-queue scheduler, critical path priority,
+cancellation of dependents on failure, operation cancellation, and the
+schedule trace, along with the layered mode it replaces as the default.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from phase_two.coordination.parallel import ParallelFeatureCoordinator
+from resources import EventQueue, MetricsManager, StateManager
+from tests.doubles.fake_phase_coordination import FakePhaseCoordination
+
+
+def make_coordinator(phase_coordination, **kwargs):
+    return ParallelFeatureCoordinator(
+        AsyncMock(spec=EventQueue),
+        AsyncMock(spec=StateManager),
+        AsyncMock(spec=MetricsManager),
+        phase_coordination,
+        **kwargs
+    )
+
+
+async def run_operation(coordinator, features, timeout=5.0):
+    started = await coordinator.start_parallel_feature_development("phase_two", "component", features, {})
+    operation_id = started["operation_id"]
+    operation = coordinator._active_operations[operation_id]
+    deadline = asyncio.get_running_loop().time() + timeout
+    while "end_time" not in operation:
+        assert asyncio.get_running_loop().time() < deadline, "operation did not finish"
+        await asyncio.sleep(0.005)
+    return operation_id, operation
+
+
+def start_offsets(coordinator, operation_id):
+    trace = coordinator.get_schedule_trace(operation_id)
+    return {event["feature_id"]: event["offset"] for event in trace["events"] if event["event"] == "start"}
+
+
+class TestFeatureDependencyAnalysis:
+    """Tests for execution order and dependency layers."""
+
+    def test_execution_order_puts_dependencies_first(self):
+        coordinator = make_coordinator(FakePhaseCoordination())
+        features = [
+            {"id": "c", "dependencies": ["b"]},
+            {"id": "b", "dependencies": ["a"]},
+            {"id": "a"},
+        ]
+        graph, order = coordinator._analyze_dependencies(features)
+
+        assert order == ["a", "b", "c"]
+        assert coordinator._get_dependency_layers(order, graph) == [["a"], ["b"], ["c"]]
+
+    def test_critical_path_lengths(self):
+        coordinator = make_coordinator(FakePhaseCoordination())
+        features = [
+            {"id": "a"},
+            {"id": "b", "dependencies": ["a"], "estimated_duration": 3},
+            {"id": "c", "dependencies": ["a"]},
+            {"id": "d"},
+        ]
+        graph, _ = coordinator._analyze_dependencies(features)
+        lengths = coordinator._critical_path_lengths({f["id"]: f for f in features}, graph)
+
+        assert lengths == {"a": 4.0, "b": 3.0, "c": 1.0, "d": 1.0}
+
+
+class TestDagScheduling:
+    """Tests for the ready-queue scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_feature_starts_when_its_own_dependencies_finish(self):
+        coordinator = make_coordinator(FakePhaseCoordination())
+        features = [
+            {"id": "slow", "duration": 0.3},
+            {"id": "fast", "duration": 0.02},
+            {"id": "after_fast", "dependencies": ["fast"], "duration": 0.02},
+        ]
+        operation_id, operation = await run_operation(coordinator, features)
+
+        assert operation["status"] == "completed"
+        offsets = start_offsets(coordinator, operation_id)
+        # Not held back behind "slow", as it would be in layered mode
+        assert offsets["after_fast"] < 0.2
+
+    @pytest.mark.asyncio
+    async def test_longest_critical_path_starts_first(self):
+        phase_coordination = FakePhaseCoordination()
+        coordinator = make_coordinator(phase_coordination, max_concurrent_features=1)
+        features = [
+            {"id": "leaf"},
+            {"id": "root"},
+            {"id": "mid", "dependencies": ["root"]},
+            {"id": "tail", "dependencies": ["mid"]},
+        ]
+        await run_operation(coordinator, features)
+
+        # "leaf" ties with "tail" once "mid" is done, but neither goes ahead of the chain
+        assert phase_coordination.started[:2] == ["root", "mid"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        phase_coordination = FakePhaseCoordination(default_duration=0.03)
+        coordinator = make_coordinator(phase_coordination, max_concurrent_features=2)
+        await run_operation(coordinator, [{"id": f"f{i}"} for i in range(6)])
+
+        assert phase_coordination.peak_running == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_dependents(self):
+        phase_coordination = FakePhaseCoordination(fail_features=["base"])
+        coordinator = make_coordinator(phase_coordination)
+        features = [
+            {"id": "base"},
+            {"id": "child", "dependencies": ["base"]},
+            {"id": "grandchild", "dependencies": ["child"]},
+            {"id": "independent"},
+        ]
+        operation_id, operation = await run_operation(coordinator, features)
+
+        assert operation["status"] == "partial_failure"
+        assert operation["failed_features"] == ["base"]
+        assert sorted(operation["cancelled_features"]) == ["child", "grandchild"]
+        assert "child" not in phase_coordination.started
+        status = await coordinator.get_operation_status(operation_id)
+        assert status["cancelled_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_without_cancellation_runs_dependents(self):
+        phase_coordination = FakePhaseCoordination(fail_features=["base"])
+        coordinator = make_coordinator(phase_coordination, cancel_dependents_on_failure=False)
+        features = [{"id": "base"}, {"id": "child", "dependencies": ["base"]}]
+        _, operation = await run_operation(coordinator, features)
+
+        assert operation["completed_features"] == ["child"]
+        assert operation["cancelled_features"] == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_operation_stops_running_features(self):
+        phase_coordination = FakePhaseCoordination()
+        coordinator = make_coordinator(phase_coordination)
+        features = [{"id": "long", "duration": 10}, {"id": "next", "dependencies": ["long"]}]
+        started = await coordinator.start_parallel_feature_development("phase_two", "component", features, {})
+        operation_id = started["operation_id"]
+        await asyncio.sleep(0.05)
+
+        result = await coordinator.cancel_operation(operation_id, "user request")
+        await asyncio.sleep(0.05)
+
+        assert sorted(result["cancelled_features"]) == ["long", "next"]
+        assert phase_coordination.running == 0
+        assert phase_coordination.started == ["long"]
+        assert coordinator._active_operations[operation_id]["status"] == "cancelled"
+
+
+class TestLayeredScheduling:
+    """Tests for the layered scheduling mode."""
+
+    @pytest.mark.asyncio
+    async def test_layer_waits_for_previous_layer(self):
+        coordinator = make_coordinator(FakePhaseCoordination(), scheduling_mode="layered")
+        features = [
+            {"id": "slow", "duration": 0.2},
+            {"id": "fast", "duration": 0.02},
+            {"id": "after_fast", "dependencies": ["fast"], "duration": 0.02},
+        ]
+        operation_id, operation = await run_operation(coordinator, features)
+
+        assert operation["status"] == "completed"
+        trace = coordinator.get_schedule_trace(operation_id)
+        assert trace["scheduling_mode"] == "layered"
+        assert start_offsets(coordinator, operation_id)["after_fast"] >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_later_layers(self):
+        coordinator = make_coordinator(FakePhaseCoordination(fail_features=["base"]), scheduling_mode="layered")
+        features = [{"id": "base"}, {"id": "child", "dependencies": ["base"]}]
+        _, operation = await run_operation(coordinator, features)
+
+        assert operation["status"] == "failed"
+        assert operation["cancelled_features"] == ["child"]
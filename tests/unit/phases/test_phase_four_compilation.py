@@ -0,0 +1,97 @@
+import asyncio
+import sys
+
+import pytest
+
+from phase_four.compilation import CompilationEngine
+from phase_four.models import CompilerType, CompilationState
+
+# Fake checker: reports a style issue for every line containing "BAD" and logs each invocation
+FAKE_TOOL = """
+import sys
+with open(sys.argv[1], "a") as log:
+    log.write(" ".join(sys.argv[2:]) + "\\n")
+failed = False
+for path in sys.argv[2:]:
+    with open(path) as source:
+        for number, line in enumerate(source, 1):
+            if "BAD" in line:
+                print(f"{path}:{number}:1: E999 bad line")
+                failed = True
+print("checked", len(sys.argv) - 2, "files")
+sys.exit(1 if failed else 0)
+"""
+
+
+@pytest.fixture
+def fake_tool(tmp_path):
+    script = tmp_path / "fake_tool.py"
+    script.write_text(FAKE_TOOL)
+    log = tmp_path / "invocations.log"
+    log.write_text("")
+    return [sys.executable, str(script), str(log)], log
+
+def invocations(log):
+    return log.read_text().splitlines()
+
+@pytest.fixture
+def engine(fake_tool):
+    command, _ = fake_tool
+    return CompilationEngine(commands={CompilerType.STYLE: command, CompilerType.LINT: command})
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_each_tool_once(engine, fake_tool):
+    """Test that a batch invokes each tool once and attributes issues to the right feature."""
+    _, log = fake_tool
+    results = await engine.compile_batch(
+        {"good": "x = 1\n", "bad": "x = 1\ny = 'BAD'\n", "copy": "x = 1\n"},
+        [CompilerType.STYLE, CompilerType.LINT]
+    )
+
+    assert len(invocations(log)) == 2
+    # Identical code is only written and checked once
+    assert all(len(line.split()) == 2 for line in invocations(log))
+    assert results["good"][CompilerType.STYLE].state == CompilationState.SUCCEEDED
+    assert results["copy"][CompilerType.LINT].success
+    bad = results["bad"][CompilerType.STYLE]
+    assert bad.state == CompilationState.FAILED
+    assert [issue["line"] for issue in bad.issues] == [2]
+    assert "checked" not in bad.output
+
+
+@pytest.mark.asyncio
+async def test_results_cached_by_code_and_version(engine, fake_tool):
+    """Test that unchanged code is served from the cache until the tool version changes."""
+    _, log = fake_tool
+    first = await engine.compile("x = 1\n", "feature", [CompilerType.STYLE])
+    second = await engine.compile("x = 1\n", "other_feature", [CompilerType.STYLE])
+
+    assert len(invocations(log)) == 1
+    assert not first[CompilerType.STYLE].cached
+    assert second[CompilerType.STYLE].cached
+
+    engine._tool_versions[CompilerType.STYLE] = "upgraded"
+    await engine.compile("x = 1\n", "feature", [CompilerType.STYLE])
+    assert len(invocations(log)) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_operations_are_isolated(engine):
+    """Test that concurrent compilations of the same feature do not share files."""
+    results = await asyncio.gather(*[
+        engine.compile("y = 'BAD'\n" if i % 2 else f"x = {i}\n", "same_feature", [CompilerType.STYLE])
+        for i in range(6)
+    ])
+
+    assert [result[CompilerType.STYLE].success for result in results] == [i % 2 == 0 for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_missing_tool_is_not_cached(tmp_path):
+    """Test that a tool that cannot run reports ERROR and is retried next time."""
+    engine = CompilationEngine(commands={CompilerType.TYPE: [str(tmp_path / "missing_tool")]})
+    result = await engine.compile("x = 1\n", "feature", [CompilerType.TYPE])
+
+    assert result[CompilerType.TYPE].state == CompilationState.ERROR
+    assert not engine._cache
@@ -0,0 +1,144 @@
+"""
+Unit tests for the Phase Zero analysis agent fan-out.
+
+Covers bounded concurrency, per-agent timeouts, partial results when agents
+fail, cancellation, and per-agent wall-time metrics.
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from phase_zero.orchestrator import PhaseZeroOrchestrator
+from resources import EventQueue, MetricsManager, StateManager
+
+
+class FakeAnalysisAgent:
+    """Analysis agent that sleeps, then returns or raises."""
+
+    def __init__(self, interface_id, delay=0.05, error=None, tracker=None):
+        self.interface_id = interface_id
+        self.delay = delay
+        self.error = error
+        self.tracker = tracker
+        self.cancelled = False
+
+    async def process(self, phase_one_outputs):
+        if self.tracker is not None:
+            self.tracker["running"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        finally:
+            if self.tracker is not None:
+                self.tracker["running"] -= 1
+        if self.error is not None:
+            raise self.error
+        return {"agent": self.interface_id, "input": phase_one_outputs}
+
+
+def make_orchestrator(**config):
+    """Build an orchestrator with only the state the agent fan-out needs."""
+    orchestrator = object.__new__(PhaseZeroOrchestrator)
+    orchestrator._event_queue = AsyncMock(spec=EventQueue)
+    orchestrator._state_manager = AsyncMock(spec=StateManager)
+    orchestrator._metrics_manager = AsyncMock(spec=MetricsManager)
+    orchestrator._health_tracker = None
+    orchestrator.revision_attempts = {}
+    orchestrator.concurrent_agents = config.get("concurrent_agents", True)
+    orchestrator.max_concurrent_agents = config.get("max_concurrent_agents", 4)
+    orchestrator.agent_timeout = config.get("agent_timeout", 5.0)
+    return orchestrator
+
+
+def recorded_metrics(orchestrator):
+    return {call.args[0]: call.args[1] for call in orchestrator._metrics_manager.record_metric.call_args_list}
+
+
+class TestPhaseZeroAgentFanOut:
+    """Tests for PhaseZeroOrchestrator._run_analysis_agents."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        tracker = {"running": 0, "peak": 0}
+        agents = {f"agent_{i}": FakeAnalysisAgent(f"agent_{i}", delay=0.1, tracker=tracker) for i in range(9)}
+        orchestrator = make_orchestrator(max_concurrent_agents=3)
+
+        start = time.monotonic()
+        results, execution = await orchestrator._run_analysis_agents(agents, {"outputs": 1})
+        elapsed = time.monotonic() - start
+
+        assert tracker["peak"] == 3
+        assert list(results) == list(agents)
+        assert all(result["agent"] == agent_id for agent_id, result in results.items())
+        # Three waves of 0.1s rather than nine sequential calls
+        assert elapsed < 0.6
+        assert execution["mode"] == "concurrent"
+        assert set(execution["agent_times"]) == set(agents)
+
+    @pytest.mark.asyncio
+    async def test_latency_tracks_slowest_agent(self):
+        agents = {
+            "fast": FakeAnalysisAgent("fast", delay=0.05),
+            "slow": FakeAnalysisAgent("slow", delay=0.3),
+            "medium": FakeAnalysisAgent("medium", delay=0.1),
+        }
+
+        concurrent = make_orchestrator()
+        _, concurrent_execution = await concurrent._run_analysis_agents(agents, {})
+        sequential = make_orchestrator(concurrent_agents=False)
+        _, sequential_execution = await sequential._run_analysis_agents(agents, {})
+
+        assert concurrent_execution["total_time"] < 0.4
+        assert sequential_execution["total_time"] >= 0.45
+        assert sequential_execution["mode"] == "sequential"
+
+    @pytest.mark.asyncio
+    async def test_partial_results_on_failure_and_timeout(self):
+        hanging = FakeAnalysisAgent("hanging", delay=10)
+        agents = {
+            "ok": FakeAnalysisAgent("ok"),
+            "broken": FakeAnalysisAgent("broken", error=RuntimeError("bad output")),
+            "hanging": hanging,
+        }
+        orchestrator = make_orchestrator(agent_timeout=0.2)
+
+        results, execution = await orchestrator._run_analysis_agents(agents, {})
+
+        assert results["ok"]["agent"] == "ok"
+        assert results["broken"]["status"] == "failure"
+        assert results["broken"]["error"] == "bad output"
+        assert results["hanging"]["status"] == "timeout"
+        assert hanging.cancelled
+        assert execution["failed"] == ["broken"]
+        assert execution["timed_out"] == ["hanging"]
+        assert orchestrator.revision_attempts["hanging"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates_to_agents(self):
+        agents = {f"agent_{i}": FakeAnalysisAgent(f"agent_{i}", delay=10) for i in range(3)}
+        orchestrator = make_orchestrator()
+
+        task = asyncio.create_task(orchestrator._run_analysis_agents(agents, {}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert all(agent.cancelled for agent in agents.values())
+
+    @pytest.mark.asyncio
+    async def test_records_per_agent_wall_time(self):
+        agents = {"sun": FakeAnalysisAgent("sun"), "shade": FakeAnalysisAgent("shade", delay=0.1)}
+        orchestrator = make_orchestrator()
+
+        await orchestrator._run_analysis_agents(agents, {})
+
+        metrics = recorded_metrics(orchestrator)
+        assert metrics["phase_zero:agent:sun:wall_time"] >= 0.05
+        assert metrics["phase_zero:agent:shade:wall_time"] >= 0.1
+        assert "phase_zero:analysis_agents:wall_time" in metrics
@@ -0,0 +1,182 @@
+"""
+Unit tests for chunked CheckpointManager checkpoints.
+
+Covers chunk sharing between checkpoints and phases, writes proportional to
+the changed context, restoring from persisted manifests, checkpoints stored
+as complete context dicts, and garbage collection of unreferenced chunks.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from resources import EventQueue, MetricsManager
+from resources.phase_coordinator.checkpoint import CHUNK_KEY_PREFIX, CheckpointManager
+from resources.phase_coordinator.constants import PhaseState, PhaseType
+from resources.phase_coordinator.models import PhaseContext
+
+
+class InMemoryStateStore:
+    """State manager double keeping entries in a dict and counting writes."""
+
+    def __init__(self):
+        self.entries = {}
+        self.writes = []
+
+    async def set_state(self, resource_id, state, metadata=None, resource_type=None, transition_reason=None):
+        self.entries[resource_id] = SimpleNamespace(state=state)
+        self.writes.append(resource_id)
+        return self.entries[resource_id]
+
+    async def get_state(self, resource_id, default=None, version=None):
+        return self.entries.get(resource_id, default)
+
+    async def get_states_many(self, resource_ids):
+        return {resource_id: self.entries[resource_id] for resource_id in resource_ids if resource_id in self.entries}
+
+    async def delete_state(self, resource_id, state_type="STATE"):
+        return self.entries.pop(resource_id, None) is not None
+
+    async def get_keys_by_prefix(self, prefix):
+        return [resource_id for resource_id in self.entries if resource_id.startswith(prefix)]
+
+
+def make_manager(state_store=None):
+    return CheckpointManager(
+        AsyncMock(spec=EventQueue),
+        state_store or InMemoryStateStore(),
+        AsyncMock(spec=MetricsManager)
+    )
+
+
+def make_context(phase_id="phase_one", **config):
+    return PhaseContext(
+        phase_id=phase_id,
+        phase_type=PhaseType.ONE,
+        state=PhaseState.RUNNING,
+        config={"model": "large", "prompt": "x" * 2000, **config},
+        metrics={"tokens": 10}
+    )
+
+
+def chunk_writes(state_store):
+    return [key for key in state_store.writes if key.startswith(CHUNK_KEY_PREFIX)]
+
+
+class TestCheckpointDeltas:
+    """Tests for chunked checkpoint creation and restore."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fields_are_not_rewritten(self):
+        state_store = InMemoryStateStore()
+        manager = make_manager(state_store)
+        context = make_context()
+
+        await manager.create_checkpoint("phase_one", context)
+        first_writes = len(chunk_writes(state_store))
+        context.metrics["tokens"] = 20
+        await manager.create_checkpoint("phase_one", context)
+
+        # Only the changed metric and the checkpoint id list are new
+        assert len(chunk_writes(state_store)) - first_writes == 2
+        stats = manager.get_storage_stats()
+        assert stats["checkpoints"] == 2
+        assert stats["chunks"] < stats["chunk_references"]
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_shared_across_phases(self):
+        state_store = InMemoryStateStore()
+        manager = make_manager(state_store)
+
+        first = await manager.create_checkpoint("phase_one", make_context("phase_one"))
+        before = len(chunk_writes(state_store))
+        second = await manager.create_checkpoint("phase_two", make_context("phase_two"))
+
+        written = chunk_writes(state_store)[before:]
+        prompt_chunk = manager._manifests[first]["fields"]["config"]["keys"]["prompt"]
+        assert manager._manifests[second]["fields"]["config"]["keys"]["prompt"] == prompt_chunk
+        assert f"{CHUNK_KEY_PREFIX}{prompt_chunk}" not in written
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_ids_are_unique(self):
+        manager = make_manager()
+        context = make_context()
+
+        first = await manager.create_checkpoint("phase_one", context)
+        second = await manager.create_checkpoint("phase_one", context)
+
+        assert first != second
+        assert context.checkpoint_ids == [first, second]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_is_isolated_from_later_changes(self):
+        manager = make_manager()
+        context = make_context()
+        checkpoint_id = await manager.create_checkpoint("phase_one", context)
+
+        context.config["model"] = "small"
+        data = manager.get_checkpoint_data(checkpoint_id)
+        data["config"]["model"] = "mutated"
+
+        restored = await manager.restore_from_checkpoint(checkpoint_id)
+        assert restored.config["model"] == "large"
+        assert restored.state == PhaseState.RUNNING
+        assert restored.checkpoint_ids == [checkpoint_id]
+
+    @pytest.mark.asyncio
+    async def test_restore_from_persisted_manifest(self):
+        state_store = InMemoryStateStore()
+        original = make_manager(state_store)
+        checkpoint_id = await original.create_checkpoint("phase_one", make_context(retries=3))
+
+        state_store.get_state = AsyncMock(wraps=state_store.get_state)
+        restored = await make_manager(state_store).restore_from_checkpoint(checkpoint_id)
+
+        assert restored.config["retries"] == 3
+        assert restored.metrics == {"tokens": 10}
+        # The manifest is read individually, its chunks in one bulk read
+        assert state_store.get_state.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_restore_of_complete_context_dict(self):
+        state_store = InMemoryStateStore()
+        context = make_context()
+        await state_store.set_state("phase_checkpoint:legacy", context.to_dict())
+
+        restored = await make_manager(state_store).restore_from_checkpoint("legacy")
+
+        assert restored.config == context.config
+
+    @pytest.mark.asyncio
+    async def test_garbage_collection_keeps_shared_chunks(self):
+        state_store = InMemoryStateStore()
+        manager = make_manager(state_store)
+        context = make_context()
+        first = await manager.create_checkpoint("phase_one", context)
+        context.config["prompt"] = "y" * 2000
+        second = await manager.create_checkpoint("phase_one", context)
+
+        assert await manager.collect_garbage() == 0
+        assert await manager.delete_checkpoint(first)
+        removed = await manager.collect_garbage()
+
+        # The old prompt and the first checkpoint id list are no longer referenced
+        assert removed == 2
+        assert f"phase_checkpoint:{first}" not in state_store.entries
+        assert manager.get_storage_stats()["unreferenced"] == 0
+        restored = await manager.restore_from_checkpoint(second)
+        assert restored.config["prompt"] == "y" * 2000
+
+    @pytest.mark.asyncio
+    async def test_garbage_collection_keeps_chunks_of_unloaded_checkpoints(self):
+        state_store = InMemoryStateStore()
+        persisted = await make_manager(state_store).create_checkpoint("phase_one", make_context())
+
+        # A new process writes the same chunks without loading the persisted checkpoint
+        manager = make_manager(state_store)
+        own = await manager.create_checkpoint("phase_two", make_context("phase_two"))
+        assert await manager.delete_checkpoint(own)
+        await manager.collect_garbage()
+
+        restored = await make_manager(state_store).restore_from_checkpoint(persisted)
+        assert restored.config["prompt"] == "x" * 2000
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from resources.error_traceback import (
+    ErrorTracebackGraph,
+    TracebackEdge,
+    TracebackNode,
+    TracebackNodeType
+)
+
+
+def error_node(node_id, error_type, component_id, timestamp):
+    return TracebackNode(
+        node_id=node_id,
+        node_type=TracebackNodeType.ERROR,
+        label=error_type,
+        timestamp=timestamp,
+        metadata={"error_type": error_type, "component_id": component_id}
+    )
+
+# Tests for stable edge IDs, time-ordered pruning and the error index
+class TestErrorTracebackIndex:
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_edge_ids_stable(self):
+        """Test that pruning removes expired entries without invalidating surviving edge IDs."""
+        graph = ErrorTracebackGraph()
+        old = datetime.now() - timedelta(days=10)
+        await graph.add_node(TracebackNode("component", TracebackNodeType.COMPONENT, "component"))
+        for i in range(4):
+            timestamp = old if i < 2 else datetime.now()
+            await graph.add_node(error_node(f"error_{i}", "ValueError", "component", timestamp))
+            await graph.add_edge(TracebackEdge(f"error_{i}", "component", "detected_in", timestamp=timestamp))
+        caused_id = await graph.add_edge(TracebackEdge("error_2", "error_3", "caused"))
+        # Recent edge attached to an expiring node is removed with the node
+        await graph.add_edge(TracebackEdge("error_0", "error_3", "caused"))
+
+        await graph.prune_old_entries()
+
+        assert set(graph._nodes) == {"component", "error_2", "error_3"}
+        assert graph._edges[caused_id].relationship == "caused"
+        assert [edge.source_id for edge in await graph.get_incoming_edges("error_3")] == ["error_2"]
+        assert [edge.source_id for edge in await graph.get_incoming_edges("component")] == ["error_2", "error_3"]
+        assert len(graph._edge_time_index) == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_since_uses_key_index(self):
+        """Test that similarity lookups return only matching errors inside the window."""
+        graph = ErrorTracebackGraph()
+        now = datetime.now()
+        await graph.add_node(error_node("old", "ValueError", "a", now - timedelta(hours=2)))
+        await graph.add_node(error_node("recent", "ValueError", "a", now))
+        await graph.add_node(error_node("other_type", "KeyError", "a", now))
+        await graph.add_node(error_node("other_component", "ValueError", "b", now))
+
+        cutoff = now - timedelta(hours=1)
+        assert [n.node_id for n in await graph.get_errors_since(cutoff, "ValueError", "a")] == ["recent"]
+        assert len(await graph.get_errors_since(cutoff)) == 3
+        assert len(await graph.get_errors_since(cutoff, error_type="ValueError")) == 2
+
+        # Metadata updates move the node between keys
+        await graph.add_node(error_node("recent", "KeyError", "a", now))
+        assert await graph.get_errors_since(cutoff, "ValueError", "a") == []
+        assert len(await graph.get_errors_since(cutoff, "KeyError", "a")) == 2
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from resources.base import BaseManager, ManagerConfig, OperationMode
+from resources.errors import ResourceTimeoutError
+from resources.events import EventQueue
+
+
+class ModeTestManager(BaseManager):
+    """Minimal concrete manager for exercising protected_operation"""
+
+    async def _cleanup_resources(self, force: bool = False) -> None:
+        pass
+
+
+@pytest_asyncio.fixture
+async def event_queue():
+    queue = EventQueue()
+    await queue.start()
+    yield queue
+    await queue.stop()
+
+
+@pytest_asyncio.fixture
+async def manager(event_queue):
+    manager = ModeTestManager(
+        event_queue=event_queue,
+        manager_config=ManagerConfig(default_operation_timeout=1.0, health_update_interval=60.0)
+    )
+    yield manager
+    await manager.terminate()
+
+
+async def max_concurrency(manager, calls):
+    """Run (operation, mode, key) calls concurrently and return the peak overlap."""
+    active = 0
+    peak = 0
+
+    async def body():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    await asyncio.gather(*[
+        manager.protected_operation(operation, body, mode=mode, key=key)
+        for operation, mode, key in calls
+    ])
+    return peak
+
+
+class TestOperationModes:
+
+    @pytest.mark.asyncio
+    async def test_exclusive_serializes_same_operation(self, manager):
+        """Test that the default mode still runs one call per operation name."""
+        peak = await max_concurrency(manager, [("op", OperationMode.EXCLUSIVE, None)] * 5)
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently(self, manager):
+        """Test that READ operations with the same name overlap."""
+        peak = await max_concurrency(manager, [("read", OperationMode.READ, None)] * 5)
+        assert peak == 5
+
+    @pytest.mark.asyncio
+    async def test_writes_serialize_per_key(self, manager):
+        """Test that WRITE operations only serialize when they share a key."""
+        assert await max_concurrency(manager, [("write", OperationMode.WRITE, "a")] * 3) == 1
+        calls = [("write", OperationMode.WRITE, key) for key in ("a", "b", "c")]
+        assert await max_concurrency(manager, calls) == 3
+        # Key locks are released once no caller holds them
+        assert len(manager._key_locks) == 0
+
+    @pytest.mark.asyncio
+    async def test_read_timeout(self, manager):
+        """Test that the lock-free path still enforces timeouts."""
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(ResourceTimeoutError):
+            await manager.protected_operation("slow_read", slow, timeout=0.05, mode=OperationMode.READ)
+        # The timeout must not leave a pending cancellation on the caller
+        await asyncio.sleep(0.01)
+        assert asyncio.current_task().cancelling() == 0
+
+    @pytest.mark.asyncio
+    async def test_health_updates_are_rate_limited(self, manager):
+        """Test that successes within the interval are aggregated into one update."""
+        updates = []
+        original = manager._health_tracker.update_health
+
+        async def record_update(component, status):
+            updates.append(status)
+            await original(component, status)
+
+        manager._health_tracker.update_health = record_update
+
+        async def ok():
+            return True
+
+        for _ in range(10):
+            await manager.protected_operation("read", ok, mode=OperationMode.READ)
+        assert len(updates) == 1
+
+        manager._last_health_update -= 60.0
+        await manager.protected_operation("read", ok, mode=OperationMode.READ)
+        assert len(updates) == 2
+        assert updates[-1].metadata["successful_operations"] == 10
+
+    @pytest.mark.asyncio
+    async def test_success_after_error_updates_health(self, manager):
+        """Test that the first success after an error is reported immediately."""
+        async def ok():
+            return True
+
+        async def fail():
+            raise ValueError("boom")
+
+        await manager.protected_operation("op", ok)
+        with pytest.raises(ValueError):
+            await manager.protected_operation("op", fail)
+        assert manager._health_update_due
+
+        await manager.protected_operation("op", ok)
+        assert not manager._health_update_due
+        health = await manager.get_health_status()
+        assert health.status == "HEALTHY"
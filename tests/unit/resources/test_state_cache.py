@@ -0,0 +1,96 @@
+import pytest
+import pytest_asyncio
+
+from resources.state import StateManager, StateManagerConfig, MemoryStateBackend
+from resources.common import ResourceState, ResourceType
+
+
+class MockEventQueue:
+    """Mock EventQueue for testing"""
+
+    def __init__(self):
+        self.events = []
+
+    async def emit(self, event_type, data, priority="normal"):
+        self.events.append((event_type, data, priority))
+        return True
+
+
+class CountingBackend(MemoryStateBackend):
+    """Memory backend that records history loads"""
+
+    def __init__(self):
+        super().__init__()
+        self.history_loads = 0
+
+    async def load_history(self, resource_id, limit=None):
+        self.history_loads += 1
+        return await super().load_history(resource_id, limit)
+
+
+@pytest_asyncio.fixture
+async def make_manager():
+    def factory(cache_size=1000, backend=None):
+        StateManager.reset_for_testing()
+        config = StateManagerConfig(
+            persistence_type="memory",
+            cache_size=cache_size,
+            enable_metrics=True,
+        )
+        manager = StateManager(MockEventQueue(), config)
+        if backend is not None:
+            manager._backend = backend
+        return manager
+
+    yield factory
+    StateManager.reset_for_testing()
+
+
+class TestStateCache:
+    """Tests for the StateManager LRU cache and snapshot cadence."""
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self, make_manager):
+        manager = make_manager(cache_size=2)
+        for resource_id in ("a", "b"):
+            await manager.set_state(resource_id, {"v": resource_id}, resource_type=ResourceType.STATE)
+
+        # Touch "a" so "b" becomes the eviction candidate
+        await manager.get_state("a")
+        await manager.set_state("c", {"v": "c"}, resource_type=ResourceType.STATE)
+
+        assert list(manager._states_cache) == ["a", "c"]
+        stats = manager.get_cache_stats()
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+        assert stats["capacity"] == 2
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_counts(self, make_manager):
+        manager = make_manager(cache_size=1)
+        await manager.set_state("a", {"v": 1}, resource_type=ResourceType.STATE)
+        await manager.set_state("b", {"v": 2}, resource_type=ResourceType.STATE)
+        before = manager.get_cache_stats()
+
+        await manager.get_state("b")  # hit
+        await manager.get_state("a")  # evicted earlier: miss, then reloaded
+
+        stats = manager.get_cache_stats()
+        assert stats["hits"] == before["hits"] + 1
+        assert stats["misses"] == before["misses"] + 1
+        assert 0.0 < stats["hit_rate"] < 1.0
+        assert (await manager.get_metrics())["cache_evictions"] == stats["evictions"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_cadence_does_not_load_history(self, make_manager):
+        backend = CountingBackend()
+        manager = make_manager(backend=backend)
+
+        states = [ResourceState.ACTIVE, ResourceState.PAUSED] * 10
+        for state in states:
+            await manager.set_state("res", state, resource_type=ResourceType.COMPUTE)
+
+        assert backend.history_loads == 0
+        assert await backend.get_transition_count("res") == 20
+        # Snapshots are taken on every 10th transition
+        assert len(await backend.load_snapshots("res")) == 2
@@ -0,0 +1,108 @@
+import os
+import pickle
+
+import pytest
+
+from resources.state import FileStateBackend, StateEntry
+from resources.common import ResourceState, ResourceType
+
+
+def _entry(i):
+    return StateEntry(
+        state=ResourceState.ACTIVE if i % 2 == 0 else ResourceState.PAUSED,
+        resource_type=ResourceType.COMPUTE,
+        metadata={"version": i},
+    )
+
+
+class TestFileHistoryLog:
+    """Tests for the append-only history log of FileStateBackend."""
+
+    @pytest.mark.asyncio
+    async def test_appends_do_not_rewrite_log(self, tmp_path):
+        backend = FileStateBackend(str(tmp_path))
+        await backend.save_state("res", _entry(0))
+        log_file = backend._history_file("res")
+        first_size = os.path.getsize(log_file)
+
+        for i in range(1, 5):
+            await backend.save_state("res", _entry(i))
+
+        # Every record is the same size, so the log only grew by appends
+        assert os.path.getsize(log_file) == first_size * 5
+        assert [e.metadata["version"] for e in await backend.load_history("res")] == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_limited_history_reads_only_tail(self, tmp_path):
+        backend = FileStateBackend(str(tmp_path))
+        for i in range(50):
+            await backend.save_state("res", _entry(i))
+
+        offsets = backend._log_offsets["res"]
+        calls = []
+        original = backend._read_records
+
+        def spy(log_file, start, end):
+            calls.append((start, end))
+            return original(log_file, start, end)
+
+        backend._read_records = spy
+        history = await backend.load_history("res", limit=3)
+
+        assert [e.metadata["version"] for e in history] == [47, 48, 49]
+        assert calls == [(offsets[-3], backend._log_ends["res"])]
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_and_torn_tail_truncated(self, tmp_path):
+        backend = FileStateBackend(str(tmp_path))
+        for i in range(3):
+            await backend.save_state("res", _entry(i))
+        log_file = backend._history_file("res")
+        with open(log_file, "ab") as f:
+            f.write(b"\x00\x00\x10\x00partial")
+
+        reopened = FileStateBackend(str(tmp_path))
+        history = await reopened.load_history("res")
+        assert [e.metadata["version"] for e in history] == [0, 1, 2]
+        assert await reopened.get_transition_count("res") == 3
+
+        await reopened.save_state("res", _entry(3))
+        history = await reopened.load_history("res")
+        assert [e.metadata["version"] for e in history] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_legacy_pickled_history_is_migrated(self, tmp_path):
+        backend = FileStateBackend(str(tmp_path))
+        legacy_file = backend.history_dir / "res.pickle"
+        with open(legacy_file, "wb") as f:
+            pickle.dump([_entry(0), _entry(1)], f)
+
+        await backend.save_state("res", _entry(2))
+
+        assert not legacy_file.exists()
+        history = await backend.load_history("res")
+        assert [e.metadata["version"] for e in history] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_periodic_compaction(self, tmp_path):
+        backend = FileStateBackend(str(tmp_path), compact_threshold=20, compact_keep=5)
+        for i in range(25):
+            await backend.save_state("res", _entry(i))
+
+        history = await backend.load_history("res")
+        # Compacted once at 20 records (first + one per day + 5 recent), then 5 appends
+        assert len(history) < 25
+        assert history[0].metadata["version"] == 0
+        assert history[-1].metadata["version"] == 24
+        # The transition counter is unaffected by compaction
+        assert await backend.get_transition_count("res") == 25
+
+    @pytest.mark.asyncio
+    async def test_delete_state_removes_log(self, tmp_path):
+        backend = FileStateBackend(str(tmp_path))
+        await backend.save_state("res", _entry(0))
+
+        assert await backend.delete_state("res")
+        assert not backend._history_file("res").exists()
+        assert await backend.load_history("res") == []
+        assert not await backend.delete_state("res")
@@ -0,0 +1,163 @@
+import sqlite3
+
+import pytest
+import pytest_asyncio
+
+from resources.state import (
+    StateManager, StateManagerConfig, StateEntry,
+    MemoryStateBackend, FileStateBackend, SQLiteStateBackend
+)
+from resources.common import ResourceState, ResourceType
+
+
+class MockEventQueue:
+    """Mock EventQueue for testing"""
+
+    def __init__(self):
+        self.events = []
+
+    async def emit(self, event_type, data, priority="normal"):
+        self.events.append((event_type, data, priority))
+        return True
+
+
+def _entry(state):
+    return StateEntry(state=state, resource_type=ResourceType.COMPUTE)
+
+
+@pytest_asyncio.fixture(params=["memory", "file", "sqlite"])
+async def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryStateBackend()
+    elif request.param == "file":
+        backend = FileStateBackend(str(tmp_path))
+    else:
+        backend = SQLiteStateBackend(str(tmp_path / "state.db"))
+    yield backend
+    if request.param == "sqlite":
+        await backend.close()
+
+
+async def _populate(backend):
+    await backend.save_state("workflow:a:1", _entry(ResourceState.ACTIVE))
+    await backend.save_state("workflow:a:2", _entry(ResourceState.PAUSED))
+    await backend.save_state("workflow:b:1", _entry(ResourceState.ACTIVE))
+    await backend.save_state("agent:x", _entry(ResourceState.ACTIVE))
+
+
+class TestStateIndexes:
+    """Tests for indexed by-state and by-prefix queries on each backend."""
+
+    @pytest.mark.asyncio
+    async def test_ids_by_state_follow_transitions(self, backend):
+        await _populate(backend)
+        active = str(ResourceState.ACTIVE)
+        paused = str(ResourceState.PAUSED)
+
+        assert sorted(await backend.get_resource_ids_by_state(active)) == [
+            "agent:x", "workflow:a:1", "workflow:b:1"
+        ]
+        assert await backend.count_resources_by_state() == {active: 3, paused: 1}
+
+        await backend.save_state("agent:x", _entry(ResourceState.PAUSED))
+        await backend.delete_state("workflow:b:1")
+
+        assert await backend.get_resource_ids_by_state(active) == ["workflow:a:1"]
+        assert await backend.count_resources_by_state() == {active: 1, paused: 2}
+
+    @pytest.mark.asyncio
+    async def test_prefix_lookup(self, backend):
+        await _populate(backend)
+
+        assert await backend.get_resource_ids_by_prefix("workflow:a:") == [
+            "workflow:a:1", "workflow:a:2"
+        ]
+        assert await backend.get_resource_ids_by_prefix("workflow:c") == []
+        assert len(await backend.get_resource_ids_by_prefix("")) == 4
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_and_delete(self, backend):
+        await _populate(backend)
+
+        states = await backend.get_states_many(["workflow:a:1", "agent:x", "missing"])
+        assert set(states) == {"workflow:a:1", "agent:x"}
+        assert states["agent:x"].state == ResourceState.ACTIVE
+
+        assert await backend.delete_states_many(["workflow:a:1", "workflow:a:2", "missing"]) == 2
+        assert await backend.get_resource_ids_by_prefix("workflow:") == ["workflow:b:1"]
+        assert await backend.load_history("workflow:a:1") == []
+
+    @pytest.mark.asyncio
+    async def test_file_index_rebuilt_on_reopen(self, tmp_path):
+        backend = FileStateBackend(str(tmp_path))
+        await _populate(backend)
+
+        reopened = FileStateBackend(str(tmp_path))
+        assert (await reopened.count_resources_by_state())[str(ResourceState.ACTIVE)] == 3
+        assert await reopened.get_resource_ids_by_prefix("agent:") == ["agent:x"]
+
+    @pytest.mark.asyncio
+    async def test_sqlite_state_key_column_is_backfilled(self, tmp_path):
+        db_path = str(tmp_path / "state.db")
+        backend = SQLiteStateBackend(db_path)
+        await _populate(backend)
+        await backend.close()
+
+        # Simulate a database written before the state_key column existed
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE states SET state_key = NULL")
+        conn.commit()
+        conn.close()
+
+        reopened = SQLiteStateBackend(db_path)
+        try:
+            assert (await reopened.count_resources_by_state())[str(ResourceState.ACTIVE)] == 3
+            assert await reopened.get_resource_ids_by_state(str(ResourceState.PAUSED)) == ["workflow:a:2"]
+        finally:
+            await reopened.close()
+
+
+@pytest_asyncio.fixture
+async def manager():
+    StateManager.reset_for_testing()
+    config = StateManagerConfig(persistence_type="memory", cache_size=2, enable_metrics=True)
+    manager = StateManager(MockEventQueue(), config)
+    yield manager
+    StateManager.reset_for_testing()
+
+
+class TestStateManagerQueries:
+    """Tests for StateManager queries backed by the backend indexes."""
+
+    @pytest.mark.asyncio
+    async def test_queries_use_backend_indexes(self, manager):
+        await _populate(manager._backend)
+
+        assert sorted(await manager.get_resources_by_state(ResourceState.ACTIVE)) == [
+            "agent:x", "workflow:a:1", "workflow:b:1"
+        ]
+        assert (await manager.count_resources_by_state())[str(ResourceState.PAUSED)] == 1
+        assert await manager.get_keys_by_prefix("workflow:b") == ["workflow:b:1"]
+
+    @pytest.mark.asyncio
+    async def test_get_states_many_fills_cache(self, manager):
+        await _populate(manager._backend)
+
+        states = await manager.get_states_many(["workflow:a:1", "agent:x", "missing"])
+        assert set(states) == {"workflow:a:1", "agent:x"}
+        assert set(manager._states_cache) == {"workflow:a:1", "agent:x"}
+
+        hits = manager.get_cache_stats()["hits"]
+        await manager.get_states_many(["agent:x"])
+        assert manager.get_cache_stats()["hits"] == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_clear_workflow_states(self, manager):
+        await manager.set_state("workflow:a:1", ResourceState.ACTIVE, resource_type=ResourceType.COMPUTE)
+        await manager.set_state("workflow:a:2", ResourceState.ACTIVE, resource_type=ResourceType.COMPUTE)
+        await manager.set_state("agent:x", ResourceState.ACTIVE, resource_type=ResourceType.COMPUTE)
+
+        assert await manager.clear_workflow_states("workflow:") == 2
+        assert "workflow:a:2" not in manager._states_cache
+        assert await manager.get_state("workflow:a:1") is None
+        assert await manager.get_keys_by_prefix("") == ["agent:x"]
@@ -0,0 +1,102 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from resources.state import SQLiteStateBackend, StateEntry, StateSnapshot
+from resources.common import ResourceState, ResourceType
+
+
+def _entry(i):
+    return StateEntry(
+        state=ResourceState.ACTIVE if i % 2 == 0 else ResourceState.PAUSED,
+        resource_type=ResourceType.COMPUTE,
+        metadata={"index": i},
+    )
+
+
+class TestSQLiteWriter:
+    """Tests for the SQLiteStateBackend writer thread and reader pool."""
+
+    @pytest.mark.asyncio
+    async def test_database_uses_wal(self, tmp_path):
+        db_path = str(tmp_path / "state.db")
+        backend = SQLiteStateBackend(db_path)
+        try:
+            conn = sqlite3.connect(db_path)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            conn.close()
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_are_group_committed(self, tmp_path):
+        backend = SQLiteStateBackend(str(tmp_path / "state.db"))
+        try:
+            results = await asyncio.gather(*(backend.save_state(f"res-{i}", _entry(i)) for i in range(100)))
+            assert all(results)
+
+            stats = backend.get_write_stats()
+            assert stats["writes"] == 100
+            assert stats["transactions"] < 100
+            assert stats["max_batch"] > 1
+            assert len(await backend.get_all_resource_ids()) == 100
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_write_behind_reads_own_writes(self, tmp_path):
+        backend = SQLiteStateBackend(str(tmp_path / "state.db"), wait_for_commit=False)
+        try:
+            for i in range(20):
+                assert await backend.save_state("res", _entry(i))
+            await backend.save_snapshot("res", StateSnapshot(state={"state": "ACTIVE"}))
+
+            state = await backend.load_state("res")
+            assert state.metadata["index"] == 19
+            assert len(await backend.load_history("res")) == 20
+            assert len(await backend.load_snapshots("res")) == 1
+            assert await backend.get_transition_count("res") == 20
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_history_tail_is_chronological(self, tmp_path):
+        backend = SQLiteStateBackend(str(tmp_path / "state.db"))
+        try:
+            for i in range(10):
+                await backend.save_state("res", _entry(i))
+            history = await backend.load_history("res", limit=3)
+            assert [e.metadata["index"] for e in history] == [7, 8, 9]
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_writer_thread_exits_when_idle(self, tmp_path):
+        backend = SQLiteStateBackend(str(tmp_path / "state.db"), writer_idle_timeout=0.05)
+        try:
+            await backend.save_state("res", _entry(0))
+            assert backend.get_write_stats()["writer_running"]
+            await asyncio.sleep(0.3)
+            assert not backend.get_write_stats()["writer_running"]
+
+            # The next write restarts it
+            assert await backend.save_state("res", _entry(1))
+            assert len(await backend.load_history("res")) == 2
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_and_clear(self, tmp_path):
+        backend = SQLiteStateBackend(str(tmp_path / "state.db"))
+        try:
+            for i in range(3):
+                await backend.save_state(f"res-{i}", _entry(i))
+
+            assert await backend.delete_state("res-0")
+            assert not await backend.delete_state("res-0")
+            assert await backend.load_history("res-0") == []
+            assert await backend.clear_all_states() == 2
+            assert await backend.get_all_resource_ids() == []
+        finally:
+            await backend.close()
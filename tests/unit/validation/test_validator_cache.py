@@ -0,0 +1,75 @@
+import jsonschema
+import pytest
+
+from agent_validation import SchemaValidatorCache, Validator
+
+SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string"}, "count": {"type": "integer"}},
+}
+
+
+class TestSchemaValidatorCache:
+    """Tests for cached jsonschema validators."""
+
+    def test_equal_schemas_share_a_validator(self):
+        cache = SchemaValidatorCache()
+        validator = cache.get(SCHEMA)
+
+        assert cache.get(dict(SCHEMA)) is validator
+        assert cache.get(SCHEMA, jsonschema.Draft7Validator) is not validator
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_modified_schema_gets_new_validator(self):
+        cache = SchemaValidatorCache()
+        schema = {"type": "object", "required": ["a"]}
+        cache.validate({"a": 1}, schema)
+
+        schema["required"] = ["b"]
+        with pytest.raises(jsonschema.ValidationError):
+            cache.validate({"a": 1}, schema)
+
+    def test_validate_matches_jsonschema(self):
+        cache = SchemaValidatorCache()
+        instance = {"name": 1, "count": "x"}
+
+        with pytest.raises(jsonschema.ValidationError) as expected:
+            jsonschema.validate(instance, SCHEMA)
+        with pytest.raises(jsonschema.ValidationError) as actual:
+            cache.validate(instance, SCHEMA)
+        assert actual.value.message == expected.value.message
+
+        with pytest.raises(jsonschema.SchemaError):
+            cache.get({"type": 12})
+
+    def test_lru_bound(self):
+        cache = SchemaValidatorCache(max_size=2)
+        for i in range(3):
+            cache.get({"type": "object", "required": [str(i)]})
+        assert cache.get_stats()["size"] == 2
+        assert cache.get_stats()["evictions"] == 1
+
+
+class TestJSONExtractionFastPaths:
+    """Tests for the linear bracket counter and raw_decode fast path."""
+
+    def setup_method(self):
+        self.validator = object.__new__(Validator)
+
+    def test_backslash_runs_before_quotes(self):
+        content = r'{"a": "x\\", "b": "\\\"}{", "c": "\\\\"} trailing }'
+        assert self.validator._extract_json_with_bracket_counting(content) == content[:content.index(" trailing")]
+
+    def test_escape_heavy_content_is_linear(self):
+        body = '\\\\' * 50000
+        content = '{"a": "' + body + '"} tail'
+        assert self.validator._extract_json_with_bracket_counting(content) == content[:-5]
+
+    def test_raw_decode_ignores_trailing_text(self):
+        assert self.validator.extract_json_from_response('Result: {"a": [1, {"b": "}"}]} done') == '{"a": [1, {"b": "}"}]}'
+        # Invalid JSON at the first brace falls back to bracket counting and unescaping
+        assert self.validator._extract_json_with_raw_decode('{not json} {"a": 1}') is None
+        assert self.validator.extract_json_from_response('"{\\"a\\": 1}"') == '{"a": 1}'